@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""Benchmark cold start of lightweight kiln CLI commands.
+
+Runs each command in a fresh interpreter under `python -X importtime` and
+reports the wall-clock time and the total import time, plus the slowest
+top-level imports. Commands that exceed the budget fail the run, so this can
+gate CI.
+
+Usage:
+    python scripts/bench_cli_startup.py [--runs N] [--budget-ms MS]
+
+Exit codes:
+    0 - Every command imported within the budget
+    1 - At least one command exceeded the budget
+"""
+
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# Import-time budget per command, in milliseconds
+DEFAULT_BUDGET_MS = 100.0
+
+# (label, kiln arguments) of commands that must start fast
+COMMANDS = [
+    ("kiln --version", ["--version"]),
+    ("kiln --help", ["--help"]),
+    ("kiln logs <issue>", ["logs", "owner/repo#1"]),
+]
+
+_IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+def parse_importtime(stderr: str) -> dict[str, int]:
+    """Parse `-X importtime` output into top-level module -> cumulative microseconds."""
+    top_level: dict[str, int] = {}
+    for line in stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match and len(match.group(3)) == 1:
+            top_level[match.group(4)] = int(match.group(2))
+    return top_level
+
+
+def run_command(args: list[str], cwd: Path) -> tuple[float, dict[str, int]]:
+    """Run kiln with args in a fresh interpreter.
+
+    Returns:
+        Tuple of (wall-clock milliseconds, top-level imports in microseconds)
+    """
+    code = f"import sys; sys.argv = ['kiln', *{args!r}]; from src.cli import main; main()"
+    env = {**os.environ, "PYTHONPATH": str(REPO_ROOT)}
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        cwd=cwd,
+        env=env,
+    )
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    return elapsed_ms, parse_importtime(result.stderr)
+
+
+def main() -> int:
+    """Run the benchmark and print a report."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="Runs per command (median reported)")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS)
+    args = parser.parse_args()
+
+    over_budget = False
+    with tempfile.TemporaryDirectory() as tmp:
+        cwd = Path(tmp)
+        # `kiln logs` needs a database to get past its first check
+        sys.path.insert(0, str(REPO_ROOT))
+        from src.database import Database
+
+        (cwd / ".kiln").mkdir()
+        Database(str(cwd / ".kiln" / "kiln.db")).close()
+
+        for label, kiln_args in COMMANDS:
+            samples = [run_command(kiln_args, cwd) for _ in range(args.runs)]
+            wall_ms = statistics.median(wall for wall, _ in samples)
+            import_ms = statistics.median(
+                sum(us for name, us in imports.items() if name != "site") / 1000
+                for _, imports in samples
+            )
+            status = "ok" if import_ms <= args.budget_ms else "OVER BUDGET"
+            over_budget |= import_ms > args.budget_ms
+            print(f"{label:<22} wall {wall_ms:7.1f} ms  imports {import_ms:7.1f} ms  {status}")
+
+            slowest = sorted(samples[-1][1].items(), key=lambda item: item[1], reverse=True)[:5]
+            for name, us in slowest:
+                print(f"    {us / 1000:7.1f} ms  {name}")
+
+    return 1 if over_budget else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
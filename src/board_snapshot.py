@@ -0,0 +1,199 @@
+"""Incremental board diffing for the daemon poll loop.
+
+Each poll fetches every item on the configured boards, but on a mostly idle
+board almost nothing changes between polls. BoardSnapshot keeps a fingerprint
+per board item (status, labels, state, stateReason, comment count and merged
+flag) in memory and in the SQLite database, and turns each fetch into a change
+set. Only changed or time-sensitive items need to go through the per-item
+handlers; unchanged items would produce the same decisions as last time.
+
+Time-sensitive items are those whose outcome depends on something outside
+their own fingerprint (a workflow finishing, a blocking issue being merged).
+The daemon marks them dirty so they are re-evaluated on the next poll. A full
+scan runs on the first poll after startup and periodically as a safety net.
+
+Between polls the daemon may refresh a few items it was told about (see
+src/wake_channel.py). Such a partial diff covers only the fetched items: it
+neither reports removals nor settles the dirty set, which stay with the next
+full poll.
+"""
+
+import hashlib
+import json
+import threading
+import time
+from dataclasses import dataclass, field
+
+from src.database import Database
+from src.interfaces import TicketItem
+from src.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Seconds between full scans that re-evaluate every item regardless of changes
+FULL_SCAN_INTERVAL = 600
+
+
+def item_fingerprint(item: TicketItem) -> str:
+    """Compute a stable fingerprint of the item fields the handlers act on.
+
+    Args:
+        item: TicketItem from the board
+
+    Returns:
+        Hex digest that changes whenever status, labels, state, state reason,
+        comment count or merged flag change
+    """
+    payload = json.dumps(
+        [
+            item.status,
+            sorted(item.labels),
+            item.state,
+            item.state_reason,
+            item.comment_count,
+            item.has_merged_changes,
+        ]
+    )
+    return hashlib.sha1(payload.encode("utf-8"), usedforsecurity=False).hexdigest()
+
+
+@dataclass
+class BoardChangeSet:
+    """Result of diffing a board fetch against the previous snapshot.
+
+    Attributes:
+        changed: Items that are new, changed, or marked dirty since the last poll
+        unchanged: Items whose fingerprint matches the previous snapshot
+        removed: Board item IDs that are no longer on any fetched board
+        fingerprints: Fingerprints of all fetched items, keyed by board item ID
+        full_scan: Whether every item should be processed this poll
+        partial: Whether the fetch covered only some items (a targeted refresh)
+    """
+
+    changed: list[TicketItem] = field(default_factory=list)
+    unchanged: list[TicketItem] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+    fingerprints: dict[str, str] = field(default_factory=dict)
+    full_scan: bool = False
+    partial: bool = False
+
+    @property
+    def items_to_process(self) -> list[TicketItem]:
+        """Items that should go through the per-item handlers this poll."""
+        if self.full_scan:
+            return self.changed + self.unchanged
+        return self.changed
+
+
+class BoardSnapshot:
+    """Fingerprint store that produces a change set for every poll."""
+
+    def __init__(self, database: Database, full_scan_interval: float = FULL_SCAN_INTERVAL) -> None:
+        """Initialize the snapshot, loading persisted fingerprints.
+
+        Args:
+            database: Database used to persist fingerprints across restarts
+            full_scan_interval: Seconds between full scans
+        """
+        self.database = database
+        self.full_scan_interval = full_scan_interval
+        self._fingerprints: dict[str, str] = database.get_board_snapshot()
+        self._dirty: set[str] = set()
+        # Dirty keys taken by diff() but not yet committed (restored if a poll fails)
+        self._uncommitted_dirty: set[str] = set()
+        self._lock = threading.Lock()
+        self._last_full_scan: float | None = None
+        logger.debug(f"Loaded {len(self._fingerprints)} board item fingerprints")
+
+    def mark_dirty(self, repo: str, issue_number: int) -> None:
+        """Force an issue through the handlers on the next poll.
+
+        Safe to call from worker threads.
+
+        Args:
+            repo: Repository in 'hostname/owner/repo' format
+            issue_number: Issue number
+        """
+        with self._lock:
+            self._dirty.add(f"{repo}#{issue_number}")
+
+    def diff(self, items: list[TicketItem], partial: bool = False) -> BoardChangeSet:
+        """Compare fetched items to the snapshot.
+
+        Takes the current dirty set. The snapshot and dirty set are only settled
+        by commit(), so a poll that fails part-way re-evaluates the same items
+        next time.
+
+        A partial diff is for a targeted refresh: every fetched item counts as
+        changed (it was refreshed because something happened to it), nothing is
+        reported removed, and the dirty set is left for the next full poll.
+
+        Args:
+            items: All items fetched this poll
+            partial: Whether items are only a subset of the boards
+
+        Returns:
+            BoardChangeSet for this poll
+        """
+        if partial:
+            return BoardChangeSet(
+                changed=list(items),
+                fingerprints={item.item_id: item_fingerprint(item) for item in items},
+                partial=True,
+            )
+
+        now = time.monotonic()
+        full_scan = (
+            self._last_full_scan is None or now - self._last_full_scan >= self.full_scan_interval
+        )
+        if full_scan:
+            self._last_full_scan = now
+
+        with self._lock:
+            dirty = self._dirty | self._uncommitted_dirty
+            self._uncommitted_dirty = dirty
+            self._dirty = set()
+
+        change_set = BoardChangeSet(full_scan=full_scan)
+        for item in items:
+            fingerprint = item_fingerprint(item)
+            change_set.fingerprints[item.item_id] = fingerprint
+            key = f"{item.repo}#{item.ticket_id}"
+            if self._fingerprints.get(item.item_id) != fingerprint or key in dirty:
+                change_set.changed.append(item)
+            else:
+                change_set.unchanged.append(item)
+
+        change_set.removed = [
+            item_id for item_id in self._fingerprints if item_id not in change_set.fingerprints
+        ]
+
+        logger.debug(
+            f"Board diff: {len(change_set.changed)} changed, {len(change_set.unchanged)} "
+            f"unchanged, {len(change_set.removed)} removed" + (" (full scan)" if full_scan else "")
+        )
+        return change_set
+
+    def commit(self, change_set: BoardChangeSet) -> None:
+        """Record the change set's fingerprints as the new snapshot.
+
+        Only fingerprints that differ from the stored ones are written.
+
+        Args:
+            change_set: Change set returned by diff() for this poll
+        """
+        updates = {
+            item_id: fingerprint
+            for item_id, fingerprint in change_set.fingerprints.items()
+            if self._fingerprints.get(item_id) != fingerprint
+        }
+        if updates or change_set.removed:
+            self.database.update_board_snapshot(updates, change_set.removed)
+
+        for item_id in change_set.removed:
+            self._fingerprints.pop(item_id, None)
+        self._fingerprints.update(updates)
+
+        if not change_set.partial:
+            with self._lock:
+                self._uncommitted_dirty = set()
@@ -0,0 +1,203 @@
+"""Shared CI watcher for workflows waiting on check runs.
+
+ImplementWorkflow's validation phase waits for CI on the PR head commit,
+often for many minutes. Polling from the workflow thread kept a workflow slot
+busy for the whole wait, and every waiting workflow polled GitHub on its own.
+
+CIWatcher keeps the set of commits workflows are waiting on and polls them
+from one background thread: every pending commit of a repository is checked
+with a single batched query per poll. A workflow registers its commit, gives
+its lane slot back while it waits (see LaneScheduler.released), and continues on
+its worker as soon as the watcher reports all checks completed. When a
+repository's checks can't be read for NETWORK_FAILURE_LIMIT polls in a row,
+its waiting workflows get the NetworkError instead of waiting out their
+timeout.
+"""
+
+import threading
+from collections import defaultdict
+from concurrent.futures import Future
+from contextlib import AbstractContextManager, nullcontext
+from typing import Any
+
+from src.interfaces import CheckRunResult
+from src.logger import get_logger
+from src.ticket_clients.base import NetworkError
+from src.utils.lane_scheduler import LaneScheduler
+
+logger = get_logger(__name__)
+
+# Seconds between polls of pending commits
+DEFAULT_POLL_INTERVAL = 15.0
+
+# Consecutive failed polls of a repository before its waiters get the error
+NETWORK_FAILURE_LIMIT = 3
+
+
+class CIWatcher:
+    """Batch-polls pending commits and resolves a future once their checks complete."""
+
+    def __init__(
+        self,
+        ticket_client: Any,
+        slots: LaneScheduler | None = None,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+    ) -> None:
+        """Initialize the watcher.
+
+        Args:
+            ticket_client: GitHub client providing get_check_runs_bulk()
+            slots: Lane scheduler whose slots waiting workflows release, if any
+            poll_interval: Seconds between polls of pending commits
+        """
+        self.ticket_client = ticket_client
+        self.slots = slots
+        self.poll_interval = poll_interval
+        self._lock = threading.Lock()
+        # (repo, sha) -> futures of the workflows waiting on that commit
+        self._waiters: dict[tuple[str, str], list[Future[list[CheckRunResult]]]] = {}
+        # (repo, sha) -> checks seen on the latest poll
+        self._latest: dict[tuple[str, str], list[CheckRunResult]] = {}
+        # repo -> consecutive polls that failed with a network error
+        self._network_failures: dict[str, int] = defaultdict(int)
+        self._wake = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def watch(self, repo: str, sha: str) -> "Future[list[CheckRunResult]]":
+        """Register a commit to wait on.
+
+        Args:
+            repo: Repository in 'hostname/owner/repo' format
+            sha: Commit SHA
+
+        Returns:
+            Future resolved with all check runs of the commit once every
+            check has completed
+        """
+        future: Future[list[CheckRunResult]] = Future()
+        with self._lock:
+            self._waiters.setdefault((repo, sha), []).append(future)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="ci-watcher", daemon=True)
+                self._thread.start()
+        # Poll right away: checks may have finished before the workflow asked
+        self._wake.set()
+        logger.debug(f"Watching CI for {repo}@{sha[:8]}")
+        return future
+
+    def cancel(
+        self, repo: str, sha: str, future: "Future[list[CheckRunResult]]"
+    ) -> list[CheckRunResult]:
+        """Stop waiting on a commit (e.g. after a timeout).
+
+        Args:
+            repo: Repository in 'hostname/owner/repo' format
+            sha: Commit SHA
+            future: Future returned by watch()
+
+        Returns:
+            Checks seen on the latest poll (empty if the commit was never polled)
+        """
+        key = (repo, sha)
+        with self._lock:
+            waiters = self._waiters.get(key, [])
+            if future in waiters:
+                waiters.remove(future)
+            if not waiters:
+                self._waiters.pop(key, None)
+            latest = self._latest.get(key, [])
+            if key not in self._waiters:
+                self._latest.pop(key, None)
+        future.cancel()
+        return latest
+
+    def suspended(self) -> AbstractContextManager[None]:
+        """Context manager that gives up the calling workflow's slot while waiting."""
+        if self.slots is None:
+            return nullcontext()
+        return self.slots.released()
+
+    def pending_count(self) -> int:
+        """Number of commits with at least one waiting workflow."""
+        with self._lock:
+            return len(self._waiters)
+
+    def stop(self) -> None:
+        """Stop the polling thread. Pending futures are cancelled."""
+        self._stopped.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+        with self._lock:
+            waiters = [f for futures in self._waiters.values() for f in futures]
+            self._waiters.clear()
+            self._latest.clear()
+        for future in waiters:
+            future.cancel()
+
+    def _run(self) -> None:
+        """Poll pending commits until stopped."""
+        while not self._stopped.is_set():
+            self._wake.wait(timeout=self.poll_interval)
+            self._wake.clear()
+            if self._stopped.is_set():
+                break
+            try:
+                self.poll_once()
+            except Exception as e:
+                logger.error(f"CI watcher poll failed: {e}", exc_info=True)
+
+    def poll_once(self) -> None:
+        """Query every pending commit, one request per repository, and resolve finished ones."""
+        with self._lock:
+            pending: dict[str, list[str]] = defaultdict(list)
+            for repo, sha in self._waiters:
+                pending[repo].append(sha)
+
+        for repo, shas in pending.items():
+            try:
+                results = self.ticket_client.get_check_runs_bulk(repo, shas)
+            except NetworkError as e:
+                self._network_failures[repo] += 1
+                if self._network_failures[repo] >= NETWORK_FAILURE_LIMIT:
+                    self._fail(repo, shas, e)
+                else:
+                    logger.warning(f"Network error checking CI for {repo}, retrying next poll: {e}")
+                continue
+
+            self._network_failures.pop(repo, None)
+            for sha, check_runs in results.items():
+                self._record(repo, sha, check_runs)
+
+    def _fail(self, repo: str, shas: list[str], error: NetworkError) -> None:
+        """Stop waiting on a repository's commits and hand its waiters the error."""
+        logger.error(
+            f"CI for {repo} unreachable for {NETWORK_FAILURE_LIMIT} polls, giving up: {error}"
+        )
+        self._network_failures.pop(repo, None)
+        with self._lock:
+            waiters = []
+            for sha in shas:
+                waiters.extend(self._waiters.pop((repo, sha), []))
+                self._latest.pop((repo, sha), None)
+        for future in waiters:
+            if future.set_running_or_notify_cancel():
+                future.set_exception(error)
+
+    def _record(self, repo: str, sha: str, check_runs: list[CheckRunResult]) -> None:
+        """Store a commit's checks and resolve its waiters if all have completed."""
+        key = (repo, sha)
+        with self._lock:
+            if key not in self._waiters:
+                return
+            self._latest[key] = check_runs
+            if not check_runs or not all(run.is_completed for run in check_runs):
+                return
+            waiters = self._waiters.pop(key)
+            self._latest.pop(key, None)
+
+        logger.debug(f"All {len(check_runs)} CI checks completed for {repo}@{sha[:8]}")
+        for future in waiters:
+            if future.set_running_or_notify_cancel():
+                future.set_result(check_runs)
@@ -3,17 +3,24 @@ Claude CLI wrapper module for running Claude commands with prompts.
 
 This module provides a simple interface to execute the Claude CLI with streaming
 JSON output and proper error handling.
+
+stdout and stderr are drained together through a selector, so the total and
+inactivity timeouts are enforced even while Claude prints nothing, and a full
+stderr pipe can never block the process.
 """
 
+import codecs
 import contextlib
 import json
 import os
 import re
+import selectors
 import subprocess
 import time
 from collections.abc import Callable
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Any
 
 from src.integrations.telemetry import LLMMetrics
 from src.logger import get_logger, log_message
@@ -74,6 +81,106 @@ class ClaudeTimeoutError(ClaudeRunnerError):
     pass
 
 
+# Bytes read from a pipe per ready event
+_READ_CHUNK_SIZE = 65536
+
+
+def _stream_process_output(
+    process: subprocess.Popen[str],
+    timeout: float,
+    inactivity_timeout: float,
+    on_line: Callable[[str], None],
+) -> str:
+    """Drain a process's stdout and stderr until both are closed.
+
+    Reads the raw pipe file descriptors as data arrives, so the deadlines are
+    checked even when the process produces no output. Complete stdout lines
+    are passed to on_line as they arrive; stderr is collected.
+
+    Args:
+        process: Running process with stdout and stderr pipes
+        timeout: Maximum total seconds to read for
+        inactivity_timeout: Maximum seconds without stdout output
+        on_line: Called with each complete stdout line (without newline)
+
+    Returns:
+        Everything the process wrote to stderr
+
+    Raises:
+        ClaudeTimeoutError: If a deadline passes
+    """
+    assert process.stdout is not None, "stdout should be available"
+    assert process.stderr is not None, "stderr should be available"
+
+    decoders = {
+        process.stdout: codecs.getincrementaldecoder("utf-8")(errors="replace"),
+        process.stderr: codecs.getincrementaldecoder("utf-8")(errors="replace"),
+    }
+    pending_line = ""
+    stderr_parts: list[str] = []
+
+    start_time = time.monotonic()
+    last_activity_time = start_time
+
+    with selectors.DefaultSelector() as selector:
+        selector.register(process.stdout, selectors.EVENT_READ)
+        selector.register(process.stderr, selectors.EVENT_READ)
+
+        while selector.get_map():
+            current_time = time.monotonic()
+
+            # Check total timeout
+            if current_time - start_time > timeout:
+                logger.error(f"Claude execution timed out after {timeout} seconds (total)")
+                raise ClaudeTimeoutError(
+                    f"Claude execution exceeded total timeout of {timeout} seconds"
+                )
+
+            # Check inactivity timeout
+            if current_time - last_activity_time > inactivity_timeout:
+                logger.error(
+                    f"Claude execution timed out after {inactivity_timeout} seconds of inactivity"
+                )
+                raise ClaudeTimeoutError(
+                    f"Claude execution exceeded inactivity timeout of {inactivity_timeout} seconds"
+                )
+
+            # Wait for output, but never past the nearest deadline
+            wait = min(
+                start_time + timeout - current_time,
+                last_activity_time + inactivity_timeout - current_time,
+            )
+            for key, _ in selector.select(timeout=max(wait, 0) + 0.01):
+                stream = key.fileobj
+                chunk = os.read(key.fd, _READ_CHUNK_SIZE)
+                final = not chunk
+                if final:
+                    selector.unregister(stream)
+                text = decoders[stream].decode(chunk, final=final)  # type: ignore[index]
+
+                if stream is process.stderr:
+                    stderr_parts.append(text)
+                    continue
+
+                if chunk:
+                    # Got output, reset inactivity timer
+                    last_activity_time = time.monotonic()
+                *lines, pending_line = (pending_line + text).split("\n")
+                if final and pending_line:
+                    lines.append(pending_line)
+                for line in lines:
+                    on_line(line)
+
+    return "".join(stderr_parts)
+
+
+def _kill(process: subprocess.Popen[str]) -> None:
+    """Kill a process and reap it."""
+    process.kill()
+    with contextlib.suppress(subprocess.TimeoutExpired):
+        process.wait(timeout=5)
+
+
 # Error patterns for user-friendly troubleshooting suggestions
 # Each tuple is (regex_pattern, suggestion_message)
 ERROR_PATTERNS = [
@@ -153,6 +260,7 @@ def run_claude(
     execution_stage: str | None = None,
     mcp_config_path: str | None = None,
     process_registrar: Callable[[subprocess.Popen[str]], None] | None = None,
+    on_event: Callable[[dict[str, Any]], None] | None = None,
 ) -> ClaudeResult:
     """
     Run the Claude CLI with a given prompt and return the response with metrics.
@@ -173,6 +281,8 @@ def run_claude(
         mcp_config_path: Path to MCP configuration file. If provided, adds --mcp-config flag.
         process_registrar: Optional callback invoked immediately after subprocess spawn.
             Called with the Popen object, enabling external tracking/termination.
+        on_event: Optional callback invoked with each parsed stream-json event as
+            it arrives, before the run completes.
 
     Returns:
         ClaudeResult containing response text and optional LLMMetrics
@@ -250,56 +360,26 @@ def run_claude(
         process.stdin.write(prompt)
         process.stdin.close()
 
-        # Track timeout
-        start_time = time.time()
-        last_activity_time = time.time()
-        response_parts = []
-        non_json_output = []  # Capture non-JSON output for error reporting
+        response_parts: list[str] = []
+        non_json_output: list[str] = []  # Capture non-JSON output for error reporting
         llm_metrics: LLMMetrics | None = None
 
-        # Read stdout line by line
-        logger.debug("Reading streaming JSON output")
-        assert process.stdout is not None, "stdout should be available"
-        while True:
-            current_time = time.time()
-
-            # Check total timeout
-            if current_time - start_time > timeout:
-                process.kill()
-                logger.error(f"Claude execution timed out after {timeout} seconds (total)")
-                raise ClaudeTimeoutError(
-                    f"Claude execution exceeded total timeout of {timeout} seconds"
-                )
-
-            # Check inactivity timeout
-            if current_time - last_activity_time > inactivity_timeout:
-                process.kill()
-                logger.error(
-                    f"Claude execution timed out after {inactivity_timeout} seconds of inactivity"
-                )
-                raise ClaudeTimeoutError(
-                    f"Claude execution exceeded inactivity timeout of {inactivity_timeout} seconds"
-                )
-
-            # Read a line from stdout
-            line = process.stdout.readline()
-
-            # If no more output and process has finished, break
-            if not line and process.poll() is not None:
-                break
+        def handle_line(line: str) -> None:
+            nonlocal llm_metrics
 
             # Skip empty lines
-            if not line or not line.strip():
-                continue
-
-            # Got output, reset inactivity timer
-            last_activity_time = time.time()
+            if not line.strip():
+                return
 
             # Parse JSON line
             try:
                 data = json.loads(line.strip())
                 logger.debug(f"Received JSON object: {data.get('type', 'unknown')}")
 
+                # Deliver the event to the caller as it arrives
+                if on_event is not None and isinstance(data, dict):
+                    on_event(data)
+
                 # Extract text from different event types
                 # Claude CLI stream-json format sends: system, assistant, result
                 if isinstance(data, dict):
@@ -357,25 +437,30 @@ def run_claude(
                 logger.warning(f"Failed to parse JSON line: {line[:100]}... Error: {e}")
                 non_json_output.append(line.strip())
                 # Continue processing, don't fail on partial JSON
-                continue
-
-        # Wait for process to complete
-        return_code = process.wait(timeout=5)
-
-        # Read stderr before closing (needed for error messages)
-        stderr_output = ""
-        if process.stderr:
-            with contextlib.suppress(Exception):
-                stderr_output = process.stderr.read()
 
-        # Explicitly close pipes to prevent FD leaks
+        # Drain stdout and stderr together, enforcing the timeouts
+        logger.debug("Reading streaming JSON output")
         try:
-            if process.stdout:
-                process.stdout.close()
-            if process.stderr:
-                process.stderr.close()
-        except Exception as e:
-            logger.warning(f"Error closing Claude process pipes: {e}")
+            stderr_output = _stream_process_output(
+                process, timeout, inactivity_timeout, handle_line
+            )
+
+            # Wait for process to complete
+            return_code = process.wait(timeout=5)
+        except BaseException:
+            # Don't leave a process behind on a timeout or a failure mid-stream
+            if process.poll() is None:
+                _kill(process)
+            raise
+        finally:
+            # Explicitly close pipes to prevent FD leaks
+            try:
+                if process.stdout:
+                    process.stdout.close()
+                if process.stderr:
+                    process.stderr.close()
+            except Exception as e:
+                logger.warning(f"Error closing Claude process pipes: {e}")
 
         # Check return code
         if return_code != 0:
@@ -16,7 +16,7 @@ import re
 import shutil
 import sys
 import zipfile
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -29,6 +29,9 @@ __version__ = "1.1.0"
 KILN_DIR = ".kiln"
 CONFIG_FILE = "config"
 
+# Finished days of workflow run totals shown by `kiln logs`
+SUMMARY_ROLLUP_DAYS = 30
+
 # ANSI escape codes for startup message colors
 RESET = "\033[0m"
 STARTUP_COLORS = {
@@ -380,6 +383,9 @@ def run_daemon(daemon_mode: bool = False) -> None:
             ghes_logs_mask=config.ghes_logs_mask,
             ghes_host=config.github_enterprise_host,
             org_name=org_name,
+            async_logging=config.log_async,
+            json_log_file=config.log_json_file or None,
+            log_queue_size=config.log_queue_size,
         )
 
         logger = get_logger(__name__)
@@ -838,8 +844,12 @@ def format_duration(start: datetime, end: datetime | None) -> str:
     """Format duration between two timestamps."""
     if end is None:
         return "running..."
-    delta = end - start
-    total_seconds = int(delta.total_seconds())
+    return format_seconds((end - start).total_seconds())
+
+
+def format_seconds(seconds: float) -> str:
+    """Format a number of seconds as a short duration (e.g. '4m 10s')."""
+    total_seconds = int(seconds)
     if total_seconds < 60:
         return f"{total_seconds}s"
     elif total_seconds < 3600:
@@ -973,6 +983,39 @@ def cmd_logs_summary(db: Database) -> None:
 
         print(f"{identifier:<25} {branch:<30} {pr_display:<30} {state}")
 
+    _print_run_rollups(db)
+
+
+def _print_run_rollups(db: Database) -> None:
+    """Print workflow run totals of the last SUMMARY_ROLLUP_DAYS finished days.
+
+    Reads the daily aggregates kept by run-history retention instead of
+    scanning run_history.
+
+    Args:
+        db: Database instance
+    """
+    since_day = (datetime.now() - timedelta(days=SUMMARY_ROLLUP_DAYS)).strftime("%Y-%m-%d")
+    # (workflow, outcome) -> [runs, total seconds, max seconds]
+    totals: dict[tuple[str, str], list[float]] = {}
+    for rollup in db.get_run_rollups(since_day=since_day):
+        entry = totals.setdefault((rollup.workflow, rollup.outcome), [0, 0.0, 0.0])
+        entry[0] += rollup.runs
+        entry[1] += rollup.total_duration_seconds
+        entry[2] = max(entry[2], rollup.max_duration_seconds)
+    if not totals:
+        return
+
+    print(f"\nWorkflow runs, last {SUMMARY_ROLLUP_DAYS} days (excluding today)")
+    print(f"{'Workflow':<12} {'Outcome':<12} {'Runs':>6} {'Avg':>10} {'Max':>10}")
+    print("-" * 54)
+    for (workflow, outcome), (runs, total, longest) in sorted(totals.items()):
+        average = format_seconds(total / runs) if runs else "-"
+        print(
+            f"{workflow:<12} {outcome:<12} {int(runs):>6} {average:>10} "
+            f"{format_seconds(longest):>10}"
+        )
+
 
 def cmd_logs(args: argparse.Namespace) -> None:
     """Handle the 'logs' subcommand."""
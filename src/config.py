@@ -13,7 +13,7 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from urllib.parse import urlparse
 
-from src.ticket_clients import GHES_VERSION_CLIENTS
+from src.workspace import CloneStrategy
 
 logger = logging.getLogger(__name__)
 
@@ -75,7 +75,10 @@ def _detect_ghes_version(hostname: str, token: str) -> str:
 
     version = f"{parts[0]}.{parts[1]}"
 
-    # Validate against supported versions
+    # Validate against supported versions. Imported here because the ticket
+    # clients pull in requests, which lightweight CLI commands never need.
+    from src.ticket_clients import GHES_VERSION_CLIENTS
+
     if version not in GHES_VERSION_CLIENTS:
         supported = ", ".join(sorted(GHES_VERSION_CLIENTS.keys()))
         raise ValueError(
@@ -113,7 +116,8 @@ class Config:
         database_path: Path to the SQLite database file
         workspace_dir: Directory for workspace files
         watched_statuses: List of project statuses to monitor for changes
-        max_concurrent_workflows: Maximum number of workflows to run in parallel
+        max_concurrent_workflows: Maximum number of workflows to run in parallel per
+            work lane, unless lane_concurrency sets the lane's cap
         prepare_pr_delay: Base delay in seconds before checking for PR after creation
     """
 
@@ -151,6 +155,25 @@ class Config:
         False  # When True, daemon fails to start if any MCP server is unreachable
     )
     prepare_pr_delay: int = 10  # Delay in seconds before checking for PR after creation
+    github_http_transport: bool = False  # Send `gh api` calls over pooled HTTP connections
+    board_fetch_concurrency_per_host: int = 4  # Concurrent project board fetches per hostname
+    github_response_cache_mb: int = 32  # Conditional-request cache size (0 disables)
+    github_response_cache_path: str = ""  # Optional file to persist the cache across restarts
+    rate_limit_budget: float = 0.8  # Fraction of each host's hourly rate limit kiln may spend
+    max_poll_interval: int = 600  # Upper bound when stretching the poll interval for rate limits
+    log_async: bool = False  # Format and write log records on a listener thread
+    log_json_file: str = ""  # Optional JSON-lines log for machine analysis
+    log_queue_size: int = 10000  # Records buffered in async logging mode
+    run_history_retention_days: int = 90  # Prune run history older than this (0 keeps all)
+    run_history_max_rows: int = 50000  # Cap on stored run history rows (0 for no cap)
+    worktree_pool_size: int = 2  # Pre-created worktrees kept per repo (0 disables the pool)
+    git_fetch_ttl: int = 30  # Seconds a repo's fetch is reused by other worktrees
+    # Partial/sparse/shallow clone settings per repository ('hostname/owner/repo')
+    clone_strategies: dict[str, CloneStrategy] = field(default_factory=dict)
+    wake_port: int = 0  # Localhost port accepting "item changed" hints (0 disables)
+    # Concurrency cap per work lane (see WORK_LANES); unlisted lanes use max_concurrent_workflows
+    lane_concurrency: dict[str, int] = field(default_factory=dict)
+    max_suspended_workflows: int = 8  # Workflows that can wait on CI beyond the lane caps
 
 
 def determine_workspace_dir() -> str:
@@ -202,6 +225,87 @@ def _validate_project_urls_host(
             )
 
 
+# Work lanes with separate concurrency caps: worktree preparation, Research and
+# Plan runs, Implement runs, and comment edits
+WORK_LANES = ("prepare", "research_plan", "implement", "comments")
+
+
+def parse_lane_concurrency(value: str) -> dict[str, int]:
+    """Parse the LANE_CONCURRENCY setting.
+
+    Entries are comma-separated '<lane>=<cap>' pairs, e.g.
+    "implement=2,comments=4". Lanes are listed in WORK_LANES.
+
+    Args:
+        value: Raw setting value
+
+    Returns:
+        Dictionary mapping lane name to its concurrency cap
+
+    Raises:
+        ValueError: If a lane is unknown or a cap is not a positive integer
+    """
+    caps: dict[str, int] = {}
+    for entry in value.split(","):
+        entry = entry.strip()
+        if not entry:
+            continue
+        lane, _, cap = entry.partition("=")
+        lane = lane.strip()
+        if lane not in WORK_LANES:
+            raise ValueError(
+                f"Invalid LANE_CONCURRENCY lane '{lane}'. Expected one of: {', '.join(WORK_LANES)}."
+            )
+        if not cap.strip().isdigit() or int(cap) < 1:
+            raise ValueError(f"LANE_CONCURRENCY cap for '{lane}' must be a positive integer")
+        caps[lane] = int(cap)
+    return caps
+
+
+def parse_clone_strategies(value: str) -> dict[str, CloneStrategy]:
+    """Parse the CLONE_STRATEGIES setting.
+
+    Entries are separated by ';'. Each entry is a repository in
+    'hostname/owner/repo' format followed by space-separated options:
+    'partial', 'sparse=<dir>,<dir>,...' and 'shallow-since=<date>', e.g.
+    "github.com/org/monorepo partial sparse=services/api,libs shallow-since=2024-01-01".
+
+    Args:
+        value: Raw setting value
+
+    Returns:
+        Dictionary mapping repository to its CloneStrategy
+
+    Raises:
+        ValueError: If an entry has no options or an option is unknown
+    """
+    strategies: dict[str, CloneStrategy] = {}
+    for entry in value.split(";"):
+        parts = entry.split()
+        if not parts:
+            continue
+        repo, options = parts[0], parts[1:]
+        if not options:
+            raise ValueError(f"CLONE_STRATEGIES entry for '{repo}' has no options")
+
+        strategy = CloneStrategy()
+        for option in options:
+            name, _, arg = option.partition("=")
+            if name == "partial" and not arg:
+                strategy.partial = True
+            elif name == "sparse" and arg:
+                strategy.sparse_paths = [p.strip("/") for p in arg.split(",") if p.strip("/")]
+            elif name == "shallow-since" and arg:
+                strategy.shallow_since = arg
+            else:
+                raise ValueError(
+                    f"Invalid CLONE_STRATEGIES option '{option}' for '{repo}'. "
+                    "Expected 'partial', 'sparse=<dirs>' or 'shallow-since=<date>'."
+                )
+        strategies[repo] = strategy
+    return strategies
+
+
 def parse_config_file(config_path: Path) -> dict[str, str]:
     """Parse a KEY=value config file.
 
@@ -414,6 +518,35 @@ def load_config_from_file(config_path: Path) -> Config:
     # PR creation retry delay
     prepare_pr_delay = int(data.get("PREPARE_PR_DELAY", "10"))
 
+    # In-process pooled HTTP transport for GitHub API calls
+    github_http_transport = data.get("GITHUB_HTTP_TRANSPORT", "false").lower() == "true"
+
+    # Concurrent project board fetches per GitHub hostname
+    board_fetch_concurrency_per_host = int(data.get("BOARD_FETCH_CONCURRENCY_PER_HOST", "4"))
+
+    # ETag cache for REST GETs sent over the HTTP transport
+    github_response_cache_mb = int(data.get("GITHUB_RESPONSE_CACHE_MB", "32"))
+    github_response_cache_path = data.get("GITHUB_RESPONSE_CACHE_PATH", "")
+
+    # Rate-limit budgeting (adaptive poll interval)
+    rate_limit_budget = float(data.get("RATE_LIMIT_BUDGET", "0.8"))
+    max_poll_interval = int(data.get("MAX_POLL_INTERVAL", "600"))
+
+    # Async logging pipeline and structured log output
+    log_async = data.get("LOG_ASYNC", "false").lower() == "true"
+    log_json_file = data.get("LOG_JSON_FILE", "")
+    log_queue_size = int(data.get("LOG_QUEUE_SIZE", "10000"))
+
+    # Run history retention (older runs survive as daily rollups)
+    run_history_retention_days = int(data.get("RUN_HISTORY_RETENTION_DAYS", "90"))
+    run_history_max_rows = int(data.get("RUN_HISTORY_MAX_ROWS", "50000"))
+    worktree_pool_size = int(data.get("WORKTREE_POOL_SIZE", "2"))
+    git_fetch_ttl = int(data.get("GIT_FETCH_TTL", "30"))
+    clone_strategies = parse_clone_strategies(data.get("CLONE_STRATEGIES", ""))
+    wake_port = int(data.get("WAKE_PORT", "0"))
+    lane_concurrency = parse_lane_concurrency(data.get("LANE_CONCURRENCY", ""))
+    max_suspended_workflows = int(data.get("MAX_SUSPENDED_WORKFLOWS", "8"))
+
     return Config(
         github_token=github_token,
         github_enterprise_host=github_enterprise_host,
@@ -444,6 +577,23 @@ def load_config_from_file(config_path: Path) -> Config:
         azure_scope=azure_scope,
         mcp_fail_on_error=mcp_fail_on_error,
         prepare_pr_delay=prepare_pr_delay,
+        github_http_transport=github_http_transport,
+        board_fetch_concurrency_per_host=board_fetch_concurrency_per_host,
+        github_response_cache_mb=github_response_cache_mb,
+        github_response_cache_path=github_response_cache_path,
+        rate_limit_budget=rate_limit_budget,
+        max_poll_interval=max_poll_interval,
+        log_async=log_async,
+        log_json_file=log_json_file,
+        log_queue_size=log_queue_size,
+        run_history_retention_days=run_history_retention_days,
+        run_history_max_rows=run_history_max_rows,
+        worktree_pool_size=worktree_pool_size,
+        git_fetch_ttl=git_fetch_ttl,
+        clone_strategies=clone_strategies,
+        wake_port=wake_port,
+        lane_concurrency=lane_concurrency,
+        max_suspended_workflows=max_suspended_workflows,
     )
 
 
@@ -612,6 +762,35 @@ def load_config_from_env() -> Config:
     # PR creation retry delay
     prepare_pr_delay = int(os.environ.get("PREPARE_PR_DELAY", "10"))
 
+    # In-process pooled HTTP transport for GitHub API calls
+    github_http_transport = os.environ.get("GITHUB_HTTP_TRANSPORT", "false").lower() == "true"
+
+    # Concurrent project board fetches per GitHub hostname
+    board_fetch_concurrency_per_host = int(os.environ.get("BOARD_FETCH_CONCURRENCY_PER_HOST", "4"))
+
+    # ETag cache for REST GETs sent over the HTTP transport
+    github_response_cache_mb = int(os.environ.get("GITHUB_RESPONSE_CACHE_MB", "32"))
+    github_response_cache_path = os.environ.get("GITHUB_RESPONSE_CACHE_PATH", "")
+
+    # Rate-limit budgeting (adaptive poll interval)
+    rate_limit_budget = float(os.environ.get("RATE_LIMIT_BUDGET", "0.8"))
+    max_poll_interval = int(os.environ.get("MAX_POLL_INTERVAL", "600"))
+
+    # Async logging pipeline and structured log output
+    log_async = os.environ.get("LOG_ASYNC", "false").lower() == "true"
+    log_json_file = os.environ.get("LOG_JSON_FILE", "")
+    log_queue_size = int(os.environ.get("LOG_QUEUE_SIZE", "10000"))
+
+    # Run history retention (older runs survive as daily rollups)
+    run_history_retention_days = int(os.environ.get("RUN_HISTORY_RETENTION_DAYS", "90"))
+    run_history_max_rows = int(os.environ.get("RUN_HISTORY_MAX_ROWS", "50000"))
+    worktree_pool_size = int(os.environ.get("WORKTREE_POOL_SIZE", "2"))
+    git_fetch_ttl = int(os.environ.get("GIT_FETCH_TTL", "30"))
+    clone_strategies = parse_clone_strategies(os.environ.get("CLONE_STRATEGIES", ""))
+    wake_port = int(os.environ.get("WAKE_PORT", "0"))
+    lane_concurrency = parse_lane_concurrency(os.environ.get("LANE_CONCURRENCY", ""))
+    max_suspended_workflows = int(os.environ.get("MAX_SUSPENDED_WORKFLOWS", "8"))
+
     return Config(
         github_token=github_token,
         github_enterprise_host=github_enterprise_host,
@@ -642,6 +821,23 @@ def load_config_from_env() -> Config:
         azure_scope=azure_scope,
         mcp_fail_on_error=mcp_fail_on_error,
         prepare_pr_delay=prepare_pr_delay,
+        github_http_transport=github_http_transport,
+        board_fetch_concurrency_per_host=board_fetch_concurrency_per_host,
+        github_response_cache_mb=github_response_cache_mb,
+        github_response_cache_path=github_response_cache_path,
+        rate_limit_budget=rate_limit_budget,
+        max_poll_interval=max_poll_interval,
+        log_async=log_async,
+        log_json_file=log_json_file,
+        log_queue_size=log_queue_size,
+        run_history_retention_days=run_history_retention_days,
+        run_history_max_rows=run_history_max_rows,
+        worktree_pool_size=worktree_pool_size,
+        git_fetch_ttl=git_fetch_ttl,
+        clone_strategies=clone_strategies,
+        wake_port=wake_port,
+        lane_concurrency=lane_concurrency,
+        max_suspended_workflows=max_suspended_workflows,
     )
 
 
@@ -15,21 +15,22 @@ import subprocess
 import sys
 import threading
 import time
-from concurrent.futures import Future, ThreadPoolExecutor
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from datetime import datetime
 from pathlib import Path
 from typing import Any, TypedDict
 
-from tenacity import wait_exponential
-
+from src.board_snapshot import BoardSnapshot
+from src.ci_watcher import CIWatcher
 from src.claude_runner import run_claude
 from src.comment_processor import CommentProcessor
-from src.config import STAGE_MODELS, Config, load_config
-from src.database import Database, ProjectMetadata, RunRecord
+from src.config import STAGE_MODELS, WORK_LANES, Config, load_config
+from src.database import Database, MergeQueueEntry, ProjectMetadata, RunRecord
 from src.frontmatter import parse_issue_frontmatter
 from src.integrations.auto_merging import AutoMergingEntry, AutoMergingManager
 from src.integrations.azure_oauth import AzureOAuthClient
-from src.integrations.mcp_client import check_all_mcp_servers
 from src.integrations.mcp_config import MCPConfigManager
 from src.integrations.pr_validation import PRValidationManager
 from src.integrations.repo_credentials import RepoCredentialsManager
@@ -43,23 +44,39 @@ from src.integrations.telemetry import (
     get_git_version,
     get_tracer,
     init_telemetry,
+    record_lane_utilization,
+    record_lane_wait,
     record_llm_metrics,
+    record_queue_depth,
 )
-from src.interfaces import TicketItem
+from src.interfaces import PullRequestSnapshot, TicketItem
 from src.labels import REQUIRED_LABELS, Labels
 from src.logger import (
     MaskingFilter,
     RunLogger,
     _extract_org_from_url,
     clear_issue_context,
+    get_log_queue_stats,
     get_logger,
     log_message,
     set_issue_context,
     setup_logging,
 )
+from src.merge_train import MergeTrain, evaluate_merge_train, plan_probes
 from src.security import ActorCategory, check_actor_allowed
-from src.ticket_clients import get_github_client
+from src.ticket_clients import (
+    HTTPTransport,
+    NetworkError,
+    RateLimitBudget,
+    RateLimitTracker,
+    ResponseCache,
+    get_github_client,
+)
+from src.utils.coalescing_jobs import CoalescingJobs
 from src.utils.gh import get_gh_env
+from src.utils.keyed_executor import KeyedExecutor
+from src.utils.lane_scheduler import LaneScheduler
+from src.wake_channel import WakeChannel
 from src.workflows import (
     ImplementWorkflow,
     PlanWorkflow,
@@ -69,7 +86,9 @@ from src.workflows import (
     WorkflowContext,
 )
 from src.workflows.implement import ImplementationIncompleteError
-from src.workspace import WorkspaceError, WorkspaceManager
+from src.workflows.prepare import parse_repo
+from src.workspace import WorkspaceError, WorkspaceManager, issue_branch_name
+from src.worktree_gc import WorktreeCollector
 
 logger = get_logger(__name__)
 
@@ -229,8 +248,20 @@ class Daemon:
     # Hibernation interval in seconds (5 minutes)
     HIBERNATION_INTERVAL = 300
 
+    # Worker threads for poll side effects (label, status and archive writes)
+    POLL_IO_WORKERS = 8
+
+    # Worker threads for concurrent project board fetches (across all hosts)
+    BOARD_FETCH_WORKERS = 8
+
+    # Seconds between database retention passes (rollups, pruning, vacuum)
+    RETENTION_INTERVAL = 24 * 3600
+
+    # Seconds between queue metrics log lines (metrics are recorded every poll)
+    QUEUE_METRICS_LOG_INTERVAL = 300
+
     # Map status names to workflow classes
-    # Note: PrepareWorkflow runs automatically before other workflows if no worktree exists
+    # Note: worktrees are created automatically before other workflows if missing
     WORKFLOW_MAP: dict[str, type[Workflow]] = {
         "Research": ResearchWorkflow,
         "Plan": PlanWorkflow,
@@ -289,6 +320,9 @@ class Daemon:
         self._shutdown_requested = False
         self._shutdown_event = threading.Event()  # For efficient interruptible sleeps
         self._hibernating = False  # Hibernation mode for network failures
+        self._last_retention_at = 0.0  # time.monotonic() of the last retention pass
+        self._last_queue_metrics_log_at = 0.0  # time.monotonic() of the last metrics line
+        self._log_records_dropped = 0  # Async logging drops as of the last metrics line
 
         # Track in-progress workflows to prevent duplicates
         # Maps "repo#issue_number" -> start timestamp
@@ -308,37 +342,98 @@ class Daemon:
         # Track repos that have had labels initialized
         self._repos_with_labels: set[str] = set()
 
-        # Thread pool for parallel workflow execution
-        self.executor = ThreadPoolExecutor(
-            max_workers=config.max_concurrent_workflows, thread_name_prefix="workflow-"
+        # Workflow threads, with a separately capped and prioritized lane per kind of
+        # work. The extra threads serve workflows suspended on CI, which give their
+        # lane slot back while waiting.
+        lane_caps = dict.fromkeys(WORK_LANES, config.max_concurrent_workflows)
+        lane_caps.update(config.lane_concurrency)
+        self.lanes = LaneScheduler(
+            lane_caps,
+            max_workers=sum(lane_caps.values()) + config.max_suspended_workflows,
+            thread_name_prefix="workflow-",
+            on_wait=record_lane_wait,
         )
-        logger.debug(
-            f"ThreadPoolExecutor initialized with {config.max_concurrent_workflows} workers"
+        logger.debug(f"Workflow lanes initialized: {lane_caps}")
+
+        # Bounded pool for poll side effects (label/status/archive writes), ordered per item
+        self._io_executor = KeyedExecutor(
+            max_workers=self.POLL_IO_WORKERS, thread_name_prefix="poll-io-"
+        )
+        self._poll_io_futures: dict[Future[Any], TicketItem] = {}
+
+        # Pool for concurrent project board fetches (capped per host in _fetch_board_items)
+        self._board_fetch_executor = ThreadPoolExecutor(
+            max_workers=self.BOARD_FETCH_WORKERS, thread_name_prefix="board-fetch-"
         )
 
         # Initialize components
         self.database = Database(config.database_path)
         logger.debug(f"Database initialized at {config.database_path}")
 
+        # Per-item fingerprints so each poll only handles items that changed
+        self.board_snapshot = BoardSnapshot(self.database)
+
+        # Optional local endpoint for "item changed" hints between polls (started in run())
+        self.wake_channel: WakeChannel | None = None
+        if config.wake_port:
+            self.wake_channel = WakeChannel(config.wake_port)
+
         tokens: dict[str, str] = {}
         if config.github_enterprise_host and config.github_enterprise_token:
             tokens[config.github_enterprise_host] = config.github_enterprise_token
         elif config.github_token:
             tokens["github.com"] = config.github_token
 
+        # Optional pooled HTTP transport replaces per-call gh subprocesses for API calls
+        self.http_transport: HTTPTransport | None = None
+        if config.github_http_transport:
+            response_cache = None
+            if config.github_response_cache_mb > 0:
+                response_cache = ResponseCache(
+                    max_bytes=config.github_response_cache_mb * 1024 * 1024,
+                    path=config.github_response_cache_path or None,
+                )
+            self.http_transport = HTTPTransport(cache=response_cache)
+            logger.info("GitHub API calls will use pooled HTTP connections")
+
+        # Rate-limit state shared by every API call, used to pace polls and defer work
+        self.rate_limits = RateLimitTracker()
+        self.rate_budget = RateLimitBudget(
+            self.rate_limits,
+            budget_fraction=config.rate_limit_budget,
+            max_interval=config.max_poll_interval,
+        )
+
         # Create the appropriate GitHub client based on version
         self.ticket_client = get_github_client(
             tokens=tokens,
             enterprise_version=config.github_enterprise_version,
+            http_transport=self.http_transport,
+            rate_limits=self.rate_limits,
         )
         logger.info(f"Ticket client initialized: {self.ticket_client.client_description}")
 
+        # Shared CI watcher: batch-polls commits that Implement workflows wait on
+        self.ci_watcher = CIWatcher(self.ticket_client, slots=self.lanes)
+
         # Log feature availability for the selected client
         self._log_client_features()
 
-        self.workspace_manager = WorkspaceManager(config.workspace_dir)
+        self.workspace_manager = WorkspaceManager(
+            config.workspace_dir,
+            pool_size=config.worktree_pool_size,
+            fetch_ttl=config.git_fetch_ttl,
+            clone_strategies=config.clone_strategies,
+        )
         logger.debug(f"Workspace manager initialized with dir: {config.workspace_dir}")
 
+        # Removes worktrees of finished issues in batches, off the poll loop
+        self.worktree_gc = WorktreeCollector(
+            self.workspace_manager,
+            on_collected=self._mark_cleaned_up,
+            in_use=self._workflow_in_progress,
+        )
+
         self.runner = WorkflowRunner(config, version=version, daemon=self)
 
         self.comment_processor = CommentProcessor(
@@ -353,6 +448,14 @@ class Daemon:
             workspace_manager=self.workspace_manager,
         )
 
+        # Per-issue comment jobs; comments arriving mid-run queue a single re-run
+        self.comment_jobs = CoalescingJobs(
+            self._process_comments,
+            lambda job, item: self._submit_workflow(job, item, lane="comments"),
+            key=lambda item: f"{item.repo}#{item.ticket_id}",
+            still_needed=self._might_have_new_comments,
+        )
+
         # Initialize Azure OAuth client if configured
         self.azure_oauth_client: AzureOAuthClient | None = None
         if (
@@ -392,6 +495,13 @@ class Daemon:
         self.auto_merging_manager = AutoMergingManager()
         self._validate_auto_merging_config()
 
+        # Speculative merge queue state per repo (rebuilt after a restart):
+        # the train under test, PR -> HEAD SHA of PRs that failed in a train
+        # (skipped until they change), and the size of the next bisect train
+        self._merge_trains: dict[str, MergeTrain] = {}
+        self._merge_train_rejects: dict[str, dict[int, str]] = {}
+        self._merge_train_limits: dict[str, int] = {}
+
         # Setup signal handlers for graceful shutdown
         signal.signal(signal.SIGINT, self._signal_handler)
         signal.signal(signal.SIGTERM, self._signal_handler)
@@ -570,6 +680,9 @@ class Daemon:
 
         logger.info(f"Validating MCP connections ({len(mcp_servers)} server(s))...")
 
+        # Import here: the mcp SDK is slow to import and only needed with servers
+        from src.integrations.mcp_client import check_all_mcp_servers
+
         # Test MCP server connectivity and list tools
         results = asyncio.run(check_all_mcp_servers(mcp_servers))
         failed_servers = []
@@ -617,6 +730,8 @@ class Daemon:
 
         logger.debug(f"Checking MCP health before workflow ({len(mcp_servers)} server(s))...")
 
+        from src.integrations.mcp_client import check_all_mcp_servers
+
         results = asyncio.run(check_all_mcp_servers(mcp_servers))
         failed = [r for r in results if not r.success]
 
@@ -727,6 +842,8 @@ class Daemon:
         logger.info(f"Received {signal_name}, initiating graceful shutdown...")
         self._shutdown_requested = True
         self._shutdown_event.set()  # Wake up any waiting sleeps
+        if self.wake_channel is not None:
+            self.wake_channel.interrupt()
 
     def _enter_hibernation(self, reason: str) -> None:
         """Enter hibernation mode due to network connectivity issues.
@@ -814,6 +931,8 @@ class Daemon:
         Uses tenacity's wait_exponential for calculating backoff times on non-network
         failures.
         """
+        from tenacity import wait_exponential
+
         # Import here to avoid circular imports
         from src.ticket_clients.base import NetworkError
 
@@ -833,9 +952,15 @@ class Daemon:
         # Clean up any stale eyes reactions from previous crashes
         self._cleanup_stale_processing_comments()
 
+        # One-time full VACUUM of older databases, before any work is scheduled
+        self._enable_incremental_vacuum()
+
         self._running = True
         consecutive_failures = 0
 
+        if self.wake_channel is not None:
+            self.wake_channel.start()
+
         try:
             while self._running and not self._shutdown_requested:
                 # HEALTH CHECK: Validate GitHub API connectivity before polling
@@ -865,6 +990,8 @@ class Daemon:
                 try:
                     self._poll()
                     consecutive_failures = 0  # Reset on success
+                    self._maybe_apply_retention()
+                    self._report_queue_metrics()
                 except NetworkError as e:
                     # Network error during poll - will trigger hibernation on next loop
                     logger.warning(f"Network error during poll: {e}")
@@ -886,8 +1013,9 @@ class Daemon:
                         break  # Shutdown requested during backoff
                     continue  # Skip the normal poll interval sleep
 
-                # Sleep between polls (interruptible via shutdown event)
-                if self._shutdown_event.wait(timeout=self.config.poll_interval):
+                # Sleep between polls (interruptible via shutdown event), stretched
+                # when the rate-limit budget would run out before it resets
+                if self._wait_for_next_poll(self._next_poll_interval()):
                     break  # Shutdown requested during poll interval
 
         except KeyboardInterrupt:
@@ -900,16 +1028,29 @@ class Daemon:
         logger.debug("Stopping daemon")
         self._running = False
 
+        if self.wake_channel is not None:
+            self.wake_channel.stop()
+
         # Clean up running workflow labels before executor shutdown
         self._cleanup_running_labels()
 
-        # Shutdown executor and wait for running workflows
+        # Shut down the workflow lanes and wait for queued and running workflows
         try:
-            logger.debug("Shutting down thread pool executor...")
-            self.executor.shutdown(wait=True, cancel_futures=False)
-            logger.debug("Thread pool executor shut down")
+            logger.debug("Shutting down workflow lanes...")
+            self.lanes.shutdown()
+            logger.debug("Workflow lanes shut down")
         except Exception as e:
-            logger.error(f"Error shutting down executor: {e}")
+            logger.error(f"Error shutting down workflow lanes: {e}")
+
+        # Stop the CI watcher after workflows waiting on it have finished
+        self.ci_watcher.stop()
+
+        # Finish the current worktree cleanup batch (the rest is requeued after restart)
+        self.worktree_gc.stop()
+
+        # Finish pending poll side effects
+        self._io_executor.shutdown(wait=True)
+        self._board_fetch_executor.shutdown(wait=True)
 
         # Close database connection
         try:
@@ -918,6 +1059,11 @@ class Daemon:
         except Exception as e:
             logger.error(f"Error closing database: {e}")
 
+        # Close pooled HTTP connections
+        if self.http_transport is not None:
+            self.http_transport.close()
+            logger.debug("HTTP transport closed")
+
         logger.debug("Daemon stopped")
 
     def _cleanup_stale_processing_comments(self) -> None:
@@ -954,6 +1100,84 @@ class Daemon:
                 except Exception:
                     pass
 
+    def _enable_incremental_vacuum(self) -> None:
+        """Convert the database to incremental auto_vacuum if it predates it.
+
+        Retention passes only run bounded incremental vacuums, so the full
+        VACUUM needed for the conversion runs here, at startup. Errors are
+        logged; retention then simply doesn't shrink the file.
+        """
+        try:
+            if self.database.enable_incremental_vacuum():
+                logger.info("Converted database to incremental auto_vacuum")
+        except Exception as e:
+            logger.warning(f"Could not convert database to incremental auto_vacuum: {e}")
+
+    def _maybe_apply_retention(self) -> None:
+        """Apply run-history retention once every RETENTION_INTERVAL seconds.
+
+        Rolls finished days up into daily aggregates, prunes run history past
+        config.run_history_retention_days / run_history_max_rows and reclaims
+        free pages. Errors are logged and retried on the next interval.
+        """
+        now = time.monotonic()
+        if self._last_retention_at and now - self._last_retention_at < self.RETENTION_INTERVAL:
+            return
+        self._last_retention_at = now
+
+        try:
+            result = self.database.apply_retention(
+                self.config.run_history_retention_days, self.config.run_history_max_rows
+            )
+        except Exception as e:
+            logger.warning(f"Run history retention failed: {e}")
+            return
+        if result.rolled_up_days or result.deleted_runs or result.deleted_processing_comments:
+            logger.info(
+                f"Run history retention: rolled up {result.rolled_up_days} day(s), "
+                f"deleted {result.deleted_runs} run(s) and "
+                f"{result.deleted_processing_comments} stale processing comment(s)"
+            )
+
+    def _report_queue_metrics(self) -> None:
+        """Record work queue depths, logging them every QUEUE_METRICS_LOG_INTERVAL seconds.
+
+        Lane utilization and queue wait times cover the time since the last log line.
+        The async logging queue is included when async logging is enabled.
+        """
+        comments = self.comment_jobs.stats()
+        record_queue_depth("comments", comments.depth)
+        for lane, stats in self.lanes.stats().items():
+            record_queue_depth(f"lane.{lane}", stats.queued)
+        log_queue = get_log_queue_stats()
+        if log_queue is not None:
+            record_queue_depth("log", log_queue.queued)
+
+        now = time.monotonic()
+        if now - self._last_queue_metrics_log_at < self.QUEUE_METRICS_LOG_INTERVAL:
+            return
+        self._last_queue_metrics_log_at = now
+        logger.info(
+            f"Comment jobs: {comments.queued} queued, {comments.running} running, "
+            f"{comments.rerun_pending} re-run pending, {comments.coalesced} coalesced"
+        )
+        for lane, stats in self.lanes.stats(reset=True).items():
+            record_lane_utilization(lane, stats.utilization)
+            logger.info(
+                f"Lane {lane}: {stats.running}/{stats.cap} running, {stats.queued} queued, "
+                f"{stats.suspended} suspended, {stats.utilization:.0%} utilized, "
+                f"wait {stats.mean_wait:.1f}s mean / {stats.max_wait:.1f}s max "
+                f"over {stats.started} started"
+            )
+        if log_queue is not None:
+            dropped = log_queue.dropped_records - self._log_records_dropped
+            self._log_records_dropped = log_queue.dropped_records
+            log = logger.warning if dropped else logger.info
+            log(
+                f"Log queue: {log_queue.queued}/{log_queue.capacity} queued, "
+                f"{log_queue.max_depth} max depth, {dropped} record(s) dropped since last report"
+            )
+
     def _cleanup_running_labels(self) -> None:
         """Remove running workflow labels from issues on graceful shutdown.
 
@@ -1068,125 +1292,471 @@ class Daemon:
                     f"Stale workflow detected: {key} started {now - started_at:.0f}s ago - removing from tracking"
                 )
                 self._in_progress.pop(key, None)
-
-        all_items: list[TicketItem] = []
+                repo, _, issue_number = key.rpartition("#")
+                self.board_snapshot.mark_dirty(repo, int(issue_number))
 
         try:
             # Fetch items from all configured projects
-            for project_url in self.config.project_urls:
-                try:
-                    items = self.ticket_client.get_board_items(project_url)
-                    logger.debug(f"Fetched {len(items)} items from {project_url}")
-                    all_items.extend(items)
-                except Exception as e:
-                    logger.error(f"Failed to fetch from {project_url}: {e}")
-                    continue
+            all_items = self._fetch_board_items()
 
             logger.debug(f"Total items from all projects: {len(all_items)}")
 
-            # Check for Done items needing cleanup
-            for item in all_items:
-                if item.status == "Done":
-                    self._maybe_cleanup(item)
+            self._process_board_items(all_items)
 
-            # Auto-archive issues closed without completion (won't do, duplicate, manual)
-            for item in all_items:
-                self._maybe_archive_closed(item)
+            logger.debug("Poll cycle completed")
 
-            # Clean up worktrees for all closed issues
-            for item in all_items:
-                self._maybe_cleanup_closed(item)
+        except Exception as e:
+            logger.error(f"Error fetching project items: {e}", exc_info=True)
+            raise
 
-            # Move Validate issues with merged PR to Done
-            for item in all_items:
-                self._maybe_move_to_done(item)
+    def _process_board_items(self, all_items: list[TicketItem], partial: bool = False) -> None:
+        """Run the handlers and dispatch workflows for fetched board items.
 
-            # Set issues without status to Backlog
-            for item in all_items:
-                self._maybe_set_backlog(item)
+        Args:
+            all_items: Items fetched from the boards
+            partial: Whether all_items is a targeted refresh of a few items
+                rather than every item on the boards (see _refresh_items)
+        """
+        # Load the stored state of every item with one query per repository;
+        # comment checks and workflow starts this cycle read from the cache
+        self.database.cache_issue_states((item.repo, item.ticket_id) for item in all_items)
+
+        # Only items that changed since the last poll (or were marked dirty)
+        # go through the handlers; unchanged items would get the same result
+        change_set = self.board_snapshot.diff(all_items, partial=partial)
+        items = change_set.items_to_process
+
+        # Process user comments on issues in Backlog, Research, or Plan status.
+        # Checked for every item: the comment count comparison is local-only and
+        # picks up retries after a failed comment run.
+        # At most one job per issue: submissions while one is queued or running coalesce.
+        for item in all_items:
+            if self._might_have_new_comments(item):
+                self.comment_jobs.submit(item)
+
+        # Single pass over changed items. Handlers that only act on cached item
+        # data run on the I/O pool (in order per item, concurrently across items);
+        # handlers that need fresh lookups or in-memory workflow state run here.
+        # Their per-issue lookups are served from aliased batch queries.
+        # Low-priority handlers are deferred for hosts whose rate-limit budget is low.
+        self._poll_io_futures = {}
+        items_to_process: list[TicketItem] = []
+        low_budget_hosts = {
+            hostname
+            for hostname in {item.repo.split("/")[0] for item in items}
+            if self.rate_budget.is_low(hostname)
+        }
+        if low_budget_hosts:
+            logger.info(
+                f"Rate-limit budget low on {', '.join(sorted(low_budget_hosts))}, "
+                f"deferring archive and cleanup"
+            )
+        lookup_candidates = self._batch_lookup_candidates(items)
+        with self.ticket_client.issue_lookup_batch(lookup_candidates):
+            for item in items:
+                low_budget = item.repo.split("/")[0] in low_budget_hosts
+                if low_budget:
+                    # Re-evaluate once the budget recovers
+                    self.board_snapshot.mark_dirty(item.repo, item.ticket_id)
+                handlers = self._io_handlers(include_low_priority=not low_budget)
+                io_future = self._submit_item_io(item, self._run_item_handlers, item, handlers)
+                if Labels.RESET in item.labels or Labels.STOP in item.labels:
+                    # Reset and stop change the item from this thread; let its
+                    # queued side effects (e.g. worktree cleanup) finish first.
+                    # Failures are reported by _wait_for_item_io.
+                    wait([io_future])
+                self._run_item_handlers(item, self._poll_thread_handlers())
 
-            # Process user comments on issues in Backlog, Research, or Plan status
-            for item in all_items:
-                if self._might_have_new_comments(item):
-                    self.executor.submit(self.comment_processor.process, item)
+                if self._should_trigger_workflow(item):
+                    items_to_process.append(item)
+                elif self._should_yolo_advance(item):
+                    # Issue has yolo but isn't eligible for workflow (likely already complete)
+                    # Advance to next status
+                    self._yolo_advance(item)
 
-            # YOLO: Move Backlog issues with yolo/auto label to Research
-            for item in all_items:
-                # Fast path: if not in cached labels, definitely not present
-                if not self._has_any_yolo_label(item.labels):
-                    continue
-                if item.status != "Backlog" or item.state == "CLOSED":
-                    continue
+        # Process Dependabot auto-merge queue (on full polls only)
+        if not partial:
+            self._poll_merge_queue()
 
-                key = f"{item.repo}#{item.ticket_id}"
+        self.board_snapshot.commit(change_set)
 
-                # Fresh check: verify yolo/auto label is still present (may have been removed since poll started)
-                if not self._has_yolo_label(item.repo, item.ticket_id):
-                    logger.debug(
-                        f"YOLO: Skipping Backlog→Research for {key} - yolo/auto label was removed"
-                    )
-                    continue
+        if items_to_process:
+            self._dispatch_workflows(items_to_process)
+        else:
+            logger.debug("No workflows to trigger")
+
+        # Wait for this poll's side effects so the next poll sees their results
+        self._wait_for_item_io()
+
+    def _wait_for_next_poll(self, timeout: float) -> bool:
+        """Sleep until the next poll, refreshing items named by wake hints meanwhile.
+
+        Without a wake channel this is a plain interruptible sleep. With one,
+        each hint refreshes just the named items and the sleep continues; the
+        full poll still runs when the interval is up.
+
+        Args:
+            timeout: Seconds until the next poll
+
+        Returns:
+            True if shutdown was requested
+        """
+        if self.wake_channel is None:
+            return self._shutdown_event.wait(timeout=timeout)
+
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            woken = self.wake_channel.wait(remaining)
+            if self._shutdown_event.is_set():
+                return True
+            if not woken:
+                return False
+
+            hints = self.wake_channel.drain()
+            if hints.full:
+                logger.info("Wake hint requested a full poll")
+                return False
+            if hints.items:
+                self._refresh_items(hints.items)
+
+    def _refresh_items(self, issues: set[tuple[str, int]]) -> None:
+        """Fetch and handle only the given issues' board items.
+
+        Failures are logged and the issues marked dirty, so the next full poll
+        handles them.
+
+        Args:
+            issues: (repo, issue number) pairs reported as changed
+        """
+        logger.info(f"Wake hint: refreshing {len(issues)} item(s)")
+        try:
+            items = self.ticket_client.get_board_items_for_issues(
+                list(self.config.project_urls), sorted(issues)
+            )
+            self._process_board_items(items, partial=True)
+        except Exception as e:
+            logger.warning(f"Targeted refresh failed, leaving it to the next poll: {e}")
+            for repo, issue_number in issues:
+                self.board_snapshot.mark_dirty(repo, issue_number)
+
+    def _next_poll_interval(self) -> float:
+        """Account for the finished poll cycle's API cost and pick the next wait.
+
+        In gh CLI mode the rate-limit state is read from the (free) rate_limit
+        endpoint; with the HTTP transport it is kept current from response headers.
+
+        Returns:
+            Seconds to wait before the next poll (config.poll_interval unless
+            the rate-limit budget requires a longer wait)
+        """
+        if self.http_transport is None:
+            for hostname in sorted(self._project_hostnames()):
+                self.ticket_client.refresh_rate_limits(hostname)
+        self.rate_budget.end_cycle()
+
+        interval = self.rate_budget.next_interval(self.config.poll_interval)
+        if interval != self.config.poll_interval:
+            logger.info(
+                f"Rate-limit budget low, stretching poll interval to {interval:.0f}s "
+                f"(configured {self.config.poll_interval}s)"
+            )
+        return interval
+
+    def _project_hostnames(self) -> set[str]:
+        """Hostnames of all configured project boards."""
+        return {self._get_hostname_from_url(url) for url in self.config.project_urls}
+
+    def _fetch_board_items(self) -> list[TicketItem]:
+        """Fetch items from all configured project boards.
 
-                # Get the specific yolo-like label that was added
-                yolo_label = self._get_yolo_label_from(item.labels) or Labels.YOLO
-                actor = self.ticket_client.get_label_actor(item.repo, item.ticket_id, yolo_label)
-                actor_category = check_actor_allowed(
-                    actor, self.config.username_self, key, "YOLO", self.config.team_usernames
+        Boards are fetched concurrently, with at most
+        config.board_fetch_concurrency_per_host fetches in flight per GitHub
+        hostname, so a poll takes as long as the slowest board rather than the
+        sum of all boards. Boards that fail to fetch are logged and skipped.
+
+        Returns:
+            Items from all boards, in config.project_urls order
+        """
+        project_urls = list(self.config.project_urls)
+        start = time.monotonic()
+
+        results: dict[str, tuple[list[TicketItem], float]] = {}
+        if len(project_urls) <= 1:
+            for project_url in project_urls:
+                results.update(self._fetch_boards_in_turn(deque([project_url])))
+        else:
+            by_host: dict[str, deque[str]] = {}
+            for project_url in project_urls:
+                by_host.setdefault(self._get_hostname_from_url(project_url), deque()).append(
+                    project_url
                 )
-                if actor_category != ActorCategory.SELF:
-                    continue
-                logger.info(
-                    f"YOLO: Starting auto-progression for {key} from Backlog "
-                    f"(label added by allowed user '{actor}')"
+
+            # Each host gets up to per_host fetchers sharing that host's queue
+            per_host = max(1, self.config.board_fetch_concurrency_per_host)
+            futures: list[Future[dict[str, tuple[list[TicketItem], float]]]] = []
+            for pending in by_host.values():
+                for _ in range(min(per_host, len(pending))):
+                    futures.append(
+                        self._board_fetch_executor.submit(self._fetch_boards_in_turn, pending)
+                    )
+            for future in futures:
+                results.update(future.result())
+
+        all_items: list[TicketItem] = []
+        for project_url in project_urls:
+            if project_url in results:
+                all_items.extend(results[project_url][0])
+
+        if len(results) > 1:
+            slowest_url, (_, slowest) = max(results.items(), key=lambda r: r[1][1])
+            logger.debug(
+                f"Fetched {len(results)} projects in {time.monotonic() - start:.2f}s "
+                f"(slowest: {slowest_url} in {slowest:.2f}s)"
+            )
+        return all_items
+
+    def _fetch_boards_in_turn(
+        self, pending: deque[str]
+    ) -> dict[str, tuple[list[TicketItem], float]]:
+        """Fetch boards from a shared queue until it is empty.
+
+        Args:
+            pending: Project URLs still to fetch (shared with other fetchers)
+
+        Returns:
+            Dict mapping each fetched project URL to (items, fetch seconds).
+            Projects that failed to fetch are omitted.
+        """
+        results: dict[str, tuple[list[TicketItem], float]] = {}
+        while True:
+            try:
+                project_url = pending.popleft()
+            except IndexError:
+                return results
+
+            start = time.monotonic()
+            try:
+                items = self.ticket_client.get_board_items(project_url)
+            except Exception as e:
+                logger.error(f"Failed to fetch from {project_url}: {e}")
+                continue
+            elapsed = time.monotonic() - start
+            logger.debug(f"Fetched {len(items)} items from {project_url} in {elapsed:.2f}s")
+            results[project_url] = (items, elapsed)
+
+    def _io_handlers(
+        self, *, include_low_priority: bool = True
+    ) -> list[Callable[[TicketItem], None]]:
+        """Per-item handlers that only act on cached item data, in execution order.
+
+        These run on the poll I/O pool so label, status and archive writes for
+        different items proceed concurrently.
+
+        Args:
+            include_low_priority: Whether to include archive and cleanup handlers,
+                which are deferred while the host's rate-limit budget is low
+        """
+        low_priority: list[Callable[[TicketItem], None]] = [
+            self._maybe_cleanup_done,
+            self._maybe_archive_closed,
+            self._maybe_cleanup_closed,
+        ]
+        return [
+            *(low_priority if include_low_priority else []),
+            self._maybe_move_to_done,
+            self._maybe_set_backlog,
+        ]
+
+    def _poll_thread_handlers(self) -> list[Callable[[TicketItem], None]]:
+        """Per-item handlers that run on the poll thread, in execution order.
+
+        These need fresh (batched) lookups or in-memory workflow state.
+        """
+        return [
+            self._maybe_start_yolo,
+            self._maybe_handle_reset,
+            self._maybe_handle_stop,
+        ]
+
+    @staticmethod
+    def _run_item_handlers(item: TicketItem, handlers: list[Callable[[TicketItem], None]]) -> None:
+        """Run handlers for a single item in order.
+
+        Args:
+            item: TicketItem to handle
+            handlers: Handlers to run
+        """
+        for handler in handlers:
+            handler(item)
+
+    def _submit_item_io(
+        self, item: TicketItem, fn: Callable[..., Any], *args: Any, **kwargs: Any
+    ) -> Future[Any]:
+        """Run a side effect for an item on the poll I/O pool.
+
+        Side effects for the same item run in submission order; side effects for
+        different items run concurrently. The poll waits for them before finishing.
+
+        Args:
+            item: TicketItem the side effect belongs to
+            fn: Callable to run
+            *args: Positional arguments for fn
+            **kwargs: Keyword arguments for fn
+
+        Returns:
+            Future for the side effect
+        """
+        key = f"{item.repo}#{item.ticket_id}"
+        future = self._io_executor.submit(key, fn, *args, **kwargs)
+        self._poll_io_futures[future] = item
+        return future
+
+    def _wait_for_item_io(self) -> None:
+        """Wait for this poll's side effects and report failures.
+
+        Items whose side effects failed are re-evaluated on the next poll.
+
+        Raises:
+            NetworkError: If any side effect lost connectivity (triggers hibernation)
+        """
+        network_error: NetworkError | None = None
+        for future, item in self._poll_io_futures.items():
+            try:
+                future.result()
+            except NetworkError as e:
+                network_error = network_error or e
+                self.board_snapshot.mark_dirty(item.repo, item.ticket_id)
+            except Exception as e:
+                logger.error(
+                    f"Poll handler failed for {item.repo}#{item.ticket_id}: {e}", exc_info=True
                 )
-                hostname = self._get_hostname_from_url(item.board_url)
-                self.ticket_client.update_item_status(item.item_id, "Research", hostname=hostname)
+                self.board_snapshot.mark_dirty(item.repo, item.ticket_id)
+        self._poll_io_futures = {}
+        if network_error is not None:
+            raise network_error
 
-            # Handle reset label: clear kiln content and move issue to Backlog
-            for item in all_items:
-                self._maybe_handle_reset(item)
+    def _dispatch_workflows(self, items: list[TicketItem]) -> None:
+        """Submit workflows for items to the workflow thread pool.
 
-            # Handle stop label: kill implementation without full reset
-            for item in all_items:
-                self._maybe_handle_stop(item)
+        Args:
+            items: TicketItems that need a workflow run
+        """
+        logger.debug(f"Submitting {len(items)} items for parallel processing")
 
-            # Process Dependabot auto-merge queue
-            self._poll_merge_queue()
+        # Submit workflows to thread pool
+        futures: dict[Future[None], TicketItem] = {}
+        for item in items:
+            future = self._submit_workflow(self._process_item_workflow, item)
+            futures[future] = item
 
-            # Collect items that need workflow execution
-            items_to_process: list[TicketItem] = []
-            for item in all_items:
-                if self._should_trigger_workflow(item):
-                    items_to_process.append(item)
-                elif self._should_yolo_advance(item):
-                    # Issue has yolo but isn't eligible for workflow (likely already complete)
-                    # Advance to next status
-                    self._yolo_advance(item)
+        # Log submission - workflows will run asynchronously
+        # Results are logged in _on_workflow_complete via add_done_callback
+        for future, item in futures.items():
+            callback = lambda f, bound_item=item: self._on_workflow_complete(f, bound_item)  # noqa: E731
+            future.add_done_callback(callback)
 
-            if not items_to_process:
-                logger.debug("No workflows to trigger")
-                logger.debug("Poll cycle completed")
-                return
+    def _submit_workflow(
+        self, fn: Callable[[TicketItem], None], item: TicketItem, lane: str | None = None
+    ) -> Future[None]:
+        """Queue work in a workflow lane, to run once the lane has a free slot.
 
-            logger.debug(f"Submitting {len(items_to_process)} items for parallel processing")
+        Args:
+            fn: Workflow entry point (workflow run or comment processing)
+            item: TicketItem to process
+            lane: Lane to run in; defaults to the lane of the item's workflow
 
-            # Submit workflows to thread pool
-            futures: dict[Future[None], TicketItem] = {}
-            for item in items_to_process:
-                future = self.executor.submit(self._process_item_workflow, item)
-                futures[future] = item
+        Returns:
+            Future for the work
+        """
+        return self.lanes.submit(
+            lane or self._workflow_lane(item),
+            fn,
+            item,
+            repo=item.repo,
+            priority=self._work_priority(item),
+        )
 
-            # Log submission - workflows will run asynchronously
-            # Results are logged in _on_workflow_complete via add_done_callback
-            for future, item in futures.items():
-                callback = lambda f, bound_item=item: self._on_workflow_complete(f, bound_item)  # noqa: E731
-                future.add_done_callback(callback)
+    def _workflow_lane(self, item: TicketItem) -> str:
+        """Lane for the workflow run of an item's status."""
+        return "implement" if item.status == "Implement" else "research_plan"
 
-            logger.debug("Poll cycle completed")
+    def _work_priority(self, item: TicketItem) -> tuple[int, int]:
+        """Order of an item's work within its lane: YOLO issues first, then older issues.
 
-        except Exception as e:
-            logger.error(f"Error fetching project items: {e}", exc_info=True)
-            raise
+        Issue numbers stand in for age (lower numbers were opened earlier).
+        """
+        return (0 if self._has_any_yolo_label(item.labels) else 1, item.ticket_id)
+
+    def _process_comments(self, item: TicketItem) -> None:
+        """Comment job body (runs in the comments lane via comment_jobs)."""
+        self.comment_processor.process(item)
+
+    def _maybe_start_yolo(self, item: TicketItem) -> None:
+        """YOLO: Move Backlog issues with yolo/auto label to Research.
+
+        The status change is applied on the poll I/O pool.
+
+        Args:
+            item: TicketItem to check (with cached labels)
+        """
+        # Fast path: if not in cached labels, definitely not present
+        if not self._has_any_yolo_label(item.labels):
+            return
+        if item.status != "Backlog" or item.state == "CLOSED":
+            return
+
+        key = f"{item.repo}#{item.ticket_id}"
+
+        # Fresh check: verify yolo/auto label is still present (may have been removed since poll started)
+        if not self._has_yolo_label(item.repo, item.ticket_id):
+            logger.debug(f"YOLO: Skipping Backlog→Research for {key} - yolo/auto label was removed")
+            return
+
+        # Get the specific yolo-like label that was added
+        yolo_label = self._get_yolo_label_from(item.labels) or Labels.YOLO
+        actor = self.ticket_client.get_label_actor(item.repo, item.ticket_id, yolo_label)
+        actor_category = check_actor_allowed(
+            actor, self.config.username_self, key, "YOLO", self.config.team_usernames
+        )
+        if actor_category != ActorCategory.SELF:
+            return
+        logger.info(
+            f"YOLO: Starting auto-progression for {key} from Backlog "
+            f"(label added by allowed user '{actor}')"
+        )
+        hostname = self._get_hostname_from_url(item.board_url)
+        self._submit_item_io(
+            item, self.ticket_client.update_item_status, item.item_id, "Research", hostname=hostname
+        )
+
+    def _batch_lookup_candidates(self, items: list[TicketItem]) -> list[tuple[str, int]]:
+        """Select the issues whose per-issue lookups should be batched this poll.
+
+        Covers open issues the handlers will query GitHub about: issues in
+        watched statuses (blocked_by and status actor checks) and issues
+        carrying yolo/auto, reset or stop labels (label actor checks).
+
+        Args:
+            items: All TicketItems fetched this poll
+
+        Returns:
+            List of (repo, issue_number) pairs
+        """
+        candidates: list[tuple[str, int]] = []
+        for item in items:
+            if item.state == "CLOSED":
+                continue
+            if (
+                item.status in self.config.watched_statuses
+                or self._has_any_yolo_label(item.labels)
+                or Labels.RESET in item.labels
+                or Labels.STOP in item.labels
+            ):
+                candidates.append((item.repo, item.ticket_id))
+        return candidates
 
     def _should_trigger_workflow(self, item: TicketItem) -> bool:
         """Check if an item needs a workflow triggered.
@@ -1271,6 +1841,8 @@ class Daemon:
         is_blocked, blockers = self._is_blocked_by_unmerged_issues(item)
         if is_blocked:
             logger.info(f"Skipping {key} - blocked by issues without merged PRs: {blockers}")
+            # Blockers can merge without this item changing, so re-check next poll
+            self.board_snapshot.mark_dirty(item.repo, item.ticket_id)
             return False
 
         # Check actor authorization if supported by the client
@@ -1466,6 +2038,11 @@ class Daemon:
             if not blocked_by:
                 return (False, [])
 
+            # Fetch linked PRs for all blockers in one batched query
+            self.ticket_client.queue_issue_lookups(
+                [(item.repo, blocker_num) for blocker_num in blocked_by]
+            )
+
             blocking_issues = []
             for blocker_num in blocked_by:
                 linked_prs = self.ticket_client.get_linked_prs(item.repo, blocker_num)
@@ -1554,6 +2131,15 @@ class Daemon:
         stored = self.database.get_issue_state(item.repo, item.ticket_id)
         return not (stored and item.comment_count == stored.last_known_comment_count)
 
+    def _maybe_cleanup_done(self, item: TicketItem) -> None:
+        """Clean up worktree for items in Done status.
+
+        Args:
+            item: TicketItem to check
+        """
+        if item.status == "Done":
+            self._maybe_cleanup(item)
+
     def _maybe_cleanup(self, item: TicketItem) -> None:
         """Clean up worktree for Done issues.
 
@@ -1574,17 +2160,29 @@ class Daemon:
         if Labels.CLEANED_UP in item.labels:
             return
 
-        # Clean up worktree if it exists
+        # Queue worktree removal if it exists; the collector marks the issue once done
         worktree_path = self._get_worktree_path(item.repo, item.ticket_id)
         if Path(worktree_path).exists():
-            try:
-                self.workspace_manager.cleanup_workspace(item.repo, item.ticket_id)
-                logger.info("Cleaned up worktree")
-            except Exception as e:
-                logger.error(f"Cleanup failed: {e}")
+            self.worktree_gc.enqueue(item.repo, item.ticket_id)
+            logger.info("Queued worktree cleanup")
+            return
 
         # Mark as cleaned up (prevents repeated checks)
-        self.ticket_client.add_label(item.repo, item.ticket_id, Labels.CLEANED_UP)
+        self._mark_cleaned_up(item.repo, item.ticket_id)
+
+    def _mark_cleaned_up(self, repo: str, issue_number: int) -> None:
+        """Add the cleaned_up label once an issue's worktree cleanup was attempted.
+
+        Args:
+            repo: Repository in 'hostname/owner/repo' format
+            issue_number: Issue number
+        """
+        self.ticket_client.add_label(repo, issue_number, Labels.CLEANED_UP)
+
+    def _workflow_in_progress(self, repo: str, issue_number: int) -> bool:
+        """Whether a workflow is running for an issue (its worktree must be kept)."""
+        with self._in_progress_lock:
+            return f"{repo}#{issue_number}" in self._in_progress
 
     def _maybe_archive_closed(self, item: TicketItem) -> None:
         """Archive project items for issues closed without actual completion.
@@ -1653,6 +2251,8 @@ class Daemon:
         hostname = self._get_hostname_from_url(item.board_url)
         if self.ticket_client.archive_item(metadata.project_id, item.item_id, hostname=hostname):
             logger.info("Archived from project board")
+        else:
+            self.board_snapshot.mark_dirty(item.repo, item.ticket_id)
 
     def _maybe_cleanup_closed(self, item: TicketItem) -> None:
         """Clean up worktree for any closed issue.
@@ -1682,17 +2282,15 @@ class Daemon:
         if Labels.CLEANED_UP in item.labels:
             return
 
-        # Clean up worktree if it exists
+        # Queue worktree removal if it exists; the collector marks the issue once done
         worktree_path = self._get_worktree_path(item.repo, item.ticket_id)
         if Path(worktree_path).exists():
-            try:
-                self.workspace_manager.cleanup_workspace(item.repo, item.ticket_id)
-                logger.info("Cleaned up worktree for closed issue")
-            except Exception as e:
-                logger.error(f"Cleanup failed for closed issue: {e}")
+            self.worktree_gc.enqueue(item.repo, item.ticket_id)
+            logger.info("Queued worktree cleanup for closed issue")
+            return
 
         # Mark as cleaned up (prevents repeated checks)
-        self.ticket_client.add_label(item.repo, item.ticket_id, Labels.CLEANED_UP)
+        self._mark_cleaned_up(item.repo, item.ticket_id)
 
     def _maybe_move_to_done(self, item: TicketItem) -> None:
         """Move issues to Done when PR is merged and issue is closed as COMPLETED.
@@ -1730,6 +2328,8 @@ class Daemon:
             logger.info(f"Moved {item.repo}#{item.ticket_id} to Done")
         except Exception as e:
             logger.error(f"Failed to move {item.repo}#{item.ticket_id} to Done: {e}")
+            # Retry on the next poll; the item itself won't change
+            self.board_snapshot.mark_dirty(item.repo, item.ticket_id)
 
     def _maybe_set_backlog(self, item: TicketItem) -> None:
         """Set issues without a status to Backlog.
@@ -1756,6 +2356,8 @@ class Daemon:
             logger.info(f"Set {item.repo}#{item.ticket_id} to Backlog")
         except Exception as e:
             logger.error(f"Failed to set {item.repo}#{item.ticket_id} to Backlog: {e}")
+            # Retry on the next poll; the item itself won't change
+            self.board_snapshot.mark_dirty(item.repo, item.ticket_id)
 
     def _maybe_handle_reset(self, item: TicketItem) -> None:
         """Handle the reset label by clearing kiln content and moving issue to Backlog.
@@ -1953,43 +2555,90 @@ class Daemon:
            - If ready → merge
         5. After merge, trigger rebase on next PR
 
+        Queue state is read from one snapshot of every open PR carrying the
+        configured label or a queue label, so a poll costs the same number of
+        requests whatever the queue depth. If the snapshot query fails, the
+        queue is refreshed with per-PR lookups instead (and processed
+        sequentially, whatever the configured strategy).
+
+        With the speculative strategy, step 4 is replaced by a merge train
+        (see _advance_merge_train).
+
         Args:
             config: AutoMergingEntry with repo settings
         """
         repo = config.repo
+        snapshot = self.ticket_client.list_labeled_pr_snapshots(
+            repo, [config.label, Labels.AUTO_MERGING, Labels.AUTO_MERGE_QUEUE]
+        )
+        if snapshot is None:
+            self._process_repo_merge_queue_per_pr(config)
+            return
 
         # 1. Recover state from labels (handles daemon restart)
-        self._recover_merge_queue_from_labels(repo, config.label)
+        self._recover_merge_queue(
+            repo,
+            merging_prs=[pr.number for pr in snapshot if Labels.AUTO_MERGING in pr.labels],
+            queued_prs=[pr.number for pr in snapshot if Labels.AUTO_MERGE_QUEUE in pr.labels],
+        )
 
-        # 2. Discover new PRs with the configured label
-        prs = self.ticket_client.list_prs_by_label(repo, config.label)
+        # 2-3. Discover new PRs with the configured label (snapshot is in creation order)
+        self._add_new_prs_to_merge_queue(
+            repo, [pr.number for pr in snapshot if config.label in pr.labels]
+        )
+
+        # 4. Remove PRs that were manually merged or closed. Queued PRs missing
+        #    from the snapshot are no longer open (or lost their labels); only
+        #    those need a state lookup
+        open_prs = {pr.number: pr for pr in snapshot}
+        for entry in self.database.get_merge_queue(repo):
+            if entry.pr_number not in open_prs:
+                self._remove_finished_pr_from_merge_queue(repo, entry.pr_number)
+
+        # Refresh queue after cleanup
         queue = self.database.get_merge_queue(repo)
 
-        # 3. Add new PRs to queue in creation order
-        existing_pr_numbers = {e.pr_number for e in queue}
-        new_prs = [pr for pr in prs if pr["number"] not in existing_pr_numbers]
+        if not queue:
+            return  # Queue is empty
 
-        # Sort by createdAt to maintain FIFO order
-        new_prs.sort(key=lambda p: p.get("createdAt", ""))
+        # 5. Speculative: test a batch of PRs together and merge the passing prefix
+        if config.strategy == "speculative":
+            self._advance_merge_train(config, queue, open_prs)
+            return
 
-        for pr in new_prs:
-            pr_number = pr["number"]
-            position = len(queue) + len([p for p in new_prs if p["number"] < pr_number])
-            self.database.add_to_merge_queue(repo, pr_number, position)
-            self.ticket_client.add_label(repo, pr_number, Labels.AUTO_MERGE_QUEUE)
-            logger.info(f"Added PR #{pr_number} to merge queue for {repo}")
+        # 5. Process ONLY the first PR in queue (sequential processing)
+        first_pr = queue[0]
+        self._process_single_pr(
+            repo, first_pr.pr_number, config.merge_method, open_prs.get(first_pr.pr_number)
+        )
 
-        # Refresh queue after adding new entries
-        queue = self.database.get_merge_queue(repo)
+    def _process_repo_merge_queue_per_pr(self, config: AutoMergingEntry) -> None:
+        """Process the merge queue for a single repository with per-PR lookups.
+
+        Fallback for _process_repo_merge_queue when the labeled-PR snapshot
+        is unavailable: lists each label separately and looks up every queued
+        PR's state.
+
+        Args:
+            config: AutoMergingEntry with repo settings
+        """
+        repo = config.repo
+
+        # 1. Recover state from labels (handles daemon restart). Low priority:
+        #    skipped while the host's rate-limit budget is low
+        if not self.rate_budget.is_low(repo.split("/")[0]):
+            self._recover_merge_queue_from_labels(repo, config.label)
+
+        # 2. Discover new PRs with the configured label
+        prs = self.ticket_client.list_prs_by_label(repo, config.label)
+
+        # 3. Add new PRs to queue in creation order
+        prs.sort(key=lambda p: p.get("createdAt", ""))
+        self._add_new_prs_to_merge_queue(repo, [pr["number"] for pr in prs])
 
         # 4. Remove PRs that were manually merged or closed
-        for entry in queue:
-            state = self.ticket_client.get_pr_state(repo, entry.pr_number)
-            if state in ("MERGED", "CLOSED"):
-                logger.info(f"Removing PR #{entry.pr_number} from queue ({state.lower()})")
-                self.database.remove_from_merge_queue(repo, entry.pr_number)
-                self.ticket_client.remove_label(repo, entry.pr_number, Labels.AUTO_MERGE_QUEUE)
-                self.ticket_client.remove_label(repo, entry.pr_number, Labels.AUTO_MERGING)
+        for entry in self.database.get_merge_queue(repo):
+            self._remove_finished_pr_from_merge_queue(repo, entry.pr_number)
 
         # Refresh queue after cleanup
         queue = self.database.get_merge_queue(repo)
@@ -2001,6 +2650,37 @@ class Daemon:
         first_pr = queue[0]
         self._process_single_pr(repo, first_pr.pr_number, config.merge_method)
 
+    def _add_new_prs_to_merge_queue(self, repo: str, pr_numbers: list[int]) -> None:
+        """Append PRs that are not yet queued to the end of the merge queue.
+
+        Args:
+            repo: Repository in 'hostname/owner/repo' format
+            pr_numbers: Candidate PR numbers in creation (FIFO) order
+        """
+        queue = self.database.get_merge_queue(repo)
+        existing_pr_numbers = {e.pr_number for e in queue}
+        new_pr_numbers = [n for n in pr_numbers if n not in existing_pr_numbers]
+
+        for pr_number in new_pr_numbers:
+            position = len(queue) + len([n for n in new_pr_numbers if n < pr_number])
+            self.database.add_to_merge_queue(repo, pr_number, position)
+            self.ticket_client.add_label(repo, pr_number, Labels.AUTO_MERGE_QUEUE)
+            logger.info(f"Added PR #{pr_number} to merge queue for {repo}")
+
+    def _remove_finished_pr_from_merge_queue(self, repo: str, pr_number: int) -> None:
+        """Drop a queued PR and its queue labels if it was merged or closed.
+
+        Args:
+            repo: Repository in 'hostname/owner/repo' format
+            pr_number: Queued PR number
+        """
+        state = self.ticket_client.get_pr_state(repo, pr_number)
+        if state in ("MERGED", "CLOSED"):
+            logger.info(f"Removing PR #{pr_number} from queue ({state.lower()})")
+            self.database.remove_from_merge_queue(repo, pr_number)
+            self.ticket_client.remove_label(repo, pr_number, Labels.AUTO_MERGE_QUEUE)
+            self.ticket_client.remove_label(repo, pr_number, Labels.AUTO_MERGING)
+
     def _recover_merge_queue_from_labels(self, repo: str, _config_label: str) -> None:
         """Recover merge queue state from GitHub labels after daemon restart.
 
@@ -2011,13 +2691,34 @@ class Daemon:
             repo: Repository in 'hostname/owner/repo' format
             _config_label: The configured label for Dependabot PRs (unused, reserved for future)
         """
+        # Check for PRs with auto-merging label (was being processed)
+        merging_prs = self.ticket_client.list_prs_by_label(repo, Labels.AUTO_MERGING)
+
+        # Check for PRs with auto-merge-queue label (was in queue)
+        queued_prs = self.ticket_client.list_prs_by_label(repo, Labels.AUTO_MERGE_QUEUE)
+        # Sort by createdAt to maintain order
+        queued_prs.sort(key=lambda p: p.get("createdAt", ""))
+
+        self._recover_merge_queue(
+            repo,
+            merging_prs=[pr["number"] for pr in merging_prs],
+            queued_prs=[pr["number"] for pr in queued_prs],
+        )
+
+    def _recover_merge_queue(
+        self, repo: str, merging_prs: list[int], queued_prs: list[int]
+    ) -> None:
+        """Add labeled PRs missing from the database back to the merge queue.
+
+        Args:
+            repo: Repository in 'hostname/owner/repo' format
+            merging_prs: PRs labeled auto-merging (were being merged)
+            queued_prs: PRs labeled auto-merge-queue, in creation order
+        """
         queue = self.database.get_merge_queue(repo)
         existing_pr_numbers = {e.pr_number for e in queue}
 
-        # Check for PRs with auto-merging label (was being processed)
-        merging_prs = self.ticket_client.list_prs_by_label(repo, Labels.AUTO_MERGING)
-        for pr in merging_prs:
-            pr_number = pr["number"]
+        for pr_number in merging_prs:
             if pr_number not in existing_pr_numbers:
                 # Recover: add to queue with 'merging' status at position 0
                 self.database.add_to_merge_queue(repo, pr_number, position=0)
@@ -2025,13 +2726,7 @@ class Daemon:
                 logger.info(f"Recovered PR #{pr_number} from auto-merging label")
                 existing_pr_numbers.add(pr_number)
 
-        # Check for PRs with auto-merge-queue label (was in queue)
-        queued_prs = self.ticket_client.list_prs_by_label(repo, Labels.AUTO_MERGE_QUEUE)
-        # Sort by createdAt to maintain order
-        queued_prs.sort(key=lambda p: p.get("createdAt", ""))
-
-        for pr in queued_prs:
-            pr_number = pr["number"]
+        for pr_number in queued_prs:
             if pr_number not in existing_pr_numbers:
                 # Recover: add to queue at end
                 position = len(existing_pr_numbers)
@@ -2039,7 +2734,13 @@ class Daemon:
                 logger.info(f"Recovered PR #{pr_number} from auto-merge-queue label")
                 existing_pr_numbers.add(pr_number)
 
-    def _process_single_pr(self, repo: str, pr_number: int, merge_method: str) -> None:
+    def _process_single_pr(
+        self,
+        repo: str,
+        pr_number: int,
+        merge_method: str,
+        snapshot: PullRequestSnapshot | None = None,
+    ) -> None:
         """Process a single PR through the merge flow.
 
         Handles the full state machine for one PR:
@@ -2054,16 +2755,23 @@ class Daemon:
             repo: Repository in 'hostname/owner/repo' format
             pr_number: PR number to process
             merge_method: Merge method ('merge', 'squash', 'rebase')
+            snapshot: The PR's state from this poll's snapshot; looked up
+                with separate requests when None
         """
-        # Get merge state
-        merge_state = self.ticket_client.get_pr_merge_state(repo, pr_number)
-        if not merge_state:
-            logger.warning(f"Could not get merge state for PR #{pr_number}")
-            return
+        if snapshot is not None:
+            merge_status = snapshot.merge_state_status
+            mergeable = snapshot.mergeable
+            review_decision = snapshot.review_decision
+        else:
+            # Get merge state
+            merge_state = self.ticket_client.get_pr_merge_state(repo, pr_number)
+            if not merge_state:
+                logger.warning(f"Could not get merge state for PR #{pr_number}")
+                return
 
-        merge_status = merge_state.get("mergeStateStatus", "UNKNOWN")
-        mergeable = merge_state.get("mergeable", "UNKNOWN")
-        review_decision = merge_state.get("reviewDecision", "")
+            merge_status = merge_state.get("mergeStateStatus", "UNKNOWN")
+            mergeable = merge_state.get("mergeable", "UNKNOWN")
+            review_decision = merge_state.get("reviewDecision", "")
 
         logger.debug(
             f"PR #{pr_number} state: {merge_status}, mergeable: {mergeable}, review: {review_decision}"
@@ -2080,12 +2788,18 @@ class Daemon:
             return
 
         # Check CI status
-        sha = self.ticket_client.get_pr_head_sha(repo, pr_number)
+        if snapshot is not None:
+            sha = snapshot.head_sha
+        else:
+            sha = self.ticket_client.get_pr_head_sha(repo, pr_number)
         if not sha:
             logger.warning(f"Could not get HEAD SHA for PR #{pr_number}")
             return
 
-        checks = self.ticket_client.get_check_runs(repo, sha)
+        if snapshot is not None and snapshot.checks is not None:
+            checks = snapshot.checks
+        else:
+            checks = self.ticket_client.get_check_runs(repo, sha)
 
         # If CI still running, wait
         if checks and any(not check.is_completed for check in checks):
@@ -2101,7 +2815,24 @@ class Daemon:
             return
 
         # CI passed (or no CI configured) - proceed to approve and merge
+        if self._approve_and_merge_pr(repo, pr_number, merge_method, review_decision):
+            # Trigger rebase on next PR in queue
+            self._trigger_next_pr_rebase(repo)
+
+    def _approve_and_merge_pr(
+        self, repo: str, pr_number: int, merge_method: str, review_decision: str
+    ) -> bool:
+        """Approve a queued PR if needed and merge it.
 
+        Args:
+            repo: Repository in 'hostname/owner/repo' format
+            pr_number: PR number to merge
+            merge_method: Merge method ('merge', 'squash', 'rebase')
+            review_decision: The PR's current review decision
+
+        Returns:
+            True if the PR was merged and removed from the queue
+        """
         # Update labels to show we're actively processing
         self.ticket_client.remove_label(repo, pr_number, Labels.AUTO_MERGE_QUEUE)
         self.ticket_client.add_label(repo, pr_number, Labels.AUTO_MERGING)
@@ -2112,18 +2843,18 @@ class Daemon:
             logger.info(f"Approving PR #{pr_number}...")
             if not self.ticket_client.approve_pr(repo, pr_number):
                 logger.warning(f"Failed to approve PR #{pr_number}, will retry next poll")
-                return
+                return False
 
         # Attempt merge
         logger.info(f"Merging PR #{pr_number}...")
-        if self.ticket_client.merge_pr(repo, pr_number, merge_method):
-            logger.info(f"Successfully merged PR #{pr_number} in {repo}")
-            self.database.remove_from_merge_queue(repo, pr_number)
-            self.ticket_client.remove_label(repo, pr_number, Labels.AUTO_MERGING)
-            # Trigger rebase on next PR in queue
-            self._trigger_next_pr_rebase(repo)
-        else:
+        if not self.ticket_client.merge_pr(repo, pr_number, merge_method):
             logger.warning(f"Failed to merge PR #{pr_number} in {repo}, will retry next poll")
+            return False
+
+        logger.info(f"Successfully merged PR #{pr_number} in {repo}")
+        self.database.remove_from_merge_queue(repo, pr_number)
+        self.ticket_client.remove_label(repo, pr_number, Labels.AUTO_MERGING)
+        return True
 
     def _trigger_rebase_if_needed(self, repo: str, pr_number: int) -> None:
         """Trigger a rebase on a PR if not already waiting for one.
@@ -2170,6 +2901,228 @@ class Daemon:
         else:
             logger.warning(f"Failed to trigger rebase for PR #{next_pr.pr_number}")
 
+    def _advance_merge_train(
+        self,
+        config: AutoMergingEntry,
+        queue: list[MergeQueueEntry],
+        open_prs: dict[int, PullRequestSnapshot],
+    ) -> None:
+        """Move the repository's speculative merge train forward by one poll.
+
+        Reads the CI of the train under test, merges every PR at its front
+        whose probe passed, and handles a failed probe: a culprit PR is set
+        aside until its HEAD changes, a failed batch is retried at half size
+        (bisect batching). Once a train is merged or given up, the next one is
+        built from the front of the queue and pushed right away.
+
+        A train is dropped without merging anything further if one of its
+        unmerged PRs left the queue or was pushed to since the train was built,
+        or if the base branch moved for any reason other than the train's own
+        merges (its probes no longer test what merging would produce).
+
+        Args:
+            config: AutoMergingEntry with repo settings
+            queue: The repository's merge queue, in order
+            open_prs: Snapshot of each open queue PR by number
+        """
+        repo = config.repo
+        train = self._merge_trains.get(repo)
+
+        if train is not None:
+            queued = {entry.pr_number for entry in queue}
+            for index in range(train.merged, len(train.pr_numbers)):
+                pr_number = train.pr_numbers[index]
+                snapshot = open_prs.get(pr_number)
+                if (
+                    pr_number not in queued
+                    or snapshot is None
+                    or snapshot.head_sha != train.head_shas[index]
+                ):
+                    logger.info(f"PR #{pr_number} changed, restarting merge train for {repo}")
+                    self._end_merge_train(repo)
+                    train = None
+                    break
+
+        if train is not None:
+            base_head = next(
+                (
+                    pr.base_head_sha
+                    for pr in open_prs.values()
+                    if pr.base_ref == train.base_branch and pr.base_head_sha
+                ),
+                None,
+            )
+            if base_head is not None and not train.base_sha:
+                # First snapshot since the train's own merges moved the base
+                train.base_sha = base_head
+            elif base_head is not None and base_head != train.base_sha:
+                logger.info(f"{train.base_branch} moved, restarting merge train for {repo}")
+                self._end_merge_train(repo)
+                train = None
+
+        if train is not None:
+            if not self._run_merge_train(config, train, open_prs):
+                return
+            self._end_merge_train(repo)
+            queue = self.database.get_merge_queue(repo)
+
+        self._start_merge_train(config, queue, open_prs)
+
+    def _run_merge_train(
+        self,
+        config: AutoMergingEntry,
+        train: MergeTrain,
+        open_prs: dict[int, PullRequestSnapshot],
+    ) -> bool:
+        """Merge the passing front of a train and act on a failed probe.
+
+        Args:
+            config: AutoMergingEntry with repo settings
+            train: The repository's train under test
+            open_prs: Snapshot of each open queue PR by number
+
+        Returns:
+            True if the train is finished (fully merged or failed)
+        """
+        repo = config.repo
+        probe_shas = [train.commits[i] for i in train.probes]
+        verdict = evaluate_merge_train(
+            train, self.ticket_client.get_check_runs_bulk(repo, probe_shas), no_ci=config.no_ci
+        )
+
+        while train.merged < verdict.passed:
+            pr_number = train.pr_numbers[train.merged]
+            snapshot = open_prs[pr_number]
+            if not self._approve_and_merge_pr(
+                repo, pr_number, config.merge_method, snapshot.review_decision
+            ):
+                return False
+            train.merged += 1
+            # The merge moved the base; the next snapshot re-anchors base_sha
+            train.base_sha = ""
+            self._merge_train_limits.pop(repo, None)
+
+        if verdict.culprit is not None:
+            index = train.pr_numbers.index(verdict.culprit)
+            logger.warning(
+                f"PR #{verdict.culprit} failed CI in the merge train for {repo}, "
+                "skipping it until it is updated"
+            )
+            self._merge_train_rejects.setdefault(repo, {})[verdict.culprit] = train.head_shas[index]
+            return True
+        if verdict.retest_size is not None:
+            logger.info(
+                f"Merge train of {len(train.pr_numbers)} PR(s) failed CI in {repo}, "
+                f"retrying with {verdict.retest_size}"
+            )
+            self._merge_train_limits[repo] = verdict.retest_size
+            return True
+
+        if train.merged < len(train.pr_numbers):
+            if verdict.missing_checks:
+                logger.warning(
+                    f"Merge train for {repo} got no CI checks; waiting for them "
+                    "(set no_ci for repositories without CI)"
+                )
+            else:
+                logger.debug(f"Merge train for {repo} still waiting on CI")
+            return False
+        logger.info(f"Merged train of {len(train.pr_numbers)} PR(s) in {repo}")
+        return True
+
+    def _start_merge_train(
+        self,
+        config: AutoMergingEntry,
+        queue: list[MergeQueueEntry],
+        open_prs: dict[int, PullRequestSnapshot],
+    ) -> None:
+        """Build a train from the front of the queue and push its probes.
+
+        Takes up to batch_size queued PRs (fewer while bisecting) that target
+        the same branch, have no known conflicts and have not failed a train
+        at their current HEAD. A PR that does not merge cleanly on top of the
+        ones before it is set aside like a CI failure.
+
+        Args:
+            config: AutoMergingEntry with repo settings
+            queue: The repository's merge queue, in order
+            open_prs: Snapshot of each open queue PR by number
+        """
+        repo = config.repo
+        limit = self._merge_train_limits.get(repo, config.batch_size)
+        rejects = self._merge_train_rejects.setdefault(repo, {})
+
+        candidates: list[PullRequestSnapshot] = []
+        for entry in queue:
+            snapshot = open_prs.get(entry.pr_number)
+            if snapshot is None or not snapshot.head_sha or snapshot.mergeable == "CONFLICTING":
+                continue
+            if rejects.get(snapshot.number) == snapshot.head_sha:
+                continue
+            if candidates and snapshot.base_ref != candidates[0].base_ref:
+                continue
+            candidates.append(snapshot)
+            if len(candidates) >= limit:
+                break
+
+        if not candidates or not candidates[0].base_ref:
+            return
+
+        base_branch = candidates[0].base_ref
+        try:
+            build = self.workspace_manager.build_merge_train(
+                self._get_clone_url(repo), repo, base_branch, [pr.number for pr in candidates]
+            )
+        except WorkspaceError as e:
+            logger.warning(f"Could not build merge train for {repo}: {e}")
+            return
+
+        if build.conflict is not None:
+            conflict = next(pr for pr in candidates if pr.number == build.conflict)
+            rejects[conflict.number] = conflict.head_sha or ""
+        if not build.commits:
+            return
+
+        train = MergeTrain(
+            repo=repo,
+            base_branch=base_branch,
+            base_sha=build.base_sha,
+            pr_numbers=build.pr_numbers,
+            head_shas=build.head_shas,
+            commits=build.commits,
+            probes=plan_probes(len(build.commits), config.batching),
+        )
+        try:
+            self.workspace_manager.push_branches(
+                self._get_clone_url(repo), repo, train.probe_refs()
+            )
+        except WorkspaceError as e:
+            logger.warning(f"Could not push merge train for {repo}: {e}")
+            return
+
+        self._merge_trains[repo] = train
+        for pr_number in train.pr_numbers:
+            self.database.update_merge_queue_status(repo, pr_number, "testing")
+        logger.info(
+            f"Started merge train for {repo} on {base_branch}: "
+            f"{', '.join(f'#{n}' for n in train.pr_numbers)}"
+        )
+
+    def _end_merge_train(self, repo: str) -> None:
+        """Forget a repository's train and delete its probe branches.
+
+        Args:
+            repo: Repository in 'hostname/owner/repo' format
+        """
+        train = self._merge_trains.pop(repo, None)
+        if train is None:
+            return
+        for pr_number in train.pr_numbers[train.merged :]:
+            self.database.update_merge_queue_status(repo, pr_number, "queued")
+        self.workspace_manager.delete_remote_branches(
+            self._get_clone_url(repo), repo, list(train.probe_refs())
+        )
+
     def _clear_kiln_content(self, item: TicketItem) -> None:
         """Clear kiln-generated content from an issue's body.
 
@@ -2514,7 +3467,8 @@ class Daemon:
                 # Add preparing label during worktree creation
                 self.ticket_client.add_label(item.repo, item.ticket_id, Labels.PREPARING)
                 try:
-                    self._auto_prepare_worktree(item)
+                    with self.lanes.switched("prepare"):
+                        self._auto_prepare_worktree(item)
                 finally:
                     # Remove preparing label after worktree created
                     self.ticket_client.remove_label(item.repo, item.ticket_id, Labels.PREPARING)
@@ -2821,10 +3775,14 @@ class Daemon:
     def _on_workflow_complete(self, future: "Future[None]", _item: TicketItem) -> None:
         """Callback when a workflow completes (success or failure).
 
+        Marks the item dirty so the next poll re-evaluates it even if the
+        workflow left its labels unchanged.
+
         Args:
             future: The completed Future
             item: The TicketItem that was processed
         """
+        self.board_snapshot.mark_dirty(_item.repo, _item.ticket_id)
         try:
             future.result()
             logger.info("Completed workflow")
@@ -2876,13 +3834,13 @@ class Daemon:
         return parent_issue_number, parent_branch
 
     def _auto_prepare_worktree(self, item: TicketItem) -> None:
-        """Create worktree for an issue using PrepareWorkflow.
+        """Create worktree for an issue.
 
-        This runs the prepare workflow to create the worktree automatically
-        when an issue enters Research/Plan/Implement without an existing worktree.
-
-        Pre-fetches the issue body so PrepareWorkflow can include it directly
-        in the prompt without requiring Claude to make an API call.
+        Runs automatically when an issue enters Research/Plan/Implement without
+        an existing worktree. The worktree is claimed from the workspace
+        manager's pool of pre-created worktrees (or created directly) on a
+        branch named after the issue. If that fails, PrepareWorkflow is run
+        instead, with the pre-fetched issue body included in its prompt.
 
         Also checks if the issue has a parent with an open PR, and if so,
         passes the parent branch information so the child issue branches
@@ -2891,7 +3849,7 @@ class Daemon:
         Args:
             item: TicketItem to prepare worktree for
         """
-        # Pre-fetch issue body for PrepareWorkflow
+        # Issue body carries the feature_branch frontmatter (and the PrepareWorkflow prompt)
         issue_body = self.ticket_client.get_ticket_body(item.repo, item.ticket_id)
 
         # Parse frontmatter for explicit feature_branch setting
@@ -2907,6 +3865,43 @@ class Daemon:
             # Check for parent issue with open PR
             parent_issue_number, parent_branch = self._get_parent_pr_info(item.repo, item.ticket_id)
 
+        try:
+            self.workspace_manager.claim_worktree(
+                self._get_clone_url(item.repo),
+                item.repo,
+                item.ticket_id,
+                issue_branch_name(item.ticket_id, item.title),
+                base_branch=parent_branch,
+            )
+        except WorkspaceError as e:
+            logger.warning(f"Could not create worktree directly, running prepare workflow: {e}")
+            self._run_prepare_workflow(item, issue_body, parent_issue_number, parent_branch)
+
+        if parent_branch:
+            logger.info(f"Auto-prepared worktree (branching from parent branch '{parent_branch}')")
+        else:
+            logger.info("Auto-prepared worktree")
+
+    def _get_clone_url(self, repo: str) -> str:
+        """Get the HTTPS clone URL for a repository in 'hostname/owner/repo' format."""
+        hostname, owner_repo = parse_repo(repo)
+        return f"https://{hostname}/{owner_repo}.git"
+
+    def _run_prepare_workflow(
+        self,
+        item: TicketItem,
+        issue_body: str | None,
+        parent_issue_number: int | None,
+        parent_branch: str | None,
+    ) -> None:
+        """Create worktree for an issue by running PrepareWorkflow.
+
+        Args:
+            item: TicketItem to prepare worktree for
+            issue_body: Pre-fetched issue body for the prompt
+            parent_issue_number: Parent issue whose PR branch is the base, if any
+            parent_branch: Branch to create the worktree from instead of main
+        """
         workflow = PrepareWorkflow()
         # Use absolute path so Claude knows exactly where to create things
         abs_workspace_path = str(Path(self.config.workspace_dir).resolve())
@@ -2923,11 +3918,6 @@ class Daemon:
         )
         self.runner.run(workflow, ctx, "Prepare")
 
-        if parent_branch:
-            logger.info(f"Auto-prepared worktree (branching from parent branch '{parent_branch}')")
-        else:
-            logger.info("Auto-prepared worktree")
-
     def _run_workflow(
         self,
         workflow_name: str,
@@ -3006,6 +3996,7 @@ class Daemon:
             username_self=self.config.username_self,
             parent_issue_number=parent_issue_number,
             parent_branch=parent_branch,
+            ci_watcher=self.ci_watcher,
         )
 
         # Run workflow
@@ -3078,6 +4069,9 @@ def main() -> None:
             ghes_logs_mask=config.ghes_logs_mask,
             ghes_host=config.github_enterprise_host,
             org_name=org_name,
+            async_logging=config.log_async,
+            json_log_file=config.log_json_file or None,
+            log_queue_size=config.log_queue_size,
         )
         logger.info("=== Agentic Metallurgy Daemon Starting ===")
         logger.info(f"Logging to file: {config.log_file}")
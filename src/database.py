@@ -3,13 +3,48 @@ Database module for tracking GitHub issue states in SQLite.
 
 This module provides functionality to persist and retrieve issue state information,
 including the repository, issue number, current status/column, and last updated timestamp.
+
+The database runs in WAL mode so readers never block on the writer. Each thread
+reads through its own connection, while every mutation is handed to a single
+writer thread that owns the only write connection. The writer drains whatever
+mutations are queued when it wakes and commits them in one transaction (group
+commit), so a burst of per-item updates from the poll workers costs one fsync
+instead of one per update. Callers still block until their write is committed,
+so a read after a write always sees it.
 """
 
 import json
+import queue
 import sqlite3
 import threading
+from collections import defaultdict
+from collections.abc import Callable, Iterable
+from concurrent.futures import Future
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import date, datetime, timedelta
+from typing import Any
+
+# Seconds a connection waits on a locked database before raising
+BUSY_TIMEOUT_MS = 5000
+
+# Page cache per connection, in KiB (negative cache_size is KiB in SQLite)
+CACHE_SIZE_KIB = 8192
+
+# Upper bound on queued write requests committed in one transaction
+MAX_WRITES_PER_COMMIT = 256
+
+# A unit of work run on the writer connection
+WriteJob = Callable[[sqlite3.Connection], Any]
+
+# Freed pages returned to the filesystem per retention pass
+RETENTION_VACUUM_PAGES = 1000
+
+# Issues per query in get_issue_states_bulk (stays under SQLite's bound-parameter limit)
+ISSUE_STATE_CHUNK_SIZE = 500
+
+_ISSUE_STATE_COLUMNS = """repo, issue_number, status, last_updated, branch_name, project_url,
+                   last_processed_comment_timestamp, last_known_comment_count,
+                   research_session_id, plan_session_id, implement_session_id, placement_status"""
 
 
 @dataclass
@@ -84,6 +119,46 @@ class RunRecord:
     log_path: str | None = None
 
 
+@dataclass
+class RunRollup:
+    """
+    Daily aggregate of completed workflow runs.
+
+    Attributes:
+        day: Completion date (YYYY-MM-DD, local time)
+        repo: Repository name (e.g., "github.com/owner/repo")
+        workflow: Workflow name ("research", "plan", "implement")
+        outcome: Result of the runs ("success", "failed", "stalled", "unknown")
+        runs: Number of runs
+        total_duration_seconds: Sum of run durations
+        max_duration_seconds: Longest run duration
+    """
+
+    day: str
+    repo: str
+    workflow: str
+    outcome: str
+    runs: int
+    total_duration_seconds: float
+    max_duration_seconds: float
+
+
+@dataclass
+class RetentionResult:
+    """
+    Outcome of one Database.apply_retention() pass.
+
+    Attributes:
+        rolled_up_days: Days newly aggregated into run_history_daily
+        deleted_runs: run_history rows deleted
+        deleted_processing_comments: Orphaned processing_comments rows deleted
+    """
+
+    rolled_up_days: int = 0
+    deleted_runs: int = 0
+    deleted_processing_comments: int = 0
+
+
 @dataclass
 class IssueState:
     """
@@ -117,6 +192,154 @@ class IssueState:
     placement_status: str | None = None
 
 
+def _tune_connection(conn: sqlite3.Connection) -> None:
+    """Apply the per-connection PRAGMAs used by every kiln connection."""
+    conn.execute(f"PRAGMA busy_timeout = {BUSY_TIMEOUT_MS}")
+    conn.execute("PRAGMA synchronous = NORMAL")
+    conn.execute(f"PRAGMA cache_size = -{CACHE_SIZE_KIB}")
+    conn.execute("PRAGMA temp_store = MEMORY")
+
+
+@dataclass
+class _WriteRequest:
+    """Jobs queued for the writer thread, committed together."""
+
+    jobs: list[WriteJob]
+    future: "Future[list[Any]]"
+    # Run outside any transaction (e.g. VACUUM), after earlier requests commit
+    exclusive: bool = False
+
+
+class _Writer:
+    """Single thread owning the write connection and group-committing queued writes.
+
+    Each request is a list of jobs that must commit together. The thread takes
+    every request queued when it wakes (up to MAX_WRITES_PER_COMMIT), runs each
+    inside its own savepoint so a failing request is rolled back on its own, and
+    commits them all in one transaction. Exclusive requests end the current
+    group and run on their own without a transaction.
+    """
+
+    def __init__(self, db_path: str) -> None:
+        """Initialize the writer. The thread starts on the first submit.
+
+        Args:
+            db_path: Path to the SQLite database file
+        """
+        self.db_path = db_path
+        self._queue: queue.Queue[_WriteRequest | None] = queue.Queue()
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+
+    def submit(self, jobs: list[WriteJob], exclusive: bool = False) -> "Future[list[Any]]":
+        """Queue jobs to run and commit together.
+
+        Args:
+            jobs: Callables taking the write connection
+            exclusive: Run the jobs outside any transaction
+
+        Returns:
+            Future resolved with each job's return value once committed
+        """
+        future: Future[list[Any]] = Future()
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="db-writer", daemon=True)
+                self._thread.start()
+            self._queue.put(_WriteRequest(jobs, future, exclusive))
+        return future
+
+    def run(self, jobs: list[WriteJob], exclusive: bool = False) -> list[Any]:
+        """Run jobs on the writer thread and wait for their commit.
+
+        Raises:
+            Exception: Whatever a job raised (its request is rolled back)
+        """
+        if threading.current_thread() is self._thread:
+            raise RuntimeError("Database writes cannot be issued from inside a write job")
+        return self.submit(jobs, exclusive).result()
+
+    def stop(self) -> None:
+        """Commit everything queued so far and stop the thread."""
+        with self._lock:
+            thread = self._thread
+            if thread is None:
+                return
+            self._queue.put(None)
+            self._thread = None
+        thread.join()
+
+    def _run(self) -> None:
+        """Group-commit queued requests until stopped."""
+        conn = sqlite3.connect(self.db_path, isolation_level=None, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        _tune_connection(conn)
+        try:
+            stopping = False
+            while not stopping:
+                requests = [self._queue.get()]
+                while len(requests) < MAX_WRITES_PER_COMMIT:
+                    try:
+                        requests.append(self._queue.get_nowait())
+                    except queue.Empty:
+                        break
+                group: list[_WriteRequest] = []
+                for request in requests:
+                    if request is None:
+                        stopping = True
+                    elif request.exclusive:
+                        self._commit(conn, group)
+                        group = []
+                        self._run_exclusive(conn, request)
+                    else:
+                        group.append(request)
+                self._commit(conn, group)
+        finally:
+            conn.close()
+
+    def _run_exclusive(self, conn: sqlite3.Connection, request: _WriteRequest) -> None:
+        """Run a request's jobs outside a transaction and resolve its future."""
+        try:
+            results = [job(conn) for job in request.jobs]
+        except Exception as e:
+            request.future.set_exception(e)
+        else:
+            request.future.set_result(results)
+
+    def _commit(
+        self,
+        conn: sqlite3.Connection,
+        requests: list[_WriteRequest],
+    ) -> None:
+        """Run a group of requests in one transaction and resolve their futures."""
+        if not requests:
+            return
+        outcomes: list[tuple[Future[list[Any]], list[Any] | BaseException]] = []
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            for request in requests:
+                conn.execute("SAVEPOINT request")
+                try:
+                    results = [job(conn) for job in request.jobs]
+                except Exception as e:
+                    conn.execute("ROLLBACK TO request")
+                    outcomes.append((request.future, e))
+                else:
+                    outcomes.append((request.future, results))
+                conn.execute("RELEASE request")
+            conn.execute("COMMIT")
+        except Exception as e:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            outcomes = [(request.future, e) for request in requests]
+
+        for future, outcome in outcomes:
+            if isinstance(outcome, BaseException):
+                future.set_exception(outcome)
+            else:
+                future.set_result(outcome)
+
+
 class Database:
     """
     SQLite database manager for issue state tracking.
@@ -136,6 +359,11 @@ class Database:
         self._local = threading.local()
         self._init_lock = threading.Lock()
         self._initialized = False
+        self._writer = _Writer(db_path)
+        # Issue states prefetched for the current poll cycle (see cache_issue_states)
+        self._state_cache: dict[tuple[str, int], IssueState | None] | None = None
+        self._state_cache_version = 0
+        self._state_cache_lock = threading.Lock()
         self.init_db()
 
     def _get_conn(self) -> sqlite3.Connection:
@@ -143,8 +371,16 @@ class Database:
         if not hasattr(self._local, "conn") or self._local.conn is None:
             self._local.conn = sqlite3.connect(self.db_path)
             self._local.conn.row_factory = sqlite3.Row
+            _tune_connection(self._local.conn)
         return self._local.conn  # type: ignore[no-any-return]
 
+    def _write(self, job: WriteJob) -> Any:
+        """Run a write job on the writer thread, blocking until it is committed.
+
+        Concurrent callers share a transaction (see _Writer).
+        """
+        return self._writer.run([job])[0]
+
     @property
     def conn(self) -> sqlite3.Connection:
         """Property for backwards compatibility - returns thread-local connection."""
@@ -166,6 +402,11 @@ class Database:
             if self._initialized:
                 return
             conn = self._get_conn()
+            # WAL is persistent in the database file, so setting it once is enough
+            # auto_vacuum must be chosen before the first table is created; existing
+            # databases are converted by enable_incremental_vacuum() at daemon startup
+            conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+            conn.execute("PRAGMA journal_mode = WAL")
             with conn:
                 conn.execute("""
                     CREATE TABLE IF NOT EXISTS issue_states (
@@ -246,6 +487,38 @@ class Database:
                     CREATE INDEX IF NOT EXISTS idx_run_history_repo_issue
                     ON run_history (repo, issue_number)
                 """)
+                # Indexes for time-range, outcome and workflow queries and retention
+                conn.execute("""
+                    CREATE INDEX IF NOT EXISTS idx_run_history_started_at
+                    ON run_history (started_at)
+                """)
+                conn.execute("""
+                    CREATE INDEX IF NOT EXISTS idx_run_history_completed_at
+                    ON run_history (completed_at)
+                """)
+                conn.execute("""
+                    CREATE INDEX IF NOT EXISTS idx_run_history_outcome
+                    ON run_history (outcome, started_at)
+                """)
+                conn.execute("""
+                    CREATE INDEX IF NOT EXISTS idx_run_history_workflow
+                    ON run_history (workflow, started_at)
+                """)
+
+                # Create run_history_daily table with per-day rollups of completed runs,
+                # kept after the underlying run_history rows are deleted
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS run_history_daily (
+                        day TEXT NOT NULL,
+                        repo TEXT NOT NULL,
+                        workflow TEXT NOT NULL,
+                        outcome TEXT NOT NULL,
+                        runs INTEGER NOT NULL,
+                        total_duration_seconds REAL NOT NULL,
+                        max_duration_seconds REAL NOT NULL,
+                        PRIMARY KEY (day, repo, workflow, outcome)
+                    )
+                """)
 
                 # Create processing_comments table for tracking active comment processing
                 # Used to detect stale eyes reactions from crashes
@@ -258,6 +531,10 @@ class Database:
                         PRIMARY KEY (repo, issue_number, comment_id)
                     )
                 """)
+                conn.execute("""
+                    CREATE INDEX IF NOT EXISTS idx_processing_comments_started_at
+                    ON processing_comments (started_at)
+                """)
 
                 # Create merge_queue table for Dependabot auto-merge queue tracking
                 conn.execute("""
@@ -276,6 +553,15 @@ class Database:
                     CREATE INDEX IF NOT EXISTS idx_merge_queue_repo_position
                     ON merge_queue (repo, position)
                 """)
+
+                # Create board_snapshot table for incremental board diffing
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS board_snapshot (
+                        item_id TEXT PRIMARY KEY,
+                        fingerprint TEXT NOT NULL,
+                        last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                    )
+                """)
             self._initialized = True
 
     def get_issue_state(self, repo: str, issue_number: int) -> IssueState | None:
@@ -289,13 +575,88 @@ class Database:
         Returns:
             IssueState object if found, None otherwise
         """
+        with self._state_cache_lock:
+            cache = self._state_cache
+            if cache is not None and (repo, issue_number) in cache:
+                return cache[(repo, issue_number)]
+        return self._select_issue_state(self._get_conn(), repo, issue_number)
+
+    def get_issue_states_bulk(
+        self, keys: Iterable[tuple[str, int]]
+    ) -> dict[tuple[str, int], IssueState]:
+        """
+        Retrieve the states of many issues with one query per repository chunk.
+
+        Args:
+            keys: (repo, issue_number) pairs
+
+        Returns:
+            Dict mapping (repo, issue_number) to its IssueState; issues without
+            a stored state are absent
+        """
+        by_repo: dict[str, set[int]] = defaultdict(set)
+        for repo, issue_number in keys:
+            by_repo[repo].add(issue_number)
+
         conn = self._get_conn()
-        cursor = conn.cursor()
-        cursor.execute(
-            """
-            SELECT repo, issue_number, status, last_updated, branch_name, project_url,
-                   last_processed_comment_timestamp, last_known_comment_count,
-                   research_session_id, plan_session_id, implement_session_id, placement_status
+        states: dict[tuple[str, int], IssueState] = {}
+        for repo, numbers in by_repo.items():
+            ordered = sorted(numbers)
+            for start in range(0, len(ordered), ISSUE_STATE_CHUNK_SIZE):
+                chunk = ordered[start : start + ISSUE_STATE_CHUNK_SIZE]
+                placeholders = ", ".join("?" * len(chunk))
+                cursor = conn.execute(
+                    f"""
+                    SELECT {_ISSUE_STATE_COLUMNS}
+                    FROM issue_states
+                    WHERE repo = ? AND issue_number IN ({placeholders})
+                    """,
+                    (repo, *chunk),
+                )
+                for row in cursor.fetchall():
+                    states[(repo, row["issue_number"])] = self._row_to_issue_state(row)
+        return states
+
+    def cache_issue_states(self, keys: Iterable[tuple[str, int]]) -> None:
+        """
+        Prefetch issue states so get_issue_state() is served from memory.
+
+        Replaces the previous cache. Called once per poll cycle with every
+        item on the boards; issues without a stored state are cached as
+        missing. Writes through update_issue_state() evict the issue, so the
+        cache never serves a value older than the last write.
+
+        Args:
+            keys: (repo, issue_number) pairs to prefetch
+        """
+        keys = list(keys)
+        with self._state_cache_lock:
+            version = self._state_cache_version
+        states = self.get_issue_states_bulk(keys)
+        cache: dict[tuple[str, int], IssueState | None] = dict.fromkeys(keys)
+        cache.update(states)
+        with self._state_cache_lock:
+            # An issue written while we were reading may be stale in `states`
+            if version == self._state_cache_version:
+                self._state_cache = cache
+            else:
+                self._state_cache = None
+
+    def _evict_issue_state(self, repo: str, issue_number: int) -> None:
+        """Drop an issue from the prefetched cache before it is written."""
+        with self._state_cache_lock:
+            self._state_cache_version += 1
+            if self._state_cache is not None:
+                self._state_cache.pop((repo, issue_number), None)
+
+    @staticmethod
+    def _select_issue_state(
+        conn: sqlite3.Connection, repo: str, issue_number: int
+    ) -> IssueState | None:
+        """Read one issue state through the given connection."""
+        cursor = conn.execute(
+            f"""
+            SELECT {_ISSUE_STATE_COLUMNS}
             FROM issue_states
             WHERE repo = ? AND issue_number = ?
             """,
@@ -304,22 +665,27 @@ class Database:
 
         row = cursor.fetchone()
         if row:
-            return IssueState(
-                repo=row["repo"],
-                issue_number=row["issue_number"],
-                status=row["status"],
-                last_updated=datetime.fromisoformat(row["last_updated"]),
-                branch_name=row["branch_name"],
-                project_url=row["project_url"],
-                last_processed_comment_timestamp=row["last_processed_comment_timestamp"],
-                last_known_comment_count=row["last_known_comment_count"],
-                research_session_id=row["research_session_id"],
-                plan_session_id=row["plan_session_id"],
-                implement_session_id=row["implement_session_id"],
-                placement_status=row["placement_status"],
-            )
+            return Database._row_to_issue_state(row)
         return None
 
+    @staticmethod
+    def _row_to_issue_state(row: sqlite3.Row) -> IssueState:
+        """Build an IssueState from an issue_states row."""
+        return IssueState(
+            repo=row["repo"],
+            issue_number=row["issue_number"],
+            status=row["status"],
+            last_updated=datetime.fromisoformat(row["last_updated"]),
+            branch_name=row["branch_name"],
+            project_url=row["project_url"],
+            last_processed_comment_timestamp=row["last_processed_comment_timestamp"],
+            last_known_comment_count=row["last_known_comment_count"],
+            research_session_id=row["research_session_id"],
+            plan_session_id=row["plan_session_id"],
+            implement_session_id=row["implement_session_id"],
+            placement_status=row["placement_status"],
+        )
+
     def get_all_issue_states(self, limit: int = 100) -> list[IssueState]:
         """
         Get all tracked issue states, ordered by last_updated descending.
@@ -333,10 +699,8 @@ class Database:
         conn = self._get_conn()
         cursor = conn.cursor()
         cursor.execute(
-            """
-            SELECT repo, issue_number, status, last_updated, branch_name, project_url,
-                   last_processed_comment_timestamp, last_known_comment_count,
-                   research_session_id, plan_session_id, implement_session_id, placement_status
+            f"""
+            SELECT {_ISSUE_STATE_COLUMNS}
             FROM issue_states
             ORDER BY last_updated DESC
             LIMIT ?
@@ -344,25 +708,7 @@ class Database:
             (limit,),
         )
 
-        states = []
-        for row in cursor.fetchall():
-            states.append(
-                IssueState(
-                    repo=row["repo"],
-                    issue_number=row["issue_number"],
-                    status=row["status"],
-                    last_updated=datetime.fromisoformat(row["last_updated"]),
-                    branch_name=row["branch_name"],
-                    project_url=row["project_url"],
-                    last_processed_comment_timestamp=row["last_processed_comment_timestamp"],
-                    last_known_comment_count=row["last_known_comment_count"],
-                    research_session_id=row["research_session_id"],
-                    plan_session_id=row["plan_session_id"],
-                    implement_session_id=row["implement_session_id"],
-                    placement_status=row["placement_status"],
-                )
-            )
-        return states
+        return [self._row_to_issue_state(row) for row in cursor.fetchall()]
 
     def update_issue_state(
         self,
@@ -397,33 +743,31 @@ class Database:
             implement_session_id: Claude session ID for Implement workflow (optional, preserved if not provided)
             placement_status: Original status when issue first entered workflow (optional, preserved if not provided; use empty string to clear)
         """
-        conn = self._get_conn()
+        values = {
+            "branch_name": branch_name,
+            "project_url": project_url,
+            "last_processed_comment_timestamp": last_processed_comment_timestamp,
+            "last_known_comment_count": last_known_comment_count,
+            "research_session_id": research_session_id,
+            "plan_session_id": plan_session_id,
+            "implement_session_id": implement_session_id,
+            "placement_status": placement_status,
+        }
+
+        def write(conn: sqlite3.Connection) -> None:
+            # Preserve existing values if not provided. Read on the writer
+            # connection so queued updates to the same issue are seen.
+            existing = self._select_issue_state(conn, repo, issue_number)
+            merged = dict(values)
+            if existing:
+                for name, value in merged.items():
+                    if value is None:
+                        merged[name] = getattr(existing, name)
+
+            # Convert empty string to None for placement_status (used to clear the value)
+            if merged["placement_status"] == "":
+                merged["placement_status"] = None
 
-        # Preserve existing values if not provided
-        existing = self.get_issue_state(repo, issue_number)
-        if existing:
-            if branch_name is None:
-                branch_name = existing.branch_name
-            if project_url is None:
-                project_url = existing.project_url
-            if last_processed_comment_timestamp is None:
-                last_processed_comment_timestamp = existing.last_processed_comment_timestamp
-            if last_known_comment_count is None:
-                last_known_comment_count = existing.last_known_comment_count
-            if research_session_id is None:
-                research_session_id = existing.research_session_id
-            if plan_session_id is None:
-                plan_session_id = existing.plan_session_id
-            if implement_session_id is None:
-                implement_session_id = existing.implement_session_id
-            if placement_status is None:
-                placement_status = existing.placement_status
-
-        # Convert empty string to None for placement_status (used to clear the value)
-        if placement_status == "":
-            placement_status = None
-
-        with conn:
             conn.execute(
                 """
                 INSERT OR REPLACE INTO issue_states
@@ -437,17 +781,23 @@ class Database:
                     issue_number,
                     status,
                     datetime.now().isoformat(),
-                    branch_name,
-                    project_url,
-                    last_processed_comment_timestamp,
-                    last_known_comment_count,
-                    research_session_id,
-                    plan_session_id,
-                    implement_session_id,
-                    placement_status,
+                    merged["branch_name"],
+                    merged["project_url"],
+                    merged["last_processed_comment_timestamp"],
+                    merged["last_known_comment_count"],
+                    merged["research_session_id"],
+                    merged["plan_session_id"],
+                    merged["implement_session_id"],
+                    merged["placement_status"],
                 ),
             )
 
+        # Evict before and after the write: a prefetch racing with the write
+        # may have cached the row as it was before the commit
+        self._evict_issue_state(repo, issue_number)
+        self._write(write)
+        self._evict_issue_state(repo, issue_number)
+
     def get_project_metadata(self, project_url: str) -> ProjectMetadata | None:
         """
         Retrieve cached metadata for a project.
@@ -490,23 +840,24 @@ class Database:
         Args:
             metadata: ProjectMetadata object to store
         """
-        conn = self._get_conn()
-        with conn:
-            conn.execute(
+        params = (
+            metadata.project_url,
+            metadata.repo,
+            metadata.project_id,
+            metadata.status_field_id,
+            json.dumps(metadata.status_options),
+            datetime.now().isoformat(),
+        )
+        self._write(
+            lambda conn: conn.execute(
                 """
                 INSERT OR REPLACE INTO project_metadata
                 (project_url, repo, project_id, status_field_id, status_options, last_updated)
                 VALUES (?, ?, ?, ?, ?, ?)
                 """,
-                (
-                    metadata.project_url,
-                    metadata.repo,
-                    metadata.project_id,
-                    metadata.status_field_id,
-                    json.dumps(metadata.status_options),
-                    datetime.now().isoformat(),
-                ),
+                params,
             )
+        )
 
     def get_workflow_session_id(self, repo: str, issue_number: int, workflow: str) -> str | None:
         """
@@ -579,29 +930,32 @@ class Database:
         Returns:
             The auto-generated ID of the inserted record
         """
-        conn = self._get_conn()
-        with conn:
+        params = (
+            record.repo,
+            record.issue_number,
+            record.workflow,
+            record.started_at.isoformat(),
+            record.completed_at.isoformat() if record.completed_at else None,
+            record.outcome,
+            record.session_id,
+            record.log_path,
+        )
+
+        def write(conn: sqlite3.Connection) -> int | None:
             cursor = conn.execute(
                 """
                 INSERT INTO run_history
                 (repo, issue_number, workflow, started_at, completed_at, outcome, session_id, log_path)
                 VALUES (?, ?, ?, ?, ?, ?, ?, ?)
                 """,
-                (
-                    record.repo,
-                    record.issue_number,
-                    record.workflow,
-                    record.started_at.isoformat(),
-                    record.completed_at.isoformat() if record.completed_at else None,
-                    record.outcome,
-                    record.session_id,
-                    record.log_path,
-                ),
+                params,
             )
-            lastrowid = cursor.lastrowid
-            if lastrowid is None:
-                raise RuntimeError("Failed to get lastrowid after INSERT")
-            return lastrowid
+            return cursor.lastrowid
+
+        lastrowid: int | None = self._write(write)
+        if lastrowid is None:
+            raise RuntimeError("Failed to get lastrowid after INSERT")
+        return lastrowid
 
     def update_run_record(
         self,
@@ -621,30 +975,26 @@ class Database:
             session_id: Claude session ID for linking to conversation
             log_path: Path to the per-run log file
         """
-        conn = self._get_conn()
-        with conn:
-            # Build dynamic UPDATE query for non-None fields
-            updates = []
-            params = []
-            if completed_at is not None:
-                updates.append("completed_at = ?")
-                params.append(completed_at.isoformat())
-            if outcome is not None:
-                updates.append("outcome = ?")
-                params.append(outcome)
-            if session_id is not None:
-                updates.append("session_id = ?")
-                params.append(session_id)
-            if log_path is not None:
-                updates.append("log_path = ?")
-                params.append(log_path)
-
-            if updates:
-                params.append(str(run_id))
-                conn.execute(
-                    f"UPDATE run_history SET {', '.join(updates)} WHERE id = ?",
-                    params,
-                )
+        # Build dynamic UPDATE query for non-None fields
+        updates = []
+        params = []
+        if completed_at is not None:
+            updates.append("completed_at = ?")
+            params.append(completed_at.isoformat())
+        if outcome is not None:
+            updates.append("outcome = ?")
+            params.append(outcome)
+        if session_id is not None:
+            updates.append("session_id = ?")
+            params.append(session_id)
+        if log_path is not None:
+            updates.append("log_path = ?")
+            params.append(log_path)
+
+        if updates:
+            params.append(str(run_id))
+            sql = f"UPDATE run_history SET {', '.join(updates)} WHERE id = ?"
+            self._write(lambda conn: conn.execute(sql, params))
 
     def get_run_history(self, repo: str, issue_number: int, limit: int = 50) -> list[RunRecord]:
         """
@@ -730,6 +1080,179 @@ class Database:
             )
         return None
 
+    def get_run_rollups(
+        self,
+        since_day: str | None = None,
+        repo: str | None = None,
+        workflow: str | None = None,
+    ) -> list[RunRollup]:
+        """
+        Get daily run aggregates, optionally filtered.
+
+        Only days that have ended are aggregated, so today's runs are not
+        included (see apply_retention).
+
+        Args:
+            since_day: Earliest day to include (YYYY-MM-DD)
+            repo: Only include this repository
+            workflow: Only include this workflow
+
+        Returns:
+            List of RunRollup objects ordered by day, repo, workflow and outcome
+        """
+        conditions = []
+        params: list[str] = []
+        if since_day is not None:
+            conditions.append("day >= ?")
+            params.append(since_day)
+        if repo is not None:
+            conditions.append("repo = ?")
+            params.append(repo)
+        if workflow is not None:
+            conditions.append("workflow = ?")
+            params.append(workflow)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+        cursor = self._get_conn().execute(
+            f"""
+            SELECT day, repo, workflow, outcome, runs, total_duration_seconds,
+                   max_duration_seconds
+            FROM run_history_daily
+            {where}
+            ORDER BY day, repo, workflow, outcome
+            """,
+            params,
+        )
+        return [
+            RunRollup(
+                day=row["day"],
+                repo=row["repo"],
+                workflow=row["workflow"],
+                outcome=row["outcome"],
+                runs=row["runs"],
+                total_duration_seconds=row["total_duration_seconds"],
+                max_duration_seconds=row["max_duration_seconds"],
+            )
+            for row in cursor.fetchall()
+        ]
+
+    def apply_retention(self, max_age_days: int, max_rows: int) -> RetentionResult:
+        """
+        Roll up finished days, delete old run history and reclaim free pages
+        with a bounded incremental vacuum.
+
+        Runs are aggregated into run_history_daily by completion day once the
+        day has ended, and only runs of aggregated days are ever deleted, so
+        the rollups stay complete. Deleted are runs started more than
+        max_age_days ago (including runs that never completed) and, beyond
+        that, the oldest runs over max_rows. processing_comments rows older
+        than max_age_days are orphans from crashes and are deleted too.
+
+        Args:
+            max_age_days: Delete runs started longer ago than this (0 keeps all)
+            max_rows: Keep at most this many run_history rows (0 for no cap)
+
+        Returns:
+            RetentionResult with what was rolled up and deleted
+        """
+        today = datetime.now().strftime("%Y-%m-%d")
+        cutoff = (
+            (datetime.now() - timedelta(days=max_age_days)).isoformat() if max_age_days else None
+        )
+
+        def write(conn: sqlite3.Connection) -> RetentionResult:
+            result = RetentionResult()
+
+            # Aggregate every completed day not rolled up yet (days are rolled up once)
+            last_day = conn.execute("SELECT MAX(day) FROM run_history_daily").fetchone()[0]
+            start = (
+                (date.fromisoformat(last_day) + timedelta(days=1)).isoformat() if last_day else ""
+            )
+            result.rolled_up_days = conn.execute(
+                """
+                SELECT COUNT(DISTINCT substr(completed_at, 1, 10)) FROM run_history
+                WHERE completed_at >= ? AND completed_at < ?
+                """,
+                (start, today),
+            ).fetchone()[0]
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO run_history_daily
+                (day, repo, workflow, outcome, runs, total_duration_seconds, max_duration_seconds)
+                SELECT day, repo, workflow, outcome, COUNT(*), SUM(duration), MAX(duration)
+                FROM (
+                    SELECT substr(completed_at, 1, 10) AS day, repo, workflow,
+                           COALESCE(outcome, 'unknown') AS outcome,
+                           MAX(0, (julianday(completed_at) - julianday(started_at)) * 86400)
+                               AS duration
+                    FROM run_history
+                    WHERE completed_at >= ? AND completed_at < ?
+                )
+                GROUP BY day, repo, workflow, outcome
+                """,
+                (start, today),
+            )
+
+            # Completed runs of rolled-up days, or runs that never completed
+            deletable = "(completed_at < :today OR completed_at IS NULL)"
+            if cutoff is not None:
+                result.deleted_runs += conn.execute(
+                    f"DELETE FROM run_history WHERE started_at < :cutoff AND {deletable}",
+                    {"cutoff": cutoff, "today": today},
+                ).rowcount
+                result.deleted_processing_comments = conn.execute(
+                    "DELETE FROM processing_comments WHERE started_at < ?", (cutoff,)
+                ).rowcount
+            if max_rows:
+                result.deleted_runs += conn.execute(
+                    """
+                    DELETE FROM run_history
+                    WHERE completed_at < :today AND id NOT IN (
+                        SELECT id FROM run_history ORDER BY started_at DESC LIMIT :max_rows
+                    )
+                    """,
+                    {"today": today, "max_rows": max_rows},
+                ).rowcount
+            return result
+
+        result: RetentionResult = self._writer.run([write])[0]
+        self._vacuum()
+        return result
+
+    def _vacuum(self) -> None:
+        """Return up to RETENTION_VACUUM_PAGES free pages to the filesystem.
+
+        Only databases in incremental auto_vacuum mode release pages; a full
+        VACUUM is never run here (see enable_incremental_vacuum).
+        """
+
+        def vacuum(conn: sqlite3.Connection) -> None:
+            if conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2:
+                conn.execute(f"PRAGMA incremental_vacuum({RETENTION_VACUUM_PAGES})").fetchall()
+
+        self._writer.run([vacuum], exclusive=True)
+
+    def enable_incremental_vacuum(self) -> bool:
+        """Switch a database created before incremental auto_vacuum to it.
+
+        The switch takes one full VACUUM, which rewrites the whole file and
+        blocks every other write while it runs, so it is meant for startup,
+        before any work is scheduled. Does nothing if the mode is already set.
+
+        Returns:
+            True if the database was converted
+        """
+
+        def convert(conn: sqlite3.Connection) -> bool:
+            if conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2:
+                return False
+            conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+            conn.execute("VACUUM")
+            return True
+
+        converted: bool = self._writer.run([convert], exclusive=True)[0]
+        return converted
+
     def add_processing_comment(self, repo: str, issue_number: int, comment_id: str) -> None:
         """Record that a comment is being processed.
 
@@ -738,16 +1261,17 @@ class Database:
             issue_number: GitHub issue number
             comment_id: GraphQL node ID for the comment
         """
-        conn = self._get_conn()
-        with conn:
-            conn.execute(
+        params = (repo, issue_number, comment_id, datetime.now().isoformat())
+        self._write(
+            lambda conn: conn.execute(
                 """
                 INSERT OR REPLACE INTO processing_comments
                 (repo, issue_number, comment_id, started_at)
                 VALUES (?, ?, ?, ?)
                 """,
-                (repo, issue_number, comment_id, datetime.now().isoformat()),
+                params,
             )
+        )
 
     def remove_processing_comment(self, repo: str, issue_number: int, comment_id: str) -> None:
         """Remove a comment from processing tracking.
@@ -759,15 +1283,15 @@ class Database:
             issue_number: GitHub issue number
             comment_id: GraphQL node ID for the comment
         """
-        conn = self._get_conn()
-        with conn:
-            conn.execute(
+        self._write(
+            lambda conn: conn.execute(
                 """
                 DELETE FROM processing_comments
                 WHERE repo = ? AND issue_number = ? AND comment_id = ?
                 """,
                 (repo, issue_number, comment_id),
             )
+        )
 
     def get_stale_processing_comments(
         self, stale_threshold_seconds: int = 3600
@@ -784,8 +1308,6 @@ class Database:
         Returns:
             List of (repo, issue_number, comment_id) tuples for stale comments
         """
-        from datetime import timedelta
-
         conn = self._get_conn()
         cursor = conn.cursor()
         # Calculate threshold as ISO timestamp for direct comparison
@@ -809,9 +1331,8 @@ class Database:
             pr_number: Pull request number
             position: Queue position (0 = first in queue)
         """
-        conn = self._get_conn()
-        with conn:
-            conn.execute(
+        self._write(
+            lambda conn: conn.execute(
                 """
                 INSERT OR REPLACE INTO merge_queue
                 (repo, pr_number, position, status, queued_at, last_checked)
@@ -819,6 +1340,7 @@ class Database:
                 """,
                 (repo, pr_number, position),
             )
+        )
 
     def get_merge_queue(self, repo: str) -> list[MergeQueueEntry]:
         """Get all entries in the merge queue for a repository, ordered by position.
@@ -865,29 +1387,23 @@ class Database:
         Args:
             repo: Repository name (e.g., "github.com/owner/repo")
             pr_number: Pull request number
-            status: New status ('queued', 'merging', 'waiting_rebase', 'waiting_ci')
+            status: New status ('queued', 'merging', 'waiting_rebase', 'waiting_ci',
+                'testing')
             update_last_checked: Whether to update the last_checked timestamp (default True)
         """
-        conn = self._get_conn()
-        with conn:
-            if update_last_checked:
-                conn.execute(
-                    """
-                    UPDATE merge_queue
-                    SET status = ?, last_checked = CURRENT_TIMESTAMP
-                    WHERE repo = ? AND pr_number = ?
-                    """,
-                    (status, repo, pr_number),
-                )
-            else:
-                conn.execute(
-                    """
-                    UPDATE merge_queue
-                    SET status = ?
-                    WHERE repo = ? AND pr_number = ?
-                    """,
-                    (status, repo, pr_number),
-                )
+        if update_last_checked:
+            sql = """
+                UPDATE merge_queue
+                SET status = ?, last_checked = CURRENT_TIMESTAMP
+                WHERE repo = ? AND pr_number = ?
+                """
+        else:
+            sql = """
+                UPDATE merge_queue
+                SET status = ?
+                WHERE repo = ? AND pr_number = ?
+                """
+        self._write(lambda conn: conn.execute(sql, (status, repo, pr_number)))
 
     def remove_from_merge_queue(self, repo: str, pr_number: int) -> None:
         """Remove a PR from the merge queue.
@@ -898,8 +1414,8 @@ class Database:
             repo: Repository name (e.g., "github.com/owner/repo")
             pr_number: Pull request number
         """
-        conn = self._get_conn()
-        with conn:
+
+        def write(conn: sqlite3.Connection) -> None:
             # Get the position of the PR being removed
             cursor = conn.execute(
                 "SELECT position FROM merge_queue WHERE repo = ? AND pr_number = ?",
@@ -927,6 +1443,8 @@ class Database:
                 (repo, removed_position),
             )
 
+        self._write(write)
+
     def get_merge_queue_by_status(self, repo: str, status: str) -> MergeQueueEntry | None:
         """Get the first entry in the merge queue with a specific status.
 
@@ -964,13 +1482,48 @@ class Database:
             )
         return None
 
+    def get_board_snapshot(self) -> dict[str, str]:
+        """Get the persisted board item fingerprints.
+
+        Returns:
+            Dict mapping board item ID to fingerprint
+        """
+        conn = self._get_conn()
+        cursor = conn.cursor()
+        cursor.execute("SELECT item_id, fingerprint FROM board_snapshot")
+        return {row["item_id"]: row["fingerprint"] for row in cursor.fetchall()}
+
+    def update_board_snapshot(self, fingerprints: dict[str, str], removed: list[str]) -> None:
+        """Upsert changed board item fingerprints and delete removed items.
+
+        Args:
+            fingerprints: Dict mapping board item ID to its new fingerprint
+            removed: Board item IDs no longer on any board
+        """
+        upserts = list(fingerprints.items())
+        deletes = [(item_id,) for item_id in removed]
+
+        def write(conn: sqlite3.Connection) -> None:
+            conn.executemany(
+                """
+                INSERT OR REPLACE INTO board_snapshot (item_id, fingerprint, last_updated)
+                VALUES (?, ?, CURRENT_TIMESTAMP)
+                """,
+                upserts,
+            )
+            conn.executemany("DELETE FROM board_snapshot WHERE item_id = ?", deletes)
+
+        self._write(write)
+
     def close(self) -> None:
         """
-        Close the current thread's database connection.
+        Close the current thread's database connection and stop the writer.
 
-        Should be called when done with the database to free resources.
-        Can also be used via context manager pattern.
+        Queued writes are committed before the writer stops; it restarts on
+        the next write. Should be called when done with the database to free
+        resources. Can also be used via context manager pattern.
         """
+        self._writer.stop()
         if hasattr(self._local, "conn") and self._local.conn:
             self._local.conn.close()
             self._local.conn = None
@@ -8,63 +8,103 @@ This package contains modules for optional external services:
 - repo_credentials: Repository credential file management
 - slack: Slack notifications
 - telemetry: OpenTelemetry instrumentation
+
+Submodules are imported on first access of a re-exported name, so importing
+one integration (e.g. telemetry) does not load the dependencies of the others
+(mcp, requests).
 """
 
-# Re-exports from azure_oauth
-from src.integrations.azure_oauth import (
-    AzureOAuthClient,
-    AzureOAuthError,
-    AzureTokenRequestError,
-)
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    # Re-exports from azure_oauth
+    from src.integrations.azure_oauth import (
+        AzureOAuthClient,
+        AzureOAuthError,
+        AzureTokenRequestError,
+    )
+
+    # Re-exports from mcp_client
+    from src.integrations.mcp_client import (
+        MCPTestResult,
+        check_all_mcp_servers,
+        check_mcp_server,
+    )
 
-# Re-exports from mcp_client
-from src.integrations.mcp_client import (
-    MCPTestResult,
-    check_all_mcp_servers,
-    check_mcp_server,
-)
+    # Re-exports from mcp_config
+    from src.integrations.mcp_config import (
+        MCPConfig,
+        MCPConfigError,
+        MCPConfigLoadError,
+        MCPConfigManager,
+        MCPConfigWriteError,
+    )
 
-# Re-exports from mcp_config
-from src.integrations.mcp_config import (
-    MCPConfig,
-    MCPConfigError,
-    MCPConfigLoadError,
-    MCPConfigManager,
-    MCPConfigWriteError,
-)
+    # Re-exports from pr_validation
+    from src.integrations.pr_validation import (
+        PRValidationEntry,
+        PRValidationError,
+        PRValidationLoadError,
+        PRValidationManager,
+    )
 
-# Re-exports from pr_validation
-from src.integrations.pr_validation import (
-    PRValidationEntry,
-    PRValidationError,
-    PRValidationLoadError,
-    PRValidationManager,
-)
+    # Re-exports from repo_credentials
+    from src.integrations.repo_credentials import (
+        RepoCredentialEntry,
+        RepoCredentialsError,
+        RepoCredentialsLoadError,
+        RepoCredentialsManager,
+    )
 
-# Re-exports from repo_credentials
-from src.integrations.repo_credentials import (
-    RepoCredentialEntry,
-    RepoCredentialsError,
-    RepoCredentialsLoadError,
-    RepoCredentialsManager,
-)
+    # Re-exports from slack
+    from src.integrations.slack import (
+        init_slack,
+        send_comment_processed_notification,
+        send_phase_completion_notification,
+        send_startup_ping,
+    )
 
-# Re-exports from slack
-from src.integrations.slack import (
-    init_slack,
-    send_comment_processed_notification,
-    send_phase_completion_notification,
-    send_startup_ping,
-)
+    # Re-exports from telemetry
+    from src.integrations.telemetry import (
+        LLMMetrics,
+        get_git_version,
+        get_tracer,
+        init_telemetry,
+        record_llm_metrics,
+    )
 
-# Re-exports from telemetry
-from src.integrations.telemetry import (
-    LLMMetrics,
-    get_git_version,
-    get_tracer,
-    init_telemetry,
-    record_llm_metrics,
-)
+# Re-exported name -> submodule defining it
+_EXPORTS: dict[str, str] = {
+    "AzureOAuthClient": "azure_oauth",
+    "AzureOAuthError": "azure_oauth",
+    "AzureTokenRequestError": "azure_oauth",
+    "MCPTestResult": "mcp_client",
+    "check_all_mcp_servers": "mcp_client",
+    "check_mcp_server": "mcp_client",
+    "MCPConfig": "mcp_config",
+    "MCPConfigError": "mcp_config",
+    "MCPConfigLoadError": "mcp_config",
+    "MCPConfigManager": "mcp_config",
+    "MCPConfigWriteError": "mcp_config",
+    "PRValidationEntry": "pr_validation",
+    "PRValidationError": "pr_validation",
+    "PRValidationLoadError": "pr_validation",
+    "PRValidationManager": "pr_validation",
+    "RepoCredentialEntry": "repo_credentials",
+    "RepoCredentialsError": "repo_credentials",
+    "RepoCredentialsLoadError": "repo_credentials",
+    "RepoCredentialsManager": "repo_credentials",
+    "init_slack": "slack",
+    "send_comment_processed_notification": "slack",
+    "send_phase_completion_notification": "slack",
+    "send_startup_ping": "slack",
+    "LLMMetrics": "telemetry",
+    "get_git_version": "telemetry",
+    "get_tracer": "telemetry",
+    "init_telemetry": "telemetry",
+    "record_llm_metrics": "telemetry",
+}
 
 __all__ = [
     # azure_oauth
@@ -103,3 +143,13 @@ __all__ = [
     "init_telemetry",
     "record_llm_metrics",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import a re-exported name from its submodule on first access."""
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module_name}"), name)
+    globals()[name] = value
+    return value
@@ -3,6 +3,15 @@
 This module provides management of auto-merging configuration for Dependabot PRs,
 including loading settings from .kiln/auto-merging.yaml and per-repo lookup for
 determining which repositories have auto-merging enabled.
+
+Each repository picks a queue strategy. "sequential" merges one PR at a time,
+asking Dependabot to rebase the next one after each merge. "speculative"
+merges the first batch_size queued PRs onto the base branch in a local clone,
+pushes the result so CI tests them together, and merges the passing prefix;
+batching chooses whether every prefix of the batch is tested at once
+("prefixes") or only the whole batch, halving it on failure ("bisect").
+A speculative train waits for CI on its pushed branches; repositories without
+CI set no_ci so a train without checks counts as passing.
 """
 
 import logging
@@ -22,6 +31,12 @@ AUTO_MERGING_CONFIG_PATH = ".kiln/auto-merging.yaml"
 # Default values
 DEFAULT_MERGE_METHOD = "squash"
 DEFAULT_LABEL = "dependencies"
+DEFAULT_STRATEGY = "sequential"
+DEFAULT_BATCH_SIZE = 4
+DEFAULT_BATCHING = "prefixes"
+
+VALID_STRATEGIES = ("sequential", "speculative")
+VALID_BATCHINGS = ("prefixes", "bisect")
 
 
 class AutoMergingError(Exception):
@@ -46,12 +61,21 @@ class AutoMergingEntry:
         enabled: Whether auto-merging is enabled for this repository.
         merge_method: Merge method to use ('merge', 'squash', 'rebase').
         label: Label used to identify Dependabot PRs to auto-merge.
+        strategy: Queue strategy ('sequential' or 'speculative').
+        batch_size: Most PRs tested together by the speculative strategy.
+        batching: How a speculative batch is tested ('prefixes' or 'bisect').
+        no_ci: Whether the repository has no CI, so speculative trains pass
+            without checks instead of waiting for them.
     """
 
     repo: str
     enabled: bool
     merge_method: str = field(default=DEFAULT_MERGE_METHOD)
     label: str = field(default=DEFAULT_LABEL)
+    strategy: str = field(default=DEFAULT_STRATEGY)
+    batch_size: int = field(default=DEFAULT_BATCH_SIZE)
+    batching: str = field(default=DEFAULT_BATCHING)
+    no_ci: bool = False
 
 
 class AutoMergingManager:
@@ -193,13 +217,78 @@ class AutoMergingManager:
                 f"Repository entry {index} 'label' cannot be empty or whitespace"
             )
 
+        # Parse strategy and batching (default to sequential merging)
+        strategy = self._parse_choice(
+            index, repo_entry, "strategy", DEFAULT_STRATEGY, VALID_STRATEGIES
+        )
+        batching = self._parse_choice(
+            index, repo_entry, "batching", DEFAULT_BATCHING, VALID_BATCHINGS
+        )
+
+        # Parse batch_size (defaults to DEFAULT_BATCH_SIZE)
+        batch_size = repo_entry.get("batch_size", DEFAULT_BATCH_SIZE)
+        if not isinstance(batch_size, int) or isinstance(batch_size, bool):
+            raise AutoMergingLoadError(
+                f"Repository entry {index} 'batch_size' must be an integer, "
+                f"got {type(batch_size).__name__}"
+            )
+        if batch_size < 1:
+            raise AutoMergingLoadError(
+                f"Repository entry {index} 'batch_size' must be at least 1, got {batch_size}"
+            )
+
+        # Parse no_ci (defaults to False: speculative trains wait for checks)
+        no_ci = repo_entry.get("no_ci", False)
+        if not isinstance(no_ci, bool):
+            raise AutoMergingLoadError(
+                f"Repository entry {index} 'no_ci' must be a boolean, got {type(no_ci).__name__}"
+            )
+
         return AutoMergingEntry(
             repo=repo_key,
             enabled=enabled,
             merge_method=merge_method,
             label=label.strip(),
+            strategy=strategy,
+            batch_size=batch_size,
+            batching=batching,
+            no_ci=no_ci,
         )
 
+    def _parse_choice(
+        self,
+        index: int,
+        repo_entry: dict[str, Any],
+        key: str,
+        default: str,
+        choices: tuple[str, ...],
+    ) -> str:
+        """Parse an optional string field restricted to a set of values.
+
+        Args:
+            index: Index of the entry in the config list (for error messages).
+            repo_entry: Raw dictionary from the YAML config.
+            key: Field name.
+            default: Value used when the field is absent.
+            choices: Accepted values.
+
+        Returns:
+            The field's value.
+
+        Raises:
+            AutoMergingLoadError: If the value is not one of choices.
+        """
+        value = repo_entry.get(key, default)
+        if not isinstance(value, str):
+            raise AutoMergingLoadError(
+                f"Repository entry {index} '{key}' must be a string, got {type(value).__name__}"
+            )
+        if value not in choices:
+            raise AutoMergingLoadError(
+                f"Repository entry {index} '{key}' must be one of {choices}, got '{value}'"
+            )
+        return value
+
     def get_config(self, repo: str) -> AutoMergingEntry | None:
         """Get auto-merging settings for a specific repository.
 
@@ -1,16 +1,15 @@
-"""OpenTelemetry instrumentation for kiln."""
+"""OpenTelemetry instrumentation for kiln.
+
+Only the OpenTelemetry API is imported with this module; it hands out no-op
+tracers until init_telemetry() runs. The SDK and OTLP exporters (protobuf,
+requests) are imported by init_telemetry(), so they are only loaded when an
+endpoint is configured.
+"""
 
 from dataclasses import dataclass, field
 from typing import Any
 
 from opentelemetry import metrics, trace
-from opentelemetry.exporter.otlp.proto.http.metric_exporter import OTLPMetricExporter
-from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
-from opentelemetry.sdk.metrics import MeterProvider
-from opentelemetry.sdk.metrics.export import PeriodicExportingMetricReader
-from opentelemetry.sdk.resources import Resource
-from opentelemetry.sdk.trace import TracerProvider
-from opentelemetry.sdk.trace.export import BatchSpanProcessor
 
 from src.logger import get_logger
 
@@ -45,6 +44,9 @@ _meter: metrics.Meter | None = None
 _token_counter: metrics.Counter | None = None
 _cost_counter: metrics.Counter | None = None
 _duration_histogram: metrics.Histogram | None = None
+_queue_depth_histogram: metrics.Histogram | None = None
+_lane_wait_histogram: metrics.Histogram | None = None
+_lane_utilization_histogram: metrics.Histogram | None = None
 
 
 @dataclass
@@ -76,11 +78,20 @@ def init_telemetry(
         service_version: Optional service version (e.g., "v1.2.3")
     """
     global _initialized, _tracer, _meter
-    global _token_counter, _cost_counter, _duration_histogram
+    global _token_counter, _cost_counter, _duration_histogram, _queue_depth_histogram
+    global _lane_wait_histogram, _lane_utilization_histogram
 
     if _initialized or not endpoint:
         return
 
+    from opentelemetry.exporter.otlp.proto.http.metric_exporter import OTLPMetricExporter
+    from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+    from opentelemetry.sdk.metrics import MeterProvider
+    from opentelemetry.sdk.metrics.export import PeriodicExportingMetricReader
+    from opentelemetry.sdk.resources import Resource
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import BatchSpanProcessor
+
     resource_attrs = {"service.name": service_name}
     if service_version:
         resource_attrs["service.version"] = service_version
@@ -116,6 +127,21 @@ def init_telemetry(
         unit="ms",
         description="Duration of LLM requests in milliseconds",
     )
+    _queue_depth_histogram = _meter.create_histogram(
+        "kiln.queue.depth",
+        unit="jobs",
+        description="Jobs queued or running in a daemon work queue, sampled every poll",
+    )
+    _lane_wait_histogram = _meter.create_histogram(
+        "kiln.lane.wait",
+        unit="s",
+        description="Time work spent queued in a workflow lane before starting",
+    )
+    _lane_utilization_histogram = _meter.create_histogram(
+        "kiln.lane.utilization",
+        unit="1",
+        description="Fraction of a workflow lane's slots in use between samples",
+    )
 
     _initialized = True
     version_info = f", version={service_version}" if service_version else ""
@@ -169,3 +195,36 @@ def record_llm_metrics(
 
     if _duration_histogram and metrics_data.duration_ms > 0:
         _duration_histogram.record(metrics_data.duration_ms, attributes)
+
+
+def record_queue_depth(queue: str, depth: int) -> None:
+    """Record a sample of a daemon work queue's depth to OTel.
+
+    Args:
+        queue: Queue name (e.g., "comments")
+        depth: Jobs queued or running
+    """
+    if _queue_depth_histogram:
+        _queue_depth_histogram.record(depth, {"queue": queue})
+
+
+def record_lane_wait(lane: str, seconds: float) -> None:
+    """Record how long work waited in a workflow lane to OTel.
+
+    Args:
+        lane: Lane name (e.g., "implement")
+        seconds: Time between submission and start
+    """
+    if _lane_wait_histogram:
+        _lane_wait_histogram.record(seconds, {"lane": lane})
+
+
+def record_lane_utilization(lane: str, utilization: float) -> None:
+    """Record a workflow lane's slot utilization to OTel.
+
+    Args:
+        lane: Lane name (e.g., "implement")
+        utilization: Fraction of the lane's slots in use over the sampled window
+    """
+    if _lane_utilization_histogram:
+        _lane_utilization_histogram.record(utilization, {"lane": lane})
@@ -4,6 +4,7 @@ from src.interfaces.ticket import (
     CheckRunResult,
     Comment,
     LinkedPullRequest,
+    PullRequestSnapshot,
     TicketClient,
     TicketItem,
 )
@@ -12,6 +13,7 @@ __all__ = [
     "CheckRunResult",
     "Comment",
     "LinkedPullRequest",
+    "PullRequestSnapshot",
     "TicketClient",
     "TicketItem",
 ]
@@ -127,6 +127,37 @@ class LinkedPullRequest:
     title: str | None = None
 
 
+@dataclass
+class PullRequestSnapshot:
+    """Merge-relevant state of an open pull request, read in one batched query.
+
+    Attributes:
+        number: PR number
+        created_at: Creation timestamp (ISO 8601), used for FIFO queue order
+        labels: Names of the labels on the PR
+        merge_state_status: BEHIND, BLOCKED, CLEAN, DIRTY, UNSTABLE, UNKNOWN
+        mergeable: MERGEABLE, CONFLICTING, UNKNOWN
+        review_decision: APPROVED, CHANGES_REQUESTED, REVIEW_REQUIRED, or empty
+        head_sha: HEAD commit SHA
+        base_ref: Name of the branch the PR targets
+        base_head_sha: Commit the target branch currently points at, or None
+            if the branch was deleted
+        checks: Check runs and statuses of the HEAD commit, or None if they did
+            not fit in the query (look them up with get_check_runs())
+    """
+
+    number: int
+    created_at: str
+    labels: set[str] = field(default_factory=set)
+    merge_state_status: str = "UNKNOWN"
+    mergeable: str = "UNKNOWN"
+    review_decision: str = ""
+    head_sha: str | None = None
+    base_ref: str = ""
+    base_head_sha: str | None = None
+    checks: list[CheckRunResult] | None = None
+
+
 @runtime_checkable
 class TicketClient(Protocol):
     """Protocol defining the interface for ticket system clients.
@@ -140,6 +171,20 @@ class TicketClient(Protocol):
         """Get all items from a board/project."""
         ...
 
+    def get_board_items_for_issues(
+        self, board_urls: list[str], issues: list[tuple[str, int]]
+    ) -> list[TicketItem]:
+        """Get the items of specific tickets on any of the given boards.
+
+        Args:
+            board_urls: Boards the items may belong to
+            issues: (repo, ticket_id) pairs
+
+        Returns:
+            TicketItem for each ticket on each of the boards it is on
+        """
+        ...
+
     def get_board_metadata(self, board_url: str) -> dict[str, Any]:
         """Get board metadata (status options, field IDs, etc.)."""
         ...
@@ -316,6 +361,20 @@ class TicketClient(Protocol):
         """
         ...
 
+    def list_labeled_pr_snapshots(
+        self, repo: str, labels: list[str]
+    ) -> list[PullRequestSnapshot] | None:
+        """Get the merge state of every open PR carrying any of the labels.
+
+        Args:
+            repo: Repository in 'hostname/owner/repo' format
+            labels: Label names; a PR matches if it has at least one
+
+        Returns:
+            Snapshots ordered by creation time, or None if the query failed
+        """
+        ...
+
     def merge_pr(self, repo: str, pr_number: int, merge_method: str = "squash") -> bool:
         """Merge a pull request.
 
@@ -7,12 +7,21 @@ built-in logging module.
 
 from __future__ import annotations
 
+import atexit
 import contextvars
+import copy
+import json
 import logging
 import os
+import queue
+import re
 import sys
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
 from datetime import datetime
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import IO
 
 # Context variable for issue tracking (thread-safe)
 _issue_context: contextvars.ContextVar[str] = contextvars.ContextVar(
@@ -167,6 +176,16 @@ class ColoredFormatter(logging.Formatter):
         return message
 
 
+def _record_issue_context(record: logging.LogRecord) -> str:
+    """Issue context a record was logged under.
+
+    Records handed to another thread (see AsyncLogHandler) carry the context
+    captured when they were logged; otherwise it is read from the current thread.
+    """
+    captured = getattr(record, "captured_issue_context", None)
+    return captured if captured is not None else get_issue_context()
+
+
 class ContextAwareFormatter(ColoredFormatter):
     """Formatter that injects issue context from contextvars."""
 
@@ -182,7 +201,7 @@ class ContextAwareFormatter(ColoredFormatter):
 
     def format(self, record: logging.LogRecord) -> str:
         """Format the log record with issue context."""
-        issue_context = get_issue_context()
+        issue_context = _record_issue_context(record)
         if self.masking_filter:
             issue_context = self.masking_filter._mask_value(issue_context)
         record.issue_context = issue_context
@@ -204,19 +223,29 @@ class PlainContextAwareFormatter(logging.Formatter):
 
     def format(self, record: logging.LogRecord) -> str:
         """Format the log record with issue context."""
-        issue_context = get_issue_context()
+        issue_context = _record_issue_context(record)
         if self.masking_filter:
             issue_context = self.masking_filter._mask_value(issue_context)
         record.issue_context = issue_context
         return super().format(record)
 
 
+# Strings up to this length are memoized by MaskingFilter (contexts, repo names, URLs)
+_MASK_CACHE_MAX_LEN = 512
+_MASK_CACHE_SIZE = 4096
+
+
 class MaskingFilter(logging.Filter):
     """Filter that masks GHES hostname and org name in log records.
 
     When enabled, replaces GHES hostname with <GHES> and organization name
     with <ORG> in all log output to prevent exposure of sensitive
     infrastructure details.
+
+    The hostname and org patterns are compiled into one regex, so each string
+    is scanned once. A masked record is tagged with the filter's settings and
+    skipped by any other handler carrying an equivalent filter, and masking of
+    short, frequently repeated strings is memoized.
     """
 
     def __init__(self, ghes_host: str | None, org_name: str | None) -> None:
@@ -231,6 +260,13 @@ class MaskingFilter(logging.Filter):
         super().__init__()
         self.ghes_host = ghes_host
         self.org_name = org_name
+        self._mark = (ghes_host, org_name)
+        # Compiled on first use (see _compile)
+        self._replacements: dict[str, str] = {}
+        self._pattern: re.Pattern[str] | None = None
+        self._compiled = False
+        self._cache: OrderedDict[str, str] = OrderedDict()
+        self._cache_lock = threading.Lock()
 
     def filter(self, record: logging.LogRecord) -> bool:
         """Apply masking to the log record.
@@ -245,6 +281,10 @@ class MaskingFilter(logging.Filter):
         if not self.ghes_host or self.ghes_host == "github.com":
             return True
 
+        # Already masked by an equivalent filter on another handler
+        if getattr(record, "masked_for", None) == self._mark:
+            return True
+
         # Mask issue_context attribute if present
         if hasattr(record, "issue_context"):
             record.issue_context = self._mask_value(str(record.issue_context))
@@ -253,19 +293,23 @@ class MaskingFilter(logging.Filter):
         if record.msg:
             record.msg = self._mask_value(str(record.msg))
 
+        # Mask a traceback rendered before the record was queued
+        if record.exc_text:
+            record.exc_text = self._mask_value(record.exc_text)
+
         # Mask any args that contain strings
         if record.args:
             if isinstance(record.args, dict):
                 record.args = {
-                    k: self._mask_value(str(v)) if isinstance(v, str) else v
+                    k: self._mask_value(v) if isinstance(v, str) else v
                     for k, v in record.args.items()
                 }
             elif isinstance(record.args, tuple):
                 record.args = tuple(
-                    self._mask_value(str(arg)) if isinstance(arg, str) else arg
-                    for arg in record.args
+                    self._mask_value(arg) if isinstance(arg, str) else arg for arg in record.args
                 )
 
+        record.masked_for = self._mark
         return True
 
     def _mask_value(self, value: str) -> str:
@@ -277,14 +321,197 @@ class MaskingFilter(logging.Filter):
         Returns:
             The masked string with hostname replaced by <GHES> and org by <ORG>.
         """
+        if not self._compiled:
+            self._compile()
+        if self._pattern is None:
+            return value
+        if len(value) > _MASK_CACHE_MAX_LEN:
+            return self._substitute(value)
+
+        with self._cache_lock:
+            cached = self._cache.get(value)
+            if cached is not None:
+                self._cache.move_to_end(value)
+                return cached
+        masked = self._substitute(value)
+        with self._cache_lock:
+            self._cache[value] = masked
+            if len(self._cache) > _MASK_CACHE_SIZE:
+                self._cache.popitem(last=False)
+        return masked
+
+    def _compile(self) -> None:
+        """Compile the hostname and org replacements into one pattern."""
+        # Alternatives in the order the replacements used to be applied
+        replacements: dict[str, str] = {}
         if self.ghes_host:
-            value = value.replace(self.ghes_host, "<GHES>")
+            replacements[self.ghes_host] = "<GHES>"
         if self.org_name:
-            # Handle /org/ pattern (repo paths)
-            value = value.replace(f"/{self.org_name}/", "/<ORG>/")
-            # Handle /orgs/org pattern (project URLs)
-            value = value.replace(f"/orgs/{self.org_name}", "/orgs/<ORG>")
-        return value
+            # /orgs/org pattern (project URLs) before /org/ (repo paths) so a
+            # project URL is masked as a whole
+            replacements[f"/orgs/{self.org_name}"] = "/orgs/<ORG>"
+            replacements[f"/{self.org_name}/"] = "/<ORG>/"
+        self._replacements = replacements
+        if replacements:
+            self._pattern = re.compile("|".join(re.escape(k) for k in replacements))
+        self._compiled = True
+
+    def _substitute(self, value: str) -> str:
+        """Run the compiled pattern over a string."""
+        assert self._pattern is not None
+        return self._pattern.sub(lambda m: self._replacements[m.group(0)], value)
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """Formatter emitting one JSON object per record, for machine analysis."""
+
+    def __init__(self, masking_filter: MaskingFilter | None = None) -> None:
+        """Initialize the formatter.
+
+        Args:
+            masking_filter: Optional MaskingFilter to apply to issue_context.
+        """
+        super().__init__()
+        self.masking_filter = masking_filter
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Serialize the record as a single JSON line."""
+        issue_context = _record_issue_context(record)
+        if self.masking_filter:
+            issue_context = self.masking_filter._mask_value(issue_context)
+        entry = {
+            "ts": datetime.fromtimestamp(record.created).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "issue_context": issue_context,
+            "thread": record.threadName,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exc_info"] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False)
+
+
+# Records buffered between the logging threads and the listener in async mode
+DEFAULT_LOG_QUEUE_SIZE = 10000
+
+# Seconds a WARNING+ record may wait for queue space before it is dropped too
+_BLOCKING_ENQUEUE_TIMEOUT = 1.0
+
+# Renders tracebacks on the logging thread, while their frames still exist
+_traceback_formatter = logging.Formatter()
+
+
+class AsyncLogHandler(QueueHandler):
+    """QueueHandler feeding a bounded queue drained by a listener thread.
+
+    The calling thread only captures the issue context and merges the message
+    arguments; formatting, masking and file I/O happen on the listener. When
+    the queue is full, DEBUG and INFO records are dropped rather than stalling
+    a workflow thread, and WARNING+ records wait briefly for space. Drops are
+    counted for backpressure reporting (see get_log_queue_stats).
+    """
+
+    def __init__(self, log_queue: queue.Queue[logging.LogRecord | None]) -> None:
+        """Initialize the handler.
+
+        Args:
+            log_queue: Bounded queue read by the listener
+        """
+        super().__init__(log_queue)
+        self.log_queue = log_queue
+        self.dropped_records = 0
+        self.max_depth = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Copy the record for the listener thread.
+
+        The issue context is captured and the message arguments are merged.
+        The traceback is rendered into exc_text, not into the message, so
+        formatters on the listener still see it as a separate field.
+        """
+        record = copy.copy(record)
+        record.captured_issue_context = get_issue_context()
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = _traceback_formatter.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """Put the record on the queue, dropping it if the queue stays full."""
+        try:
+            if record.levelno >= logging.WARNING:
+                self.log_queue.put(record, timeout=_BLOCKING_ENQUEUE_TIMEOUT)
+            else:
+                self.log_queue.put_nowait(record)
+        except queue.Full:
+            self.dropped_records += 1
+            return
+        depth = self.log_queue.qsize()
+        if depth > self.max_depth:
+            self.max_depth = depth
+
+
+class _AsyncLogListener(QueueListener):
+    """QueueListener whose stop sentinel waits for space in a full queue."""
+
+    def enqueue_sentinel(self) -> None:
+        """Queue the stop sentinel behind the pending records."""
+        self.queue.put(self._sentinel)  # type: ignore[attr-defined]
+
+
+@dataclass
+class LogQueueStats:
+    """Backpressure counters of the async logging pipeline."""
+
+    queued: int
+    capacity: int
+    max_depth: int
+    dropped_records: int
+
+
+_async_handler: AsyncLogHandler | None = None
+_async_listener: _AsyncLogListener | None = None
+
+
+def get_log_queue_stats() -> LogQueueStats | None:
+    """Backpressure counters of the async logging pipeline (None when logging is synchronous)."""
+    handler = _async_handler
+    if handler is None:
+        return None
+    return LogQueueStats(
+        queued=handler.log_queue.qsize(),
+        capacity=handler.log_queue.maxsize,
+        max_depth=handler.max_depth,
+        dropped_records=handler.dropped_records,
+    )
+
+
+def stop_async_logging() -> None:
+    """Flush queued records and stop the async logging listener, if running."""
+    global _async_handler, _async_listener
+    listener, handler = _async_listener, _async_handler
+    _async_listener = None
+    _async_handler = None
+    if handler is not None:
+        logging.getLogger().removeHandler(handler)
+    if listener is not None:
+        listener.stop()
+        for target in listener.handlers:
+            target.close()
+        if handler is not None and handler.dropped_records:
+            print(
+                f"[logger] Dropped {handler.dropped_records} log record(s) while the queue was full",
+                file=sys.stderr,
+            )
+
+
+atexit.register(stop_async_logging)
 
 
 def _extract_org_from_url(project_url: str) -> str | None:
@@ -296,8 +523,6 @@ def _extract_org_from_url(project_url: str) -> str | None:
     Returns:
         The organization name if found, otherwise None.
     """
-    import re
-
     match = re.search(r"/orgs/([^/]+)/projects/", project_url)
     return match.group(1) if match else None
 
@@ -310,6 +535,9 @@ def setup_logging(
     ghes_logs_mask: bool = False,
     ghes_host: str | None = None,
     org_name: str | None = None,
+    async_logging: bool = False,
+    json_log_file: str | None = None,
+    log_queue_size: int = DEFAULT_LOG_QUEUE_SIZE,
 ) -> None:
     """
     Configure the root logger with a standard format and level.
@@ -327,6 +555,11 @@ def setup_logging(
         ghes_host: GitHub Enterprise Server hostname to mask. If None or
                    "github.com", masking is disabled regardless of ghes_logs_mask.
         org_name: Organization name to mask. Extracted from project URLs.
+        async_logging: If True, log calls only enqueue records on a bounded
+                       queue; a listener thread formats and writes them.
+        json_log_file: Optional path of an additional JSON-lines log, rotated
+                       like log_file.
+        log_queue_size: Capacity of the async logging queue.
 
     Format: "[%(asctime)s] %(levelname)s %(threadName)s %(name)s: %(message)s"
     Output: When daemon_mode=False: stdout for INFO/DEBUG, stderr for WARNING+, and file.
@@ -352,6 +585,7 @@ def setup_logging(
     root_logger.setLevel(log_level)
 
     # Remove any existing handlers
+    stop_async_logging()
     root_logger.handlers.clear()
 
     # Add console handlers only in non-daemon mode
@@ -400,6 +634,38 @@ def setup_logging(
         except Exception as e:
             print(f"[logger] Failed to create file handler: {e}", file=sys.stderr)
 
+    # Add JSON-lines handler for machine-readable logs
+    if json_log_file:
+        try:
+            json_dir = os.path.dirname(json_log_file)
+            if json_dir:
+                os.makedirs(json_dir, exist_ok=True)
+
+            json_handler = DateRotatingFileHandler(
+                json_log_file,
+                maxBytes=log_size,
+                backupCount=log_backups,
+            )
+            json_handler.setLevel(logging.DEBUG)
+            json_handler.setFormatter(JsonLinesFormatter(masking_filter=masking_filter))
+            if masking_filter:
+                json_handler.addFilter(masking_filter)
+            root_logger.addHandler(json_handler)
+            print(f"[logger] JSON handler added: {json_log_file}", file=sys.stderr)
+        except Exception as e:
+            print(f"[logger] Failed to create JSON handler: {e}", file=sys.stderr)
+
+    # Move the handlers behind a queue so log calls don't wait on formatting or disk I/O
+    if async_logging:
+        global _async_handler, _async_listener
+        targets = list(root_logger.handlers)
+        root_logger.handlers.clear()
+        log_queue: queue.Queue[logging.LogRecord | None] = queue.Queue(maxsize=log_queue_size)
+        _async_handler = AsyncLogHandler(log_queue)
+        _async_listener = _AsyncLogListener(log_queue, *targets, respect_handler_level=True)
+        _async_listener.start()
+        root_logger.addHandler(_async_handler)
+
 
 def get_logger(name: str) -> logging.Logger:
     """
@@ -433,10 +699,132 @@ def log_message(logger: logging.Logger, label: str, content: str) -> None:
         logger.debug(f"{label}: {content[:100]}...")
 
 
+# Per-run log files kept open at once by the run log router
+RUN_LOG_MAX_OPEN_FILES = 32
+
+RUN_LOG_FORMAT = (
+    "[%(asctime)s] %(levelname)s %(issue_context)s %(threadName)s %(name)s: %(message)s"
+)
+
+
+@dataclass
+class _RunLogRoute:
+    """Destination of the records logged under one issue context."""
+
+    log_path: str
+    level: int
+    formatter: logging.Formatter
+    masking_filter: MaskingFilter | None = None
+
+
+class RunLogRouter(logging.Handler):
+    """Root handler that writes each record to the run log of its issue context.
+
+    A single router serves every active RunLogger. Records are routed by the
+    emitting thread's issue context (see set_issue_context), so a record is
+    formatted and written once for its own run and never for the other runs
+    going on concurrently. Records from contexts without an active run are
+    dropped after one dict lookup.
+
+    Open run log files are pooled: at most max_open_files stay open, and the
+    least recently written one is closed (and reopened in append mode if it is
+    written again) when the limit is reached.
+    """
+
+    def __init__(self, max_open_files: int = RUN_LOG_MAX_OPEN_FILES) -> None:
+        """Initialize the router.
+
+        Args:
+            max_open_files: Maximum number of run log files kept open
+        """
+        super().__init__(logging.DEBUG)
+        self.max_open_files = max_open_files
+        self._routes: dict[str, list[_RunLogRoute]] = {}
+        self._files: OrderedDict[str, IO[str]] = OrderedDict()
+        self._routes_lock = threading.Lock()
+
+    def add_route(self, context: str, route: _RunLogRoute) -> None:
+        """Send records of an issue context to a run log, installing the router if needed."""
+        with self._routes_lock:
+            self._routes.setdefault(context, []).append(route)
+            root = logging.getLogger()
+            if self not in root.handlers:
+                root.addHandler(self)
+
+    def remove_route(self, context: str, route: _RunLogRoute) -> None:
+        """Stop routing to a run log; the router uninstalls itself once idle."""
+        with self._routes_lock:
+            routes = self._routes.get(context, [])
+            if route in routes:
+                routes.remove(route)
+            if not routes:
+                self._routes.pop(context, None)
+            idle = not self._routes
+            if idle:
+                logging.getLogger().removeHandler(self)
+        self.acquire()
+        try:
+            file = self._files.pop(route.log_path, None)
+            if file is not None:
+                file.close()
+        finally:
+            self.release()
+
+    def open_file_count(self) -> int:
+        """Number of run log files currently open."""
+        return len(self._files)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Write the record to the run logs of the emitting thread's issue context."""
+        routes = self._routes.get(get_issue_context())
+        if not routes:
+            return
+        for route in list(routes):
+            if record.levelno < route.level:
+                continue
+            try:
+                if route.masking_filter:
+                    route.masking_filter.filter(record)
+                self._write(route.log_path, route.formatter.format(record) + "\n")
+            except Exception:
+                self.handleError(record)
+
+    def _write(self, path: str, text: str) -> None:
+        """Append text to a pooled log file (called with the handler lock held)."""
+        file = self._files.get(path)
+        if file is None:
+            file = open(path, "a", encoding="utf-8")  # noqa: SIM115 - kept open in the pool
+            self._files[path] = file
+            while len(self._files) > self.max_open_files:
+                _, oldest = self._files.popitem(last=False)
+                oldest.close()
+        else:
+            self._files.move_to_end(path)
+        file.write(text)
+        file.flush()
+
+    def close(self) -> None:
+        """Close all pooled files."""
+        self.acquire()
+        try:
+            for file in self._files.values():
+                file.close()
+            self._files.clear()
+        finally:
+            self.release()
+        super().close()
+
+
+_run_log_router = RunLogRouter()
+
+
 class RunLogger:
     """Context manager for per-run logging.
 
-    Adds a temporary file handler to capture logs for a specific workflow run.
+    Routes the logs of a specific workflow run to a dedicated file through the
+    shared RunLogRouter. The run's issue context is set on the entering thread
+    for the duration of the run, and only records logged under that context
+    are written to the file.
     Creates a dedicated log file at .kiln/logs/{hostname}/{owner}/{repo}/{issue_number}/{workflow}-{timestamp}.log
 
     Example:
@@ -472,7 +860,9 @@ class RunLogger:
         self.started_at = datetime.now()
         self.log_path: str | None = None
         self.session_id: str | None = None
-        self._handler: logging.FileHandler | None = None
+        self._route: _RunLogRoute | None = None
+        self._context = f"{repo}#{issue_number}"
+        self._context_token: contextvars.Token[str] | None = None
 
     def _generate_log_path(self) -> str:
         """Generate hierarchical log path.
@@ -503,9 +893,10 @@ class RunLogger:
         )
 
     def __enter__(self) -> RunLogger:
-        """Set up per-run file handler.
+        """Set up per-run log routing.
 
-        Creates the log directory if needed and adds a file handler to the root logger.
+        Creates the log file (and its directory), sets the run's issue context
+        on the calling thread and registers the file with the run log router.
 
         Returns:
             Self for context manager usage.
@@ -513,20 +904,19 @@ class RunLogger:
         self.log_path = self._generate_log_path()
         log_dir = os.path.dirname(self.log_path)
         os.makedirs(log_dir, exist_ok=True)
-
-        # Create file handler with same format as global log
-        log_format = (
-            "[%(asctime)s] %(levelname)s %(issue_context)s %(threadName)s %(name)s: %(message)s"
+        open(self.log_path, "a").close()
+
+        # Same format as the global log
+        formatter = PlainContextAwareFormatter(RUN_LOG_FORMAT, masking_filter=self.masking_filter)
+        self._route = _RunLogRoute(
+            log_path=self.log_path,
+            level=logging.getLogger().level,  # Follow global level
+            formatter=formatter,
+            masking_filter=self.masking_filter,
         )
-        formatter = PlainContextAwareFormatter(log_format, masking_filter=self.masking_filter)
-
-        self._handler = logging.FileHandler(self.log_path)
-        self._handler.setLevel(logging.getLogger().level)  # Follow global level
-        self._handler.setFormatter(formatter)
-        if self.masking_filter:
-            self._handler.addFilter(self.masking_filter)
 
-        logging.getLogger().addHandler(self._handler)
+        self._context_token = _issue_context.set(self._context)
+        _run_log_router.add_route(self._context, self._route)
         return self
 
     def __exit__(
@@ -535,17 +925,19 @@ class RunLogger:
         exc_val: BaseException | None,
         exc_tb: object,
     ) -> None:
-        """Remove the per-run file handler and clean up.
+        """Stop routing logs to the run file and restore the previous issue context.
 
         Args:
             exc_type: Exception type if an exception was raised
             exc_val: Exception value if an exception was raised
             exc_tb: Exception traceback if an exception was raised
         """
-        if self._handler:
-            self._handler.close()
-            logging.getLogger().removeHandler(self._handler)
-            self._handler = None
+        if self._route:
+            _run_log_router.remove_route(self._context, self._route)
+            self._route = None
+        if self._context_token is not None:
+            _issue_context.reset(self._context_token)
+            self._context_token = None
 
     def set_session_id(self, session_id: str) -> None:
         """Record the Claude session ID for this run.
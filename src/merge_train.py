@@ -0,0 +1,163 @@
+"""Speculative merge trains for the Dependabot auto-merge queue.
+
+The sequential queue merges one PR per CI run: after each merge the next PR is
+rebased by Dependabot, runs CI again and waits for another poll. A merge train
+instead merges the first few queued PRs onto the base branch in the local
+clone (see WorkspaceManager.build_merge_train) and pushes the merge commits to
+kiln-owned branches, so CI tests the combined result of several PRs at once.
+
+Which merge commits are pushed ("probes") depends on the batching mode:
+
+- "prefixes" pushes one branch per PR, each holding that PR merged on top of
+  all PRs before it. Every prefix is tested in parallel, so a failure
+  identifies its culprit directly and the PRs before it can still be merged.
+- "bisect" pushes only the commit holding the whole batch. One CI run covers
+  every PR; if it fails, the next train tests the first half of the batch,
+  and so on until the culprit is found.
+
+evaluate_merge_train turns the probes' checks into a verdict: how many PRs at
+the front of the train passed and may be merged, and which PR (or which
+smaller batch) should be tried next when a probe failed.
+"""
+
+import time
+from dataclasses import dataclass, field
+
+from src.interfaces import CheckRunResult
+
+# Branch namespace the probes are pushed to
+MERGE_TRAIN_BRANCH_PREFIX = "kiln/merge-train"
+
+# Seconds after a push during which a probe without checks is expected to get
+# some, to give CI time to register its runs. After that, a probe without
+# checks passes only in repositories configured as having no CI.
+CHECKS_REGISTRATION_GRACE = 120.0
+
+
+def plan_probes(count: int, batching: str) -> list[int]:
+    """Choose which merge commits of a train are pushed for CI.
+
+    Args:
+        count: Number of PRs in the train
+        batching: 'prefixes' or 'bisect'
+
+    Returns:
+        Indices into the train's commits, in ascending order
+    """
+    if count <= 0:
+        return []
+    if batching == "bisect":
+        return [count - 1]
+    return list(range(count))
+
+
+@dataclass
+class MergeTrain:
+    """A batch of queued PRs under speculative test.
+
+    Attributes:
+        repo: Repository in 'hostname/owner/repo' format
+        base_branch: Branch the PRs target
+        base_sha: Base branch commit the train was built on, moved forward to
+            the branch head after the train's own merges (empty until seen)
+        pr_numbers: PRs in the train, in queue order
+        head_shas: HEAD commit of each PR the train was built from
+        commits: commits[i] is the base with pr_numbers[: i + 1] merged
+        probes: Indices of the commits pushed for CI
+        pushed_at: time.monotonic() when the probes were pushed
+        merged: Number of PRs at the front of the train already merged
+    """
+
+    repo: str
+    base_branch: str
+    base_sha: str
+    pr_numbers: list[int]
+    head_shas: list[str]
+    commits: list[str]
+    probes: list[int]
+    pushed_at: float = field(default_factory=time.monotonic)
+    merged: int = 0
+
+    def branch_name(self, index: int) -> str:
+        """Name of the branch a probe is pushed to."""
+        return f"{MERGE_TRAIN_BRANCH_PREFIX}/{self.pr_numbers[index]}"
+
+    def probe_refs(self) -> dict[str, str]:
+        """Branch name -> commit SHA of every probe."""
+        return {self.branch_name(i): self.commits[i] for i in self.probes}
+
+
+@dataclass
+class MergeTrainVerdict:
+    """Outcome of a merge train's CI so far.
+
+    Attributes:
+        passed: Number of PRs at the front of the train whose probe passed
+        culprit: PR whose merge made a probe fail, when it could be pinned down
+        retest_size: When a failing probe covered several untested PRs, the
+            number of PRs to put in the next train to narrow the failure down
+        missing_checks: Whether a probe still had no checks after the
+            registration grace period (it stays pending)
+    """
+
+    passed: int = 0
+    culprit: int | None = None
+    retest_size: int | None = None
+    missing_checks: bool = False
+
+    @property
+    def failed(self) -> bool:
+        """Check if a probe failed."""
+        return self.culprit is not None or self.retest_size is not None
+
+
+def evaluate_merge_train(
+    train: MergeTrain,
+    checks_by_sha: dict[str, list[CheckRunResult]],
+    now: float | None = None,
+    no_ci: bool = False,
+) -> MergeTrainVerdict:
+    """Judge a merge train from the checks of its probes.
+
+    Probes are read in order. A passing probe vouches for every PR up to and
+    including it; reading stops at the first probe still running or failed.
+    A probe without checks is pending, unless the repository has no CI and
+    the registration grace period is over.
+
+    Args:
+        train: The train under test
+        checks_by_sha: Checks of each probe commit
+        now: Current time.monotonic(); defaults to now
+        no_ci: Whether the repository is configured as having no CI
+
+    Returns:
+        MergeTrainVerdict for the train
+    """
+    now = time.monotonic() if now is None else now
+    verdict = MergeTrainVerdict()
+
+    for index in train.probes:
+        checks = checks_by_sha.get(train.commits[index], [])
+        if not checks:
+            if now - train.pushed_at < CHECKS_REGISTRATION_GRACE:
+                break
+            if not no_ci:
+                # CI never registered: an unverified merge is never safe
+                verdict.missing_checks = True
+                break
+            verdict.passed = index + 1
+            continue
+        if any(not check.is_completed for check in checks):
+            break
+        if all(check.is_successful for check in checks):
+            verdict.passed = index + 1
+            continue
+
+        untested = index + 1 - verdict.passed
+        if untested == 1:
+            verdict.culprit = train.pr_numbers[index]
+        else:
+            verdict.retest_size = untested // 2
+        break
+
+    return verdict
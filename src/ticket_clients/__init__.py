@@ -11,9 +11,13 @@ This package provides GitHub client implementations for different GitHub version
 
 Use get_github_client() factory function to get the appropriate client based
 on the GITHUB_ENTERPRISE_VERSION configuration.
+
+All clients shell out to the gh CLI by default. Passing an HTTPTransport to the
+factory sends `gh api` calls over pooled keep-alive connections instead; give
+the transport a ResponseCache to revalidate REST GETs with ETags.
 """
 
-from src.ticket_clients.base import GitHubClientBase, NetworkError
+from src.ticket_clients.base import GitHubClientBase, NetworkError, RateLimitError
 from src.ticket_clients.github import GitHubTicketClient
 from src.ticket_clients.github_enterprise_3_14 import GitHubEnterprise314Client
 from src.ticket_clients.github_enterprise_3_15 import GitHubEnterprise315Client
@@ -21,6 +25,9 @@ from src.ticket_clients.github_enterprise_3_16 import GitHubEnterprise316Client
 from src.ticket_clients.github_enterprise_3_17 import GitHubEnterprise317Client
 from src.ticket_clients.github_enterprise_3_18 import GitHubEnterprise318Client
 from src.ticket_clients.github_enterprise_3_19 import GitHubEnterprise319Client
+from src.ticket_clients.http_transport import HTTPTransport
+from src.ticket_clients.rate_limit import RateLimitBudget, RateLimitTracker
+from src.ticket_clients.response_cache import ResponseCache
 
 # Type alias for all GitHub client types
 # Some GHES versions extend GitHubClientBase (limited features)
@@ -41,12 +48,17 @@ GHES_VERSION_CLIENTS: dict[str, type[GitHubClient]] = {
 def get_github_client(
     tokens: dict[str, str] | None = None,
     enterprise_version: str | None = None,
+    *,
+    http_transport: HTTPTransport | None = None,
+    rate_limits: RateLimitTracker | None = None,
 ) -> GitHubClient:
     """Factory function to get the appropriate GitHub client.
 
     Args:
         tokens: Dictionary mapping hostname to token
         enterprise_version: GHES version string (e.g., "3.14") or None for github.com
+        http_transport: Optional pooled HTTP transport for `gh api` calls
+        rate_limits: Optional shared rate-limit tracker
 
     Returns:
         Appropriate GitHub client instance
@@ -56,7 +68,7 @@ def get_github_client(
     """
     if enterprise_version is None:
         # github.com - use the standard client
-        return GitHubTicketClient(tokens)
+        return GitHubTicketClient(tokens, http_transport=http_transport, rate_limits=rate_limits)
 
     # Normalize version string
     version = enterprise_version.strip()
@@ -69,7 +81,7 @@ def get_github_client(
         )
 
     client_class = GHES_VERSION_CLIENTS[version]
-    return client_class(tokens)
+    return client_class(tokens, http_transport=http_transport, rate_limits=rate_limits)
 
 
 __all__ = [
@@ -81,7 +93,12 @@ __all__ = [
     "GitHubEnterprise317Client",
     "GitHubEnterprise318Client",
     "GitHubEnterprise319Client",
+    "HTTPTransport",
     "NetworkError",
+    "RateLimitBudget",
+    "RateLimitError",
+    "RateLimitTracker",
+    "ResponseCache",
     "get_github_client",
     "GHES_VERSION_CLIENTS",
 ]
@@ -0,0 +1,145 @@
+"""Batched CI status lookups for several commits of one repository.
+
+Checking CI one commit at a time costs two REST requests per commit (check
+runs plus commit statuses) on every poll. The commit's statusCheckRollup
+covers both, and aliasing one `object(oid:)` per commit lets a single GraphQL
+query answer for every commit a repository has pending:
+
+    query($owner: String!, $repo: String!) {
+      repository(owner: $owner, name: $repo) {
+        c0: object(oid: "<sha>") { ... on Commit { statusCheckRollup { ... } } }
+        c1: object(oid: "<sha>") { ... }
+      }
+    }
+
+Commits whose rollup has more contexts than one page are reported as
+unresolved so the caller can fall back to the paginated REST lookup.
+"""
+
+import re
+from typing import Any
+
+from src.interfaces import CheckRunResult
+
+# Upper bound on commits per aliased query
+MAX_COMMITS_PER_QUERY = 25
+
+# Contexts (check runs + commit statuses) fetched per commit
+CONTEXTS_PER_COMMIT = 100
+
+_SHA_PATTERN = re.compile(r"^[0-9a-fA-F]{7,40}$")
+
+# Selection of a Commit's check runs and statuses (also used by pr_snapshot)
+ROLLUP_SELECTION = f"""... on Commit {{
+            statusCheckRollup {{
+              contexts(first: {CONTEXTS_PER_COMMIT}) {{
+                pageInfo {{ hasNextPage }}
+                nodes {{
+                  __typename
+                  ... on CheckRun {{
+                    name
+                    status
+                    conclusion
+                    detailsUrl
+                    title
+                    summary
+                  }}
+                  ... on StatusContext {{
+                    context
+                    state
+                    targetUrl
+                    description
+                  }}
+                }}
+              }}
+            }}
+          }}"""
+
+# Commit status states mapped to (status, conclusion), as in the REST lookup
+_STATUS_CONTEXT_STATES: dict[str, tuple[str, str | None]] = {
+    "PENDING": ("in_progress", None),
+    "EXPECTED": ("in_progress", None),
+    "SUCCESS": ("completed", "success"),
+    "FAILURE": ("completed", "failure"),
+    "ERROR": ("completed", "failure"),
+}
+
+
+def build_check_rollup_query(shas: list[str]) -> str:
+    """Build an aliased query for the status check rollups of several commits.
+
+    Args:
+        shas: Commit SHAs (at most MAX_COMMITS_PER_QUERY)
+
+    Returns:
+        GraphQL query taking $owner and $repo; commit i is aliased as "c{i}"
+
+    Raises:
+        ValueError: If a SHA is not a hex object id
+    """
+    aliases = []
+    for i, sha in enumerate(shas):
+        if not _SHA_PATTERN.match(sha):
+            raise ValueError(f"Invalid commit SHA: {sha!r}")
+        aliases.append(f'c{i}: object(oid: "{sha}") {{\n          {ROLLUP_SELECTION}\n        }}')
+
+    return (
+        "query($owner: String!, $repo: String!) {\n"
+        "  rateLimit { cost remaining resetAt limit }\n"
+        "  repository(owner: $owner, name: $repo) {\n        "
+        + "\n        ".join(aliases)
+        + "\n  }\n}"
+    )
+
+
+def parse_check_rollup(node: dict[str, Any] | None) -> list[CheckRunResult] | None:
+    """Convert one aliased commit node into CheckRunResults.
+
+    Args:
+        node: The commit's object node from the rollup query
+
+    Returns:
+        List of check results (empty if the commit has no checks yet), or None
+        if the commit was not found or its contexts did not fit in one page
+    """
+    if node is None:
+        return None
+
+    rollup = node.get("statusCheckRollup")
+    if rollup is None:
+        # No check runs or statuses reported yet
+        return []
+
+    contexts = rollup.get("contexts") or {}
+    if (contexts.get("pageInfo") or {}).get("hasNextPage"):
+        return None
+
+    results: list[CheckRunResult] = []
+    for context in contexts.get("nodes") or []:
+        if context.get("__typename") == "CheckRun":
+            title = context.get("title") or ""
+            summary = context.get("summary") or ""
+            conclusion = context.get("conclusion")
+            results.append(
+                CheckRunResult(
+                    name=context.get("name", "unknown"),
+                    status=(context.get("status") or "queued").lower(),
+                    conclusion=conclusion.lower() if conclusion else None,
+                    details_url=context.get("detailsUrl"),
+                    output=f"{title}: {summary}".strip(": ") or None,
+                )
+            )
+        elif context.get("__typename") == "StatusContext":
+            status, conclusion = _STATUS_CONTEXT_STATES.get(
+                context.get("state") or "PENDING", ("in_progress", None)
+            )
+            results.append(
+                CheckRunResult(
+                    name=context.get("context", "unknown"),
+                    status=status,
+                    conclusion=conclusion,
+                    details_url=context.get("targetUrl"),
+                    output=context.get("description"),
+                )
+            )
+    return results
@@ -9,16 +9,79 @@ import json
 import os
 import re
 import subprocess
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
 from datetime import datetime
 from typing import Any
 
-from src.interfaces import CheckRunResult, Comment, LinkedPullRequest, TicketItem
+from src.interfaces import (
+    CheckRunResult,
+    Comment,
+    LinkedPullRequest,
+    PullRequestSnapshot,
+    TicketItem,
+)
 from src.labels import REQUIRED_LABELS, LabelConfig
 from src.logger import get_logger, is_debug_mode
-from src.ticket_clients.base import NetworkError
+from src.ticket_clients.base import NetworkError, RateLimitError
+from src.ticket_clients.check_batch import (
+    MAX_COMMITS_PER_QUERY,
+    build_check_rollup_query,
+    parse_check_rollup,
+)
+from src.ticket_clients.http_transport import HTTPTransport, parse_gh_api_args
+from src.ticket_clients.issue_batch import IssueBatcher
+from src.ticket_clients.issue_items import (
+    MAX_ISSUES_PER_QUERY,
+    build_issue_items_query,
+    project_item_nodes,
+)
+from src.ticket_clients.pr_snapshot import LABELED_PRS_QUERY, parse_pr_snapshot
+from src.ticket_clients.rate_limit import RateLimitTracker
 
 logger = get_logger(__name__)
 
+# Selection of a ProjectV2Item, shared by full board queries and targeted item refreshes
+BOARD_ITEM_FIELDS = """
+        id
+        fieldValues(first: 20) {
+          nodes {
+            ... on ProjectV2ItemFieldSingleSelectValue {
+              name
+              field {
+                ... on ProjectV2SingleSelectField {
+                  name
+                }
+              }
+            }
+          }
+        }
+        content {
+          ... on Issue {
+            number
+            title
+            state
+            stateReason
+            repository {
+              nameWithOwner
+            }
+            labels(first: 20) {
+              nodes {
+                name
+              }
+            }
+            closedByPullRequestsReferences(first: 10) {
+              nodes {
+                merged
+              }
+            }
+            comments {
+              totalCount
+            }
+          }
+        }
+"""
+
 
 class GitHubTicketClient:
     """GitHub implementation of TicketClient protocol.
@@ -54,16 +117,29 @@ class GitHubTicketClient:
         """Human-readable description of this client."""
         return "GitHub.com"
 
-    def __init__(self, tokens: dict[str, str] | None = None) -> None:
+    def __init__(
+        self,
+        tokens: dict[str, str] | None = None,
+        *,
+        http_transport: HTTPTransport | None = None,
+        rate_limits: RateLimitTracker | None = None,
+    ) -> None:
         """Initialize the GitHub client.
 
         Args:
             tokens: Dictionary mapping hostname to token, or None to use gh auth login credentials.
                     Example: {"github.com": "ghp_xxx", "github.mycompany.com": "ghp_yyy"}
+            http_transport: Optional pooled HTTP transport. When set, `gh api` calls for
+                    hosts with a configured token are sent in-process over keep-alive
+                    connections instead of forking gh. Other commands still use gh.
+            rate_limits: Shared rate-limit tracker. A private one is created if omitted.
         """
         self.tokens = tokens or {}
+        self.http_transport = http_transport
+        self.rate_limits = rate_limits if rate_limits is not None else RateLimitTracker()
         # Internal cache mapping repo -> hostname, populated by get_board_items()
         self._repo_host_map: dict[str, str] = {}
+        self._issue_batcher = IssueBatcher(self, self.ISSUE_BATCH_FIELDS)
         logger.debug("GitHubTicketClient initialized")
 
     def validate_connection(self, hostname: str = "github.com", *, quiet: bool = False) -> bool:
@@ -191,6 +267,39 @@ class GitHubTicketClient:
     CLASSIC_PAT_PREFIX = "ghp_"
     FINE_GRAINED_PAT_PREFIX = "github_pat_"
 
+    # Per-issue lookups that can be served from aliased batch queries (see issue_batch)
+    ISSUE_BATCH_FIELDS: tuple[str, ...] = (
+        "body",
+        "labels",
+        "label_events",
+        "status_events",
+        "linked_prs",
+    )
+
+    def refresh_rate_limits(self, hostname: str = "github.com") -> None:
+        """Record the current rate-limit state of a host in the shared tracker.
+
+        Uses GET /rate_limit, which does not count against the rate limit.
+        Hosts without rate limiting (some GHES installs) are skipped quietly,
+        and so are network failures: the daemon's next connectivity check
+        deals with those.
+
+        Args:
+            hostname: GitHub hostname to query
+        """
+        try:
+            output = self._run_gh_command(["api", "rate_limit"], hostname=hostname)
+            resources = json.loads(output).get("resources", {})
+        except (
+            subprocess.CalledProcessError,
+            json.JSONDecodeError,
+            AttributeError,
+            NetworkError,
+        ) as e:
+            logger.debug(f"Could not read rate limits for {hostname}: {e}")
+            return
+        self.rate_limits.record_rate_limit_resources(hostname, resources)
+
     def validate_scopes(self, hostname: str = "github.com") -> bool:
         """Validate that the token has exactly the required OAuth scopes.
 
@@ -313,6 +422,31 @@ class GitHubTicketClient:
         """
         return f"https://{repo}"
 
+    # Batched lookups
+
+    @contextmanager
+    def issue_lookup_batch(self, issues: Iterable[tuple[str, int]]) -> Iterator[None]:
+        """Serve per-issue lookups for the given issues from aliased batch queries.
+
+        While the context is open on the current thread, get_ticket_body,
+        get_ticket_labels, get_label_actor, get_last_status_actor and
+        get_linked_prs answer from one aliased GraphQL query per chunk of
+        issues instead of one query per call.
+
+        Args:
+            issues: (repo, issue_number) pairs expected to be looked up
+        """
+        with self._issue_batcher.batch(issues):
+            yield
+
+    def queue_issue_lookups(self, issues: Iterable[tuple[str, int]]) -> None:
+        """Add issues to the current lookup batch, if one is open.
+
+        Args:
+            issues: (repo, issue_number) pairs expected to be looked up
+        """
+        self._issue_batcher.queue(issues)
+
     # Board operations
 
     def get_board_items(self, board_url: str) -> list[TicketItem]:
@@ -331,6 +465,50 @@ class GitHubTicketClient:
         logger.debug(f"Retrieved {len(items)} board items")
         return items
 
+    def get_board_items_for_issues(
+        self, board_urls: list[str], issues: list[tuple[str, int]]
+    ) -> list[TicketItem]:
+        """Get the board items of specific issues without fetching whole boards.
+
+        Looks up each issue's project items with aliased queries (one per chunk
+        of issues on the same host) and keeps the items on the given boards.
+
+        Args:
+            board_urls: Project URLs the items may belong to
+            issues: (repo, issue number) pairs, repo in 'hostname/owner/repo' format
+
+        Returns:
+            TicketItem for each issue on each of the boards it is on
+        """
+        boards = {self._parse_board_url(url): url for url in board_urls}
+        by_host: dict[str, list[tuple[str, str, int]]] = {}
+        for repo, number in dict.fromkeys(issues):
+            hostname, owner, repo_name = self._parse_repo(repo)
+            by_host.setdefault(hostname, []).append((owner, repo_name, number))
+
+        items: list[TicketItem] = []
+        for hostname, keys in by_host.items():
+            for start in range(0, len(keys), MAX_ISSUES_PER_QUERY):
+                chunk = keys[start : start + MAX_ISSUES_PER_QUERY]
+                query, variables = build_issue_items_query(chunk, BOARD_ITEM_FIELDS)
+                response = self._execute_graphql_query(query, variables, hostname=hostname)
+                for nodes in project_item_nodes(response, len(chunk)):
+                    for node in nodes:
+                        project_url = (node.get("project") or {}).get("url") or ""
+                        try:
+                            board_url = boards.get(self._parse_board_url(project_url))
+                        except ValueError:
+                            continue
+                        if board_url is None:
+                            continue  # Project is not a configured board
+                        item = self._parse_board_item_node(node, board_url, hostname)
+                        if item:
+                            items.append(item)
+                            self._repo_host_map[item.repo] = hostname
+
+        logger.debug(f"Refreshed {len(items)} board items for {len(issues)} issues")
+        return items
+
     def get_board_metadata(self, board_url: str) -> dict[str, Any]:
         """Get GitHub project metadata including status field and options.
 
@@ -594,17 +772,18 @@ class GitHubTicketClient:
         """
 
         try:
-            response = self._execute_graphql_query(
-                query,
-                {
-                    "owner": owner,
-                    "repo": repo_name,
-                    "issueNumber": ticket_id,
-                },
-                repo=repo,
-            )
-
-            issue_data = response.get("data", {}).get("repository", {}).get("issue")
+            batched, issue_data = self._issue_batcher.lookup(repo, ticket_id, "body")
+            if not batched:
+                response = self._execute_graphql_query(
+                    query,
+                    {
+                        "owner": owner,
+                        "repo": repo_name,
+                        "issueNumber": ticket_id,
+                    },
+                    repo=repo,
+                )
+                issue_data = response.get("data", {}).get("repository", {}).get("issue")
             if issue_data is None:
                 return None
 
@@ -643,17 +822,18 @@ class GitHubTicketClient:
 
         try:
             logger.debug(f"Fetching labels for {repo}#{ticket_id}")
-            response = self._execute_graphql_query(
-                query,
-                {
-                    "owner": owner,
-                    "repo": repo_name,
-                    "issueNumber": ticket_id,
-                },
-                repo=repo,
-            )
-
-            issue_data = response.get("data", {}).get("repository", {}).get("issue")
+            batched, issue_data = self._issue_batcher.lookup(repo, ticket_id, "labels")
+            if not batched:
+                response = self._execute_graphql_query(
+                    query,
+                    {
+                        "owner": owner,
+                        "repo": repo_name,
+                        "issueNumber": ticket_id,
+                    },
+                    repo=repo,
+                )
+                issue_data = response.get("data", {}).get("repository", {}).get("issue")
             if issue_data is None:
                 return set()
 
@@ -674,6 +854,7 @@ class GitHubTicketClient:
             ticket_id: Issue number
             label: Label name to add
         """
+        self._issue_batcher.invalidate(repo, ticket_id)
         repo_ref = self._get_repo_ref(repo)
         args = ["issue", "edit", str(ticket_id), "--repo", repo_ref, "--add-label", label]
         try:
@@ -712,6 +893,7 @@ class GitHubTicketClient:
             ticket_id: Issue number
             label: Label name to remove
         """
+        self._issue_batcher.invalidate(repo, ticket_id)
         repo_ref = self._get_repo_ref(repo)
         try:
             args = ["issue", "edit", str(ticket_id), "--repo", repo_ref, "--remove-label", label]
@@ -1070,17 +1252,18 @@ class GitHubTicketClient:
         """
 
         try:
-            response = self._execute_graphql_query(
-                query,
-                {
-                    "owner": owner,
-                    "repo": repo_name,
-                    "issueNumber": ticket_id,
-                },
-                repo=repo,
-            )
-
-            issue_data = response.get("data", {}).get("repository", {}).get("issue")
+            batched, issue_data = self._issue_batcher.lookup(repo, ticket_id, "status_events")
+            if not batched:
+                response = self._execute_graphql_query(
+                    query,
+                    {
+                        "owner": owner,
+                        "repo": repo_name,
+                        "issueNumber": ticket_id,
+                    },
+                    repo=repo,
+                )
+                issue_data = response.get("data", {}).get("repository", {}).get("issue")
             if not issue_data:
                 return None
 
@@ -1162,17 +1345,18 @@ class GitHubTicketClient:
         """
 
         try:
-            response = self._execute_graphql_query(
-                query,
-                {
-                    "owner": owner,
-                    "repo": repo_name,
-                    "issueNumber": ticket_id,
-                },
-                repo=repo,
-            )
-
-            issue_data = response.get("data", {}).get("repository", {}).get("issue")
+            batched, issue_data = self._issue_batcher.lookup(repo, ticket_id, "label_events")
+            if not batched:
+                response = self._execute_graphql_query(
+                    query,
+                    {
+                        "owner": owner,
+                        "repo": repo_name,
+                        "issueNumber": ticket_id,
+                    },
+                    repo=repo,
+                )
+                issue_data = response.get("data", {}).get("repository", {}).get("issue")
             if not issue_data:
                 return None
 
@@ -1232,17 +1416,18 @@ class GitHubTicketClient:
         """
 
         try:
-            response = self._execute_graphql_query(
-                query,
-                {
-                    "owner": owner,
-                    "repo": repo_name,
-                    "issueNumber": ticket_id,
-                },
-                repo=repo,
-            )
-
-            issue_data = response.get("data", {}).get("repository", {}).get("issue")
+            batched, issue_data = self._issue_batcher.lookup(repo, ticket_id, "linked_prs")
+            if not batched:
+                response = self._execute_graphql_query(
+                    query,
+                    {
+                        "owner": owner,
+                        "repo": repo_name,
+                        "issueNumber": ticket_id,
+                    },
+                    repo=repo,
+                )
+                issue_data = response.get("data", {}).get("repository", {}).get("issue")
             if not issue_data:
                 logger.debug(f"No issue data found for {repo}#{ticket_id}")
                 return []
@@ -1540,6 +1725,50 @@ class GitHubTicketClient:
         logger.debug(f"Found {len(results)} check runs for {repo}@{sha[:8]}")
         return results
 
+    def get_check_runs_bulk(self, repo: str, shas: list[str]) -> dict[str, list[CheckRunResult]]:
+        """Get check runs and commit statuses for several commits of one repository.
+
+        Uses one aliased statusCheckRollup query per chunk of commits instead of
+        two REST requests per commit. Commits the rollup cannot answer (unknown
+        commit, more contexts than one page, failed query) fall back to
+        get_check_runs().
+
+        Args:
+            repo: Repository in 'hostname/owner/repo' format
+            shas: Commit SHAs to query
+
+        Returns:
+            Dict mapping each SHA to its list of CheckRunResult objects
+        """
+        _, owner, repo_name = self._parse_repo(repo)
+        results: dict[str, list[CheckRunResult]] = {}
+        unique_shas = list(dict.fromkeys(shas))
+
+        for start in range(0, len(unique_shas), MAX_COMMITS_PER_QUERY):
+            chunk = unique_shas[start : start + MAX_COMMITS_PER_QUERY]
+            try:
+                response = self._execute_graphql_query(
+                    build_check_rollup_query(chunk),
+                    {"owner": owner, "repo": repo_name},
+                    repo=repo,
+                )
+            except (subprocess.CalledProcessError, ValueError) as e:
+                logger.warning(f"Batched check lookup failed for {repo}, querying per commit: {e}")
+                continue
+
+            repository = (response.get("data") or {}).get("repository") or {}
+            for i, sha in enumerate(chunk):
+                checks = parse_check_rollup(repository.get(f"c{i}"))
+                if checks is not None:
+                    results[sha] = checks
+
+        for sha in unique_shas:
+            if sha not in results:
+                results[sha] = self.get_check_runs(repo, sha)
+
+        logger.debug(f"Fetched check runs for {len(unique_shas)} commits in {repo}")
+        return results
+
     def _get_check_runs_for_commit(
         self, hostname: str, owner: str, repo_name: str, sha: str
     ) -> list[CheckRunResult]:
@@ -1908,6 +2137,59 @@ class GitHubTicketClient:
 
     # Merge queue operations
 
+    def _uses_conditional_requests(self, repo: str) -> bool:
+        """Check whether REST GETs for a repo are revalidated from the response cache.
+
+        Args:
+            repo: Repository in 'hostname/owner/repo' format
+
+        Returns:
+            True if `gh api` GETs go through an HTTP transport with a response cache
+        """
+        if self.http_transport is None or self.http_transport.cache is None:
+            return False
+        return bool(self._get_token_for_host(self._get_hostname_for_repo(repo)))
+
+    def _list_prs_by_label_rest(self, repo: str, label: str, state: str) -> list[dict[str, Any]]:
+        """List labeled pull requests through the REST pulls endpoint.
+
+        Used instead of `gh pr list` when REST GETs are conditional, so an
+        unchanged PR list is answered by a 304 that costs no rate limit.
+
+        Args:
+            repo: Repository in 'hostname/owner/repo' format
+            label: Label name to filter by
+            state: PR state filter ('open', 'closed', 'all')
+
+        Returns:
+            List of dicts with PR info: number, title, createdAt, headRefOid
+        """
+        _, owner, repo_name = self._parse_repo(repo)
+        args = ["api", f"repos/{owner}/{repo_name}/pulls?state={state}&per_page=100", "--paginate"]
+
+        try:
+            output = self._run_gh_command(args, repo=repo)
+            pulls = json.loads(output)
+        except subprocess.CalledProcessError as e:
+            logger.warning(f"Failed to list PRs by label '{label}' in {repo}: {e.stderr}")
+            return []
+        except json.JSONDecodeError as e:
+            logger.error(f"Failed to parse PR list response: {e}")
+            return []
+
+        result = [
+            {
+                "number": pr["number"],
+                "title": pr["title"],
+                "createdAt": pr["created_at"],
+                "headRefOid": pr["head"]["sha"],
+            }
+            for pr in pulls
+            if any(pr_label.get("name") == label for pr_label in pr.get("labels", []))
+        ]
+        logger.debug(f"Found {len(result)} PRs with label '{label}' in {repo}")
+        return result
+
     def list_prs_by_label(self, repo: str, label: str, state: str = "open") -> list[dict[str, Any]]:
         """List pull requests with a specific label.
 
@@ -1919,6 +2201,9 @@ class GitHubTicketClient:
         Returns:
             List of dicts with PR info: number, title, createdAt, headRefOid
         """
+        if state == "open" and self._uses_conditional_requests(repo):
+            return self._list_prs_by_label_rest(repo, label, state)
+
         repo_ref = self._get_repo_ref(repo)
         args = [
             "pr",
@@ -1945,6 +2230,49 @@ class GitHubTicketClient:
             logger.error(f"Failed to parse PR list response: {e}")
             return []
 
+    def list_labeled_pr_snapshots(
+        self, repo: str, labels: list[str]
+    ) -> list[PullRequestSnapshot] | None:
+        """Get the merge state of every open PR carrying any of the labels.
+
+        One paginated GraphQL query returns each PR's labels, merge state,
+        review decision, HEAD SHA and the HEAD commit's status check rollup,
+        however many PRs match.
+
+        Args:
+            repo: Repository in 'hostname/owner/repo' format
+            labels: Label names; a PR matches if it has at least one
+
+        Returns:
+            Snapshots ordered by creation time, or None if the query failed
+        """
+        _, owner, repo_name = self._parse_repo(repo)
+        snapshots: list[PullRequestSnapshot] = []
+        after: str | None = None
+
+        while True:
+            try:
+                response = self._execute_graphql_query(
+                    LABELED_PRS_QUERY,
+                    {"owner": owner, "repo": repo_name, "labels": labels, "after": after},
+                    repo=repo,
+                )
+            except (subprocess.CalledProcessError, ValueError) as e:
+                logger.warning(f"Failed to snapshot labeled PRs in {repo}: {e}")
+                return None
+
+            repository = (response.get("data") or {}).get("repository") or {}
+            connection = repository.get("pullRequests") or {}
+            snapshots.extend(parse_pr_snapshot(node) for node in connection.get("nodes") or [])
+
+            page_info = connection.get("pageInfo") or {}
+            if not page_info.get("hasNextPage"):
+                break
+            after = page_info.get("endCursor")
+
+        logger.debug(f"Snapshot of {len(snapshots)} PRs labeled {labels} in {repo}")
+        return snapshots
+
     def merge_pr(self, repo: str, pr_number: int, merge_method: str = "squash") -> bool:
         """Merge a pull request.
 
@@ -2096,6 +2424,7 @@ class GitHubTicketClient:
         """Query GitHub API for project items using GraphQL."""
         query = f"""
         query($login: String!, $projectNumber: Int!, $cursor: String) {{
+          rateLimit {{ cost remaining resetAt limit }}
           {entity_type}(login: $login) {{
             projectV2(number: $projectNumber) {{
               items(first: 100, after: $cursor) {{
@@ -2104,43 +2433,7 @@ class GitHubTicketClient:
                   endCursor
                 }}
                 nodes {{
-                  id
-                  fieldValues(first: 20) {{
-                    nodes {{
-                      ... on ProjectV2ItemFieldSingleSelectValue {{
-                        name
-                        field {{
-                          ... on ProjectV2SingleSelectField {{
-                            name
-                          }}
-                        }}
-                      }}
-                    }}
-                  }}
-                  content {{
-                    ... on Issue {{
-                      number
-                      title
-                      state
-                      stateReason
-                      repository {{
-                        nameWithOwner
-                      }}
-                      labels(first: 20) {{
-                        nodes {{
-                          name
-                        }}
-                      }}
-                      closedByPullRequestsReferences(first: 10) {{
-                        nodes {{
-                          merged
-                        }}
-                      }}
-                      comments {{
-                        totalCount
-                      }}
-                    }}
-                  }}
+                  {BOARD_ITEM_FIELDS}
                 }}
               }}
             }}
@@ -2286,6 +2579,7 @@ class GitHubTicketClient:
                 error_messages = [e.get("message", str(e)) for e in response["errors"]]
                 raise ValueError(f"GraphQL errors: {', '.join(error_messages)}")
 
+            self.rate_limits.record_graphql(hostname, (response.get("data") or {}).get("rateLimit"))
             result: dict[str, Any] = response
             return result
 
@@ -2338,6 +2632,7 @@ class GitHubTicketClient:
                 error_messages = [e.get("message", str(e)) for e in response["errors"]]
                 raise ValueError(f"GraphQL errors: {', '.join(error_messages)}")
 
+            self.rate_limits.record_graphql(hostname, (response.get("data") or {}).get("rateLimit"))
             result: dict[str, Any] = response
             return result
 
@@ -2356,6 +2651,9 @@ class GitHubTicketClient:
     ) -> str:
         """Run a gh CLI command with proper error handling.
 
+        When an HTTP transport is configured, `gh api` commands are sent over the
+        pooled connection instead of forking gh. Errors are classified identically.
+
         Args:
             args: Command arguments (excluding 'gh' itself)
             input_data: Optional data to pass to stdin
@@ -2367,6 +2665,8 @@ class GitHubTicketClient:
 
         Raises:
             subprocess.CalledProcessError: If the command fails
+            RateLimitError: If GitHub rejected the call because of a rate limit
+            NetworkError: If GitHub is unreachable
         """
         if hostname is None:
             hostname = self._get_hostname_for_repo(repo) if repo else "github.com"
@@ -2382,6 +2682,22 @@ class GitHubTicketClient:
         try:
             env = {}
             token = self._get_token_for_host(hostname)
+
+            # Serve `gh api` calls over the pooled HTTP transport when possible.
+            # Falls back to gh for porcelain commands and hosts without a token.
+            if self.http_transport is not None and token:
+                api_request = parse_gh_api_args(args)
+                if api_request is not None:
+                    output = self.http_transport.execute(
+                        hostname,
+                        token,
+                        api_request,
+                        input_data=input_data,
+                        rate_limits=self.rate_limits,
+                    )
+                    logger.debug(f"HTTP request succeeded, output length: {len(output)} bytes")
+                    return output
+
             if token:
                 if hostname == "github.com":
                     env["GITHUB_TOKEN"] = token
@@ -2419,6 +2735,11 @@ class GitHubTicketClient:
             if any(pattern in error_output for pattern in network_error_patterns):
                 raise NetworkError(f"GitHub API network error: {e.stderr}") from e
 
+            # Primary and secondary rate limits: record the throttle so the daemon backs off
+            if "rate limit" in error_output:
+                self.rate_limits.record_throttle(hostname)
+                raise RateLimitError(e.returncode, e.cmd, output=e.output, stderr=e.stderr) from e
+
             # Check for authentication errors and provide user-friendly message
             if any(
                 indicator in error_output
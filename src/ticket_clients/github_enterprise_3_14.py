@@ -38,6 +38,54 @@ CLOSING_KEYWORDS = [
     "resolved",
 ]
 
+# Selection of a ProjectV2Item (merged PRs via CLOSED_EVENT), shared by full board
+# queries and targeted item refreshes
+BOARD_ITEM_FIELDS = """
+        id
+        fieldValues(first: 20) {
+          nodes {
+            ... on ProjectV2ItemFieldSingleSelectValue {
+              name
+              field {
+                ... on ProjectV2SingleSelectField {
+                  name
+                }
+              }
+            }
+          }
+        }
+        content {
+          ... on Issue {
+            number
+            title
+            state
+            stateReason
+            repository {
+              nameWithOwner
+            }
+            labels(first: 20) {
+              nodes {
+                name
+              }
+            }
+            comments {
+              totalCount
+            }
+            timelineItems(itemTypes: [CLOSED_EVENT], last: 1) {
+              nodes {
+                ... on ClosedEvent {
+                  closer {
+                    ... on PullRequest {
+                      merged
+                    }
+                  }
+                }
+              }
+            }
+          }
+        }
+"""
+
 
 class GitHubEnterprise314Client(GitHubClientBase):
     """GitHub Enterprise Server 3.14 implementation of TicketClient protocol.
@@ -53,6 +101,10 @@ class GitHubEnterprise314Client(GitHubClientBase):
     reduce false positives.
     """
 
+    # Project V2 timeline events don't exist on GHES 3.14, so status actor lookups
+    # (and cross-reference based linked PRs) are not batched
+    ISSUE_BATCH_FIELDS: tuple[str, ...] = ("body", "labels", "label_events")
+
     @property
     def supports_linked_prs(self) -> bool:
         """GHES 3.14 supports linked PRs via CrossReferencedEvent alternative."""
@@ -416,6 +468,7 @@ class GitHubEnterprise314Client(GitHubClientBase):
         """
         query = f"""
         query($login: String!, $projectNumber: Int!, $cursor: String) {{
+          rateLimit {{ cost remaining resetAt limit }}
           {entity_type}(login: $login) {{
             projectV2(number: $projectNumber) {{
               items(first: 100, after: $cursor) {{
@@ -424,49 +477,7 @@ class GitHubEnterprise314Client(GitHubClientBase):
                   endCursor
                 }}
                 nodes {{
-                  id
-                  fieldValues(first: 20) {{
-                    nodes {{
-                      ... on ProjectV2ItemFieldSingleSelectValue {{
-                        name
-                        field {{
-                          ... on ProjectV2SingleSelectField {{
-                            name
-                          }}
-                        }}
-                      }}
-                    }}
-                  }}
-                  content {{
-                    ... on Issue {{
-                      number
-                      title
-                      state
-                      stateReason
-                      repository {{
-                        nameWithOwner
-                      }}
-                      labels(first: 20) {{
-                        nodes {{
-                          name
-                        }}
-                      }}
-                      comments {{
-                        totalCount
-                      }}
-                      timelineItems(itemTypes: [CLOSED_EVENT], last: 1) {{
-                        nodes {{
-                          ... on ClosedEvent {{
-                            closer {{
-                              ... on PullRequest {{
-                                merged
-                              }}
-                            }}
-                          }}
-                        }}
-                      }}
-                    }}
-                  }}
+                  {BOARD_ITEM_FIELDS}
                 }}
               }}
             }}
@@ -518,6 +529,10 @@ class GitHubEnterprise314Client(GitHubClientBase):
 
         return items
 
+    def _board_item_fields(self) -> str:
+        """GraphQL selection of a ProjectV2Item (merged PRs via CLOSED_EVENT)."""
+        return BOARD_ITEM_FIELDS
+
     def _parse_board_item_node(
         self, node: dict[str, Any], board_url: str, hostname: str
     ) -> TicketItem | None:
@@ -619,6 +634,9 @@ class GitHubEnterprise314Client(GitHubClientBase):
         Returns:
             List of dicts with PR info: number, title, createdAt, headRefOid
         """
+        if state == "open" and self._uses_conditional_requests(repo):
+            return self._list_prs_by_label_rest(repo, label, state)
+
         repo_ref = self._get_repo_ref(repo)
         args = [
             "pr",
@@ -0,0 +1,401 @@
+"""Pooled HTTP transport for GitHub API calls.
+
+This module provides an in-process alternative to forking `gh api` for every
+GraphQL and REST call. Requests are sent over one persistent requests.Session
+per hostname, so TCP and TLS connections are kept alive and reused across calls
+instead of paying gh startup, TLS handshake and auth setup on every request.
+
+Only `gh api` invocations are translated here. Porcelain commands such as
+`gh issue edit` or `gh pr merge` keep running through the gh CLI, which also
+remains the fallback when no token is configured for a host.
+
+When a ResponseCache is attached, REST GET requests are sent as conditional
+requests and 304 Not Modified responses are served from the cache.
+
+Failures are reported the same way the gh CLI reports them so the existing
+error classification in the ticket clients keeps working unchanged:
+- HTTP and GraphQL errors raise subprocess.CalledProcessError with gh-style stderr
+- Connectivity failures raise NetworkError
+"""
+
+import json
+import subprocess
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from src.logger import get_logger
+from src.ticket_clients.rate_limit import RateLimitTracker
+from src.ticket_clients.response_cache import CachedResponse, ResponseCache
+
+logger = get_logger(__name__)
+
+# Maximum number of keep-alive connections held open per hostname
+DEFAULT_POOL_SIZE = 10
+
+# Per-request timeout in seconds (connect + read)
+DEFAULT_TIMEOUT = 30
+
+# Safety limit for --paginate requests (matches the GraphQL pagination limits)
+MAX_PAGES = 100
+
+
+@dataclass
+class ApiRequest:
+    """A `gh api` invocation translated into HTTP request parts.
+
+    Attributes:
+        method: HTTP method (GET, POST, PATCH, DELETE, ...)
+        endpoint: API endpoint, either "graphql" or a REST path like "repos/o/r/issues"
+        headers: Extra request headers passed via -H
+        fields: String fields passed via -f (sent as JSON body or query params)
+        paginate: Whether to follow Link rel="next" headers and merge pages
+    """
+
+    method: str
+    endpoint: str
+    headers: dict[str, str] = field(default_factory=dict)
+    fields: dict[str, str] = field(default_factory=dict)
+    paginate: bool = False
+
+
+def parse_gh_api_args(args: list[str]) -> ApiRequest | None:
+    """Translate `gh api` command arguments into an ApiRequest.
+
+    Supports the subset of flags the ticket clients use: -X/--method,
+    -H/--header, -f/--raw-field, --paginate and `--input -`.
+
+    Args:
+        args: Command arguments (excluding 'gh' itself), e.g. ["api", "graphql", "--input", "-"]
+
+    Returns:
+        ApiRequest, or None if the command is not `gh api` or uses unsupported
+        flags (the caller should fall back to the gh CLI).
+    """
+    if not args or args[0] != "api":
+        return None
+
+    method: str | None = None
+    endpoint: str | None = None
+    headers: dict[str, str] = {}
+    fields: dict[str, str] = {}
+    paginate = False
+    has_input = False
+
+    i = 1
+    while i < len(args):
+        arg = args[i]
+        if arg in ("-X", "--method") and i + 1 < len(args):
+            method = args[i + 1].upper()
+            i += 2
+        elif arg in ("-H", "--header") and i + 1 < len(args):
+            name, _, value = args[i + 1].partition(":")
+            headers[name.strip()] = value.strip()
+            i += 2
+        elif arg in ("-f", "--raw-field") and i + 1 < len(args):
+            key, _, value = args[i + 1].partition("=")
+            fields[key] = value
+            i += 2
+        elif arg == "--input" and i + 1 < len(args):
+            # Only stdin input is supported (body is passed as input_data)
+            if args[i + 1] != "-":
+                return None
+            has_input = True
+            i += 2
+        elif arg == "--paginate":
+            paginate = True
+            i += 1
+        elif arg.startswith("-"):
+            # Unsupported flag (e.g. -i, --jq, --template) - let gh handle it
+            return None
+        elif endpoint is None:
+            endpoint = arg
+            i += 1
+        else:
+            return None
+
+    if endpoint is None:
+        return None
+
+    # gh defaults to POST when a body is supplied, GET otherwise
+    if method is None:
+        method = "POST" if (fields or has_input or endpoint == "graphql") else "GET"
+
+    return ApiRequest(
+        method=method,
+        endpoint=endpoint,
+        headers=headers,
+        fields=fields,
+        paginate=paginate,
+    )
+
+
+class HTTPTransport:
+    """Keep-alive HTTP transport for GitHub REST and GraphQL APIs.
+
+    Maintains one requests.Session per hostname, each with its own bounded
+    connection pool. Sessions are created lazily and shared across threads.
+    """
+
+    def __init__(
+        self,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        timeout: int = DEFAULT_TIMEOUT,
+        cache: ResponseCache | None = None,
+    ) -> None:
+        """Initialize the transport.
+
+        Args:
+            pool_size: Maximum keep-alive connections per hostname
+            timeout: Per-request timeout in seconds
+            cache: Optional cache for conditional REST GET requests
+        """
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.cache = cache
+        self._sessions: dict[str, requests.Session] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def api_url(hostname: str, endpoint: str) -> str:
+        """Build the full API URL for an endpoint.
+
+        Args:
+            hostname: GitHub hostname (e.g., 'github.com' or 'github.mycompany.com')
+            endpoint: "graphql", a REST path, or an absolute URL (pagination links)
+
+        Returns:
+            Absolute URL for the request
+        """
+        if endpoint.startswith(("https://", "http://")):
+            return endpoint
+        if hostname == "github.com":
+            base = "https://api.github.com"
+            if endpoint == "graphql":
+                return f"{base}/graphql"
+        else:
+            # GHES serves GraphQL at /api/graphql and REST at /api/v3
+            if endpoint == "graphql":
+                return f"https://{hostname}/api/graphql"
+            base = f"https://{hostname}/api/v3"
+        return f"{base}/{endpoint.lstrip('/')}"
+
+    def _get_session(self, hostname: str) -> requests.Session:
+        """Get the pooled session for a hostname, creating it if needed."""
+        with self._lock:
+            session = self._sessions.get(hostname)
+            if session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_size)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                self._sessions[hostname] = session
+                logger.debug(f"Created pooled HTTP session for {hostname}")
+            return session
+
+    def execute(
+        self,
+        hostname: str,
+        token: str,
+        request: ApiRequest,
+        input_data: str | None = None,
+        rate_limits: RateLimitTracker | None = None,
+    ) -> str:
+        """Execute an API request and return the response body.
+
+        Args:
+            hostname: GitHub hostname
+            token: Token for the hostname
+            request: Parsed `gh api` request
+            input_data: Raw request body (equivalent to `--input -`)
+            rate_limits: Tracker to record X-RateLimit-* headers and throttles in
+
+        Returns:
+            Response body as a string. Paginated array responses are merged
+            into a single JSON array, matching `gh api --paginate`.
+
+        Raises:
+            subprocess.CalledProcessError: On HTTP or GraphQL errors (gh-style stderr)
+            NetworkError: On connectivity failures (timeouts, refused connections, DNS)
+        """
+        # Import here to avoid circular imports
+        from src.ticket_clients.base import NetworkError
+
+        session = self._get_session(hostname)
+        headers = {
+            "Authorization": f"bearer {token}",
+            "Accept": "application/vnd.github+json",
+            **request.headers,
+        }
+
+        data: bytes | None = None
+        params: dict[str, str] | None = None
+        if input_data is not None:
+            data = input_data.encode("utf-8")
+            headers["Content-Type"] = "application/json"
+        elif request.fields:
+            if request.method == "GET":
+                params = request.fields
+            else:
+                data = json.dumps(request.fields).encode("utf-8")
+                headers["Content-Type"] = "application/json"
+
+        url: str | None = self.api_url(hostname, request.endpoint)
+        # Only plain GETs are revalidated (GraphQL is always POST)
+        cache = self.cache if request.method == "GET" and data is None else None
+        pages: list[str] = []
+        page_count = 0
+
+        while url and page_count < MAX_PAGES:
+            page_count += 1
+            cache_key = url
+            cached: CachedResponse | None = None
+            if cache is not None:
+                cache_key = requests.Request("GET", url, params=params).prepare().url or url
+                cached = cache.get(cache_key)
+            page_headers = {**headers, **cached.conditional_headers()} if cached else headers
+
+            logger.debug(f"HTTP {request.method} {url}")
+            try:
+                response = session.request(
+                    request.method,
+                    url,
+                    headers=page_headers,
+                    data=data,
+                    params=params,
+                    timeout=self.timeout,
+                )
+            except (requests.ConnectionError, requests.Timeout) as e:
+                raise NetworkError(f"GitHub API network error: {e}") from e
+
+            if rate_limits is not None:
+                self._record_rate_limit(hostname, response, rate_limits)
+
+            if cache is not None and cached is not None and response.status_code == 304:
+                # Not modified: free against the rate limit, serve the cached page
+                logger.debug(f"HTTP 304 Not Modified, using cached response for {url}")
+                cache.record(hit=True)
+                pages.append(cached.body)
+                next_url = cached.next_url
+            else:
+                self._raise_for_error(request, response)
+                pages.append(response.text)
+                next_url = response.links.get("next", {}).get("url")
+                if cache is not None:
+                    cache.record(hit=False)
+                    self._store(cache, cache_key, response, next_url)
+
+            url = next_url if request.paginate else None
+            # Query params are already encoded in the next link
+            params = None
+
+        if len(pages) == 1:
+            return pages[0]
+        return self._merge_pages(pages)
+
+    @staticmethod
+    def _record_rate_limit(
+        hostname: str, response: requests.Response, rate_limits: RateLimitTracker
+    ) -> None:
+        """Record rate-limit headers, and throttles from 403/429 rate-limit responses.
+
+        Args:
+            hostname: GitHub hostname
+            response: The HTTP response
+            rate_limits: Tracker to record into
+        """
+        rate_limits.record_headers(hostname, response.headers)
+        if response.status_code not in (403, 429):
+            return
+        retry_after = response.headers.get("Retry-After")
+        if retry_after is not None and retry_after.isdigit():
+            rate_limits.record_throttle(hostname, float(retry_after))
+        elif response.headers.get("X-RateLimit-Remaining") == "0":
+            reset = float(response.headers.get("X-RateLimit-Reset") or 0)
+            rate_limits.record_throttle(hostname, max(reset - time.time(), 0))
+
+    @staticmethod
+    def _store(
+        cache: ResponseCache, key: str, response: requests.Response, next_url: str | None
+    ) -> None:
+        """Cache a successful response if it carries a validator.
+
+        Args:
+            cache: Response cache to store into
+            key: Full request URL
+            response: The HTTP response
+            next_url: Link rel="next" URL of the page, if any
+        """
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if not (etag or last_modified):
+            return
+        cache.put(key, CachedResponse(response.text, etag, last_modified, next_url))
+
+    def _raise_for_error(self, request: ApiRequest, response: requests.Response) -> None:
+        """Raise a gh-compatible CalledProcessError for failed responses.
+
+        Args:
+            request: The request that was sent
+            response: The HTTP response
+
+        Raises:
+            subprocess.CalledProcessError: If the response is an HTTP or GraphQL error
+        """
+        cmd = ["gh", "api", request.endpoint]
+
+        if response.status_code >= 400:
+            message = response.reason or "Request failed"
+            try:
+                body = response.json()
+                if isinstance(body, dict) and body.get("message"):
+                    message = body["message"]
+            except ValueError:
+                pass
+            stderr = f"gh: {message} (HTTP {response.status_code})"
+            raise subprocess.CalledProcessError(1, cmd, output=response.text, stderr=stderr)
+
+        # gh exits non-zero when a GraphQL response carries errors
+        if request.endpoint == "graphql":
+            try:
+                body = response.json()
+            except ValueError:
+                return
+            if isinstance(body, dict) and body.get("errors"):
+                messages = [str(e.get("message", e)) for e in body["errors"]]
+                stderr = f"gh: {'; '.join(messages)}"
+                raise subprocess.CalledProcessError(1, cmd, output=response.text, stderr=stderr)
+
+    @staticmethod
+    def _merge_pages(pages: list[str]) -> str:
+        """Merge paginated responses the way `gh api --paginate` does.
+
+        JSON array pages are concatenated into one array. Other payloads are
+        returned as the concatenation of the raw page bodies.
+        """
+        merged: list[Any] = []
+        for page in pages:
+            try:
+                data = json.loads(page)
+            except json.JSONDecodeError:
+                return "".join(pages)
+            if not isinstance(data, list):
+                return "".join(pages)
+            merged.extend(data)
+        return json.dumps(merged)
+
+    def close(self) -> None:
+        """Close all pooled sessions and their connections, and persist the cache."""
+        if self.cache is not None:
+            self.cache.save()
+            logger.debug(
+                f"Response cache: {self.cache.hits} not-modified, {self.cache.misses} full responses"
+            )
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions.clear()
@@ -0,0 +1,302 @@
+"""Batched per-issue GraphQL lookups.
+
+The daemon asks several per-issue questions during a poll (current labels,
+issue body, who added a label, who last changed the project status, which
+PRs close the issue). Asked one at a time, each is a separate GraphQL round
+trip, which adds up to hundreds of requests on a large board.
+
+IssueBatcher collects the issues a poll phase is going to look at and, on the
+first lookup that needs one of them, fetches all pending issues for that host
+with a single aliased query per chunk:
+
+    query($o0: String!, $r0: String!, $n0: Int!, $o1: ...) {
+      i0: repository(owner: $o0, name: $r0) { issue(number: $n0) { ... } }
+      i1: repository(owner: $o1, name: $r1) { issue(number: $n1) { ... } }
+    }
+
+Results are handed back to the regular client methods in the same shape as
+their single-issue queries, so parsing is shared. Issues outside an active
+batch, or whose batch query failed, fall back to the single-issue query.
+
+Batches are thread-local: only the thread that opened a batch sees its
+results, so workflow threads always query GitHub directly.
+"""
+
+import threading
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Protocol
+
+from src.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Upper bound on issues per aliased query
+MAX_ISSUES_PER_QUERY = 50
+
+# Budget of connection nodes (sum of first/last sizes) per aliased query.
+# Well below GitHub's 500,000 node limit so individual queries stay cheap.
+MAX_NODES_PER_QUERY = 10_000
+
+
+@dataclass(frozen=True)
+class BatchField:
+    """A per-issue lookup that can be served from a batched query.
+
+    Attributes:
+        response_key: Field name the single-issue query reads from the issue node
+        selection: GraphQL selection for the field (without alias)
+        nodes: Number of connection nodes the selection can return
+    """
+
+    response_key: str
+    selection: str
+    nodes: int
+
+
+BATCH_FIELDS: dict[str, BatchField] = {
+    "body": BatchField("body", "body", 1),
+    "labels": BatchField("labels", "labels(first: 100) { nodes { name } }", 100),
+    "label_events": BatchField(
+        "timelineItems",
+        """timelineItems(itemTypes: [LABELED_EVENT], last: 50) {
+          nodes {
+            ... on LabeledEvent {
+              actor { login }
+              label { name }
+              createdAt
+            }
+          }
+        }""",
+        50,
+    ),
+    "status_events": BatchField(
+        "timelineItems",
+        """timelineItems(
+          itemTypes: [ADDED_TO_PROJECT_V2_EVENT, PROJECT_V2_ITEM_STATUS_CHANGED_EVENT],
+          last: 10
+        ) {
+          nodes {
+            __typename
+            ... on AddedToProjectV2Event {
+              actor { login }
+              createdAt
+            }
+            ... on ProjectV2ItemStatusChangedEvent {
+              actor { login }
+              createdAt
+            }
+          }
+        }""",
+        10,
+    ),
+    "linked_prs": BatchField(
+        "closedByPullRequestsReferences",
+        """closedByPullRequestsReferences(first: 10) {
+          nodes {
+            number
+            url
+            body
+            state
+            merged
+            headRefName
+            title
+          }
+        }""",
+        10,
+    ),
+}
+
+
+class _GraphQLClient(Protocol):
+    """Client methods the batcher needs to build and run queries."""
+
+    def _parse_repo(self, repo: str) -> tuple[str, str, str]: ...
+
+    def _execute_graphql_query(
+        self,
+        query: str,
+        variables: dict[str, Any],
+        *,
+        hostname: str | None = None,
+        repo: str | None = None,
+    ) -> dict[str, Any]: ...
+
+
+@dataclass
+class _BatchState:
+    """Per-thread state of an open batch."""
+
+    pending: dict[tuple[str, int], None] = field(default_factory=dict)
+    results: dict[tuple[str, int], dict[str, Any] | None] = field(default_factory=dict)
+    failed: set[tuple[str, int]] = field(default_factory=set)
+
+
+class IssueBatcher:
+    """Collects per-issue lookups and serves them from aliased GraphQL queries."""
+
+    def __init__(self, client: _GraphQLClient, fields: Iterable[str]) -> None:
+        """Initialize the batcher.
+
+        Args:
+            client: Ticket client used to parse repos and execute queries
+            fields: Names of BATCH_FIELDS the client can serve from a batch.
+                    Lookups for other fields always use the single-issue query.
+        """
+        self._client = client
+        self.fields = tuple(fields)
+        self._local = threading.local()
+
+    @property
+    def issues_per_query(self) -> int:
+        """Number of issues per aliased query, bounded by the node budget."""
+        nodes_per_issue = sum(BATCH_FIELDS[name].nodes for name in self.fields) or 1
+        return max(1, min(MAX_ISSUES_PER_QUERY, MAX_NODES_PER_QUERY // nodes_per_issue))
+
+    def _state(self) -> _BatchState | None:
+        state: _BatchState | None = getattr(self._local, "state", None)
+        return state
+
+    @contextmanager
+    def batch(self, issues: Iterable[tuple[str, int]]) -> Iterator[None]:
+        """Open a batch for the current thread.
+
+        Nothing is fetched up front; the first lookup for a queued issue fetches
+        every pending issue on the same host.
+
+        Args:
+            issues: (repo, issue_number) pairs the caller expects to look up
+        """
+        previous = self._state()
+        self._local.state = _BatchState()
+        self.queue(issues)
+        try:
+            yield
+        finally:
+            self._local.state = previous
+
+    def queue(self, issues: Iterable[tuple[str, int]]) -> None:
+        """Add issues to the current thread's batch. No-op without an open batch.
+
+        Args:
+            issues: (repo, issue_number) pairs to fetch with the next batch query
+        """
+        state = self._state()
+        if state is None:
+            return
+        for key in issues:
+            if key not in state.results and key not in state.failed:
+                state.pending[key] = None
+
+    def invalidate(self, repo: str, ticket_id: int) -> None:
+        """Drop batched data for an issue after it was modified.
+
+        Args:
+            repo: Repository in 'hostname/owner/repo' format
+            ticket_id: Issue number
+        """
+        state = self._state()
+        if state is None:
+            return
+        key = (repo, ticket_id)
+        state.pending.pop(key, None)
+        state.results.pop(key, None)
+        # Later lookups for this issue go straight to the single-issue query
+        state.failed.add(key)
+
+    def lookup(
+        self, repo: str, ticket_id: int, field_name: str
+    ) -> tuple[bool, dict[str, Any] | None]:
+        """Look up an issue field from the current batch.
+
+        Args:
+            repo: Repository in 'hostname/owner/repo' format
+            ticket_id: Issue number
+            field_name: Name of a BATCH_FIELDS entry
+
+        Returns:
+            Tuple of (found, issue_data). When found is True, issue_data is the
+            issue node as the single-issue query would return it (None if the
+            issue does not exist). When found is False the caller must run its
+            own query.
+        """
+        state = self._state()
+        if state is None or field_name not in self.fields:
+            return (False, None)
+
+        key = (repo, ticket_id)
+        if key in state.pending:
+            self._fetch_pending(state, self._client._parse_repo(repo)[0])
+
+        if key not in state.results:
+            return (False, None)
+
+        issue = state.results[key]
+        if issue is None:
+            return (True, None)
+        batch_field = BATCH_FIELDS[field_name]
+        return (True, {batch_field.response_key: issue.get(field_name)})
+
+    def _fetch_pending(self, state: _BatchState, hostname: str) -> None:
+        """Fetch all pending issues for a host in aliased, chunked queries."""
+        keys = [key for key in state.pending if self._client._parse_repo(key[0])[0] == hostname]
+        for key in keys:
+            del state.pending[key]
+
+        chunk_size = self.issues_per_query
+        chunks = [keys[i : i + chunk_size] for i in range(0, len(keys), chunk_size)]
+        logger.debug(
+            f"Batch-fetching {len(keys)} issues on {hostname} in {len(chunks)} GraphQL queries"
+        )
+        for chunk in chunks:
+            try:
+                state.results.update(self._fetch_chunk(chunk, hostname))
+            except Exception as e:
+                logger.warning(
+                    f"Batched issue lookup failed for {len(chunk)} issues on {hostname}, "
+                    f"falling back to per-issue queries: {e}"
+                )
+                state.failed.update(chunk)
+
+    def _fetch_chunk(
+        self, keys: list[tuple[str, int]], hostname: str
+    ) -> dict[tuple[str, int], dict[str, Any] | None]:
+        """Run one aliased query for a chunk of issues.
+
+        Args:
+            keys: (repo, issue_number) pairs on the same host
+            hostname: GitHub hostname for the query
+
+        Returns:
+            Dict mapping each key to its issue node (None if not found)
+        """
+        selections = "\n".join(f"{name}: {BATCH_FIELDS[name].selection}" for name in self.fields)
+        declarations: list[str] = []
+        aliases: list[str] = []
+        variables: dict[str, Any] = {}
+        for i, (repo, ticket_id) in enumerate(keys):
+            _, owner, repo_name = self._client._parse_repo(repo)
+            declarations.append(f"$o{i}: String!, $r{i}: String!, $n{i}: Int!")
+            aliases.append(
+                f"i{i}: repository(owner: $o{i}, name: $r{i}) {{\n"
+                f"  issue(number: $n{i}) {{\n{selections}\n  }}\n}}"
+            )
+            variables[f"o{i}"] = owner
+            variables[f"r{i}"] = repo_name
+            variables[f"n{i}"] = ticket_id
+
+        # rateLimit reports the query's cost to the shared rate-limit tracker
+        query = (
+            f"query({', '.join(declarations)}) {{\n"
+            + "\n".join([*aliases, "rateLimit { cost remaining resetAt limit }"])
+            + "\n}"
+        )
+        response = self._client._execute_graphql_query(query, variables, hostname=hostname)
+        data = response.get("data") or {}
+
+        results: dict[tuple[str, int], dict[str, Any] | None] = {}
+        for i, key in enumerate(keys):
+            repository = data.get(f"i{i}") or {}
+            results[key] = repository.get("issue")
+        return results
@@ -0,0 +1,85 @@
+"""Targeted refresh of individual board items.
+
+A poll fetches every item of every board. When the daemon is told that a few
+specific issues changed, it only needs those items. Each issue's project
+items are reachable from the issue itself, so one aliased query returns the
+board items of many issues at once:
+
+    query($o0: String!, $r0: String!, $n0: Int!, $o1: ...) {
+      i0: repository(owner: $o0, name: $r0) {
+        issue(number: $n0) {
+          projectItems(first: 10) { nodes { project { url } ...item fields } }
+        }
+      }
+      ...
+    }
+
+The item fields are the same selection the client uses for full board
+queries, so nodes are parsed by the client's regular board item parser. Items
+on projects that are not configured boards are dropped by the caller.
+"""
+
+from typing import Any
+
+# Upper bound on issues per aliased query
+MAX_ISSUES_PER_QUERY = 25
+
+# Project items fetched per issue (one per project the issue is on)
+PROJECT_ITEMS_PER_ISSUE = 10
+
+
+def build_issue_items_query(
+    keys: list[tuple[str, str, int]], item_fields: str
+) -> tuple[str, dict[str, Any]]:
+    """Build the aliased query for the project items of several issues.
+
+    Args:
+        keys: (owner, repo name, issue number) of each issue, all on one host
+        item_fields: GraphQL selection of a ProjectV2Item (as used for boards)
+
+    Returns:
+        Tuple of (query, variables); alias i<n> holds keys[n]
+    """
+    declarations: list[str] = []
+    aliases: list[str] = []
+    variables: dict[str, Any] = {}
+    for i, (owner, repo_name, number) in enumerate(keys):
+        declarations.append(f"$o{i}: String!, $r{i}: String!, $n{i}: Int!")
+        aliases.append(
+            f"i{i}: repository(owner: $o{i}, name: $r{i}) {{\n"
+            f"  issue(number: $n{i}) {{\n"
+            f"    projectItems(first: {PROJECT_ITEMS_PER_ISSUE}) {{\n"
+            f"      nodes {{\n        project {{ url }}\n{item_fields}\n      }}\n"
+            f"    }}\n  }}\n}}"
+        )
+        variables[f"o{i}"] = owner
+        variables[f"r{i}"] = repo_name
+        variables[f"n{i}"] = number
+
+    # rateLimit reports the query's cost to the shared rate-limit tracker
+    query = (
+        f"query({', '.join(declarations)}) {{\n"
+        + "\n".join([*aliases, "rateLimit { cost remaining resetAt limit }"])
+        + "\n}"
+    )
+    return query, variables
+
+
+def project_item_nodes(response: dict[str, Any], count: int) -> list[list[dict[str, Any]]]:
+    """Extract each issue's project item nodes from a build_issue_items_query response.
+
+    Args:
+        response: GraphQL response
+        count: Number of issues in the query
+
+    Returns:
+        One list of ProjectV2Item nodes per issue, in query order (empty for
+        issues that were not found)
+    """
+    data = response.get("data") or {}
+    results: list[list[dict[str, Any]]] = []
+    for i in range(count):
+        issue = (data.get(f"i{i}") or {}).get("issue") or {}
+        nodes = (issue.get("projectItems") or {}).get("nodes") or []
+        results.append([node for node in nodes if node])
+    return results
@@ -0,0 +1,92 @@
+"""Single-query snapshot of the PRs in a repository's merge queue.
+
+Refreshing the merge queue one call at a time cost three label listings per
+repository, a state lookup per queued PR, and merge state, HEAD SHA and check
+lookups for the head of the queue. One paginated GraphQL query returns every
+open PR carrying any of the queue's labels together with all of that:
+
+    query($owner: String!, $repo: String!, $labels: [String!], $after: String) {
+      repository(owner: $owner, name: $repo) {
+        pullRequests(states: OPEN, labels: $labels, first: 50, ...) {
+          nodes {
+            number createdAt baseRefName mergeStateStatus mergeable reviewDecision headRefOid
+            baseRef { target { oid } }
+            labels { ... }
+            commits(last: 1) { nodes { commit { statusCheckRollup { ... } } } }
+          }
+        }
+      }
+    }
+"""
+
+from typing import Any
+
+from src.interfaces import PullRequestSnapshot
+from src.ticket_clients.check_batch import ROLLUP_SELECTION, parse_check_rollup
+
+# PRs fetched per page; each carries up to CONTEXTS_PER_COMMIT check contexts
+PRS_PER_PAGE = 50
+
+# Labels fetched per PR
+LABELS_PER_PR = 30
+
+LABELED_PRS_QUERY = f"""query($owner: String!, $repo: String!, $labels: [String!], $after: String) {{
+  rateLimit {{ cost remaining resetAt limit }}
+  repository(owner: $owner, name: $repo) {{
+    pullRequests(
+      states: OPEN
+      labels: $labels
+      first: {PRS_PER_PAGE}
+      after: $after
+      orderBy: {{field: CREATED_AT, direction: ASC}}
+    ) {{
+      pageInfo {{ hasNextPage endCursor }}
+      nodes {{
+        number
+        createdAt
+        baseRefName
+        mergeStateStatus
+        mergeable
+        reviewDecision
+        headRefOid
+        baseRef {{ target {{ oid }} }}
+        labels(first: {LABELS_PER_PR}) {{ nodes {{ name }} }}
+        commits(last: 1) {{
+          nodes {{
+            commit {{
+          {ROLLUP_SELECTION}
+            }}
+          }}
+        }}
+      }}
+    }}
+  }}
+}}"""
+
+
+def parse_pr_snapshot(node: dict[str, Any]) -> PullRequestSnapshot:
+    """Convert one pullRequests node into a PullRequestSnapshot.
+
+    Args:
+        node: A node of the LABELED_PRS_QUERY connection
+
+    Returns:
+        Snapshot of the PR; checks is None when the HEAD commit's rollup did
+        not fit in one page
+    """
+    commits = (node.get("commits") or {}).get("nodes") or []
+    commit = (commits[-1] or {}).get("commit") if commits else None
+    base_target = (node.get("baseRef") or {}).get("target") or {}
+
+    return PullRequestSnapshot(
+        number=node["number"],
+        created_at=node.get("createdAt") or "",
+        labels={label["name"] for label in (node.get("labels") or {}).get("nodes") or []},
+        merge_state_status=node.get("mergeStateStatus") or "UNKNOWN",
+        mergeable=node.get("mergeable") or "UNKNOWN",
+        review_decision=node.get("reviewDecision") or "",
+        head_sha=node.get("headRefOid"),
+        base_ref=node.get("baseRefName") or "",
+        base_head_sha=base_target.get("oid"),
+        checks=parse_check_rollup(commit),
+    )
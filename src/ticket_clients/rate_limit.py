@@ -0,0 +1,296 @@
+"""GitHub rate-limit accounting and poll budgeting.
+
+GitHub limits each token per hostname and per resource: REST calls draw from
+the "core" bucket, GraphQL queries from the "graphql" bucket (in points, where
+a large query costs more than one). Both reset hourly. Exceeding them, or
+GitHub's secondary limits on bursts, makes every API call fail until the
+window resets.
+
+RateLimitTracker is shared by every ticket client call. It records the
+remaining budget per (hostname, resource) from:
+- X-RateLimit-* response headers (HTTP transport)
+- the GraphQL `rateLimit { cost remaining resetAt limit }` field
+- the free `GET /rate_limit` endpoint (gh CLI mode, once per poll cycle)
+and accumulates how much budget was spent, including 403/429 throttles.
+
+RateLimitBudget turns that into scheduling decisions for the daemon: it
+predicts the cost of a poll cycle from recent cycles, stretches the poll
+interval when the remaining budget would run out before the window resets,
+and reports hosts whose budget is low so low-priority work can be deferred.
+"""
+
+import threading
+import time
+from collections.abc import Mapping
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+from src.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Seconds to back off after a throttle response without a Retry-After header
+DEFAULT_THROTTLE_SECONDS = 60
+
+# Fraction of the budget below which low-priority work is deferred
+LOW_BUDGET_FRACTION = 0.25
+
+# Weight of the latest cycle in the predicted cycle cost (exponential moving average)
+COST_SMOOTHING = 0.3
+
+
+@dataclass(frozen=True)
+class RateLimitSnapshot:
+    """Last known rate-limit state of one (hostname, resource) bucket.
+
+    Attributes:
+        limit: Requests (or GraphQL points) allowed per window
+        remaining: Requests (or points) left in the current window
+        reset_at: Unix timestamp when the window resets
+    """
+
+    limit: int
+    remaining: int
+    reset_at: float
+
+
+class RateLimitTracker:
+    """Thread-safe record of rate-limit state and spend per hostname and resource."""
+
+    def __init__(self) -> None:
+        """Initialize an empty tracker."""
+        self._lock = threading.Lock()
+        self._snapshots: dict[tuple[str, str], RateLimitSnapshot] = {}
+        self._spent: dict[tuple[str, str], int] = {}
+        self._throttled_until: dict[str, float] = {}
+
+    def update(
+        self, hostname: str, resource: str, limit: int, remaining: int, reset_at: float
+    ) -> None:
+        """Record a rate-limit observation.
+
+        Spend is the drop in remaining budget since the previous observation in
+        the same window. Observations arriving out of order (a higher remaining
+        count within the same window) are ignored.
+
+        Args:
+            hostname: GitHub hostname
+            resource: Rate-limit resource ("core", "graphql", "search", ...)
+            limit: Budget per window
+            remaining: Budget left in the window
+            reset_at: Unix timestamp when the window resets
+        """
+        key = (hostname, resource)
+        with self._lock:
+            previous = self._snapshots.get(key)
+            if previous is not None and abs(previous.reset_at - reset_at) < 1:
+                if remaining >= previous.remaining:
+                    return
+                self._spent[key] = self._spent.get(key, 0) + previous.remaining - remaining
+            elif previous is not None and reset_at > previous.reset_at:
+                # New window: everything used since the reset counts as spent
+                self._spent[key] = self._spent.get(key, 0) + max(limit - remaining, 0)
+            self._snapshots[key] = RateLimitSnapshot(limit, remaining, reset_at)
+
+    def record_headers(self, hostname: str, headers: Mapping[str, str]) -> None:
+        """Record X-RateLimit-* response headers.
+
+        Args:
+            hostname: GitHub hostname the response came from
+            headers: Response headers (case-insensitive mapping)
+        """
+        try:
+            limit = int(headers["X-RateLimit-Limit"])
+            remaining = int(headers["X-RateLimit-Remaining"])
+            reset_at = float(headers["X-RateLimit-Reset"])
+        except (KeyError, TypeError, ValueError):
+            return
+        resource = headers.get("X-RateLimit-Resource") or "core"
+        self.update(hostname, resource, limit, remaining, reset_at)
+
+    def record_graphql(self, hostname: str, rate_limit: Mapping[str, Any] | None) -> None:
+        """Record the `rateLimit` field of a GraphQL response.
+
+        Args:
+            hostname: GitHub hostname the response came from
+            rate_limit: The response's data.rateLimit object, if requested
+        """
+        if not rate_limit:
+            return
+        try:
+            reset_at = datetime.fromisoformat(str(rate_limit["resetAt"]).replace("Z", "+00:00"))
+            self.update(
+                hostname,
+                "graphql",
+                int(rate_limit["limit"]),
+                int(rate_limit["remaining"]),
+                reset_at.timestamp(),
+            )
+        except (KeyError, TypeError, ValueError):
+            return
+        logger.debug(f"GraphQL query on {hostname} cost {rate_limit.get('cost')} points")
+
+    def record_rate_limit_resources(self, hostname: str, resources: Mapping[str, Any]) -> None:
+        """Record the `resources` object of a GET /rate_limit response.
+
+        Args:
+            hostname: GitHub hostname
+            resources: Mapping of resource name to {limit, remaining, reset}
+        """
+        for resource in ("core", "graphql"):
+            bucket = resources.get(resource)
+            if not bucket:
+                continue
+            try:
+                self.update(
+                    hostname,
+                    resource,
+                    int(bucket["limit"]),
+                    int(bucket["remaining"]),
+                    float(bucket["reset"]),
+                )
+            except (KeyError, TypeError, ValueError):
+                continue
+
+    def record_throttle(self, hostname: str, retry_after: float | None = None) -> None:
+        """Record a primary or secondary rate-limit rejection.
+
+        Args:
+            hostname: GitHub hostname that throttled the request
+            retry_after: Seconds to wait before retrying, if GitHub said so
+        """
+        seconds = retry_after if retry_after is not None else DEFAULT_THROTTLE_SECONDS
+        until = time.time() + seconds
+        with self._lock:
+            self._throttled_until[hostname] = max(self._throttled_until.get(hostname, 0), until)
+        logger.warning(f"GitHub rate limit hit on {hostname}, backing off for {seconds:.0f}s")
+
+    def snapshots(self, hostname: str) -> dict[str, RateLimitSnapshot]:
+        """Last known state of every resource for a hostname.
+
+        Args:
+            hostname: GitHub hostname
+
+        Returns:
+            Dict mapping resource name to its RateLimitSnapshot
+        """
+        with self._lock:
+            return {res: snap for (host, res), snap in self._snapshots.items() if host == hostname}
+
+    def spent(self) -> dict[tuple[str, str], int]:
+        """Cumulative spend per (hostname, resource) since the tracker was created."""
+        with self._lock:
+            return dict(self._spent)
+
+    def throttled_until(self, hostname: str) -> float:
+        """Unix timestamp until which a hostname is throttled (0 if never throttled)."""
+        with self._lock:
+            return self._throttled_until.get(hostname, 0.0)
+
+    def hostnames(self) -> set[str]:
+        """Hostnames with any recorded rate-limit state."""
+        with self._lock:
+            return {host for host, _ in self._snapshots} | set(self._throttled_until)
+
+
+class RateLimitBudget:
+    """Plans poll intervals and work priority from a RateLimitTracker."""
+
+    def __init__(
+        self, tracker: RateLimitTracker, budget_fraction: float, max_interval: float
+    ) -> None:
+        """Initialize the budget.
+
+        Args:
+            tracker: Shared rate-limit tracker
+            budget_fraction: Fraction of each window's limit the daemon may spend
+                             (the rest is left for other tools sharing the token)
+            max_interval: Upper bound for a stretched poll interval, in seconds
+        """
+        self.tracker = tracker
+        self.budget_fraction = budget_fraction
+        self.max_interval = max_interval
+        self._last_spent: dict[tuple[str, str], int] = {}
+        self._predicted: dict[tuple[str, str], float] = {}
+
+    def end_cycle(self) -> None:
+        """Fold the spend since the previous call into the predicted cycle cost."""
+        spent = self.tracker.spent()
+        for key in set(spent) | set(self._predicted):
+            cost = spent.get(key, 0) - self._last_spent.get(key, 0)
+            previous = self._predicted.get(key)
+            self._predicted[key] = (
+                float(cost)
+                if previous is None
+                else COST_SMOOTHING * cost + (1 - COST_SMOOTHING) * previous
+            )
+        self._last_spent = spent
+
+    def predicted_cycle_cost(self, hostname: str, resource: str) -> float:
+        """Predicted cost of one poll cycle for a bucket (0 until a cycle was measured).
+
+        Args:
+            hostname: GitHub hostname
+            resource: Rate-limit resource
+        """
+        return self._predicted.get((hostname, resource), 0.0)
+
+    def _usable(self, snapshot: RateLimitSnapshot) -> float:
+        """Budget left in the window after holding back the unbudgeted share."""
+        return snapshot.remaining - snapshot.limit * (1 - self.budget_fraction)
+
+    def next_interval(self, base_interval: float) -> float:
+        """Compute the wait before the next poll.
+
+        Stretches the interval so the predicted cycle cost fits into the usable
+        budget until each window resets, and waits out throttles. Returns
+        base_interval unchanged when the budget is comfortable.
+
+        Args:
+            base_interval: Configured poll interval in seconds
+
+        Returns:
+            Seconds to wait before the next poll
+        """
+        now = time.time()
+        required: list[float] = []
+        for hostname in self.tracker.hostnames():
+            throttle_wait = self.tracker.throttled_until(hostname) - now
+            if throttle_wait > 0:
+                required.append(throttle_wait)
+            for resource, snapshot in self.tracker.snapshots(hostname).items():
+                until_reset = snapshot.reset_at - now
+                if until_reset <= 0:
+                    continue
+                usable = self._usable(snapshot)
+                cost = self.predicted_cycle_cost(hostname, resource)
+                if usable <= 0:
+                    required.append(until_reset)
+                elif cost > 0:
+                    required.append(until_reset / (usable / cost))
+
+        if not required or max(required) <= base_interval:
+            return base_interval
+        return min(max(required), max(self.max_interval, base_interval))
+
+    def is_low(self, hostname: str) -> bool:
+        """Check whether low-priority work for a hostname should be deferred.
+
+        Args:
+            hostname: GitHub hostname
+
+        Returns:
+            True if the host is throttled or any bucket's usable budget has
+            dropped below LOW_BUDGET_FRACTION of the budgeted share
+        """
+        if self.tracker.throttled_until(hostname) > time.time():
+            return True
+        now = time.time()
+        for snapshot in self.tracker.snapshots(hostname).values():
+            if snapshot.reset_at <= now:
+                continue
+            budgeted = snapshot.limit * self.budget_fraction
+            if self._usable(snapshot) < budgeted * LOW_BUDGET_FRACTION:
+                return True
+        return False
@@ -0,0 +1,196 @@
+"""Conditional-request cache for GitHub REST GET calls.
+
+The daemon re-reads the same REST resources every poll (issue comments, check
+runs, commit statuses, open PRs). GitHub answers a request carrying
+If-None-Match / If-Modified-Since with 304 Not Modified when nothing changed,
+and 304 responses don't count against the rate limit.
+
+ResponseCache keeps the ETag, Last-Modified and body of each GET response,
+keyed by full URL (including query string and page). HTTPTransport sends the
+validators with every GET and serves the cached body on a 304. Paginated
+responses are cached per page together with the page's next link, so a 304 on
+page one still revalidates the following pages.
+
+The cache is an LRU bounded by total body size. It can optionally be persisted
+to a JSON file (written with owner-only permissions, since bodies may contain
+private repository data) so a restarted daemon starts warm.
+"""
+
+import json
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+
+from src.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Default memory budget for cached response bodies
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+
+# Bump when the on-disk format changes; older files are ignored
+CACHE_FILE_VERSION = 1
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """A cached GET response and its validators.
+
+    Attributes:
+        body: Response body
+        etag: ETag header value, sent back as If-None-Match
+        last_modified: Last-Modified header value, sent back as If-Modified-Since
+        next_url: Link rel="next" URL of the page, if any
+    """
+
+    body: str
+    etag: str | None = None
+    last_modified: str | None = None
+    next_url: str | None = None
+
+    @property
+    def size(self) -> int:
+        """Approximate memory footprint in bytes."""
+        return (
+            len(self.body)
+            + len(self.etag or "")
+            + len(self.last_modified or "")
+            + len(self.next_url or "")
+        )
+
+    def conditional_headers(self) -> dict[str, str]:
+        """Request headers that revalidate this response."""
+        headers: dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """Thread-safe LRU cache of GET responses, bounded by total size.
+
+    Attributes:
+        hits: Number of requests answered with 304 Not Modified
+        misses: Number of requests that returned a full response
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES, path: str | None = None) -> None:
+        """Initialize the cache, loading persisted entries if a path is given.
+
+        Args:
+            max_bytes: Maximum total size of cached entries
+            path: Optional JSON file to load from and save to
+        """
+        self.max_bytes = max_bytes
+        self.path = Path(path) if path else None
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, CachedResponse] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        if self.path is not None:
+            self._load()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    @property
+    def size_bytes(self) -> int:
+        """Total size of cached entries in bytes."""
+        with self._lock:
+            return self._size
+
+    def get(self, key: str) -> CachedResponse | None:
+        """Get the cached response for a URL, marking it recently used.
+
+        Args:
+            key: Full request URL
+
+        Returns:
+            CachedResponse, or None if not cached
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key: str, entry: CachedResponse) -> None:
+        """Store a response, evicting least recently used entries as needed.
+
+        Responses larger than the whole budget are not cached.
+
+        Args:
+            key: Full request URL
+            entry: Response to cache
+        """
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= previous.size
+            if entry.size > self.max_bytes:
+                return
+            self._entries[key] = entry
+            self._size += entry.size
+            while self._size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= evicted.size
+
+    def record(self, hit: bool) -> None:
+        """Count a revalidation result.
+
+        Args:
+            hit: True for a 304 Not Modified, False for a full response
+        """
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def _load(self) -> None:
+        """Load persisted entries. Missing or unreadable files start an empty cache."""
+        if self.path is None:
+            return
+        try:
+            data = json.loads(self.path.read_text())
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable response cache {self.path}: {e}")
+            return
+
+        if not isinstance(data, dict) or data.get("version") != CACHE_FILE_VERSION:
+            logger.debug(f"Ignoring response cache {self.path} with unknown format")
+            return
+        for key, body, etag, last_modified, next_url in data.get("entries", []):
+            self.put(key, CachedResponse(body, etag, last_modified, next_url))
+        logger.debug(f"Loaded {len(self._entries)} cached responses from {self.path}")
+
+    def save(self) -> None:
+        """Persist entries to the cache file (no-op without a path).
+
+        Written atomically with owner-only permissions. Errors are logged, not raised.
+        """
+        if self.path is None:
+            return
+        with self._lock:
+            entries = [
+                [key, e.body, e.etag, e.last_modified, e.next_url]
+                for key, e in self._entries.items()
+            ]
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w") as f:
+                json.dump({"version": CACHE_FILE_VERSION, "entries": entries}, f)
+            os.replace(tmp_path, self.path)
+            logger.debug(f"Saved {len(entries)} cached responses to {self.path}")
+        except OSError as e:
+            logger.warning(f"Failed to save response cache to {self.path}: {e}")
@@ -0,0 +1,165 @@
+"""Per-key job registry that coalesces repeated submissions.
+
+Used by the daemon for comment processing: every poll submits a comment job
+for each issue whose comment count changed, and a slow job would otherwise
+collect duplicate submissions that re-read the same comments and race for
+the same reactions. The registry keeps at most one job per key:
+
+- A submission for a key that is queued but not started replaces the queued
+  argument (the newest board item wins) and is dropped.
+- A submission for a key whose job is running sets a re-run flag. When the
+  job finishes it runs once more with the newest argument, provided the
+  still_needed check passes (e.g. the comment count moved past what the
+  finished job saw).
+"""
+
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from src.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class _Entry:
+    """Registry state of one key."""
+
+    arg: Any
+    running: bool = False
+    rerun: bool = False
+
+
+@dataclass
+class CoalescingStats:
+    """Snapshot of a CoalescingJobs registry.
+
+    Attributes:
+        queued: Jobs submitted and waiting to start
+        running: Jobs currently running
+        rerun_pending: Running jobs flagged to run again
+        coalesced: Submissions folded into an existing job since startup
+    """
+
+    queued: int
+    running: int
+    rerun_pending: int
+    coalesced: int
+
+    @property
+    def depth(self) -> int:
+        """Jobs not yet finished, counting flagged re-runs."""
+        return self.queued + self.running + self.rerun_pending
+
+
+class CoalescingJobs:
+    """At most one queued or running job per key, with a single re-run."""
+
+    def __init__(
+        self,
+        fn: Callable[[Any], None],
+        submit: Callable[[Callable[[Any], None], Any], object],
+        key: Callable[[Any], str],
+        still_needed: Callable[[Any], bool] | None = None,
+    ) -> None:
+        """Initialize the registry.
+
+        Args:
+            fn: Job body, called with the newest argument for its key
+            submit: Schedules a callable with an argument (e.g. on a thread pool)
+            key: Maps an argument to its coalescing key
+            still_needed: Checked before a flagged re-run; the re-run is
+                skipped when it returns False
+        """
+        self._fn = fn
+        self._submit = submit
+        self._key = key
+        self._still_needed = still_needed
+        self._lock = threading.Lock()
+        self._entries: dict[str, _Entry] = {}
+        self._coalesced = 0
+
+    def submit(self, arg: Any) -> bool:
+        """Schedule a job for arg unless one for its key is already pending.
+
+        Args:
+            arg: Job argument
+
+        Returns:
+            True if a new job was scheduled, False if coalesced into an existing one
+        """
+        key = self._key(arg)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry.arg = arg
+                if entry.running:
+                    entry.rerun = True
+                self._coalesced += 1
+                return False
+            self._entries[key] = _Entry(arg)
+
+        try:
+            self._submit(self._run, arg)
+        except RuntimeError:
+            # Executor is shut down - don't leave a job that will never run
+            with self._lock:
+                self._entries.pop(key, None)
+            raise
+        return True
+
+    def _run(self, arg: Any) -> None:
+        """Run the job for arg's key, then its flagged re-runs while still needed."""
+        key = self._key(arg)
+        while True:
+            with self._lock:
+                entry = self._entries[key]
+                entry.running = True
+                entry.rerun = False
+                arg = entry.arg
+            try:
+                self._fn(arg)
+            except BaseException:
+                with self._lock:
+                    del self._entries[key]
+                raise
+            if not self._take_rerun(key):
+                return
+            logger.debug(f"Re-running coalesced job for {key}")
+
+    def _take_rerun(self, key: str) -> bool:
+        """Decide whether a finished job runs again, releasing its key if not."""
+        while True:
+            with self._lock:
+                entry = self._entries[key]
+                if not entry.rerun:
+                    del self._entries[key]
+                    return False
+                # Submissions arriving during the check below set the flag again
+                entry.rerun = False
+                arg = entry.arg
+            if self._rerun_needed(arg):
+                return True
+
+    def _rerun_needed(self, arg: Any) -> bool:
+        """Check whether a flagged re-run should go ahead."""
+        if self._still_needed is None:
+            return True
+        try:
+            return self._still_needed(arg)
+        except Exception as e:
+            logger.warning(f"Re-run check failed for {self._key(arg)}, re-running: {e}")
+            return True
+
+    def stats(self) -> CoalescingStats:
+        """Current queue depth and coalescing counts."""
+        with self._lock:
+            running = sum(1 for entry in self._entries.values() if entry.running)
+            return CoalescingStats(
+                queued=len(self._entries) - running,
+                running=running,
+                rerun_pending=sum(1 for entry in self._entries.values() if entry.rerun),
+                coalesced=self._coalesced,
+            )
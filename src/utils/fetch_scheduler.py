@@ -0,0 +1,84 @@
+"""Coalescing of concurrent git fetches of the same ref into one clone.
+
+Every worktree of a repository shares the main clone's object store and
+remote-tracking refs, so one `git fetch origin main` serves all of them.
+FetchScheduler runs at most one fetch per key at a time: callers arriving
+while a fetch is in flight wait for it instead of starting their own, and a
+fetch that completed less than the TTL ago is treated as fresh.
+"""
+
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future
+
+# Seconds a completed fetch is reused before fetching again
+DEFAULT_FETCH_TTL = 30.0
+
+
+class FetchScheduler:
+    """Single-flight fetches per key, with a freshness window."""
+
+    def __init__(
+        self,
+        ttl: float = DEFAULT_FETCH_TTL,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the scheduler.
+
+        Args:
+            ttl: Seconds a completed fetch counts as fresh (0 only coalesces
+                concurrent fetches)
+            clock: Monotonic clock, injectable for tests
+        """
+        self.ttl = ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        # key -> clock() when the last successful fetch started
+        self._fetched_at: dict[str, float] = {}
+        # key -> future of the fetch currently running
+        self._in_flight: dict[str, Future[None]] = {}
+
+    def fetch(self, key: str, run: Callable[[], object]) -> bool:
+        """Fetch unless a fetch for key is running or recent.
+
+        Args:
+            key: Identifies the clone and ref (e.g. "/path/to/clone:main")
+            run: Performs the fetch; raising marks it failed
+
+        Returns:
+            True if this call ran the fetch, False if it reused another one
+
+        Raises:
+            Exception: Whatever run (or the in-flight fetch joined) raised
+        """
+        with self._lock:
+            fetched_at = self._fetched_at.get(key)
+            if fetched_at is not None and self._clock() - fetched_at < self.ttl:
+                return False
+            future = self._in_flight.get(key)
+            if future is None:
+                future = Future()
+                self._in_flight[key] = future
+                started_at = self._clock()
+                owner = True
+            else:
+                owner = False
+
+        if not owner:
+            future.result()
+            return False
+
+        try:
+            run()
+        except BaseException as e:
+            with self._lock:
+                self._in_flight.pop(key, None)
+            future.set_exception(e)
+            raise
+
+        with self._lock:
+            self._fetched_at[key] = started_at
+            self._in_flight.pop(key, None)
+        future.set_result(None)
+        return True
@@ -0,0 +1,103 @@
+"""Thread pool that runs tasks concurrently across keys but in order per key.
+
+Used by the daemon poll loop for side effects (label, status and archive
+writes): independent issues are written concurrently, while writes for the
+same issue are applied in the order they were submitted.
+"""
+
+import threading
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any
+
+from src.logger import get_logger
+
+logger = get_logger(__name__)
+
+_Task = tuple["Future[Any]", Callable[..., Any], tuple[Any, ...], dict[str, Any]]
+
+
+class KeyedExecutor:
+    """Bounded worker pool with per-key FIFO ordering.
+
+    Tasks submitted under the same key never run concurrently and run in
+    submission order. Tasks under different keys run in parallel, up to
+    max_workers at a time.
+    """
+
+    def __init__(self, max_workers: int, thread_name_prefix: str = "") -> None:
+        """Initialize the executor.
+
+        Args:
+            max_workers: Maximum number of tasks running at once
+            thread_name_prefix: Prefix for worker thread names
+        """
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix=thread_name_prefix
+        )
+        self._lock = threading.Lock()
+        self._queues: dict[str, deque[_Task]] = {}
+
+    def submit(self, key: str, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> "Future[Any]":
+        """Schedule fn(*args, **kwargs) after all earlier tasks for the same key.
+
+        Args:
+            key: Ordering key (e.g. "hostname/owner/repo#123")
+            fn: Callable to run
+            *args: Positional arguments for fn
+            **kwargs: Keyword arguments for fn
+
+        Returns:
+            Future for the task's result
+        """
+        future: Future[Any] = Future()
+        task: _Task = (future, fn, args, kwargs)
+        with self._lock:
+            queue = self._queues.get(key)
+            if queue is not None:
+                # A worker is already draining this key and will pick the task up
+                queue.append(task)
+                return future
+            self._queues[key] = deque([task])
+        try:
+            self._executor.submit(self._drain, key)
+        except RuntimeError:
+            # Executor is shut down - don't leave an undrained queue behind
+            with self._lock:
+                self._queues.pop(key, None)
+            raise
+        return future
+
+    def _drain(self, key: str) -> None:
+        """Run queued tasks for a key until its queue is empty."""
+        while True:
+            with self._lock:
+                queue = self._queues[key]
+                if not queue:
+                    del self._queues[key]
+                    return
+                future, fn, args, kwargs = queue.popleft()
+
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                result = fn(*args, **kwargs)
+            except BaseException as e:
+                future.set_exception(e)
+            else:
+                future.set_result(result)
+
+    def pending_keys(self) -> int:
+        """Number of keys with queued or running tasks."""
+        with self._lock:
+            return len(self._queues)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Shut down the worker pool.
+
+        Args:
+            wait: Whether to wait for queued tasks to finish
+        """
+        self._executor.shutdown(wait=wait)
+        logger.debug("Keyed executor shut down")
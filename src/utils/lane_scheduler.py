@@ -0,0 +1,337 @@
+"""Prioritized work lanes for the daemon's workflow threads.
+
+Workflows and comment edits used to share one pool capped at
+max_concurrent_workflows, so a few long Implement runs could keep a
+seconds-long comment edit waiting for an hour. The scheduler splits the work
+into lanes (Prepare, Research/Plan, Implement, comment edits), each with its
+own concurrency cap. Work waits in its lane's queue, not on a thread, until
+the lane has a free slot; only then is it handed to the shared thread pool.
+
+When a slot frees up, the lane picks the queued task whose repository has
+the fewest tasks running in the lane, then the task with the best priority
+(lowest value), then the oldest submission. A repository with a backlog
+therefore can't take every slot while another repository is waiting.
+
+A running task can give its slot back while it waits on something external
+(released(), used for CI waits) and reacquires one ahead of queued tasks. It
+keeps its thread meanwhile, so only as many tasks as the pool has spare
+threads beyond the caps are suspended at once; past that, a task keeps its
+slot while it waits, so every task holding a slot has a thread to run on.
+switched() runs a block in another lane, e.g. worktree preparation inside a
+workflow run.
+"""
+
+import itertools
+import threading
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any
+
+from src.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class LaneStats:
+    """Activity of one lane since the last stats(reset=True).
+
+    Attributes:
+        cap: Maximum tasks running at once
+        running: Tasks holding a slot now
+        queued: Tasks waiting for a slot now
+        suspended: Running tasks that gave their slot back (e.g. waiting on CI)
+        utilization: Fraction of the lane's slots in use over the window
+        started: Tasks started in the window
+        mean_wait: Mean seconds a task started in the window spent queued
+        max_wait: Longest seconds a task started in the window spent queued
+    """
+
+    cap: int
+    running: int
+    queued: int
+    suspended: int
+    utilization: float
+    started: int
+    mean_wait: float
+    max_wait: float
+
+
+@dataclass
+class _Task:
+    """Queued unit of work."""
+
+    lane: str
+    repo: str
+    priority: tuple[Any, ...]
+    seq: int
+    fn: Callable[[Any], Any]
+    arg: Any
+    future: "Future[Any]"
+    submitted_at: float
+
+
+@dataclass
+class _Lane:
+    """Slots, queue and accounting of one lane (guarded by the scheduler lock)."""
+
+    cap: int
+    pending: list[_Task] = field(default_factory=list)
+    running: int = 0
+    resuming: int = 0
+    suspended: int = 0
+    by_repo: dict[str, int] = field(default_factory=dict)
+    busy: float = 0.0
+    changed_at: float = field(default_factory=time.monotonic)
+    started: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+
+    def account(self, now: float) -> None:
+        """Add slot time used since the last change in running tasks."""
+        self.busy += self.running * (now - self.changed_at)
+        self.changed_at = now
+
+
+class LaneScheduler:
+    """Per-lane capped, prioritized and repo-fair task dispatch onto a thread pool."""
+
+    def __init__(
+        self,
+        lanes: dict[str, int],
+        max_workers: int,
+        thread_name_prefix: str = "",
+        on_wait: Callable[[str, float], None] | None = None,
+    ) -> None:
+        """Initialize the scheduler.
+
+        Args:
+            lanes: Lane name -> maximum tasks running at once (at least 1)
+            max_workers: Threads in the shared pool; more than the sum of the
+                caps leaves room for tasks that gave their slot back
+            thread_name_prefix: Prefix for worker thread names
+            on_wait: Called with (lane, seconds queued) whenever a task starts
+        """
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix=thread_name_prefix
+        )
+        self._cond = threading.Condition()
+        self._lanes = {name: _Lane(max(1, cap)) for name, cap in lanes.items()}
+        self._spare_workers = max_workers - sum(lane.cap for lane in self._lanes.values())
+        self._detached = 0  # Threads in released() without their slot, up to _spare_workers
+        self._local = threading.local()
+        self._seq = itertools.count()
+        self._window_start = time.monotonic()
+        self._on_wait = on_wait
+        self._closed = False
+
+    def submit(
+        self,
+        lane: str,
+        fn: Callable[[Any], Any],
+        arg: Any,
+        repo: str = "",
+        priority: tuple[Any, ...] = (),
+    ) -> "Future[Any]":
+        """Queue fn(arg) in a lane.
+
+        Args:
+            lane: Lane name
+            fn: Callable to run
+            arg: Argument for fn
+            repo: Repository the work belongs to (for per-repo fairness)
+            priority: Sort key within the lane; lower runs first
+
+        Returns:
+            Future for fn's result
+
+        Raises:
+            RuntimeError: If the scheduler is shut down
+        """
+        future: Future[Any] = Future()
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("cannot schedule new work after shutdown")
+            task = _Task(lane, repo, priority, next(self._seq), fn, arg, future, time.monotonic())
+            self._lanes[lane].pending.append(task)
+            self._dispatch(lane)
+        return future
+
+    def _dispatch(self, name: str) -> None:
+        """Start queued tasks while the lane has free slots (lock held)."""
+        lane = self._lanes[name]
+        # Slots awaited by resuming tasks are not handed to queued ones
+        while lane.pending and lane.running + lane.resuming < lane.cap:
+            task = min(lane.pending, key=lambda t: (lane.by_repo.get(t.repo, 0), t.priority, t.seq))
+            lane.pending.remove(task)
+            self._take(name, task.repo)
+
+            wait = time.monotonic() - task.submitted_at
+            lane.started += 1
+            lane.total_wait += wait
+            lane.max_wait = max(lane.max_wait, wait)
+            if self._on_wait is not None:
+                self._on_wait(name, wait)
+            self._executor.submit(self._run, task)
+
+    def _take(self, name: str, repo: str) -> None:
+        """Occupy a slot of the lane (lock held)."""
+        lane = self._lanes[name]
+        lane.account(time.monotonic())
+        lane.running += 1
+        lane.by_repo[repo] = lane.by_repo.get(repo, 0) + 1
+
+    def _give(self, name: str, repo: str) -> None:
+        """Free a slot of the lane and hand it on (lock held)."""
+        lane = self._lanes[name]
+        lane.account(time.monotonic())
+        lane.running -= 1
+        lane.by_repo[repo] -= 1
+        if not lane.by_repo[repo]:
+            del lane.by_repo[repo]
+        self._cond.notify_all()
+        self._dispatch(name)
+
+    def _acquire(self, name: str, repo: str, resume: bool = False) -> None:
+        """Block until the calling thread holds a slot, ahead of queued tasks.
+
+        Args:
+            name: Lane name
+            repo: Repository the work belongs to
+            resume: Whether the thread is coming back from released()
+        """
+        lane = self._lanes[name]
+        with self._cond:
+            if resume:
+                lane.suspended -= 1
+            lane.resuming += 1
+            while lane.running >= lane.cap:
+                self._cond.wait()
+            lane.resuming -= 1
+            self._take(name, repo)
+            if resume:
+                self._detached -= 1
+
+    def _run(self, task: _Task) -> None:
+        """Run a dispatched task on a pool thread, then free its slot."""
+        self._local.slot = (task.lane, task.repo)
+        try:
+            if task.future.set_running_or_notify_cancel():
+                try:
+                    result = task.fn(task.arg)
+                except BaseException as e:
+                    task.future.set_exception(e)
+                else:
+                    task.future.set_result(result)
+        finally:
+            name, repo = self._local.slot
+            self._local.slot = None
+            with self._cond:
+                self._give(name, repo)
+
+    @contextmanager
+    def released(self) -> Iterator[None]:
+        """Give up the calling thread's slot for the duration of the block.
+
+        A no-op for threads that don't hold a slot (e.g. workflows run outside
+        the daemon's pool). The slot is kept when every spare thread is already
+        held by a suspended task: a freed slot would go to a task with no
+        thread to run on, and the suspended tasks could never get it back.
+        """
+        slot: tuple[str, str] | None = getattr(self._local, "slot", None)
+        if slot is None:
+            yield
+            return
+
+        name, repo = slot
+        with self._cond:
+            detach = self._detached < self._spare_workers
+            if detach:
+                self._detached += 1
+                self._lanes[name].suspended += 1
+                self._give(name, repo)
+        if not detach:
+            logger.info(
+                f"All {max(self._spare_workers, 0)} spare threads hold suspended tasks; "
+                f"{name} task keeps its slot while it waits"
+            )
+            try:
+                yield
+            finally:
+                # switched() clears the slot on exit
+                self._local.slot = slot
+            return
+
+        self._local.slot = None
+        try:
+            yield
+        finally:
+            self._acquire(name, repo, resume=True)
+            self._local.slot = slot
+
+    @contextmanager
+    def switched(self, lane: str) -> Iterator[None]:
+        """Run the block holding a slot in another lane instead of the current one.
+
+        Args:
+            lane: Lane to hold a slot of during the block
+        """
+        slot: tuple[str, str] | None = getattr(self._local, "slot", None)
+        repo = slot[1] if slot else ""
+        with self.released():
+            self._acquire(lane, repo)
+            self._local.slot = (lane, repo)
+            try:
+                yield
+            finally:
+                self._local.slot = None
+                with self._cond:
+                    self._give(lane, repo)
+
+    def stats(self, reset: bool = False) -> dict[str, LaneStats]:
+        """Per-lane activity since the last reset.
+
+        Args:
+            reset: Start a new window for utilization and wait times
+
+        Returns:
+            Dict mapping lane name to LaneStats
+        """
+        now = time.monotonic()
+        with self._cond:
+            window = max(now - self._window_start, 1e-9)
+            result: dict[str, LaneStats] = {}
+            for name, lane in self._lanes.items():
+                lane.account(now)
+                result[name] = LaneStats(
+                    cap=lane.cap,
+                    running=lane.running,
+                    queued=len(lane.pending),
+                    suspended=lane.suspended,
+                    utilization=min(1.0, lane.busy / (lane.cap * window)),
+                    started=lane.started,
+                    mean_wait=lane.total_wait / lane.started if lane.started else 0.0,
+                    max_wait=lane.max_wait,
+                )
+                if reset:
+                    lane.busy = 0.0
+                    lane.started = 0
+                    lane.total_wait = 0.0
+                    lane.max_wait = 0.0
+            if reset:
+                self._window_start = now
+        return result
+
+    def shutdown(self) -> None:
+        """Stop accepting work and wait for queued and running tasks to finish."""
+        with self._cond:
+            self._closed = True
+            while any(
+                lane.pending or lane.running or lane.resuming or lane.suspended
+                for lane in self._lanes.values()
+            ):
+                self._cond.wait()
+        self._executor.shutdown(wait=True)
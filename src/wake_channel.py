@@ -0,0 +1,230 @@
+"""Local wake channel for the daemon poll loop.
+
+The daemon polls every board on a fixed interval, so a status change waits up
+to poll_interval seconds before anything happens. GitHub webhooks can't reach
+the daemon directly, but a relay running next to it can: WakeChannel is a
+small HTTP server on localhost that accepts "item changed" hints and wakes
+the poll loop, which then refreshes just the named issues.
+
+    POST /wake  {"items": ["github.com/org/repo#42", ...]}   refresh these issues
+    POST /wake  {"full": true}                                run a full poll now
+
+Hints are only hints: the periodic full poll still runs and stays the source
+of truth, so a lost or bogus hint costs at most one interval of latency or
+one extra lookup. send_wake() is the client side, usable from a relay script
+or a test standing in for one.
+"""
+
+import json
+import re
+import threading
+import urllib.request
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from src.logger import get_logger
+
+logger = get_logger(__name__)
+
+WAKE_PATH = "/wake"
+
+# Largest request body accepted (a few thousand item keys)
+MAX_BODY_BYTES = 64 * 1024
+
+# "hostname/owner/repo#number"
+_ITEM_KEY = re.compile(r"^([^/#\s]+/[^/#\s]+/[^/#\s]+)#(\d+)$")
+
+
+@dataclass
+class WakeHints:
+    """Hints received since the poll loop last looked.
+
+    Attributes:
+        items: (repo, issue number) pairs reported as changed
+        full: Whether a full poll was requested
+    """
+
+    items: set[tuple[str, int]] = field(default_factory=set)
+    full: bool = False
+
+
+class WakeChannel:
+    """Localhost HTTP endpoint that collects wake hints for the poll loop."""
+
+    def __init__(self, port: int, host: str = "127.0.0.1") -> None:
+        """Initialize the channel (call start() to listen).
+
+        Args:
+            port: Port to listen on (0 picks a free port, see url)
+            host: Interface to bind; keep the default so only local
+                processes can reach the channel
+        """
+        self.host = host
+        self.port = port
+        self._lock = threading.Lock()
+        self._hints = WakeHints()
+        self._event = threading.Event()
+        self._server: ThreadingHTTPServer | None = None
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        """URL hints are posted to."""
+        return f"http://{self.host}:{self.port}{WAKE_PATH}"
+
+    def start(self) -> None:
+        """Start listening on a background thread.
+
+        If the port cannot be bound the error is logged and the channel stays
+        closed; wait() then just times out like a plain sleep.
+        """
+        channel = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self) -> None:  # noqa: N802 - http.server naming
+                status: int
+                body: dict[str, object]
+                length = int(self.headers.get("Content-Length") or 0)
+                if length > MAX_BODY_BYTES:
+                    status, body = 413, {"error": "request body too large"}
+                else:
+                    status, body = channel._handle(self.path, self.rfile.read(length))
+                payload = json.dumps(body).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+                logger.debug(f"Wake channel: {format % args}")
+
+        try:
+            self._server = ThreadingHTTPServer((self.host, self.port), Handler)
+        except OSError as e:
+            # A busy port only costs wakeups; the periodic poll keeps working
+            logger.error(f"Wake channel disabled, cannot listen on {self.host}:{self.port}: {e}")
+            return
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="wake-channel", daemon=True
+        )
+        self._thread.start()
+        logger.info(f"Wake channel listening on {self.url}")
+
+    def stop(self) -> None:
+        """Stop listening and release anyone waiting."""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+        self.interrupt()
+
+    def notify(self, items: set[tuple[str, int]] | None = None, full: bool = False) -> None:
+        """Record hints and wake the poll loop.
+
+        Args:
+            items: (repo, issue number) pairs that changed
+            full: Request a full poll
+        """
+        with self._lock:
+            self._hints.items.update(items or ())
+            self._hints.full = self._hints.full or full
+        self._event.set()
+
+    def interrupt(self) -> None:
+        """Wake the poll loop without a hint (e.g. for shutdown)."""
+        self._event.set()
+
+    def wait(self, timeout: float) -> bool:
+        """Wait for hints or an interrupt.
+
+        Args:
+            timeout: Seconds to wait at most
+
+        Returns:
+            True if woken before the timeout
+        """
+        return self._event.wait(timeout)
+
+    def drain(self) -> WakeHints:
+        """Take the hints received so far.
+
+        Returns:
+            WakeHints collected since the last drain (empty after an interrupt)
+        """
+        with self._lock:
+            self._event.clear()
+            hints, self._hints = self._hints, WakeHints()
+        return hints
+
+    def _handle(self, path: str, raw: bytes) -> tuple[int, dict[str, object]]:
+        """Parse one wake request and record its hints.
+
+        Args:
+            path: Request path
+            raw: Request body
+
+        Returns:
+            Tuple of (HTTP status, JSON response body)
+        """
+        if path.rstrip("/") != WAKE_PATH:
+            return 404, {"error": f"unknown path {path}"}
+
+        try:
+            request = json.loads(raw or b"{}")
+            if not isinstance(request, dict):
+                raise ValueError("body must be a JSON object")
+            items = {parse_item_key(key) for key in request.get("items") or []}
+        except (ValueError, TypeError) as e:
+            return 400, {"error": str(e)}
+
+        full = bool(request.get("full"))
+        self.notify(items, full=full)
+        logger.debug(f"Wake hint: {len(items)} item(s){' and full poll' if full else ''}")
+        return 202, {"accepted": len(items), "full": full}
+
+
+def parse_item_key(key: object) -> tuple[str, int]:
+    """Parse a "hostname/owner/repo#number" item key.
+
+    Args:
+        key: Item key from a wake request
+
+    Returns:
+        Tuple of (repo, issue number)
+
+    Raises:
+        ValueError: If the key is malformed
+    """
+    match = _ITEM_KEY.match(key) if isinstance(key, str) else None
+    if match is None:
+        raise ValueError(f"invalid item {key!r}, expected 'hostname/owner/repo#number'")
+    return match.group(1), int(match.group(2))
+
+
+def send_wake(
+    url: str, items: list[str] | None = None, full: bool = False, timeout: float = 5.0
+) -> dict[str, object]:
+    """Post a wake hint to a WakeChannel.
+
+    Args:
+        url: The channel's URL (WakeChannel.url)
+        items: Item keys in "hostname/owner/repo#number" format
+        full: Request a full poll
+        timeout: Seconds to wait for the response
+
+    Returns:
+        The channel's JSON response
+    """
+    body = json.dumps({"items": items or [], "full": full}).encode("utf-8")
+    request = urllib.request.Request(
+        url, data=body, headers={"Content-Type": "application/json"}, method="POST"
+    )
+    with urllib.request.urlopen(request, timeout=timeout) as response:  # noqa: S310 - local URL
+        result: dict[str, object] = json.loads(response.read())
+    return result
@@ -1,7 +1,10 @@
 """Base classes and protocols for workflow definitions."""
 
 from dataclasses import dataclass
-from typing import Protocol
+from typing import TYPE_CHECKING, Protocol
+
+if TYPE_CHECKING:
+    from src.ci_watcher import CIWatcher
 
 
 @dataclass
@@ -21,6 +24,7 @@ class WorkflowContext:
         username_self: Allowed GitHub username (optional, for reviewer assignment)
         parent_issue_number: Parent issue number if this is a child issue (optional)
         parent_branch: Branch name of parent's open PR to branch from (optional)
+        ci_watcher: Shared CI watcher serving CI waits (optional, for ImplementWorkflow)
     """
 
     repo: str
@@ -34,6 +38,7 @@ class WorkflowContext:
     username_self: str | None = None
     parent_issue_number: int | None = None
     parent_branch: str | None = None
+    ci_watcher: "CIWatcher | None" = None
 
 
 class Workflow(Protocol):
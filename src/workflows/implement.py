@@ -6,6 +6,8 @@ import re
 import subprocess
 import time
 from collections.abc import Callable
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FuturesTimeoutError
 from typing import TYPE_CHECKING, Any, TypeVar
 
 from tenacity import wait_exponential
@@ -25,6 +27,7 @@ from src.utils.gh import get_gh_env
 from src.workflows.base import WorkflowContext
 
 if TYPE_CHECKING:
+    from src.ci_watcher import CIWatcher
     from src.config import Config
 
 logger = get_logger(__name__)
@@ -900,6 +903,7 @@ class ImplementWorkflow:
         pr_number: int,
         sha: str,
         timeout: int = 600,
+        ci_watcher: "CIWatcher | None" = None,
     ) -> list[CheckRunResult]:
         """Wait for all CI checks to complete on a commit.
 
@@ -912,11 +916,16 @@ class ImplementWorkflow:
             pr_number: PR number for commenting
             sha: Commit SHA to query check runs for
             timeout: Maximum time in seconds to wait for checks (default 600s)
+            ci_watcher: Optional shared CI watcher. When set, the wait is served
+                by the watcher and the workflow gives up its workflow slot meanwhile.
 
         Returns:
             List of failed CheckRunResult objects. Empty list if all checks passed.
             If timeout is reached, returns whatever failed checks were found.
         """
+        if ci_watcher is not None:
+            return self._wait_for_ci_watched(ci_watcher, repo, pr_number, sha, timeout)
+
         client = GitHubTicketClient()
         start_time = time.time()
         poll_interval = 2.0  # Start with 2s interval
@@ -1020,6 +1029,106 @@ class ImplementWorkflow:
             logger.error(f"Failed to get final check runs status: {e}")
             return []
 
+    def _wait_for_ci_watched(
+        self,
+        ci_watcher: "CIWatcher",
+        repo: str,
+        pr_number: int,
+        sha: str,
+        timeout: int,
+    ) -> list[CheckRunResult]:
+        """Wait for CI via the shared watcher, without holding a workflow slot.
+
+        Same milestones and result as the polling wait in _wait_for_ci(), but
+        the commit is polled by the watcher together with every other pending
+        commit of the repo, and this workflow's slot is free for other work
+        until the checks complete. Like the polling wait, it gives up right
+        away (returning no failures) when the watcher reports a persistent
+        network error, and looks the checks up once more on timeout.
+
+        Args:
+            ci_watcher: Shared CI watcher
+            repo: Repository in 'hostname/owner/repo' format
+            pr_number: PR number for commenting
+            sha: Commit SHA to wait on
+            timeout: Maximum time in seconds to wait for checks
+
+        Returns:
+            List of failed CheckRunResult objects. Empty list if all checks passed.
+        """
+        logger.info(
+            f"Waiting for CI checks on {repo}#{pr_number} (SHA: {sha[:8]}, timeout: {timeout}s) "
+            "via CI watcher"
+        )
+        start_time = time.time()
+        future = ci_watcher.watch(repo, sha)
+        milestones = [
+            (180, "⏳ Still waiting for CI checks to complete (3 minutes elapsed)..."),
+            (300, "⏳ Still waiting for CI checks to complete (5 minutes elapsed)..."),
+        ]
+
+        check_runs: list[CheckRunResult] | None = None
+        try:
+            with ci_watcher.suspended():
+                for elapsed, message in milestones:
+                    if elapsed >= timeout:
+                        break
+                    check_runs = self._ci_result_by(future, start_time + elapsed)
+                    if check_runs is not None:
+                        break
+                    self._add_pr_comment(repo, pr_number, message)
+                if check_runs is None:
+                    check_runs = self._ci_result_by(future, start_time + timeout)
+        except NetworkError as e:
+            logger.error(f"Failed to get check runs after retries: {e}")
+            # On persistent network error, return empty list to allow proceeding
+            return []
+
+        if check_runs is None:
+            self._add_pr_comment(
+                repo,
+                pr_number,
+                f"⏰ CI validation timeout reached ({timeout}s). Proceeding with available results.",
+            )
+            latest = ci_watcher.cancel(repo, sha, future)
+            # Timeout reached - return whatever failed checks we found
+            try:
+                latest = ci_watcher.ticket_client.get_check_runs(repo, sha)
+            except Exception as e:
+                logger.error(f"Failed to get final check runs status: {e}")
+            failed = [run for run in latest if run.is_failed]
+            logger.warning(
+                f"CI validation timed out after {timeout}s. Found {len(failed)} failed checks."
+            )
+            return failed
+
+        failed = [run for run in check_runs if run.is_failed]
+        if failed:
+            logger.info(
+                f"All CI checks completed. {len(failed)} failed: "
+                f"{', '.join(r.name for r in failed)}"
+            )
+        else:
+            logger.info("All CI checks completed successfully")
+        return failed
+
+    @staticmethod
+    def _ci_result_by(
+        future: "Future[list[CheckRunResult]]", deadline: float
+    ) -> list[CheckRunResult] | None:
+        """Wait for a CI watcher future until a deadline.
+
+        Returns:
+            The commit's check runs, or None if they did not complete in time
+
+        Raises:
+            NetworkError: If the watcher gave up on the commit's repository
+        """
+        try:
+            return future.result(timeout=max(deadline - time.time(), 0))
+        except FuturesTimeoutError:
+            return None
+
     def _format_failed_checks(self, failed_checks: list[CheckRunResult]) -> str:
         """Format failed check runs into a human-readable summary for the fix prompt.
 
@@ -1116,6 +1225,7 @@ class ImplementWorkflow:
                 pr_number,
                 sha,
                 timeout=validation_config.timeout,
+                ci_watcher=ctx.ci_watcher,
             )
 
             # If all checks passed, we're done
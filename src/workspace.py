@@ -3,15 +3,150 @@ Workspace management module for agentic-metallurgy.
 
 Provides WorkspaceManager class for creating and managing git worktrees
 for individual issues.
+
+Creating an issue's worktree means a full checkout of the repository. To keep
+that off the path of an issue's first workflow, WorkspaceManager keeps a small
+pool of detached worktrees per repository, checked out from the default branch
+and sharing the main clone's object store. Claiming one moves it into place
+and points a new branch at the freshly fetched base (an issue branch that
+already exists locally is checked out as is, never reset); the pool is
+refilled on a background thread.
+
+Clones kiln makes itself authenticate HTTPS remotes through the gh CLI
+(`gh auth git-credential`), the same credentials kiln's gh calls use, so
+fetches and pushes in the clone and its worktrees work with private
+repositories and GitHub Enterprise hosts.
+
+Fetches go through a FetchScheduler keyed by clone and branch, so concurrent
+workflows of one repository share a single `git fetch` and a fetch within the
+last fetch_ttl seconds is reused.
+
+Large repositories can be given a CloneStrategy: a partial (blob-less) and/or
+shallow clone, and cone-mode sparse checkout applied to the clone and to every
+worktree created from it.
+
+For the speculative merge queue, build_merge_train stacks merges of several
+pull requests on a base branch in the main clone with `git merge-tree` and
+`git commit-tree`, without checking anything out, and push_branches publishes
+the resulting commits so CI runs on them.
 """
 
+import re
 import subprocess
+import threading
+import uuid
+from dataclasses import dataclass, field
 from pathlib import Path
+from urllib.parse import urlparse
 
 from src.logger import get_logger
+from src.utils.fetch_scheduler import DEFAULT_FETCH_TTL, FetchScheduler
 
 logger = get_logger(__name__)
 
+# Branch worktrees are created from unless the issue names another base
+DEFAULT_BRANCH = "main"
+
+# Directory under workspace_dir holding pre-created worktrees, one subdirectory per repo
+POOL_DIR_NAME = ".worktree-pool"
+
+# Pre-created worktrees kept per repository
+DEFAULT_POOL_SIZE = 2
+
+# Longest title slug used in generated branch names
+BRANCH_SLUG_MAX_LENGTH = 50
+
+# Local namespace pull request heads are fetched into
+PULL_REFS_NAMESPACE = "refs/kiln/pull"
+
+# Identity of speculative merge commits (they are never merged themselves)
+MERGE_TRAIN_IDENTITY = ["-c", "user.name=kiln", "-c", "user.email=kiln@localhost"]
+
+# Credential helper answering git's HTTPS credential requests with gh's token
+GH_CREDENTIAL_HELPER = "!gh auth git-credential"
+
+
+def gh_credential_config(repo_url: str) -> list[str]:
+    """Build `git clone` arguments making the clone authenticate through gh.
+
+    The helper is scoped to the URL's host and replaces any other helper for
+    it, like gh's own authenticated git commands do.
+
+    Args:
+        repo_url: Git repository URL
+
+    Returns:
+        `-c` arguments for git clone (empty for non-HTTPS URLs)
+    """
+    parsed = urlparse(repo_url)
+    if parsed.scheme != "https" or not parsed.hostname:
+        return []
+    key = f"credential.https://{parsed.hostname}.helper"
+    return ["-c", f"{key}=", "-c", f"{key}={GH_CREDENTIAL_HELPER}"]
+
+
+@dataclass
+class CloneStrategy:
+    """
+    How a repository is cloned and checked out.
+
+    Attributes:
+        partial: Clone with --filter=blob:none (file contents are fetched on demand)
+        sparse_paths: Directories checked out in cone mode (empty checks out everything)
+        shallow_since: Only clone history after this date (git --shallow-since)
+    """
+
+    partial: bool = False
+    sparse_paths: list[str] = field(default_factory=list)
+    shallow_since: str | None = None
+
+    def clone_args(self) -> list[str]:
+        """Extra `git clone` arguments for this strategy."""
+        args = []
+        if self.partial:
+            args.append("--filter=blob:none")
+        if self.shallow_since:
+            args.append(f"--shallow-since={self.shallow_since}")
+        if self.sparse_paths:
+            args.append("--sparse")
+        return args
+
+
+def issue_branch_name(issue_number: int, title: str) -> str:
+    """Build a deterministic branch name for an issue.
+
+    Args:
+        issue_number: Issue number
+        title: Issue title
+
+    Returns:
+        Branch name like '42-add-dark-mode-toggle', or just the issue number
+        if the title has no usable characters
+    """
+    slug = re.sub(r"[^a-z0-9]+", "-", title.lower()).strip("-")
+    if len(slug) > BRANCH_SLUG_MAX_LENGTH:
+        slug = slug[:BRANCH_SLUG_MAX_LENGTH].rsplit("-", 1)[0]
+    return f"{issue_number}-{slug}" if slug else str(issue_number)
+
+
+@dataclass
+class MergeTrainBuild:
+    """Merge commits of several pull requests stacked on a base branch.
+
+    Attributes:
+        base_sha: Base branch commit the train starts from
+        pr_numbers: PRs that merged cleanly, in order
+        head_shas: HEAD commit of each of those PRs as fetched
+        commits: commits[i] is the base with pr_numbers[: i + 1] merged
+        conflict: First PR that did not merge cleanly (not in pr_numbers), or None
+    """
+
+    base_sha: str
+    pr_numbers: list[int] = field(default_factory=list)
+    head_shas: list[str] = field(default_factory=list)
+    commits: list[str] = field(default_factory=list)
+    conflict: int | None = None
+
 
 class WorkspaceError(Exception):
     """Base exception for workspace management errors."""
@@ -27,14 +162,34 @@ class WorkspaceManager:
     allowing concurrent work on multiple issues from the same repository.
     """
 
-    def __init__(self, workspace_dir: str):
+    def __init__(
+        self,
+        workspace_dir: str,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        fetch_ttl: float = DEFAULT_FETCH_TTL,
+        clone_strategies: dict[str, CloneStrategy] | None = None,
+    ):
         """
         Initialize the workspace manager.
 
         Args:
             workspace_dir: Base directory for all worktrees and repository clones
+            pool_size: Pre-created worktrees to keep per repository (0 disables the pool)
+            fetch_ttl: Seconds a fetch of a repository's branch is reused by
+                other worktrees (0 only shares fetches already in flight)
+            clone_strategies: Clone strategy per repository ('hostname/owner/repo');
+                repositories not listed get a full clone
         """
         self.workspace_dir = Path(workspace_dir).resolve()
+        self.pool_size = pool_size
+        self._fetch_scheduler = FetchScheduler(ttl=fetch_ttl)
+        self.clone_strategies = clone_strategies or {}
+
+        # Serializes clone and worktree add/move operations per repository
+        self._repo_locks: dict[str, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+        # Repositories with a pool refill in progress
+        self._refilling: set[str] = set()
 
         # Create directories if they don't exist
         self.workspace_dir.mkdir(parents=True, exist_ok=True)
@@ -217,12 +372,298 @@ class WorkspaceManager:
                 raise WorkspaceError(f"Directory exists but is not a git repository: {repo_path}")
             return repo_path
 
-        logger.info(f"Cloning repository '{repo_url}' to {repo_path}")
-        self._run_git_command(["clone", repo_url, str(repo_path)])
+        strategy = self.clone_strategies.get(repo)
+        clone_args = strategy.clone_args() if strategy else []
+        logger.info(
+            f"Cloning repository '{repo_url}' to {repo_path}"
+            + (f" ({' '.join(clone_args)})" if clone_args else "")
+        )
+        self._run_git_command(
+            ["clone", *gh_credential_config(repo_url), *clone_args, repo_url, str(repo_path)]
+        )
+        if strategy and strategy.sparse_paths:
+            self._run_git_command(
+                ["sparse-checkout", "set", "--cone", *strategy.sparse_paths], cwd=repo_path
+            )
         logger.info(f"Successfully cloned repository to {repo_path}")
 
         return repo_path
 
+    def _add_worktree(
+        self,
+        repo: str,
+        repo_path: Path,
+        worktree_path: Path,
+        start_point: str,
+        branch_name: str | None = None,
+    ) -> None:
+        """
+        Create a worktree, checking out only the repository's sparse paths if configured.
+
+        Args:
+            repo: Repository in 'hostname/owner/repo' or 'owner/repo' format
+            repo_path: Path to the main repository
+            worktree_path: Where to create the worktree
+            start_point: Commit-ish to check out
+            branch_name: Branch to check out, created at start_point unless it
+                exists (detached HEAD if None)
+
+        Raises:
+            WorkspaceError: If a git command fails
+        """
+        strategy = self.clone_strategies.get(repo)
+        sparse_paths = strategy.sparse_paths if strategy else []
+
+        args = ["worktree", "add"]
+        if branch_name is None:
+            args.append("--detach")
+        elif self._branch_exists(repo_path, branch_name):
+            logger.info(f"Reusing existing branch '{branch_name}' for {worktree_path}")
+            start_point = branch_name
+        else:
+            args += ["-b", branch_name]
+        if sparse_paths:
+            # Check out after the worktree's sparse patterns are in place
+            args.append("--no-checkout")
+        self._run_git_command([*args, str(worktree_path), start_point], cwd=repo_path)
+
+        if sparse_paths:
+            self._run_git_command(
+                ["sparse-checkout", "set", "--cone", *sparse_paths], cwd=worktree_path
+            )
+            self._run_git_command(["reset", "--hard", "--quiet"], cwd=worktree_path)
+
+    def _branch_exists(self, repo_path: Path, branch: str) -> bool:
+        """Check whether a local branch exists in a clone."""
+        result = self._run_git_command(
+            ["rev-parse", "--verify", "--quiet", f"refs/heads/{branch}"], cwd=repo_path, check=False
+        )
+        return result.returncode == 0
+
+    def _fetch_branch(self, repo_path: Path, branch: str) -> None:
+        """
+        Fetch a branch from origin into a clone, sharing concurrent and recent fetches.
+
+        Args:
+            repo_path: Main clone (or standalone worktree) to fetch into
+            branch: Remote branch name
+
+        Raises:
+            WorkspaceError: If the fetch fails
+        """
+        fetched = self._fetch_scheduler.fetch(
+            f"{repo_path}:{branch}",
+            lambda: self._run_git_command(["fetch", "origin", branch], cwd=repo_path),
+        )
+        if not fetched:
+            logger.debug(f"Reusing recent fetch of origin/{branch} in {repo_path}")
+
+    def _get_main_repo_path(self, worktree: Path) -> Path:
+        """
+        Get the main clone a worktree belongs to, from its .git file.
+
+        Args:
+            worktree: Path to the worktree
+
+        Returns:
+            The main clone's path, or the worktree itself if it isn't a linked
+            worktree of a clone inside workspace_dir
+        """
+        git_path = worktree / ".git"
+        try:
+            content = git_path.read_text().strip() if git_path.is_file() else ""
+        except OSError:
+            return worktree
+        if not content.startswith("gitdir:"):
+            return worktree
+
+        # gitdir is <repo>/.git/worktrees/<name>
+        gitdir = Path(content[len("gitdir:") :].strip())
+        repo_path = (worktree / gitdir).resolve().parent.parent.parent
+        if repo_path == worktree.resolve() or not repo_path.is_relative_to(self.workspace_dir):
+            return worktree
+        return repo_path
+
+    def _repo_lock(self, repo_id: str) -> threading.Lock:
+        """Get the lock serializing git operations on a repository's clone."""
+        with self._locks_guard:
+            return self._repo_locks.setdefault(repo_id, threading.Lock())
+
+    def _get_pool_dir(self, repo_id: str) -> Path:
+        """Get the directory holding a repository's pre-created worktrees."""
+        return self._validate_path_containment(
+            self.workspace_dir / POOL_DIR_NAME / repo_id, self.workspace_dir, "worktree pool path"
+        )
+
+    def _pooled_worktrees(self, pool_dir: Path) -> list[Path]:
+        """List the ready worktrees in a pool directory, oldest name first."""
+        if not pool_dir.is_dir():
+            return []
+        return sorted(path for path in pool_dir.iterdir() if self._is_valid_worktree(path))
+
+    def pool_count(self, repo: str) -> int:
+        """Number of pre-created worktrees ready for a repository.
+
+        Args:
+            repo: Repository in 'hostname/owner/repo' or 'owner/repo' format
+
+        Returns:
+            Number of pooled worktrees
+        """
+        repo_id = self._get_repo_identifier(repo)
+        self._validate_name_component(repo_id, "repository identifier")
+        return len(self._pooled_worktrees(self._get_pool_dir(repo_id)))
+
+    def refill_pool(self, repo_url: str, repo: str) -> int:
+        """
+        Top up a repository's worktree pool to pool_size.
+
+        Clones the repository if needed and creates detached worktrees on the
+        freshly fetched default branch.
+
+        Args:
+            repo_url: Git repository URL
+            repo: Repository in 'hostname/owner/repo' or 'owner/repo' format
+
+        Returns:
+            Number of worktrees created
+
+        Raises:
+            WorkspaceError: If cloning, fetching or creating a worktree fails
+        """
+        if self.pool_size <= 0:
+            return 0
+
+        repo_id = self._get_repo_identifier(repo)
+        self._validate_name_component(repo_id, "repository identifier")
+        pool_dir = self._get_pool_dir(repo_id)
+        lock = self._repo_lock(repo_id)
+
+        with lock:
+            repo_path = self._ensure_repo_cloned(repo_url, repo)
+            # Drop registrations of pooled worktrees whose directories were deleted
+            self._run_git_command(["worktree", "prune"], cwd=repo_path)
+        self._fetch_branch(repo_path, DEFAULT_BRANCH)
+        pool_dir.mkdir(parents=True, exist_ok=True)
+
+        created = 0
+        while True:
+            with lock:
+                if len(self._pooled_worktrees(pool_dir)) >= self.pool_size:
+                    break
+                path = pool_dir / f"{repo_id}-{uuid.uuid4().hex[:8]}"
+                self._add_worktree(repo, repo_path, path, f"origin/{DEFAULT_BRANCH}")
+            created += 1
+
+        if created:
+            logger.info(f"Added {created} worktree(s) to the pool for {repo}")
+        return created
+
+    def refill_pool_async(self, repo_url: str, repo: str) -> None:
+        """
+        Refill a repository's worktree pool on a background thread.
+
+        Does nothing if the pool is disabled or a refill for the repository
+        is already running. Failures are logged.
+
+        Args:
+            repo_url: Git repository URL
+            repo: Repository in 'hostname/owner/repo' or 'owner/repo' format
+        """
+        if self.pool_size <= 0:
+            return
+        with self._locks_guard:
+            if repo in self._refilling:
+                return
+            self._refilling.add(repo)
+
+        def refill() -> None:
+            try:
+                self.refill_pool(repo_url, repo)
+            except WorkspaceError as e:
+                logger.warning(f"Failed to refill worktree pool for {repo}: {e}")
+            finally:
+                with self._locks_guard:
+                    self._refilling.discard(repo)
+
+        threading.Thread(target=refill, name="worktree-pool", daemon=True).start()
+
+    def claim_worktree(
+        self,
+        repo_url: str,
+        repo: str,
+        issue_number: int,
+        branch_name: str,
+        base_branch: str | None = None,
+    ) -> str:
+        """
+        Create an issue's worktree, from the pool when one is ready.
+
+        Fetches the base branch, moves a pooled worktree to the issue's
+        workspace path and points a new branch at the fetched base. An issue
+        branch that already exists locally (e.g. from an earlier worktree of
+        the issue) is checked out instead, keeping its commits. With an empty
+        pool the worktree is created directly. The pool is refilled in the
+        background afterwards.
+
+        Args:
+            repo_url: Git repository URL
+            repo: Repository in 'hostname/owner/repo' or 'owner/repo' format
+            issue_number: Issue number
+            branch_name: Branch for the issue (reused if it exists locally)
+            base_branch: Remote branch to start from (default: DEFAULT_BRANCH)
+
+        Returns:
+            Absolute path to the issue's worktree
+
+        Raises:
+            WorkspaceError: If the workspace path is taken or a git command fails
+        """
+        base = f"origin/{base_branch or DEFAULT_BRANCH}"
+        worktree_path = Path(self.get_workspace_path(repo, issue_number))
+        if worktree_path.exists():
+            raise WorkspaceError(f"Workspace path already exists: {worktree_path}")
+
+        repo_id = self._get_repo_identifier(repo)
+        pool_dir = self._get_pool_dir(repo_id)
+        lock = self._repo_lock(repo_id)
+
+        with lock:
+            repo_path = self._ensure_repo_cloned(repo_url, repo)
+        self._fetch_branch(repo_path, base_branch or DEFAULT_BRANCH)
+
+        with lock:
+            pooled = self._pooled_worktrees(pool_dir)
+            if pooled:
+                self._run_git_command(
+                    ["worktree", "move", str(pooled[0]), str(worktree_path)], cwd=repo_path
+                )
+            else:
+                self._add_worktree(repo, repo_path, worktree_path, base, branch_name)
+
+        if pooled:
+            if self._branch_exists(repo_path, branch_name):
+                logger.info(f"Reusing existing branch '{branch_name}' for issue {issue_number}")
+                checkout = ["checkout", branch_name]
+            else:
+                checkout = ["checkout", "-b", branch_name, base]
+            try:
+                self._run_git_command(checkout, cwd=worktree_path)
+            except WorkspaceError:
+                # Don't leave a detached worktree where the issue's worktree belongs
+                self._run_git_command(
+                    ["worktree", "remove", "--force", str(worktree_path)],
+                    cwd=repo_path,
+                    check=False,
+                )
+                raise
+            logger.info(f"Claimed pooled worktree for {repo} issue {issue_number}")
+        else:
+            logger.info(f"Created worktree for {repo} issue {issue_number} (pool empty)")
+
+        self.refill_pool_async(repo_url, repo)
+        return str(worktree_path)
+
     def get_workspace_path(self, repo: str, issue_number: int) -> str:
         """
         Get the expected workspace path for a repository and issue.
@@ -242,6 +683,39 @@ class WorkspaceManager:
         )
         return str(worktree_path)
 
+    def _list_worktree_branches(self, repo_path: Path) -> dict[str, str | None]:
+        """
+        Map every worktree of a repository to its branch, with one git call.
+
+        Args:
+            repo_path: Path to the main repository
+
+        Returns:
+            Dict of worktree path to branch name (None for detached worktrees)
+
+        Raises:
+            WorkspaceError: If git worktree list fails
+        """
+        result = self._run_git_command(["worktree", "list", "--porcelain"], cwd=repo_path)
+        # Porcelain output is one block per worktree:
+        # worktree /path/to/worktree
+        # HEAD <sha>
+        # branch refs/heads/branch-name
+        # (blank line)
+        branches: dict[str, str | None] = {}
+        current: str | None = None
+        for line in result.stdout.split("\n"):
+            if line.startswith("worktree "):
+                current = line[9:]
+                branches[current] = None
+            elif line.startswith("branch ") and current is not None:
+                # branch refs/heads/branch-name -> branch-name
+                ref = line[7:]
+                branches[current] = ref[11:] if ref.startswith("refs/heads/") else ref
+            elif not line:
+                current = None
+        return branches
+
     def _get_worktree_branch(self, worktree_path: Path, repo_path: Path) -> str | None:
         """
         Get the branch name for a worktree using git worktree list --porcelain.
@@ -256,31 +730,7 @@ class WorkspaceManager:
             Branch name or None if not found
         """
         try:
-            result = self._run_git_command(
-                ["worktree", "list", "--porcelain"],
-                cwd=repo_path,
-                check=True,
-            )
-            # Parse porcelain output format:
-            # worktree /path/to/worktree
-            # HEAD <sha>
-            # branch refs/heads/branch-name
-            # (blank line)
-            worktree_str = str(worktree_path)
-            lines = result.stdout.split("\n")
-            for i, line in enumerate(lines):
-                # Exact path match ensures we get the right branch
-                if line.startswith("worktree ") and line[9:] == worktree_str:
-                    # Look for branch line in this block
-                    for j in range(i + 1, min(i + 5, len(lines))):
-                        if lines[j].startswith("branch "):
-                            # branch refs/heads/branch-name -> branch-name
-                            ref = lines[j][7:]
-                            if ref.startswith("refs/heads/"):
-                                return ref[11:]
-                            return ref
-                    break
-            return None
+            return self._list_worktree_branches(repo_path).get(str(worktree_path))
         except WorkspaceError:
             return None
 
@@ -337,6 +787,221 @@ class WorkspaceManager:
             logger.warning(f"Repository not found at {repo_path}, cannot clean worktree")
             raise WorkspaceError(f"Cannot cleanup worktree: repository not found at {repo_path}")
 
+    def cleanup_workspaces(self, repo: str, issue_numbers: list[int]) -> list[int]:
+        """
+        Remove several worktrees of one repository and their local branches.
+
+        Batched form of cleanup_workspace: the worktree list is read once and
+        the branches of all removed worktrees are deleted with one
+        `git branch -D`. A worktree that fails to be removed is logged and
+        skipped.
+
+        Args:
+            repo: Repository in 'hostname/owner/repo' or 'owner/repo' format
+            issue_numbers: Issue numbers whose worktrees to remove
+
+        Returns:
+            Issue numbers whose worktrees were removed
+
+        Raises:
+            WorkspaceError: If worktrees exist but the repository clone doesn't
+        """
+        repo_id = self._get_repo_identifier(repo)
+        self._validate_name_component(repo_id, "repository identifier")
+        repo_path = self._validate_path_containment(
+            self.workspace_dir / repo_id, self.workspace_dir, "repository path"
+        )
+
+        worktrees = {
+            issue_number: Path(self.get_workspace_path(repo, issue_number))
+            for issue_number in issue_numbers
+        }
+        worktrees = {n: path for n, path in worktrees.items() if path.exists()}
+        if not worktrees:
+            return []
+        if not repo_path.exists():
+            raise WorkspaceError(f"Cannot cleanup worktrees: repository not found at {repo_path}")
+
+        branches = self._list_worktree_branches(repo_path)
+        removed: list[int] = []
+        stale_branches: list[str] = []
+        for issue_number, worktree_path in worktrees.items():
+            try:
+                self._run_git_command(
+                    ["worktree", "remove", "--force", str(worktree_path)], cwd=repo_path
+                )
+            except WorkspaceError as e:
+                logger.warning(f"Failed to remove worktree {worktree_path}: {e}")
+                continue
+            removed.append(issue_number)
+            branch_name = branches.get(str(worktree_path))
+            if branch_name:
+                stale_branches.append(branch_name)
+
+        if stale_branches:
+            result = self._run_git_command(
+                ["branch", "-D", *stale_branches], cwd=repo_path, check=False
+            )
+            if result.returncode != 0:
+                # Non-fatal - some branches may already be deleted
+                logger.warning(f"Failed to delete some local branches: {result.stderr.strip()}")
+
+        logger.info(f"Cleaned up {len(removed)} worktree(s) for {repo}")
+        return removed
+
+    def maintain_repo(self, repo: str) -> None:
+        """
+        Prune stale worktree metadata and let git repack if it needs to.
+
+        Runs `git worktree prune` and `git gc --auto` in the repository's
+        clone. Does nothing if the repository isn't cloned.
+
+        Args:
+            repo: Repository in 'hostname/owner/repo' or 'owner/repo' format
+
+        Raises:
+            WorkspaceError: If a git command fails
+        """
+        repo_id = self._get_repo_identifier(repo)
+        self._validate_name_component(repo_id, "repository identifier")
+        repo_path = self._validate_path_containment(
+            self.workspace_dir / repo_id, self.workspace_dir, "repository path"
+        )
+        if not (repo_path / ".git").exists():
+            return
+
+        # Pooled worktrees are moved under this lock; prune must not see one mid-move
+        with self._repo_lock(repo_id):
+            self._run_git_command(["worktree", "prune"], cwd=repo_path)
+        self._run_git_command(["gc", "--auto", "--quiet"], cwd=repo_path)
+        logger.debug(f"Ran worktree prune and gc --auto for {repo}")
+
+    def build_merge_train(
+        self, repo_url: str, repo: str, base_branch: str, pr_numbers: list[int]
+    ) -> MergeTrainBuild:
+        """
+        Merge pull requests one after another on top of a base branch.
+
+        Fetches the base branch and each PR's head, then creates a merge
+        commit per PR with `git merge-tree --write-tree` and `git commit-tree`,
+        each on top of the previous one. Nothing is checked out and no branch
+        is moved. Stops at the first PR that conflicts.
+
+        Args:
+            repo_url: Git repository URL
+            repo: Repository in 'hostname/owner/repo' or 'owner/repo' format
+            base_branch: Branch the PRs target
+            pr_numbers: PRs to merge, in order
+
+        Returns:
+            MergeTrainBuild with one commit per PR merged before any conflict
+
+        Raises:
+            WorkspaceError: If a git command fails
+        """
+        # The branch name ends up in refspecs; reject anything git wouldn't accept
+        self._run_git_command(["check-ref-format", "--branch", base_branch])
+        repo_id = self._get_repo_identifier(repo)
+        with self._repo_lock(repo_id):
+            repo_path = self._ensure_repo_cloned(repo_url, repo)
+
+        refspecs = [f"+refs/heads/{base_branch}:refs/remotes/origin/{base_branch}"]
+        refspecs += [f"+refs/pull/{n}/head:{PULL_REFS_NAMESPACE}/{n}" for n in pr_numbers]
+        self._run_git_command(["fetch", "--no-tags", "origin", *refspecs], cwd=repo_path)
+
+        def rev_parse(ref: str) -> str:
+            return self._run_git_command(["rev-parse", ref], cwd=repo_path).stdout.strip()
+
+        build = MergeTrainBuild(base_sha=rev_parse(f"refs/remotes/origin/{base_branch}"))
+        tip = build.base_sha
+        for pr_number in pr_numbers:
+            head_sha = rev_parse(f"{PULL_REFS_NAMESPACE}/{pr_number}")
+            merged = self._run_git_command(
+                ["merge-tree", "--write-tree", "--no-messages", tip, head_sha],
+                cwd=repo_path,
+                check=False,
+            )
+            if merged.returncode == 1:
+                logger.info(f"PR #{pr_number} conflicts with the merge train in {repo}")
+                build.conflict = pr_number
+                break
+            if merged.returncode != 0:
+                raise WorkspaceError(f"git merge-tree failed for PR #{pr_number}: {merged.stderr}")
+
+            tree = merged.stdout.split()[0]
+            tip = self._run_git_command(
+                [
+                    *MERGE_TRAIN_IDENTITY,
+                    "commit-tree",
+                    tree,
+                    "-p",
+                    tip,
+                    "-p",
+                    head_sha,
+                    "-m",
+                    f"Merge train: #{pr_number}",
+                ],
+                cwd=repo_path,
+            ).stdout.strip()
+            build.pr_numbers.append(pr_number)
+            build.head_shas.append(head_sha)
+            build.commits.append(tip)
+
+        logger.debug(f"Built merge train of {len(build.commits)} PR(s) on {base_branch} in {repo}")
+        return build
+
+    def push_branches(self, repo_url: str, repo: str, refs: dict[str, str]) -> None:
+        """
+        Force-push commits to branches on origin in one push.
+
+        Args:
+            repo_url: Git repository URL
+            repo: Repository in 'hostname/owner/repo' or 'owner/repo' format
+            refs: Branch name -> commit SHA
+
+        Raises:
+            WorkspaceError: If the push fails
+        """
+        if not refs:
+            return
+        repo_id = self._get_repo_identifier(repo)
+        with self._repo_lock(repo_id):
+            repo_path = self._ensure_repo_cloned(repo_url, repo)
+        refspecs = [f"+{sha}:refs/heads/{branch}" for branch, sha in refs.items()]
+        self._run_git_command(["push", "origin", *refspecs], cwd=repo_path)
+
+    def delete_remote_branches(self, repo_url: str, repo: str, branches: list[str]) -> None:
+        """
+        Delete branches on origin, ignoring ones that no longer exist.
+
+        Args:
+            repo_url: Git repository URL
+            repo: Repository in 'hostname/owner/repo' or 'owner/repo' format
+            branches: Branch names to delete
+        """
+        if not branches:
+            return
+        repo_id = self._get_repo_identifier(repo)
+        with self._repo_lock(repo_id):
+            repo_path = self._ensure_repo_cloned(repo_url, repo)
+        # One missing branch fails the whole push, so only delete the ones that exist
+        listed = self._run_git_command(
+            ["ls-remote", "--heads", "origin", *branches], cwd=repo_path, check=False
+        )
+        # Patterns match any trailing path components; keep exact names only
+        listed_names = {
+            line.split("refs/heads/", 1)[1] for line in listed.stdout.splitlines() if line.strip()
+        }
+        existing = [branch for branch in branches if branch in listed_names]
+        if not existing:
+            return
+        result = self._run_git_command(
+            ["push", "origin", "--delete", *existing], cwd=repo_path, check=False
+        )
+        if result.returncode != 0:
+            # Non-fatal - branches may already be deleted
+            logger.warning(f"Failed to delete some remote branches: {result.stderr.strip()}")
+
     def _is_valid_worktree(self, path: Path) -> bool:
         """Check if path is a valid git worktree.
 
@@ -432,6 +1097,8 @@ class WorkspaceManager:
 
         This is a deterministic operation that ensures the worktree matches
         origin/main exactly, without the possibility of merge conflicts.
+        origin/main is fetched into the main clone, where concurrent syncs of
+        the same repository share one fetch (see FetchScheduler).
 
         Args:
             worktree_path: Path to the worktree to synchronize
@@ -457,8 +1124,8 @@ class WorkspaceManager:
             # Remove untracked files and directories
             self._run_git_command(["clean", "-fd"], cwd=worktree)
 
-            # Fetch latest main
-            self._run_git_command(["fetch", "origin", "main"], cwd=worktree)
+            # Fetch latest main into the shared clone (coalesced with other worktrees)
+            self._fetch_branch(self._get_main_repo_path(worktree), DEFAULT_BRANCH)
 
             # Hard reset to origin/main (no merge/rebase conflicts possible)
             self._run_git_command(["reset", "--hard", "origin/main"], cwd=worktree)
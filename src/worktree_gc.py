@@ -0,0 +1,155 @@
+"""Background removal of worktrees for finished issues.
+
+Cleanup of Done and closed issues used to remove each worktree on the poll
+I/O pool, with a `git worktree list`, `worktree remove` and `branch -D` per
+issue, and the poll waited for all of it: closing a large epic stalled the
+poll loop for the whole removal.
+
+WorktreeCollector queues removals and drains the queue on its own thread, one
+batch per repository (see WorkspaceManager.cleanup_workspaces). It also runs
+`git worktree prune` and `git gc --auto` on a schedule in every repository it
+has cleaned up.
+"""
+
+import threading
+import time
+from collections.abc import Callable
+
+from src.logger import get_logger
+from src.workspace import WorkspaceError, WorkspaceManager
+
+logger = get_logger(__name__)
+
+# Seconds to wait after a removal is queued so that a burst lands in one batch
+DEFAULT_BATCH_DELAY = 1.0
+
+# Seconds between worktree prune / gc --auto passes per repository
+DEFAULT_MAINTENANCE_INTERVAL = 6 * 3600.0
+
+
+class WorktreeCollector:
+    """Removes queued worktrees in per-repository batches on a background thread."""
+
+    def __init__(
+        self,
+        workspace_manager: WorkspaceManager,
+        on_collected: Callable[[str, int], None] | None = None,
+        in_use: Callable[[str, int], bool] | None = None,
+        batch_delay: float = DEFAULT_BATCH_DELAY,
+        maintenance_interval: float = DEFAULT_MAINTENANCE_INTERVAL,
+    ) -> None:
+        """Initialize the collector.
+
+        Args:
+            workspace_manager: Manager performing the git operations
+            on_collected: Called with (repo, issue_number) after an issue's
+                cleanup was attempted (e.g. to label it cleaned up)
+            in_use: Returns True for issues whose worktree must not be removed
+                right now; those are dropped from the batch without callback
+            batch_delay: Seconds to wait for more removals before a batch
+            maintenance_interval: Seconds between prune/gc passes per repository
+        """
+        self.workspace_manager = workspace_manager
+        self.on_collected = on_collected
+        self.in_use = in_use
+        self.batch_delay = batch_delay
+        self.maintenance_interval = maintenance_interval
+        self._lock = threading.Lock()
+        # repo -> issue numbers queued for removal (dict keeps insertion order)
+        self._pending: dict[str, dict[int, None]] = {}
+        # repo -> time.monotonic() of the last prune/gc pass
+        self._maintained_at: dict[str, float] = {}
+        self._wake = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def enqueue(self, repo: str, issue_number: int) -> None:
+        """Queue an issue's worktree for removal. Queuing it twice is a no-op.
+
+        Args:
+            repo: Repository in 'hostname/owner/repo' format
+            issue_number: Issue number
+        """
+        with self._lock:
+            self._pending.setdefault(repo, {})[issue_number] = None
+            # First cleanup of a repository schedules its maintenance from now
+            self._maintained_at.setdefault(repo, time.monotonic())
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="worktree-gc", daemon=True)
+                self._thread.start()
+        self._wake.set()
+        logger.debug(f"Queued worktree cleanup for {repo}#{issue_number}")
+
+    def pending_count(self) -> int:
+        """Number of worktrees queued for removal."""
+        with self._lock:
+            return sum(len(issues) for issues in self._pending.values())
+
+    def stop(self) -> None:
+        """Stop the collector thread after its current batch.
+
+        Removals still queued are dropped; their issues are not reported to
+        on_collected, so they are queued again after a restart.
+        """
+        self._stopped.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout=30)
+
+    def _run(self) -> None:
+        """Collect queued worktrees and run scheduled maintenance until stopped."""
+        while not self._stopped.is_set():
+            self._wake.wait(timeout=min(self.maintenance_interval, 60.0))
+            self._wake.clear()
+            # Let the rest of a burst (e.g. a closed epic) join this batch
+            if self._stopped.wait(timeout=self.batch_delay):
+                break
+            try:
+                self.collect_once()
+                self.maintain_once()
+            except Exception as e:
+                logger.error(f"Worktree collector pass failed: {e}", exc_info=True)
+
+    def collect_once(self) -> None:
+        """Remove every queued worktree, one batch per repository."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+
+        for repo, queued in pending.items():
+            issue_numbers = [n for n in queued if self.in_use is None or not self.in_use(repo, n)]
+            if not issue_numbers:
+                continue
+            try:
+                self.workspace_manager.cleanup_workspaces(repo, issue_numbers)
+            except WorkspaceError as e:
+                logger.error(f"Worktree cleanup failed for {repo}: {e}")
+
+            if self.on_collected is None:
+                continue
+            for issue_number in issue_numbers:
+                try:
+                    self.on_collected(repo, issue_number)
+                except Exception as e:
+                    logger.warning(f"Post-cleanup step failed for {repo}#{issue_number}: {e}")
+
+    def maintain_once(self, force: bool = False) -> None:
+        """Run worktree prune and gc --auto in repositories that are due.
+
+        Args:
+            force: Maintain every known repository regardless of schedule
+        """
+        now = time.monotonic()
+        with self._lock:
+            due = [
+                repo
+                for repo, maintained_at in self._maintained_at.items()
+                if force or now - maintained_at >= self.maintenance_interval
+            ]
+            for repo in due:
+                self._maintained_at[repo] = now
+
+        for repo in due:
+            try:
+                self.workspace_manager.maintain_repo(repo)
+            except WorkspaceError as e:
+                logger.warning(f"Worktree maintenance failed for {repo}: {e}")
@@ -281,6 +281,80 @@ repos:
         with pytest.raises(AutoMergingLoadError, match="cannot be empty"):
             manager.load_config()
 
+    def test_load_config_speculative_strategy(self, tmp_path):
+        """Test that strategy, batch_size and batching are parsed."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("""
+repos:
+  - url: https://github.com/owner/repo1
+    enabled: true
+    strategy: speculative
+    batch_size: 8
+    batching: bisect
+  - url: https://github.com/owner/repo2
+    enabled: true
+""")
+
+        manager = AutoMergingManager(str(config_file))
+        result = manager.load_config()
+
+        assert result[0].strategy == "speculative"
+        assert result[0].batch_size == 8
+        assert result[0].batching == "bisect"
+        assert result[1].strategy == "sequential"
+        assert result[1].batch_size == 4
+        assert result[1].batching == "prefixes"
+        assert result[0].no_ci is False
+
+    def test_load_config_no_ci(self, tmp_path):
+        """Test that no_ci is parsed and must be a boolean."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("""
+repos:
+  - url: https://github.com/owner/repo
+    enabled: true
+    no_ci: true
+""")
+        assert AutoMergingManager(str(config_file)).load_config()[0].no_ci is True
+
+        config_file.write_text("""
+repos:
+  - url: https://github.com/owner/repo
+    enabled: true
+    no_ci: "yes"
+""")
+        with pytest.raises(AutoMergingLoadError, match="'no_ci' must be a boolean"):
+            AutoMergingManager(str(config_file)).load_config()
+
+    def test_load_config_invalid_strategy_value(self, tmp_path):
+        """Test that an unknown strategy raises error."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("""
+repos:
+  - url: https://github.com/owner/repo
+    enabled: true
+    strategy: parallel
+""")
+
+        manager = AutoMergingManager(str(config_file))
+        with pytest.raises(AutoMergingLoadError, match="'strategy' must be one of"):
+            manager.load_config()
+
+    @pytest.mark.parametrize("batch_size", ["4", "true", "0"])
+    def test_load_config_invalid_batch_size(self, tmp_path, batch_size):
+        """Test that a batch_size that is not a positive integer raises error."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(f"""
+repos:
+  - url: https://github.com/owner/repo
+    enabled: true
+    batch_size: {batch_size if batch_size != "4" else '"4"'}
+""")
+
+        manager = AutoMergingManager(str(config_file))
+        with pytest.raises(AutoMergingLoadError, match="'batch_size' must be"):
+            manager.load_config()
+
     def test_load_config_sets_cache(self, tmp_path):
         """Test that load_config sets the cached entries."""
         config_file = tmp_path / "config.yaml"
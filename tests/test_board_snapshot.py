@@ -0,0 +1,193 @@
+"""Unit tests for incremental board diffing."""
+
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from src.board_snapshot import BoardSnapshot, item_fingerprint
+from src.database import Database
+from src.interfaces import TicketItem
+
+
+@pytest.fixture
+def temp_db():
+    """Fixture providing a temporary database for tests."""
+    with tempfile.NamedTemporaryFile(mode="w", suffix=".db", delete=False) as f:
+        db_path = f.name
+
+    db = Database(db_path)
+    yield db
+
+    db.close()
+    Path(db_path).unlink(missing_ok=True)
+
+
+def _item(ticket_id, status="Research", labels=None, **kwargs):
+    """Build a TicketItem for tests."""
+    return TicketItem(
+        item_id=f"PVTI_{ticket_id}",
+        board_url="https://github.com/orgs/test/projects/1",
+        ticket_id=ticket_id,
+        repo="github.com/test/repo",
+        status=status,
+        title=f"Issue {ticket_id}",
+        labels=labels or set(),
+        **kwargs,
+    )
+
+
+def _steady_state(snapshot, items):
+    """Run the first (full scan) poll and commit it."""
+    change_set = snapshot.diff(items)
+    snapshot.commit(change_set)
+
+
+@pytest.mark.unit
+class TestItemFingerprint:
+    """Tests for item_fingerprint."""
+
+    def test_same_fields_same_fingerprint(self):
+        """Test label order and title do not affect the fingerprint."""
+        a = _item(1, labels={"a", "b"})
+        b = _item(1, labels={"b", "a"})
+        b.title = "Renamed"
+
+        assert item_fingerprint(a) == item_fingerprint(b)
+
+    @pytest.mark.parametrize(
+        "change",
+        [
+            {"status": "Plan"},
+            {"labels": {"yolo"}},
+            {"state": "CLOSED"},
+            {"state_reason": "COMPLETED"},
+            {"comment_count": 3},
+            {"has_merged_changes": True},
+        ],
+    )
+    def test_tracked_fields_change_fingerprint(self, change):
+        """Test each tracked field changes the fingerprint."""
+        base = _item(1)
+        changed = _item(1, **change)
+
+        assert item_fingerprint(base) != item_fingerprint(changed)
+
+
+@pytest.mark.unit
+class TestBoardSnapshot:
+    """Tests for BoardSnapshot change sets."""
+
+    def test_first_poll_is_full_scan(self, temp_db):
+        """Test the first poll after startup processes every item."""
+        snapshot = BoardSnapshot(temp_db)
+        items = [_item(1), _item(2)]
+
+        change_set = snapshot.diff(items)
+
+        assert change_set.full_scan is True
+        assert change_set.items_to_process == items
+
+    def test_idle_board_has_nothing_to_process(self, temp_db):
+        """Test a steady-state poll of an unchanged board processes no items."""
+        snapshot = BoardSnapshot(temp_db)
+        _steady_state(snapshot, [_item(1), _item(2)])
+
+        change_set = snapshot.diff([_item(1), _item(2)])
+
+        assert change_set.full_scan is False
+        assert change_set.items_to_process == []
+        assert len(change_set.unchanged) == 2
+
+    def test_changed_and_new_items_are_processed(self, temp_db):
+        """Test only changed and new items are in the change set."""
+        snapshot = BoardSnapshot(temp_db)
+        _steady_state(snapshot, [_item(1), _item(2)])
+
+        change_set = snapshot.diff([_item(1), _item(2, labels={"yolo"}), _item(3)])
+
+        assert [i.ticket_id for i in change_set.items_to_process] == [2, 3]
+
+    def test_removed_items(self, temp_db):
+        """Test items no longer on the board are reported and forgotten."""
+        snapshot = BoardSnapshot(temp_db)
+        _steady_state(snapshot, [_item(1), _item(2)])
+
+        change_set = snapshot.diff([_item(1)])
+        snapshot.commit(change_set)
+
+        assert change_set.removed == ["PVTI_2"]
+        assert temp_db.get_board_snapshot().keys() == {"PVTI_1"}
+
+    def test_dirty_item_is_processed_once(self, temp_db):
+        """Test marked items are processed on the next poll only."""
+        snapshot = BoardSnapshot(temp_db)
+        _steady_state(snapshot, [_item(1), _item(2)])
+
+        snapshot.mark_dirty("github.com/test/repo", 2)
+        first = snapshot.diff([_item(1), _item(2)])
+        snapshot.commit(first)
+        second = snapshot.diff([_item(1), _item(2)])
+
+        assert [i.ticket_id for i in first.items_to_process] == [2]
+        assert second.items_to_process == []
+
+    def test_uncommitted_poll_is_retried(self, temp_db):
+        """Test changes and dirty marks survive a poll that fails before commit."""
+        snapshot = BoardSnapshot(temp_db)
+        _steady_state(snapshot, [_item(1), _item(2)])
+
+        snapshot.mark_dirty("github.com/test/repo", 1)
+        snapshot.diff([_item(1), _item(2, status="Plan")])  # poll fails, no commit
+        retry = snapshot.diff([_item(1), _item(2, status="Plan")])
+
+        assert [i.ticket_id for i in retry.items_to_process] == [1, 2]
+
+    def test_mark_dirty_during_poll_survives_commit(self, temp_db):
+        """Test items marked while handlers run are processed on the following poll."""
+        snapshot = BoardSnapshot(temp_db)
+        _steady_state(snapshot, [_item(1)])
+
+        change_set = snapshot.diff([_item(1)])
+        snapshot.mark_dirty("github.com/test/repo", 1)
+        snapshot.commit(change_set)
+
+        assert [i.ticket_id for i in snapshot.diff([_item(1)]).items_to_process] == [1]
+
+    def test_partial_diff_leaves_rest_of_board(self, temp_db):
+        """Test a targeted refresh neither removes other items nor settles dirty marks."""
+        snapshot = BoardSnapshot(temp_db)
+        _steady_state(snapshot, [_item(1), _item(2)])
+
+        snapshot.mark_dirty("github.com/test/repo", 2)
+        partial = snapshot.diff([_item(1, status="Plan")], partial=True)
+        snapshot.commit(partial)
+
+        assert [i.ticket_id for i in partial.items_to_process] == [1]
+        assert partial.removed == []
+        assert temp_db.get_board_snapshot().keys() == {"PVTI_1", "PVTI_2"}
+        full = snapshot.diff([_item(1, status="Plan"), _item(2)])
+        assert [i.ticket_id for i in full.items_to_process] == [2]
+
+    def test_periodic_full_scan(self, temp_db):
+        """Test a full scan runs again once the interval has elapsed."""
+        with patch("src.board_snapshot.time.monotonic", return_value=1000.0):
+            snapshot = BoardSnapshot(temp_db, full_scan_interval=600)
+            _steady_state(snapshot, [_item(1)])
+
+        with patch("src.board_snapshot.time.monotonic", return_value=1599.0):
+            assert snapshot.diff([_item(1)]).full_scan is False
+        with patch("src.board_snapshot.time.monotonic", return_value=1600.0):
+            assert snapshot.diff([_item(1)]).items_to_process == [_item(1)]
+
+    def test_fingerprints_persist_across_restarts(self, temp_db):
+        """Test a new snapshot loads fingerprints saved by a previous run."""
+        snapshot = BoardSnapshot(temp_db)
+        _steady_state(snapshot, [_item(1), _item(2)])
+
+        restarted = BoardSnapshot(temp_db)
+        change_set = restarted.diff([_item(1), _item(2, status="Plan")])
+
+        assert [i.ticket_id for i in change_set.changed] == [2]
+        assert [i.ticket_id for i in change_set.unchanged] == [1]
@@ -0,0 +1,141 @@
+"""Unit tests for the shared CI watcher."""
+
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.ci_watcher import NETWORK_FAILURE_LIMIT, CIWatcher
+from src.interfaces import CheckRunResult
+from src.ticket_clients.base import NetworkError
+from src.utils.lane_scheduler import LaneScheduler
+
+REPO = "github.com/owner/repo"
+
+
+def done(name, conclusion="success"):
+    return CheckRunResult(name=name, status="completed", conclusion=conclusion)
+
+
+def running(name):
+    return CheckRunResult(name=name, status="in_progress")
+
+
+@pytest.fixture
+def client():
+    """Ticket client mock with get_check_runs_bulk."""
+    return MagicMock()
+
+
+@pytest.fixture
+def watcher(client):
+    """CIWatcher whose background thread is never started by these tests."""
+    ci_watcher = CIWatcher(client, poll_interval=3600)
+    ci_watcher._thread = MagicMock()  # poll_once() is driven by the tests
+    yield ci_watcher
+    ci_watcher._thread = None
+    ci_watcher.stop()
+
+
+@pytest.mark.unit
+class TestCIWatcher:
+    """Tests for CIWatcher."""
+
+    def test_one_request_per_repo(self, watcher, client):
+        """Test all pending commits of a repo are polled in one call."""
+        client.get_check_runs_bulk.return_value = {}
+        watcher.watch(REPO, "aaa1111")
+        watcher.watch(REPO, "bbb2222")
+        watcher.watch("github.com/owner/other", "ccc3333")
+
+        watcher.poll_once()
+
+        assert client.get_check_runs_bulk.call_count == 2
+        repo_call = next(c for c in client.get_check_runs_bulk.call_args_list if c[0][0] == REPO)
+        assert sorted(repo_call[0][1]) == ["aaa1111", "bbb2222"]
+
+    def test_resolves_when_all_checks_complete(self, watcher, client):
+        """Test the future resolves only once every check has completed."""
+        future = watcher.watch(REPO, "aaa1111")
+
+        client.get_check_runs_bulk.return_value = {"aaa1111": [done("lint"), running("test")]}
+        watcher.poll_once()
+        assert not future.done()
+
+        checks = [done("lint"), done("test", "failure")]
+        client.get_check_runs_bulk.return_value = {"aaa1111": checks}
+        watcher.poll_once()
+
+        assert future.result(timeout=1) == checks
+        assert watcher.pending_count() == 0
+
+    def test_no_checks_yet_keeps_waiting(self, watcher, client):
+        """Test a commit without any checks is not treated as passed."""
+        future = watcher.watch(REPO, "aaa1111")
+        client.get_check_runs_bulk.return_value = {"aaa1111": []}
+
+        watcher.poll_once()
+
+        assert not future.done()
+
+    def test_network_error_keeps_commit_pending(self, watcher, client):
+        """Test a network error is retried on the next poll."""
+        future = watcher.watch(REPO, "aaa1111")
+        client.get_check_runs_bulk.side_effect = NetworkError("unreachable")
+
+        watcher.poll_once()
+
+        assert not future.done()
+        assert watcher.pending_count() == 1
+
+    def test_persistent_network_error_fails_waiters(self, watcher, client):
+        """Test waiters get the error after repeated failed polls of their repo."""
+        future = watcher.watch(REPO, "aaa1111")
+        client.get_check_runs_bulk.side_effect = NetworkError("unreachable")
+
+        for _ in range(NETWORK_FAILURE_LIMIT):
+            watcher.poll_once()
+
+        with pytest.raises(NetworkError):
+            future.result(timeout=1)
+        assert watcher.pending_count() == 0
+
+    def test_successful_poll_resets_network_failures(self, watcher, client):
+        """Test only consecutive failures count toward giving up."""
+        future = watcher.watch(REPO, "aaa1111")
+        client.get_check_runs_bulk.side_effect = NetworkError("unreachable")
+        for _ in range(NETWORK_FAILURE_LIMIT - 1):
+            watcher.poll_once()
+        client.get_check_runs_bulk.side_effect = None
+        client.get_check_runs_bulk.return_value = {"aaa1111": [running("test")]}
+        watcher.poll_once()
+        client.get_check_runs_bulk.side_effect = NetworkError("unreachable")
+
+        watcher.poll_once()
+
+        assert not future.done()
+
+    def test_cancel_returns_latest_checks(self, watcher, client):
+        """Test cancelling a wait hands back the checks seen so far."""
+        future = watcher.watch(REPO, "aaa1111")
+        checks = [done("lint", "failure"), running("test")]
+        client.get_check_runs_bulk.return_value = {"aaa1111": checks}
+        watcher.poll_once()
+
+        assert watcher.cancel(REPO, "aaa1111", future) == checks
+        assert future.cancelled()
+        assert watcher.pending_count() == 0
+
+    def test_suspended_releases_workflow_slot(self, client):
+        """Test waiting through the watcher frees the caller's lane slot."""
+        lanes = LaneScheduler({"implement": 1}, max_workers=2)
+        ci_watcher = CIWatcher(client, slots=lanes)
+        other_ran = threading.Event()
+
+        def waiting(_):
+            with ci_watcher.suspended():
+                lanes.submit("implement", lambda _: other_ran.set(), None)
+                assert other_ran.wait(timeout=5)
+
+        lanes.submit("implement", waiting, None).result(timeout=5)
+        lanes.shutdown()
@@ -1,7 +1,10 @@
 """Unit tests for the claude_runner module."""
 
 import json
+import os
 import re
+import threading
+import time
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -18,6 +21,40 @@ from src.claude_runner import (
 from src.integrations.telemetry import LLMMetrics
 
 
+def _pipe_reader(data):
+    """Create a readable pipe end pre-filled with data and closed for writing."""
+    read_fd, write_fd = os.pipe()
+    os.write(write_fd, data.encode("utf-8"))
+    os.close(write_fd)
+    return os.fdopen(read_fd, "r")
+
+
+def make_claude_process(stdout_lines, return_code=0, stderr_output=""):
+    """Create a mock Claude process whose stdout and stderr are real pipes."""
+    mock_process = MagicMock()
+    mock_process.stdin = MagicMock()
+    mock_process.stdout = _pipe_reader("".join(stdout_lines))
+    mock_process.stderr = _pipe_reader(stderr_output)
+    mock_process.poll.return_value = return_code
+    mock_process.wait.return_value = return_code
+    return mock_process
+
+
+@pytest.fixture
+def hung_claude_process():
+    """Mock Claude process that stays alive without printing anything."""
+    stdout_read, stdout_write = os.pipe()
+    stderr_read, stderr_write = os.pipe()
+    mock_process = MagicMock()
+    mock_process.stdin = MagicMock()
+    mock_process.stdout = os.fdopen(stdout_read, "r")
+    mock_process.stderr = os.fdopen(stderr_read, "r")
+    mock_process.poll.return_value = None
+    yield mock_process
+    os.close(stdout_write)
+    os.close(stderr_write)
+
+
 @pytest.mark.unit
 class TestClaudeResult:
     """Tests for ClaudeResult dataclass."""
@@ -92,38 +129,9 @@ class TestClaudeRunnerExceptions:
 class TestRunClaude:
     """Tests for run_claude function."""
 
-    def _create_mock_process(
-        self,
-        stdout_lines,
-        return_code=0,
-        stderr_output="",
-    ):
+    def _create_mock_process(self, stdout_lines, return_code=0, stderr_output=""):
         """Helper to create a mock process with specified output."""
-        mock_process = MagicMock()
-        mock_process.stdin = MagicMock()
-        mock_process.stdout = MagicMock()
-        mock_process.stderr = MagicMock()
-
-        # Track line index for readline
-        line_index = [0]
-
-        def readline():
-            if line_index[0] < len(stdout_lines):
-                line = stdout_lines[line_index[0]]
-                line_index[0] += 1
-                return line
-            return ""
-
-        mock_process.stdout.readline = readline
-        mock_process.stderr.read.return_value = stderr_output
-
-        # poll() returns None while running, then return_code when done
-        poll_values = [None] * len(stdout_lines) + [return_code]
-        mock_process.poll.side_effect = poll_values
-
-        mock_process.wait.return_value = return_code
-
-        return mock_process
+        return make_claude_process(stdout_lines, return_code, stderr_output)
 
     def test_run_claude_success(self, mock_claude_subprocess, tmp_path):
         """Test run_claude returns successful result with response text."""
@@ -179,52 +187,87 @@ class TestRunClaude:
         assert "--resume" in cmd
         assert "session-to-resume" in cmd
 
-    def test_run_claude_timeout_total(self, mock_claude_subprocess, tmp_path):
+    def test_run_claude_timeout_total(self, mock_claude_subprocess, hung_claude_process, tmp_path):
         """Test run_claude raises ClaudeTimeoutError on total timeout."""
-        mock_process = MagicMock()
-        mock_process.stdin = MagicMock()
-        mock_process.stdout = MagicMock()
-
-        # Simulate very slow output by returning empty strings indefinitely
-        # We'll mock time.time to simulate elapsed time
-        mock_process.stdout.readline.return_value = ""
-        mock_process.poll.return_value = None
-
-        mock_claude_subprocess.return_value = mock_process
+        mock_claude_subprocess.return_value = hung_claude_process
 
         with patch("src.claude_runner.time") as mock_time:
-            # First call is start_time, second is current_time check
-            # Make it appear that timeout has exceeded
-            mock_time.time.side_effect = [
-                0,
-                0,
-                2000,
-            ]  # start, last_activity, current (2000s elapsed)
+            # start, then 2000s elapsed on the first deadline check
+            mock_time.monotonic.side_effect = [0, 2000]
 
             with pytest.raises(ClaudeTimeoutError, match="exceeded total timeout"):
                 run_claude("Prompt", str(tmp_path), timeout=1800)
 
-        mock_process.kill.assert_called_once()
+        hung_claude_process.kill.assert_called_once()
 
-    def test_run_claude_timeout_inactivity(self, mock_claude_subprocess, tmp_path):
+    def test_run_claude_timeout_inactivity(
+        self, mock_claude_subprocess, hung_claude_process, tmp_path
+    ):
         """Test run_claude raises ClaudeTimeoutError on inactivity timeout."""
-        mock_process = MagicMock()
-        mock_process.stdin = MagicMock()
-        mock_process.stdout = MagicMock()
-        mock_process.stdout.readline.return_value = ""
-        mock_process.poll.return_value = None
-
-        mock_claude_subprocess.return_value = mock_process
+        mock_claude_subprocess.return_value = hung_claude_process
 
         with patch("src.claude_runner.time") as mock_time:
-            # start_time, last_activity_time, current_time
             # Total timeout not exceeded but inactivity exceeded
-            mock_time.time.side_effect = [0, 0, 400]  # 400s > 300s inactivity timeout
+            mock_time.monotonic.side_effect = [0, 400]  # 400s > 300s inactivity timeout
 
             with pytest.raises(ClaudeTimeoutError, match="exceeded inactivity timeout"):
                 run_claude("Prompt", str(tmp_path), inactivity_timeout=300)
 
-        mock_process.kill.assert_called_once()
+        hung_claude_process.kill.assert_called_once()
+
+    def test_run_claude_hung_process_times_out_without_output(
+        self, mock_claude_subprocess, hung_claude_process, tmp_path
+    ):
+        """Test a process that prints nothing is killed once the inactivity window passes."""
+        mock_claude_subprocess.return_value = hung_claude_process
+
+        started = time.monotonic()
+        with pytest.raises(ClaudeTimeoutError, match="exceeded inactivity timeout"):
+            run_claude("Prompt", str(tmp_path), inactivity_timeout=0.2)
+
+        assert time.monotonic() - started < 5
+        hung_claude_process.kill.assert_called_once()
+
+    def test_run_claude_drains_large_stderr(self, mock_claude_subprocess, tmp_path):
+        """Test stderr is read while stdout is still open, so a full stderr pipe can't block."""
+        stdout_read, stdout_write = os.pipe()
+        stderr_read, stderr_write = os.pipe()
+        mock_process = MagicMock()
+        mock_process.stdin = MagicMock()
+        mock_process.stdout = os.fdopen(stdout_read, "r")
+        mock_process.stderr = os.fdopen(stderr_read, "r")
+        mock_process.wait.return_value = 0
+        mock_claude_subprocess.return_value = mock_process
+
+        def fake_claude():
+            # More than a pipe buffer of stderr before any stdout
+            os.write(stderr_write, b"w" * 200_000)
+            os.close(stderr_write)
+            os.write(stdout_write, json.dumps({"type": "result", "result": "ok"}).encode() + b"\n")
+            os.close(stdout_write)
+
+        writer = threading.Thread(target=fake_claude)
+        writer.start()
+        result = run_claude("Prompt", str(tmp_path), timeout=10)
+        writer.join(timeout=5)
+
+        assert result.response == "ok"
+
+    def test_run_claude_delivers_events_incrementally(self, mock_claude_subprocess, tmp_path):
+        """Test on_event receives each parsed event in stream order."""
+        events = [
+            {"type": "system", "subtype": "init"},
+            {"type": "assistant", "message": {"content": [{"type": "text", "text": "Hi"}]}},
+            {"type": "result", "result": "Done"},
+        ]
+        mock_claude_subprocess.return_value = make_claude_process(
+            [json.dumps(e) + "\n" for e in events]
+        )
+        received = []
+
+        run_claude("Prompt", str(tmp_path), on_event=received.append)
+
+        assert received == events
 
     def test_run_claude_nonzero_exit(self, mock_claude_subprocess, tmp_path):
         """Test run_claude raises ClaudeRunnerError on non-zero exit code."""
@@ -423,29 +466,9 @@ class TestRunClaude:
 class TestRunClaudeJsonStreamParsing:
     """Tests for JSON stream parsing in run_claude."""
 
-    def _create_mock_process(self, stdout_lines, return_code=0):
+    def _create_mock_process(self, stdout_lines, return_code=0, stderr_output=""):
         """Helper to create a mock process with specified output."""
-        mock_process = MagicMock()
-        mock_process.stdin = MagicMock()
-        mock_process.stdout = MagicMock()
-        mock_process.stderr = MagicMock()
-        mock_process.stderr.read.return_value = ""
-
-        line_index = [0]
-
-        def readline():
-            if line_index[0] < len(stdout_lines):
-                line = stdout_lines[line_index[0]]
-                line_index[0] += 1
-                return line
-            return ""
-
-        mock_process.stdout.readline = readline
-        poll_values = [None] * len(stdout_lines) + [return_code]
-        mock_process.poll.side_effect = poll_values
-        mock_process.wait.return_value = return_code
-
-        return mock_process
+        return make_claude_process(stdout_lines, return_code, stderr_output)
 
     def test_parses_result_event(self, mock_claude_subprocess, tmp_path):
         """Test parsing result event type extracts response."""
@@ -757,28 +780,7 @@ class TestRunClaudeErrorEnhancement:
 
     def _create_mock_process(self, stdout_lines, return_code=0, stderr_output=""):
         """Helper to create a mock process with specified output."""
-        mock_process = MagicMock()
-        mock_process.stdin = MagicMock()
-        mock_process.stdout = MagicMock()
-        mock_process.stderr = MagicMock()
-
-        line_index = [0]
-
-        def readline():
-            if line_index[0] < len(stdout_lines):
-                line = stdout_lines[line_index[0]]
-                line_index[0] += 1
-                return line
-            return ""
-
-        mock_process.stdout.readline = readline
-        mock_process.stderr.read.return_value = stderr_output
-
-        poll_values = [None] * len(stdout_lines) + [return_code]
-        mock_process.poll.side_effect = poll_values
-        mock_process.wait.return_value = return_code
-
-        return mock_process
+        return make_claude_process(stdout_lines, return_code, stderr_output)
 
     def test_nonzero_exit_includes_suggestions(self, mock_claude_subprocess, tmp_path):
         """Test that non-zero exit errors include suggestions when patterns match."""
@@ -0,0 +1,148 @@
+"""Startup-time regression tests for the kiln CLI.
+
+Lightweight commands must not pull in the daemon's heavy dependencies. Each
+test runs the CLI in a fresh interpreter under `python -X importtime` and
+inspects which modules it imported and how long the imports took.
+"""
+
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from src.database import Database
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# Import-time budget for lightweight commands, in milliseconds
+STARTUP_BUDGET_MS = 100.0
+
+# Modules only the daemon (or an optional integration) may import
+HEAVY_MODULES = [
+    "requests",
+    "opentelemetry",
+    "mcp",
+    "tenacity",
+    "src.daemon",
+    "src.ticket_clients",
+    "src.integrations",
+]
+
+_IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+def _run_kiln(args: list[str], cwd: Path) -> tuple[set[str], float]:
+    """Run `kiln <args>` under -X importtime.
+
+    Returns:
+        Tuple of (every imported module, total import milliseconds excluding site)
+    """
+    code = f"import sys; sys.argv = ['kiln', *{args!r}]; from src.cli import main; main()"
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        cwd=cwd,
+        env={**os.environ, "PYTHONPATH": str(REPO_ROOT)},
+        timeout=60,
+    )
+    modules: set[str] = set()
+    total_us = 0
+    for line in result.stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if not match:
+            continue
+        modules.add(match.group(4))
+        if len(match.group(3)) == 1 and match.group(4) != "site":
+            total_us += int(match.group(2))
+    return modules, total_us / 1000
+
+
+def _heavy_imports(modules: set[str]) -> list[str]:
+    """Return the heavy modules (or their submodules) found in modules."""
+    return sorted(
+        name
+        for name in modules
+        if any(name == heavy or name.startswith(heavy + ".") for heavy in HEAVY_MODULES)
+    )
+
+
+@pytest.fixture
+def kiln_cwd(tmp_path):
+    """Working directory with an initialized .kiln database."""
+    (tmp_path / ".kiln").mkdir()
+    Database(str(tmp_path / ".kiln" / "kiln.db")).close()
+    return tmp_path
+
+
+@pytest.mark.unit
+class TestLightweightCommandImports:
+    """Lightweight commands do not import daemon dependencies."""
+
+    @pytest.mark.parametrize(
+        "args",
+        [["--version"], ["--help"], ["logs", "owner/repo#1"]],
+        ids=["version", "help", "logs-issue"],
+    )
+    def test_no_heavy_imports(self, kiln_cwd, args):
+        """Test that the command imports none of the heavy modules."""
+        modules, _ = _run_kiln(args, kiln_cwd)
+
+        assert "src.cli" in modules
+        assert _heavy_imports(modules) == []
+
+    def test_config_does_not_import_ticket_clients(self):
+        """Test that loading src.config leaves the ticket clients (and requests) unloaded."""
+        result = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import sys, src.config; print(sorted(m for m in sys.modules "
+                "if m.split('.')[0] == 'requests' or m.startswith('src.ticket_clients')))",
+            ],
+            capture_output=True,
+            text=True,
+            cwd=REPO_ROOT,
+            timeout=60,
+        )
+
+        assert result.stdout.strip() == "[]"
+
+    def test_telemetry_without_endpoint_skips_sdk(self):
+        """Test that importing telemetry and getting a tracer does not load the SDK."""
+        result = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import sys; from src.integrations.telemetry import get_tracer, init_telemetry; "
+                "init_telemetry('', 'kiln'); get_tracer(); "
+                "print(sorted(m for m in sys.modules if m.startswith(('opentelemetry.sdk', "
+                "'opentelemetry.exporter', 'mcp'))))",
+            ],
+            capture_output=True,
+            text=True,
+            cwd=REPO_ROOT,
+            timeout=60,
+        )
+
+        assert result.stdout.strip() == "[]"
+
+
+@pytest.mark.timing
+class TestStartupBudget:
+    """Cold start of lightweight commands stays within the import-time budget."""
+
+    @pytest.mark.parametrize(
+        "args",
+        [["--version"], ["logs", "owner/repo#1"]],
+        ids=["version", "logs-issue"],
+    )
+    def test_import_time_within_budget(self, kiln_cwd, args):
+        """Test that the command's imports take less than STARTUP_BUDGET_MS."""
+        # Best of three runs filters out a cold filesystem cache
+        best_ms = min(_run_kiln(args, kiln_cwd)[1] for _ in range(3))
+
+        assert best_ms < STARTUP_BUDGET_MS
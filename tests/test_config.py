@@ -8,8 +8,11 @@ from src.config import (
     load_config,
     load_config_from_env,
     load_config_from_file,
+    parse_clone_strategies,
     parse_config_file,
+    parse_lane_concurrency,
 )
+from src.workspace import CloneStrategy
 
 
 @pytest.mark.unit
@@ -1906,3 +1909,331 @@ class TestGHESVersionAutoDetection:
         with patch("src.config.subprocess.run", return_value=mock_result):
             with pytest.raises(ValueError, match="did not return installed_version"):
                 _detect_ghes_version("github.mycompany.com", "ghp_token")
+
+
+@pytest.mark.unit
+class TestBoardFetchConcurrencyConfiguration:
+    """Tests for board_fetch_concurrency_per_host configuration variable."""
+
+    def test_default_env(self, monkeypatch):
+        """Test board_fetch_concurrency_per_host defaults to 4 when not set in env."""
+        monkeypatch.setenv("GITHUB_TOKEN", "test_token")
+        monkeypatch.setenv("PROJECT_URLS", "https://github.com/orgs/test/projects/1")
+        monkeypatch.setenv("USERNAME_SELF", "testuser")
+        monkeypatch.delenv("BOARD_FETCH_CONCURRENCY_PER_HOST", raising=False)
+
+        config = load_config_from_env()
+
+        assert config.board_fetch_concurrency_per_host == 4
+
+    def test_custom_file(self, tmp_path, monkeypatch):
+        """Test board_fetch_concurrency_per_host can be set via config file."""
+        config_file = tmp_path / "config"
+        config_file.write_text(
+            "GITHUB_TOKEN=ghp_test\n"
+            "PROJECT_URLS=https://github.com/orgs/test/projects/1\n"
+            "USERNAME_SELF=testuser\n"
+            "BOARD_FETCH_CONCURRENCY_PER_HOST=2"
+        )
+        monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+
+        config = load_config_from_file(config_file)
+
+        assert config.board_fetch_concurrency_per_host == 2
+
+
+@pytest.mark.unit
+class TestRateLimitBudgetConfiguration:
+    """Tests for rate_limit_budget and max_poll_interval configuration variables."""
+
+    def test_defaults_env(self, monkeypatch):
+        """Test rate-limit budgeting defaults when not set in env."""
+        monkeypatch.setenv("GITHUB_TOKEN", "test_token")
+        monkeypatch.setenv("PROJECT_URLS", "https://github.com/orgs/test/projects/1")
+        monkeypatch.setenv("USERNAME_SELF", "testuser")
+        monkeypatch.delenv("RATE_LIMIT_BUDGET", raising=False)
+        monkeypatch.delenv("MAX_POLL_INTERVAL", raising=False)
+
+        config = load_config_from_env()
+
+        assert config.rate_limit_budget == 0.8
+        assert config.max_poll_interval == 600
+
+    def test_custom_file(self, tmp_path, monkeypatch):
+        """Test rate-limit budgeting can be set via config file."""
+        config_file = tmp_path / "config"
+        config_file.write_text(
+            "GITHUB_TOKEN=ghp_test\n"
+            "PROJECT_URLS=https://github.com/orgs/test/projects/1\n"
+            "USERNAME_SELF=testuser\n"
+            "RATE_LIMIT_BUDGET=0.5\n"
+            "MAX_POLL_INTERVAL=900"
+        )
+        monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+
+        config = load_config_from_file(config_file)
+
+        assert config.rate_limit_budget == 0.5
+        assert config.max_poll_interval == 900
+
+
+@pytest.mark.unit
+class TestAsyncLoggingConfiguration:
+    """Tests for log_async, log_json_file and log_queue_size configuration variables."""
+
+    def test_defaults_env(self, monkeypatch):
+        """Test async logging is off and no JSON log is written by default."""
+        monkeypatch.setenv("GITHUB_TOKEN", "test_token")
+        monkeypatch.setenv("PROJECT_URLS", "https://github.com/orgs/test/projects/1")
+        monkeypatch.setenv("USERNAME_SELF", "testuser")
+        monkeypatch.delenv("LOG_ASYNC", raising=False)
+        monkeypatch.delenv("LOG_JSON_FILE", raising=False)
+        monkeypatch.delenv("LOG_QUEUE_SIZE", raising=False)
+
+        config = load_config_from_env()
+
+        assert config.log_async is False
+        assert config.log_json_file == ""
+        assert config.log_queue_size == 10000
+
+    def test_custom_file(self, tmp_path, monkeypatch):
+        """Test async logging settings can be set via config file."""
+        config_file = tmp_path / "config"
+        config_file.write_text(
+            "GITHUB_TOKEN=ghp_test\n"
+            "PROJECT_URLS=https://github.com/orgs/test/projects/1\n"
+            "USERNAME_SELF=testuser\n"
+            "LOG_ASYNC=true\n"
+            "LOG_JSON_FILE=.kiln/logs/kiln.jsonl\n"
+            "LOG_QUEUE_SIZE=500"
+        )
+        monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+
+        config = load_config_from_file(config_file)
+
+        assert config.log_async is True
+        assert config.log_json_file == ".kiln/logs/kiln.jsonl"
+        assert config.log_queue_size == 500
+
+
+@pytest.mark.unit
+class TestRunHistoryRetentionConfiguration:
+    """Tests for run_history_retention_days and run_history_max_rows configuration variables."""
+
+    def test_defaults_env(self, monkeypatch):
+        """Test retention defaults when not set in env."""
+        monkeypatch.setenv("GITHUB_TOKEN", "test_token")
+        monkeypatch.setenv("PROJECT_URLS", "https://github.com/orgs/test/projects/1")
+        monkeypatch.setenv("USERNAME_SELF", "testuser")
+        monkeypatch.delenv("RUN_HISTORY_RETENTION_DAYS", raising=False)
+        monkeypatch.delenv("RUN_HISTORY_MAX_ROWS", raising=False)
+
+        config = load_config_from_env()
+
+        assert config.run_history_retention_days == 90
+        assert config.run_history_max_rows == 50000
+
+    def test_custom_file(self, tmp_path, monkeypatch):
+        """Test retention can be set via config file."""
+        config_file = tmp_path / "config"
+        config_file.write_text(
+            "GITHUB_TOKEN=ghp_test\n"
+            "PROJECT_URLS=https://github.com/orgs/test/projects/1\n"
+            "USERNAME_SELF=testuser\n"
+            "RUN_HISTORY_RETENTION_DAYS=30\n"
+            "RUN_HISTORY_MAX_ROWS=0"
+        )
+        monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+
+        config = load_config_from_file(config_file)
+
+        assert config.run_history_retention_days == 30
+        assert config.run_history_max_rows == 0
+
+
+@pytest.mark.unit
+class TestWorktreePoolConfiguration:
+    """Tests for worktree_pool_size configuration variable."""
+
+    def test_defaults_env(self, monkeypatch):
+        """Test worktree_pool_size defaults to 2 when not set in env."""
+        monkeypatch.setenv("GITHUB_TOKEN", "test_token")
+        monkeypatch.setenv("PROJECT_URLS", "https://github.com/orgs/test/projects/1")
+        monkeypatch.setenv("USERNAME_SELF", "testuser")
+        monkeypatch.delenv("WORKTREE_POOL_SIZE", raising=False)
+
+        config = load_config_from_env()
+
+        assert config.worktree_pool_size == 2
+
+    def test_custom_file(self, tmp_path, monkeypatch):
+        """Test worktree_pool_size can be set via config file."""
+        config_file = tmp_path / "config"
+        config_file.write_text(
+            "GITHUB_TOKEN=ghp_test\n"
+            "PROJECT_URLS=https://github.com/orgs/test/projects/1\n"
+            "USERNAME_SELF=testuser\n"
+            "WORKTREE_POOL_SIZE=0"
+        )
+        monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+
+        config = load_config_from_file(config_file)
+
+        assert config.worktree_pool_size == 0
+
+
+@pytest.mark.unit
+class TestGitFetchTtlConfiguration:
+    """Tests for git_fetch_ttl configuration variable."""
+
+    def test_defaults_env(self, monkeypatch):
+        """Test git_fetch_ttl defaults to 30 when not set in env."""
+        monkeypatch.setenv("GITHUB_TOKEN", "test_token")
+        monkeypatch.setenv("PROJECT_URLS", "https://github.com/orgs/test/projects/1")
+        monkeypatch.setenv("USERNAME_SELF", "testuser")
+        monkeypatch.delenv("GIT_FETCH_TTL", raising=False)
+
+        config = load_config_from_env()
+
+        assert config.git_fetch_ttl == 30
+
+    def test_custom_file(self, tmp_path, monkeypatch):
+        """Test git_fetch_ttl can be set via config file."""
+        config_file = tmp_path / "config"
+        config_file.write_text(
+            "GITHUB_TOKEN=ghp_test\n"
+            "PROJECT_URLS=https://github.com/orgs/test/projects/1\n"
+            "USERNAME_SELF=testuser\n"
+            "GIT_FETCH_TTL=0"
+        )
+        monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+
+        config = load_config_from_file(config_file)
+
+        assert config.git_fetch_ttl == 0
+
+
+@pytest.mark.unit
+class TestCloneStrategiesConfiguration:
+    """Tests for clone_strategies configuration variable."""
+
+    def test_defaults_env(self, monkeypatch):
+        """Test clone_strategies is empty when not set in env."""
+        monkeypatch.setenv("GITHUB_TOKEN", "test_token")
+        monkeypatch.setenv("PROJECT_URLS", "https://github.com/orgs/test/projects/1")
+        monkeypatch.setenv("USERNAME_SELF", "testuser")
+        monkeypatch.delenv("CLONE_STRATEGIES", raising=False)
+
+        config = load_config_from_env()
+
+        assert config.clone_strategies == {}
+
+    def test_custom_file(self, tmp_path, monkeypatch):
+        """Test clone_strategies can be set via config file."""
+        config_file = tmp_path / "config"
+        config_file.write_text(
+            "GITHUB_TOKEN=ghp_test\n"
+            "PROJECT_URLS=https://github.com/orgs/test/projects/1\n"
+            "USERNAME_SELF=testuser\n"
+            "CLONE_STRATEGIES=github.com/org/mono partial sparse=services/api/,libs "
+            "shallow-since=2024-01-01; github.com/org/other partial"
+        )
+        monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+
+        config = load_config_from_file(config_file)
+
+        assert config.clone_strategies == {
+            "github.com/org/mono": CloneStrategy(
+                partial=True, sparse_paths=["services/api", "libs"], shallow_since="2024-01-01"
+            ),
+            "github.com/org/other": CloneStrategy(partial=True),
+        }
+
+    def test_invalid_option_raises(self):
+        """Test an unknown option is rejected."""
+        with pytest.raises(ValueError, match="Invalid CLONE_STRATEGIES option 'depth=1'"):
+            parse_clone_strategies("github.com/org/mono depth=1")
+
+    def test_entry_without_options_raises(self):
+        """Test a repository without options is rejected."""
+        with pytest.raises(ValueError, match="has no options"):
+            parse_clone_strategies("github.com/org/mono")
+
+
+@pytest.mark.unit
+class TestWakePortConfiguration:
+    """Tests for wake_port configuration variable."""
+
+    def test_defaults_env(self, monkeypatch):
+        """Test wake_port defaults to 0 (disabled) when not set in env."""
+        monkeypatch.setenv("GITHUB_TOKEN", "test_token")
+        monkeypatch.setenv("PROJECT_URLS", "https://github.com/orgs/test/projects/1")
+        monkeypatch.setenv("USERNAME_SELF", "testuser")
+        monkeypatch.delenv("WAKE_PORT", raising=False)
+
+        config = load_config_from_env()
+
+        assert config.wake_port == 0
+
+    def test_custom_file(self, tmp_path, monkeypatch):
+        """Test wake_port can be set via config file."""
+        config_file = tmp_path / "config"
+        config_file.write_text(
+            "GITHUB_TOKEN=ghp_test\n"
+            "PROJECT_URLS=https://github.com/orgs/test/projects/1\n"
+            "USERNAME_SELF=testuser\n"
+            "WAKE_PORT=8765"
+        )
+        monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+
+        config = load_config_from_file(config_file)
+
+        assert config.wake_port == 8765
+
+
+@pytest.mark.unit
+class TestLaneConcurrencyConfiguration:
+    """Tests for lane_concurrency configuration variable."""
+
+    def test_defaults_env(self, monkeypatch):
+        """Test lane_concurrency is empty when not set in env."""
+        monkeypatch.setenv("GITHUB_TOKEN", "test_token")
+        monkeypatch.setenv("PROJECT_URLS", "https://github.com/orgs/test/projects/1")
+        monkeypatch.setenv("USERNAME_SELF", "testuser")
+        monkeypatch.delenv("LANE_CONCURRENCY", raising=False)
+
+        config = load_config_from_env()
+
+        assert config.lane_concurrency == {}
+
+    def test_custom_file(self, tmp_path, monkeypatch):
+        """Test lane_concurrency can be set via config file."""
+        config_file = tmp_path / "config"
+        config_file.write_text(
+            "GITHUB_TOKEN=ghp_test\n"
+            "PROJECT_URLS=https://github.com/orgs/test/projects/1\n"
+            "USERNAME_SELF=testuser\n"
+            "LANE_CONCURRENCY=implement=2, comments=4"
+        )
+        monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+
+        config = load_config_from_file(config_file)
+
+        assert config.lane_concurrency == {"implement": 2, "comments": 4}
+
+    @pytest.mark.parametrize("value", ["deploy=2", "implement=0", "implement=x", "implement"])
+    def test_invalid_entry_raises(self, value):
+        """Test unknown lanes and non-positive caps are rejected."""
+        with pytest.raises(ValueError, match="LANE_CONCURRENCY"):
+            parse_lane_concurrency(value)
+
+    def test_max_suspended_workflows(self, monkeypatch):
+        """Test max_suspended_workflows defaults to 8 and can be set in env."""
+        monkeypatch.setenv("GITHUB_TOKEN", "test_token")
+        monkeypatch.setenv("PROJECT_URLS", "https://github.com/orgs/test/projects/1")
+        monkeypatch.setenv("USERNAME_SELF", "testuser")
+        monkeypatch.delenv("MAX_SUSPENDED_WORKFLOWS", raising=False)
+        assert load_config_from_env().max_suspended_workflows == 8
+
+        monkeypatch.setenv("MAX_SUSPENDED_WORKFLOWS", "20")
+        assert load_config_from_env().max_suspended_workflows == 20
@@ -29,6 +29,9 @@ def daemon(temp_workspace_dir):
     config.project_urls = ["https://github.com/orgs/test/projects/1"]
 
     config.github_enterprise_version = None
+    config.github_http_transport = False
+    config.wake_port = 0
+    config.max_suspended_workflows = 8
     config.username_self = "test-bot"
 
     with patch("src.ticket_clients.github.GitHubTicketClient"):
@@ -236,6 +239,23 @@ class TestMaybeArchiveClosedLazyLoading:
         # Verify archive was NOT called
         daemon.ticket_client.archive_item.assert_not_called()
 
+    def test_failed_archive_is_retried_next_poll(self, daemon):
+        """Test that an item whose archive call fails is re-evaluated on the next poll."""
+        item = make_closed_ticket_item()
+        daemon._project_metadata = {
+            item.board_url: ProjectMetadata(
+                project_url=item.board_url,
+                repo="test-org/test-repo",
+                project_id="PVT_proj123",
+            )
+        }
+        daemon.ticket_client.archive_item.return_value = False
+
+        with patch.object(daemon.board_snapshot, "mark_dirty") as mock_dirty:
+            daemon._maybe_archive_closed(item)
+
+        mock_dirty.assert_called_once_with("github.com/test-org/test-repo", 42)
+
     def test_open_issue_not_processed(self, daemon):
         """Test that open issues are not processed for archiving."""
         item = TicketItem(
@@ -27,6 +27,9 @@ def daemon(temp_workspace_dir):
     config.project_urls = ["https://github.com/orgs/test/projects/1"]
 
     config.github_enterprise_version = None
+    config.github_http_transport = False
+    config.wake_port = 0
+    config.max_suspended_workflows = 8
     config.username_self = "test-bot"
 
     with patch("src.ticket_clients.github.GitHubTicketClient"):
@@ -142,9 +145,12 @@ class TestMaybeSetBacklog:
         daemon.ticket_client.update_item_status.side_effect = Exception("API Error")
 
         # Should not raise - errors are logged but don't crash
-        daemon._maybe_set_backlog(item)
+        with patch.object(daemon.board_snapshot, "mark_dirty") as mock_dirty:
+            daemon._maybe_set_backlog(item)
 
         daemon.ticket_client.update_item_status.assert_called_once()
+        # Retried on the next poll
+        mock_dirty.assert_called_once_with("github.com/test-org/test-repo", 42)
 
     def test_enterprise_hostname_extracted_correctly(self, daemon):
         """Test that the hostname is correctly extracted for enterprise URLs."""
@@ -11,7 +11,7 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from src.daemon import Daemon
-from src.interfaces.ticket import LinkedPullRequest
+from src.interfaces.ticket import LinkedPullRequest, TicketItem
 
 
 @pytest.fixture
@@ -26,6 +26,9 @@ def daemon(temp_workspace_dir):
     config.project_urls = ["https://github.com/orgs/test/projects/1"]
 
     config.github_enterprise_version = None
+    config.github_http_transport = False
+    config.wake_port = 0
+    config.max_suspended_workflows = 8
     config.username_self = "test-bot"
 
     with patch("src.ticket_clients.github.GitHubTicketClient"):
@@ -268,3 +271,49 @@ YAML list syntax for blocked_by.
 
         result = daemon._is_blocked_by_unmerged_issues(mock_item)
         assert result == (True, [115, 116])
+
+    def test_blockers_queued_for_batched_lookup(self, daemon, mock_item):
+        """Test all blockers are queued so their linked PRs share one batched query."""
+        daemon.ticket_client.get_ticket_body.return_value = """```
+blocked_by: [115, 116]
+```
+"""
+        daemon.ticket_client.get_linked_prs.return_value = []
+
+        daemon._is_blocked_by_unmerged_issues(mock_item)
+
+        daemon.ticket_client.queue_issue_lookups.assert_called_once_with(
+            [(mock_item.repo, 115), (mock_item.repo, 116)]
+        )
+
+
+@pytest.mark.unit
+class TestBatchLookupCandidates:
+    """Tests for _batch_lookup_candidates method."""
+
+    def _item(self, ticket_id, status, labels=None, state="OPEN"):
+        return TicketItem(
+            item_id=f"PVTI_{ticket_id}",
+            board_url="https://github.com/orgs/test-org/projects/1",
+            ticket_id=ticket_id,
+            repo="github.com/test-org/test-repo",
+            status=status,
+            title=f"Issue {ticket_id}",
+            labels=labels or set(),
+            state=state,
+        )
+
+    def test_selects_watched_and_labelled_open_items(self, daemon):
+        """Test open items in watched statuses or with actor-checked labels are selected."""
+        items = [
+            self._item(1, "Research"),
+            self._item(2, "Backlog"),
+            self._item(3, "Backlog", labels={"yolo"}),
+            self._item(4, "Validate", labels={"reset"}),
+            self._item(5, "Done", labels={"stop"}),
+            self._item(6, "Implement", state="CLOSED"),
+        ]
+
+        candidates = daemon._batch_lookup_candidates(items)
+
+        assert [ticket_id for _, ticket_id in candidates] == [1, 3, 4, 5]
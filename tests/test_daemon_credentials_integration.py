@@ -50,6 +50,9 @@ def base_config(temp_workspace_dir):
     config.project_urls = ["https://github.com/orgs/test/projects/1"]
 
     config.github_enterprise_version = None
+    config.github_http_transport = False
+    config.wake_port = 0
+    config.max_suspended_workflows = 8
     config.github_enterprise_host = None
     config.github_token = None
     config.github_enterprise_token = None
@@ -77,6 +80,9 @@ def daemon_for_workflow(temp_workspace_dir):
     config.project_urls = ["https://github.com/orgs/test/projects/1"]
 
     config.github_enterprise_version = None
+    config.github_http_transport = False
+    config.wake_port = 0
+    config.max_suspended_workflows = 8
     config.username_self = "test-bot"
     config.ghes_logs_mask = False
     config.github_enterprise_host = None
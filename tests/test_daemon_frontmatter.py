@@ -5,6 +5,7 @@ These tests verify that the daemon correctly:
 - Uses explicit feature_branch when set
 - Skips parent PR lookup when feature_branch is set
 - Falls back to parent detection when no feature_branch
+- Creates the worktree on the resolved base branch, falling back to PrepareWorkflow
 """
 
 from unittest.mock import MagicMock, patch
@@ -12,6 +13,7 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from src.daemon import Daemon
+from src.workspace import WorkspaceError
 
 
 @pytest.fixture
@@ -26,12 +28,16 @@ def daemon(temp_workspace_dir):
     config.project_urls = ["https://github.com/orgs/test/projects/1"]
 
     config.github_enterprise_version = None
+    config.github_http_transport = False
+    config.wake_port = 0
+    config.max_suspended_workflows = 8
     config.username_self = "test-bot"
 
     with patch("src.ticket_clients.github.GitHubTicketClient"):
         daemon = Daemon(config)
         daemon.ticket_client = MagicMock()
         daemon.runner = MagicMock()
+        daemon.workspace_manager.claim_worktree = MagicMock()
         yield daemon
         daemon.stop()
 
@@ -117,8 +123,8 @@ No feature_branch setting.
             # Should call _get_parent_pr_info since no feature_branch
             mock_get_parent.assert_called_once()
 
-    def test_feature_branch_passed_to_workflow_context(self, daemon, mock_item):
-        """Test that feature_branch is passed as parent_branch in context."""
+    def test_feature_branch_used_as_worktree_base(self, daemon, mock_item):
+        """Test that feature_branch is the base of the claimed worktree."""
         issue_body = """```
 feature_branch: release/v2.0
 ```
@@ -129,16 +135,51 @@ Issue description.
 
         daemon._auto_prepare_worktree(mock_item)
 
+        daemon.workspace_manager.claim_worktree.assert_called_once_with(
+            "https://github.com/test-org/test-repo.git",
+            mock_item.repo,
+            42,
+            "42-test-issue",
+            base_branch="release/v2.0",
+        )
+        daemon.runner.run.assert_not_called()
+
+    def test_parent_branch_from_parent_issue_used_as_worktree_base(self, daemon, mock_item):
+        """Test that parent branch from parent issue is the base of the claimed worktree."""
+        issue_body = "No frontmatter"
+        daemon.ticket_client.get_ticket_body.return_value = issue_body
+
+        with patch.object(daemon, "_get_parent_pr_info") as mock_get_parent:
+            mock_get_parent.return_value = (99, "parent-pr-branch")
+            daemon._auto_prepare_worktree(mock_item)
+
+        call_kwargs = daemon.workspace_manager.claim_worktree.call_args.kwargs
+        assert call_kwargs["base_branch"] == "parent-pr-branch"
+
+    def test_feature_branch_passed_to_prepare_workflow_on_fallback(self, daemon, mock_item):
+        """Test that feature_branch is passed as parent_branch when PrepareWorkflow runs."""
+        issue_body = """```
+feature_branch: release/v2.0
+```
+
+Issue description.
+"""
+        daemon.ticket_client.get_ticket_body.return_value = issue_body
+        daemon.workspace_manager.claim_worktree.side_effect = WorkspaceError("clone failed")
+
+        daemon._auto_prepare_worktree(mock_item)
+
         # Check the context passed to runner.run()
         call_args = daemon.runner.run.call_args
         ctx = call_args[0][1]  # Second positional argument is the context
         assert ctx.parent_branch == "release/v2.0"
         assert ctx.parent_issue_number is None  # Should be None for explicit feature_branch
 
-    def test_parent_branch_from_parent_issue_passed_to_context(self, daemon, mock_item):
-        """Test that parent branch from parent issue is passed correctly."""
+    def test_parent_branch_from_parent_issue_passed_to_context_on_fallback(self, daemon, mock_item):
+        """Test that parent branch from parent issue is passed to PrepareWorkflow."""
         issue_body = "No frontmatter"
         daemon.ticket_client.get_ticket_body.return_value = issue_body
+        daemon.workspace_manager.claim_worktree.side_effect = WorkspaceError("clone failed")
 
         with patch.object(daemon, "_get_parent_pr_info") as mock_get_parent:
             mock_get_parent.return_value = (99, "parent-pr-branch")
@@ -191,7 +232,8 @@ class TestDaemonFrontmatterIntegrationTests:
         2. Frontmatter is parsed correctly
         3. feature_branch is extracted
         4. _get_parent_pr_info is NOT called
-        5. PrepareWorkflow is invoked with correct context
+        5. PrepareWorkflow is invoked with correct context when the worktree
+           can't be created directly
         """
         issue_body = """```
 feature_branch: release/v2.0
@@ -202,6 +244,7 @@ feature_branch: release/v2.0
 This is an issue that should branch from release/v2.0.
 """
         daemon.ticket_client.get_ticket_body.return_value = issue_body
+        daemon.workspace_manager.claim_worktree.side_effect = WorkspaceError("clone failed")
 
         with patch.object(daemon, "_get_parent_pr_info") as mock_get_parent:
             daemon._auto_prepare_worktree(mock_item)
@@ -238,6 +281,7 @@ feature_branch: develop
 Description with explicit feature branch.
 """
         daemon.ticket_client.get_ticket_body.return_value = issue_body
+        daemon.workspace_manager.claim_worktree.side_effect = WorkspaceError("clone failed")
 
         # Setup a mock that would return parent info if called
         with patch.object(daemon, "_get_parent_pr_info") as mock_get_parent:
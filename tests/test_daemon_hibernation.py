@@ -26,6 +26,9 @@ def daemon(temp_workspace_dir):
     config.project_urls = ["https://github.com/orgs/test/projects/1"]
 
     config.github_enterprise_version = None
+    config.github_http_transport = False
+    config.wake_port = 0
+    config.max_suspended_workflows = 8
 
     with patch("src.ticket_clients.github.GitHubTicketClient"):
         daemon = Daemon(config)
@@ -27,6 +27,9 @@ def config_with_azure():
     config.project_urls = ["https://github.com/orgs/test/projects/1"]
 
     config.github_enterprise_version = None
+    config.github_http_transport = False
+    config.wake_port = 0
+    config.max_suspended_workflows = 8
     config.github_enterprise_host = None
     config.github_token = None
     config.github_enterprise_token = None
@@ -54,6 +57,9 @@ def config_without_azure():
     config.project_urls = ["https://github.com/orgs/test/projects/1"]
 
     config.github_enterprise_version = None
+    config.github_http_transport = False
+    config.wake_port = 0
+    config.max_suspended_workflows = 8
     config.github_enterprise_host = None
     config.github_token = None
     config.github_enterprise_token = None
@@ -348,6 +354,9 @@ class TestDaemonMCPStartupLogging:
         config.project_urls = ["https://github.com/orgs/test/projects/1"]
 
         config.github_enterprise_version = None
+        config.github_http_transport = False
+        config.wake_port = 0
+        config.max_suspended_workflows = 8
         config.github_enterprise_host = None
         config.github_token = None
         config.github_enterprise_token = None
@@ -383,7 +392,9 @@ class TestDaemonMCPStartupLogging:
 
         with (
             patch("src.ticket_clients.github.GitHubTicketClient"),
-            patch("src.daemon.check_all_mcp_servers", return_value=mock_results) as mock_check,
+            patch(
+                "src.integrations.mcp_client.check_all_mcp_servers", return_value=mock_results
+            ) as mock_check,
             patch("src.daemon.logger") as mock_logger,
         ):
             daemon = Daemon(base_config)
@@ -425,7 +436,7 @@ class TestDaemonMCPStartupLogging:
 
         with (
             patch("src.ticket_clients.github.GitHubTicketClient"),
-            patch("src.daemon.check_all_mcp_servers", return_value=mock_results),
+            patch("src.integrations.mcp_client.check_all_mcp_servers", return_value=mock_results),
             patch("src.daemon.logger") as mock_logger,
         ):
             daemon = Daemon(base_config)
@@ -465,7 +476,7 @@ class TestDaemonMCPStartupLogging:
 
         with (
             patch("src.ticket_clients.github.GitHubTicketClient"),
-            patch("src.daemon.check_all_mcp_servers", return_value=mock_results),
+            patch("src.integrations.mcp_client.check_all_mcp_servers", return_value=mock_results),
             patch("src.daemon.logger") as mock_logger,
         ):
             daemon = Daemon(base_config)
@@ -490,7 +501,7 @@ class TestDaemonMCPStartupLogging:
         """Test that daemon doesn't call check_all_mcp_servers when no MCP config."""
         with (
             patch("src.ticket_clients.github.GitHubTicketClient"),
-            patch("src.daemon.check_all_mcp_servers") as mock_check,
+            patch("src.integrations.mcp_client.check_all_mcp_servers") as mock_check,
             patch("src.daemon.MCPConfigManager") as mock_mcp_class,
         ):
             mock_mcp_instance = MagicMock()
@@ -520,7 +531,7 @@ class TestDaemonMCPStartupLogging:
 
         with (
             patch("src.ticket_clients.github.GitHubTicketClient"),
-            patch("src.daemon.check_all_mcp_servers", return_value=mock_results),
+            patch("src.integrations.mcp_client.check_all_mcp_servers", return_value=mock_results),
             patch("src.daemon.logger") as mock_logger,
         ):
             daemon = Daemon(base_config)
@@ -551,7 +562,7 @@ class TestDaemonMCPStartupLogging:
 
         with (
             patch("src.ticket_clients.github.GitHubTicketClient"),
-            patch("src.daemon.check_all_mcp_servers", return_value=mock_results),
+            patch("src.integrations.mcp_client.check_all_mcp_servers", return_value=mock_results),
             patch("src.daemon.logger") as mock_logger,
         ):
             daemon = Daemon(base_config)
@@ -584,7 +595,7 @@ class TestDaemonMCPStartupLogging:
 
         with (
             patch("src.ticket_clients.github.GitHubTicketClient"),
-            patch("src.daemon.check_all_mcp_servers", return_value=mock_results),
+            patch("src.integrations.mcp_client.check_all_mcp_servers", return_value=mock_results),
             patch("src.daemon.logger"),
         ):
             # Daemon should initialize successfully despite all MCP failures
@@ -605,7 +616,7 @@ class TestDaemonMCPStartupLogging:
 
         with (
             patch("src.ticket_clients.github.GitHubTicketClient"),
-            patch("src.daemon.check_all_mcp_servers", return_value=mock_results),
+            patch("src.integrations.mcp_client.check_all_mcp_servers", return_value=mock_results),
             patch("src.daemon.logger") as mock_logger,
         ):
             daemon = Daemon(base_config)
@@ -0,0 +1,548 @@
+"""Unit tests for the Daemon poll handler pipeline.
+
+These tests verify that the daemon:
+- Runs the side-effect handlers for each item in order on the poll I/O pool
+- Runs lookup-dependent handlers on the poll thread
+- Waits for side effects before finishing the poll
+- Re-evaluates items whose side effects failed, and hibernates on NetworkError
+"""
+
+import threading
+import time
+from dataclasses import replace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.daemon import Daemon
+from src.interfaces.ticket import TicketItem
+from src.logger import LogQueueStats
+from src.ticket_clients.base import NetworkError
+from src.wake_channel import WakeChannel
+
+
+@pytest.fixture
+def daemon(temp_workspace_dir):
+    """Fixture providing Daemon with mocked dependencies."""
+    config = MagicMock()
+    config.poll_interval = 60
+    config.watched_statuses = ["Research", "Plan", "Implement"]
+    config.max_concurrent_workflows = 2
+    config.database_path = f"{temp_workspace_dir}/test.db"
+    config.workspace_dir = temp_workspace_dir
+    config.project_urls = ["https://github.com/orgs/test/projects/1"]
+
+    config.github_enterprise_version = None
+    config.github_http_transport = False
+    config.wake_port = 0
+    config.max_suspended_workflows = 8
+    config.username_self = "test-bot"
+
+    with patch("src.ticket_clients.github.GitHubTicketClient"):
+        daemon = Daemon(config)
+        daemon.ticket_client = MagicMock()
+        daemon.runner = MagicMock()
+        yield daemon
+        daemon.stop()
+
+
+def make_ticket_item(ticket_id: int, status: str = "Backlog", labels=None) -> TicketItem:
+    """Helper to create a TicketItem for testing."""
+    return TicketItem(
+        item_id=f"PVTI_{ticket_id}",
+        board_url="https://github.com/orgs/test-org/projects/1",
+        ticket_id=ticket_id,
+        repo="github.com/test-org/test-repo",
+        status=status,
+        title=f"Issue {ticket_id}",
+        labels=set(labels or ()),
+        state="OPEN",
+        state_reason=None,
+        has_merged_changes=False,
+        comment_count=0,
+    )
+
+
+IO_HANDLERS = [
+    "_maybe_cleanup_done",
+    "_maybe_archive_closed",
+    "_maybe_cleanup_closed",
+    "_maybe_move_to_done",
+    "_maybe_set_backlog",
+]
+POLL_THREAD_HANDLERS = ["_maybe_start_yolo", "_maybe_handle_reset", "_maybe_handle_stop"]
+
+
+def run_poll(daemon, items, **handler_side_effects):
+    """Run one poll with every handler patched to record its calls.
+
+    handler_side_effects maps handler names to an exception to raise, or a
+    callable to run before the call is recorded.
+
+    Returns:
+        List of (handler_name, ticket_id, thread_name) tuples in call order
+    """
+    calls = []
+    lock = threading.Lock()
+
+    def recorder(name):
+        def record(item):
+            effect = handler_side_effects.get(name)
+            if callable(effect) and not isinstance(effect, BaseException):
+                effect()
+            with lock:
+                calls.append((name, item.ticket_id, threading.current_thread().name))
+            if isinstance(effect, BaseException):
+                raise effect
+
+        return record
+
+    daemon.ticket_client.get_board_items.return_value = items
+    patches = [
+        patch.object(daemon, name, side_effect=recorder(name))
+        for name in IO_HANDLERS + POLL_THREAD_HANDLERS
+    ]
+    patches += [
+        patch.object(daemon, "_might_have_new_comments", return_value=False),
+        patch.object(daemon, "_should_trigger_workflow", return_value=False),
+        patch.object(daemon, "_should_yolo_advance", return_value=False),
+        patch.object(daemon, "_poll_merge_queue"),
+    ]
+    for p in patches:
+        p.start()
+    try:
+        daemon._poll()
+    finally:
+        for p in patches:
+            p.stop()
+    return calls
+
+
+@pytest.mark.unit
+class TestPollPipeline:
+    """Tests for the single-pass poll handler pipeline."""
+
+    def test_io_handlers_run_in_order_per_item_on_pool(self, daemon):
+        """Test each item's side-effect handlers run in order on pool threads."""
+        items = [make_ticket_item(n) for n in range(1, 6)]
+
+        calls = run_poll(daemon, items)
+
+        for item in items:
+            io_calls = [c for c in calls if c[1] == item.ticket_id and c[0] in IO_HANDLERS]
+            assert [c[0] for c in io_calls] == IO_HANDLERS
+            assert all(c[2].startswith("poll-io-") for c in io_calls)
+
+    def test_lookup_handlers_run_on_poll_thread(self, daemon):
+        """Test lookup-dependent handlers stay on the poll thread in order."""
+        items = [make_ticket_item(1)]
+        poll_thread = threading.current_thread().name
+
+        calls = run_poll(daemon, items)
+
+        thread_calls = [c for c in calls if c[0] in POLL_THREAD_HANDLERS]
+        assert [c[0] for c in thread_calls] == POLL_THREAD_HANDLERS
+        assert all(c[2] == poll_thread for c in thread_calls)
+
+    @pytest.mark.parametrize("label", ["reset", "stop"])
+    def test_reset_and_stop_wait_for_item_side_effects(self, daemon, label):
+        """Test reset/stop run only after the same item's queued side effects."""
+        items = [make_ticket_item(1, labels={label})]
+
+        calls = run_poll(daemon, items, _maybe_cleanup_done=lambda: time.sleep(0.2))
+
+        names = [c[0] for c in calls]
+        assert names.index("_maybe_handle_reset") > names.index("_maybe_set_backlog")
+
+    def test_poll_waits_for_side_effects(self, daemon):
+        """Test every side effect has finished when the poll returns."""
+        items = [make_ticket_item(n) for n in range(1, 11)]
+
+        calls = run_poll(daemon, items)
+
+        assert len([c for c in calls if c[0] in IO_HANDLERS]) == len(items) * len(IO_HANDLERS)
+        assert daemon._poll_io_futures == {}
+
+    def test_failed_side_effect_marks_item_dirty(self, daemon):
+        """Test a failing handler is logged and its item re-evaluated next poll."""
+        items = [make_ticket_item(1)]
+
+        with patch.object(daemon.board_snapshot, "mark_dirty") as mock_dirty:
+            calls = run_poll(daemon, items, _maybe_archive_closed=RuntimeError("boom"))
+
+        mock_dirty.assert_called_once_with("github.com/test-org/test-repo", 1)
+        # Later handlers for the same item are skipped after a failure
+        assert "_maybe_move_to_done" not in [c[0] for c in calls]
+
+    def test_failed_move_to_done_marks_item_dirty(self, daemon):
+        """Test a status update the handler swallows is retried on the next poll."""
+        item = replace(
+            make_ticket_item(1),
+            state="CLOSED",
+            state_reason="COMPLETED",
+            has_merged_changes=True,
+        )
+        daemon.ticket_client.update_item_status.side_effect = RuntimeError("boom")
+
+        with patch.object(daemon.board_snapshot, "mark_dirty") as mock_dirty:
+            daemon._maybe_move_to_done(item)
+
+        mock_dirty.assert_called_once_with("github.com/test-org/test-repo", 1)
+
+    def test_network_error_in_side_effect_is_raised(self, daemon):
+        """Test a NetworkError from the pool surfaces so the daemon hibernates."""
+        items = [make_ticket_item(1), make_ticket_item(2)]
+
+        with pytest.raises(NetworkError):
+            run_poll(daemon, items, _maybe_set_backlog=NetworkError("offline"))
+
+    def test_issue_states_prefetched_once_per_poll(self, daemon):
+        """Test stored states of all board items are loaded in one bulk read."""
+        daemon.database.update_issue_state("github.com/test-org/test-repo", 1, "Backlog")
+        items = [make_ticket_item(n) for n in range(1, 4)]
+
+        with patch.object(
+            daemon.database, "get_issue_states_bulk", wraps=daemon.database.get_issue_states_bulk
+        ) as bulk:
+            run_poll(daemon, items)
+
+        bulk.assert_called_once()
+        with patch.object(daemon.database, "_select_issue_state") as select:
+            assert daemon.database.get_issue_state("github.com/test-org/test-repo", 1) is not None
+            assert daemon.database.get_issue_state("github.com/test-org/test-repo", 2) is None
+        select.assert_not_called()
+
+
+@pytest.mark.unit
+class TestMaybeStartYolo:
+    """Tests for moving yolo Backlog items to Research."""
+
+    def test_status_update_runs_on_io_pool(self, daemon):
+        """Test the Backlog→Research move is applied by the I/O pool."""
+        item = make_ticket_item(7, labels={"yolo"})
+        daemon.ticket_client.get_ticket_labels.return_value = {"yolo"}
+        daemon.ticket_client.get_label_actor.return_value = "test-bot"
+
+        daemon._maybe_start_yolo(item)
+        daemon._wait_for_item_io()
+
+        daemon.ticket_client.update_item_status.assert_called_once_with(
+            "PVTI_7", "Research", hostname="github.com"
+        )
+
+    def test_skips_when_label_added_by_other_user(self, daemon):
+        """Test no status change when the yolo label was added by someone else."""
+        item = make_ticket_item(7, labels={"yolo"})
+        daemon.ticket_client.get_ticket_labels.return_value = {"yolo"}
+        daemon.ticket_client.get_label_actor.return_value = "someone-else"
+
+        daemon._maybe_start_yolo(item)
+        daemon._wait_for_item_io()
+
+        daemon.ticket_client.update_item_status.assert_not_called()
+
+    def test_skips_items_not_in_backlog(self, daemon):
+        """Test items outside Backlog are left alone."""
+        item = make_ticket_item(7, status="Research", labels={"yolo"})
+
+        daemon._maybe_start_yolo(item)
+
+        daemon.ticket_client.get_ticket_labels.assert_not_called()
+        assert daemon._poll_io_futures == {}
+
+
+@pytest.mark.unit
+class TestFetchBoardItems:
+    """Tests for concurrent project board fetching."""
+
+    def test_items_keep_project_order(self, daemon):
+        """Test items are returned in config order regardless of completion order."""
+        daemon.config.project_urls = [
+            "https://github.com/orgs/a/projects/1",
+            "https://github.com/orgs/b/projects/2",
+        ]
+        daemon.config.board_fetch_concurrency_per_host = 2
+        first_done = threading.Event()
+
+        def get_board_items(url):
+            if url.endswith("/1"):
+                # Finish after the second board
+                first_done.wait(timeout=5)
+                return [make_ticket_item(1)]
+            first_done.set()
+            return [make_ticket_item(2)]
+
+        daemon.ticket_client.get_board_items.side_effect = get_board_items
+
+        items = daemon._fetch_board_items()
+
+        assert [i.ticket_id for i in items] == [1, 2]
+
+    def test_failed_board_is_skipped(self, daemon):
+        """Test a board that fails to fetch doesn't drop the other boards."""
+        daemon.config.project_urls = [
+            "https://github.com/orgs/a/projects/1",
+            "https://github.com/orgs/b/projects/2",
+        ]
+        daemon.config.board_fetch_concurrency_per_host = 2
+
+        def get_board_items(url):
+            if url.endswith("/1"):
+                raise RuntimeError("boom")
+            return [make_ticket_item(2)]
+
+        daemon.ticket_client.get_board_items.side_effect = get_board_items
+
+        items = daemon._fetch_board_items()
+
+        assert [i.ticket_id for i in items] == [2]
+
+    def test_boards_on_different_hosts_fetch_concurrently(self, daemon):
+        """Test boards on different hosts are fetched in parallel."""
+        daemon.config.project_urls = [
+            "https://github.com/orgs/a/projects/1",
+            "https://github.mycompany.com/orgs/b/projects/2",
+        ]
+        daemon.config.board_fetch_concurrency_per_host = 1
+        barrier = threading.Barrier(2, timeout=5)
+
+        def get_board_items(url):
+            barrier.wait()
+            return []
+
+        daemon.ticket_client.get_board_items.side_effect = get_board_items
+
+        # Both fetches must be in flight at once for the barrier to release
+        assert daemon._fetch_board_items() == []
+
+    def test_per_host_limit(self, daemon):
+        """Test no more than the per-host limit of fetches run at once on a host."""
+        daemon.config.project_urls = [f"https://github.com/orgs/a/projects/{n}" for n in range(6)]
+        daemon.config.board_fetch_concurrency_per_host = 2
+        lock = threading.Lock()
+        in_flight = 0
+        peak = 0
+
+        def get_board_items(url):
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.02)
+            with lock:
+                in_flight -= 1
+            return []
+
+        daemon.ticket_client.get_board_items.side_effect = get_board_items
+
+        daemon._fetch_board_items()
+
+        assert daemon.ticket_client.get_board_items.call_count == 6
+        assert peak == 2
+
+
+@pytest.mark.unit
+class TestRateLimitBudgeting:
+    """Tests for deferring work and stretching polls on a low rate-limit budget."""
+
+    def test_low_budget_defers_archive_and_cleanup(self, daemon):
+        """Test only high-priority side effects run while the host budget is low."""
+        items = [make_ticket_item(1)]
+
+        with (
+            patch.object(daemon.rate_budget, "is_low", return_value=True),
+            patch.object(daemon.board_snapshot, "mark_dirty") as mock_dirty,
+        ):
+            calls = run_poll(daemon, items)
+
+        assert [c[0] for c in calls if c[0] in IO_HANDLERS] == [
+            "_maybe_move_to_done",
+            "_maybe_set_backlog",
+        ]
+        mock_dirty.assert_called_once_with("github.com/test-org/test-repo", 1)
+
+    def test_next_poll_interval_defaults_to_config(self, daemon):
+        """Test the configured interval is used without rate-limit data."""
+        assert daemon._next_poll_interval() == 60
+
+    def test_next_poll_interval_uses_budget(self, daemon):
+        """Test a stretched interval from the budget is returned."""
+        with patch.object(daemon.rate_budget, "next_interval", return_value=300.0):
+            assert daemon._next_poll_interval() == 300.0
+
+    def test_next_poll_interval_refreshes_in_cli_mode(self, daemon):
+        """Test gh CLI mode reads rate limits for every project host once per cycle."""
+        daemon.http_transport = None
+
+        daemon._next_poll_interval()
+
+        daemon.ticket_client.refresh_rate_limits.assert_called_once_with("github.com")
+
+
+@pytest.mark.unit
+class TestRunHistoryRetention:
+    """Tests for the daemon's periodic run-history retention pass."""
+
+    def test_retention_applied_once_per_interval(self, daemon):
+        """Test retention runs on the first poll and then once per interval."""
+        daemon.config.run_history_retention_days = 30
+        daemon.config.run_history_max_rows = 1000
+
+        with patch.object(daemon.database, "apply_retention") as mock_apply:
+            daemon._maybe_apply_retention()
+            daemon._maybe_apply_retention()
+            daemon._last_retention_at -= daemon.RETENTION_INTERVAL
+            daemon._maybe_apply_retention()
+
+        assert mock_apply.call_count == 2
+        mock_apply.assert_called_with(30, 1000)
+
+    def test_retention_errors_are_logged(self, daemon):
+        """Test a failing retention pass doesn't propagate."""
+        with patch.object(daemon.database, "apply_retention", side_effect=RuntimeError("locked")):
+            daemon._maybe_apply_retention()
+
+        assert daemon._last_retention_at > 0
+
+    def test_vacuum_conversion_errors_are_logged(self, daemon):
+        """Test the startup auto_vacuum conversion doesn't stop the daemon."""
+        with patch.object(
+            daemon.database, "enable_incremental_vacuum", side_effect=RuntimeError("locked")
+        ) as mock_convert:
+            daemon._enable_incremental_vacuum()
+
+        mock_convert.assert_called_once()
+
+
+@pytest.mark.unit
+class TestWakeHints:
+    """Tests for targeted refreshes between polls."""
+
+    def test_hint_refreshes_only_named_items(self, daemon):
+        """Test a wake hint runs the handlers for the refreshed items only."""
+        daemon.wake_channel = WakeChannel(0)
+        daemon.wake_channel.notify({("github.com/test-org/test-repo", 2)})
+        daemon.ticket_client.get_board_items_for_issues.return_value = [make_ticket_item(2)]
+
+        with patch.object(daemon, "_process_board_items") as mock_process:
+            shutdown = daemon._wait_for_next_poll(0.2)
+
+        assert shutdown is False
+        daemon.ticket_client.get_board_items_for_issues.assert_called_once_with(
+            daemon.config.project_urls, [("github.com/test-org/test-repo", 2)]
+        )
+        mock_process.assert_called_once_with([make_ticket_item(2)], partial=True)
+
+    def test_full_hint_ends_the_wait(self, daemon):
+        daemon.wake_channel = WakeChannel(0)
+        daemon.wake_channel.notify(full=True)
+
+        start = time.monotonic()
+        assert daemon._wait_for_next_poll(30) is False
+        assert time.monotonic() - start < 5
+        daemon.ticket_client.get_board_items_for_issues.assert_not_called()
+
+    def test_failed_refresh_marks_items_dirty(self, daemon):
+        """Test the next full poll handles items whose refresh failed."""
+        daemon.ticket_client.get_board_items_for_issues.side_effect = NetworkError("down")
+
+        daemon._refresh_items({("github.com/test-org/test-repo", 3)})
+
+        change_set = daemon.board_snapshot.diff([make_ticket_item(3)])
+        assert change_set.changed == [make_ticket_item(3)]
+
+    def test_partial_refresh_skips_merge_queue(self, daemon):
+        with patch.object(daemon, "_poll_merge_queue") as mock_merge_queue:
+            daemon._process_board_items([], partial=True)
+
+        mock_merge_queue.assert_not_called()
+
+    def test_shutdown_interrupts_wait(self, daemon):
+        daemon.wake_channel = WakeChannel(0)
+        daemon._shutdown_event.set()
+        daemon.wake_channel.interrupt()
+
+        assert daemon._wait_for_next_poll(30) is True
+
+
+@pytest.mark.unit
+class TestCommentJobs:
+    """Tests for per-issue comment job coalescing."""
+
+    def test_polls_during_slow_comment_job_submit_once(self, daemon):
+        """Test repeated polls queue a single re-run instead of duplicate jobs."""
+        started = threading.Event()
+        release = threading.Event()
+        processed = []
+
+        def process(item):
+            processed.append(item.comment_count)
+            started.set()
+            release.wait(timeout=5)
+
+        daemon.comment_processor = MagicMock()
+        daemon.comment_processor.process.side_effect = process
+        item = make_ticket_item(1)
+
+        with patch.object(daemon, "_might_have_new_comments", return_value=True):
+            assert daemon.comment_jobs.submit(item) is True
+            assert started.wait(timeout=5)
+            for count in (1, 2, 3):
+                assert daemon.comment_jobs.submit(replace(item, comment_count=count)) is False
+            assert daemon.comment_jobs.stats().depth == 2
+            release.set()
+            daemon.lanes.shutdown()
+
+        assert processed == [0, 3]
+
+    def test_queue_depth_is_recorded(self, daemon):
+        with patch("src.daemon.record_queue_depth") as mock_record:
+            daemon._report_queue_metrics()
+
+        mock_record.assert_any_call("comments", 0)
+
+    def test_log_queue_drops_are_reported(self, daemon):
+        stats = LogQueueStats(queued=3, capacity=100, max_depth=100, dropped_records=5)
+        with (
+            patch("src.daemon.get_log_queue_stats", return_value=stats),
+            patch("src.daemon.record_queue_depth") as mock_record,
+            patch("src.daemon.logger") as mock_logger,
+        ):
+            daemon._report_queue_metrics()
+
+        mock_record.assert_any_call("log", 3)
+        assert "5 record(s) dropped" in mock_logger.warning.call_args.args[0]
+
+
+@pytest.mark.unit
+class TestWorkflowLanes:
+    """Tests for routing daemon work into lanes."""
+
+    def test_workflows_and_comments_use_their_lanes(self, daemon):
+        with patch.object(daemon.lanes, "submit") as mock_submit:
+            daemon._submit_workflow(daemon._process_item_workflow, make_ticket_item(1, "Implement"))
+            daemon._submit_workflow(daemon._process_item_workflow, make_ticket_item(2, "Plan"))
+            daemon.comment_jobs.submit(make_ticket_item(3, "Research"))
+
+        lanes = [c.args[0] for c in mock_submit.call_args_list]
+        assert lanes == ["implement", "research_plan", "comments"]
+        assert mock_submit.call_args_list[0].kwargs["repo"] == "github.com/test-org/test-repo"
+
+    def test_yolo_and_older_issues_first(self, daemon):
+        yolo = make_ticket_item(9, labels={"yolo"})
+        older = make_ticket_item(3)
+        newer = make_ticket_item(7)
+
+        ranked = sorted([newer, yolo, older], key=daemon._work_priority)
+
+        assert [item.ticket_id for item in ranked] == [9, 3, 7]
+
+    def test_lane_caps_default_to_max_concurrent_workflows(self, daemon):
+        stats = daemon.lanes.stats()
+
+        assert {lane: s.cap for lane, s in stats.items()} == {
+            "prepare": 2,
+            "research_plan": 2,
+            "implement": 2,
+            "comments": 2,
+        }
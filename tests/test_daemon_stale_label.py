@@ -28,6 +28,9 @@ def daemon(temp_workspace_dir):
     config.workspace_dir = temp_workspace_dir
     config.project_urls = ["https://github.com/orgs/test/projects/1"]
     config.github_enterprise_version = None
+    config.github_http_transport = False
+    config.wake_port = 0
+    config.max_suspended_workflows = 8
     config.username_self = "kiln-bot"
     config.team_usernames = []
 
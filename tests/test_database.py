@@ -1,8 +1,12 @@
 """Unit tests for the database module."""
 
+import sqlite3
 import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -548,3 +552,145 @@ class TestClearWorkflowSessionId:
         """Test that clearing session ID for non-existent issue is a no-op."""
         # Should not raise an error
         temp_db.clear_workflow_session_id("owner/repo", 999, "Research")
+
+
+@pytest.mark.unit
+class TestBoardSnapshot:
+    """Tests for board snapshot fingerprint persistence."""
+
+    def test_empty_snapshot(self, temp_db):
+        """Test a new database has no fingerprints."""
+        assert temp_db.get_board_snapshot() == {}
+
+    def test_update_and_get_snapshot(self, temp_db):
+        """Test fingerprints are upserted and read back."""
+        temp_db.update_board_snapshot({"PVTI_1": "aaa", "PVTI_2": "bbb"}, [])
+        temp_db.update_board_snapshot({"PVTI_1": "ccc"}, [])
+
+        assert temp_db.get_board_snapshot() == {"PVTI_1": "ccc", "PVTI_2": "bbb"}
+
+    def test_removed_items_are_deleted(self, temp_db):
+        """Test removed board items are deleted from the snapshot."""
+        temp_db.update_board_snapshot({"PVTI_1": "aaa", "PVTI_2": "bbb"}, [])
+        temp_db.update_board_snapshot({}, ["PVTI_1"])
+
+        assert temp_db.get_board_snapshot() == {"PVTI_2": "bbb"}
+
+
+@pytest.mark.unit
+class TestWriterThread:
+    """Tests for WAL mode and the group-committing writer thread."""
+
+    def test_wal_mode_enabled(self, temp_db):
+        """Test the database file is switched to WAL journaling."""
+        mode = temp_db.conn.execute("PRAGMA journal_mode").fetchone()[0]
+        assert mode == "wal"
+
+    def test_connections_are_tuned(self, temp_db):
+        """Test reader connections get busy timeout and NORMAL synchronous."""
+        assert temp_db.conn.execute("PRAGMA busy_timeout").fetchone()[0] == 5000
+        # 1 == NORMAL
+        assert temp_db.conn.execute("PRAGMA synchronous").fetchone()[0] == 1
+
+    def test_writes_run_on_writer_thread(self, temp_db):
+        """Test mutations are executed by the dedicated writer thread."""
+        threads = []
+        temp_db._write(lambda conn: threads.append(threading.current_thread().name))
+
+        assert threads == ["db-writer"]
+
+    def test_write_visible_from_other_thread(self, temp_db):
+        """Test a committed write is immediately readable from another thread."""
+        temp_db.update_issue_state("owner/repo", 1, "Research")
+        result = []
+        reader = threading.Thread(
+            target=lambda: result.append(temp_db.get_issue_state("owner/repo", 1))
+        )
+        reader.start()
+        reader.join()
+
+        assert result[0].status == "Research"
+
+    def test_concurrent_writers_all_commit(self, temp_db):
+        """Test updates from many threads are all committed."""
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(lambda n: temp_db.update_issue_state("owner/repo", n, "Plan"), range(50)))
+
+        assert len(temp_db.get_all_issue_states(limit=100)) == 50
+
+    def test_failed_write_does_not_roll_back_others(self, temp_db):
+        """Test a failing request in a group commit only rolls back itself."""
+
+        def fail(conn):
+            conn.execute("INSERT INTO merge_queue (repo) VALUES ('broken')")
+
+        with pytest.raises(sqlite3.IntegrityError):
+            temp_db._write(fail)
+        temp_db.add_to_merge_queue("owner/repo", 1, 0)
+
+        assert [e.pr_number for e in temp_db.get_merge_queue("owner/repo")] == [1]
+
+    def test_close_flushes_and_writer_restarts(self, temp_db):
+        """Test close() stops the writer and later writes start it again."""
+        temp_db.update_issue_state("owner/repo", 1, "Research")
+        temp_db.close()
+        temp_db.update_issue_state("owner/repo", 2, "Plan")
+
+        assert temp_db.get_issue_state("owner/repo", 2).status == "Plan"
+
+
+@pytest.mark.unit
+class TestIssueStateBulkReads:
+    """Tests for get_issue_states_bulk and the per-poll issue state cache."""
+
+    def test_bulk_returns_existing_states_keyed_by_issue(self, temp_db):
+        """Test states of several repos are returned keyed by (repo, issue_number)."""
+        temp_db.update_issue_state("owner/a", 1, "Research")
+        temp_db.update_issue_state("owner/a", 2, "Plan")
+        temp_db.update_issue_state("owner/b", 1, "Implement")
+
+        states = temp_db.get_issue_states_bulk(
+            [("owner/a", 1), ("owner/a", 2), ("owner/b", 1), ("owner/b", 99)]
+        )
+
+        assert set(states) == {("owner/a", 1), ("owner/a", 2), ("owner/b", 1)}
+        assert states[("owner/b", 1)].status == "Implement"
+
+    def test_bulk_chunks_large_requests(self, temp_db, monkeypatch):
+        """Test requests larger than the chunk size are split across queries."""
+        monkeypatch.setattr("src.database.ISSUE_STATE_CHUNK_SIZE", 3)
+        for n in range(10):
+            temp_db.update_issue_state("owner/repo", n, "Backlog")
+
+        states = temp_db.get_issue_states_bulk([("owner/repo", n) for n in range(10)])
+
+        assert len(states) == 10
+
+    def test_cached_states_served_without_query(self, temp_db):
+        """Test get_issue_state reads prefetched states (including missing ones) from memory."""
+        temp_db.update_issue_state("owner/repo", 1, "Research")
+        temp_db.cache_issue_states([("owner/repo", 1), ("owner/repo", 2)])
+
+        with patch.object(temp_db, "_select_issue_state") as select:
+            assert temp_db.get_issue_state("owner/repo", 1).status == "Research"
+            assert temp_db.get_issue_state("owner/repo", 2) is None
+
+        select.assert_not_called()
+
+    def test_write_evicts_cached_state(self, temp_db):
+        """Test a write is visible right away despite the cache."""
+        temp_db.update_issue_state("owner/repo", 1, "Research")
+        temp_db.cache_issue_states([("owner/repo", 1)])
+
+        temp_db.update_issue_state("owner/repo", 1, "Plan", last_known_comment_count=3)
+
+        state = temp_db.get_issue_state("owner/repo", 1)
+        assert state.status == "Plan"
+        assert state.last_known_comment_count == 3
+
+    def test_uncached_issue_reads_database(self, temp_db):
+        """Test issues outside the prefetched set are still read from the database."""
+        temp_db.cache_issue_states([])
+        temp_db.update_issue_state("owner/repo", 5, "Plan")
+
+        assert temp_db.get_issue_state("owner/repo", 5).status == "Plan"
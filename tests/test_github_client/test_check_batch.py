@@ -0,0 +1,117 @@
+"""Tests for batched CI status lookups across several commits."""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from src.interfaces import CheckRunResult
+from src.ticket_clients.check_batch import build_check_rollup_query, parse_check_rollup
+
+
+def rollup(*contexts, has_next_page=False):
+    return {
+        "statusCheckRollup": {
+            "contexts": {"pageInfo": {"hasNextPage": has_next_page}, "nodes": list(contexts)}
+        }
+    }
+
+
+CHECK_RUN = {
+    "__typename": "CheckRun",
+    "name": "CI / test",
+    "status": "COMPLETED",
+    "conclusion": "FAILURE",
+    "detailsUrl": "https://example.com/run/1",
+    "title": "Tests failed",
+    "summary": "2 failures",
+}
+STATUS_CONTEXT = {
+    "__typename": "StatusContext",
+    "context": "jenkins/build",
+    "state": "PENDING",
+    "targetUrl": "https://jenkins/1",
+    "description": "Building",
+}
+
+
+@pytest.mark.unit
+class TestCheckRollup:
+    """Tests for the rollup query builder and parser."""
+
+    def test_query_aliases_each_commit(self):
+        """Test one aliased object lookup per commit."""
+        query = build_check_rollup_query(["abc1234", "def5678"])
+
+        assert 'c0: object(oid: "abc1234")' in query
+        assert 'c1: object(oid: "def5678")' in query
+
+    def test_query_rejects_non_hex_sha(self):
+        """Test SHAs are validated before being inlined in the query."""
+        with pytest.raises(ValueError):
+            build_check_rollup_query(['abc") { x }'])
+
+    def test_parse_maps_check_runs_and_statuses(self):
+        """Test both context types map to the REST lookup's CheckRunResult shape."""
+        results = parse_check_rollup(rollup(CHECK_RUN, STATUS_CONTEXT))
+
+        assert results == [
+            CheckRunResult(
+                name="CI / test",
+                status="completed",
+                conclusion="failure",
+                details_url="https://example.com/run/1",
+                output="Tests failed: 2 failures",
+            ),
+            CheckRunResult(
+                name="jenkins/build",
+                status="in_progress",
+                conclusion=None,
+                details_url="https://jenkins/1",
+                output="Building",
+            ),
+        ]
+
+    def test_parse_unresolved_commits(self):
+        """Test missing commits and truncated rollups are left to the fallback."""
+        assert parse_check_rollup(None) is None
+        assert parse_check_rollup(rollup(CHECK_RUN, has_next_page=True)) is None
+        assert parse_check_rollup({"statusCheckRollup": None}) == []
+
+
+@pytest.mark.unit
+class TestGetCheckRunsBulk:
+    """Tests for get_check_runs_bulk on the ticket client."""
+
+    def test_single_query_for_all_commits(self, github_client):
+        """Test several commits are answered by one GraphQL query."""
+        response = {"data": {"repository": {"c0": rollup(CHECK_RUN), "c1": rollup()}}}
+
+        with (
+            patch.object(
+                github_client, "_run_gh_command", return_value=json.dumps(response)
+            ) as mock_gh,
+            patch.object(github_client, "get_check_runs") as mock_single,
+        ):
+            results = github_client.get_check_runs_bulk(
+                "github.com/owner/repo", ["abc1234", "def5678"]
+            )
+
+        assert mock_gh.call_count == 1
+        mock_single.assert_not_called()
+        assert [r.name for r in results["abc1234"]] == ["CI / test"]
+        assert results["def5678"] == []
+
+    def test_unresolved_commit_falls_back_to_rest(self, github_client):
+        """Test a commit the rollup could not answer is queried individually."""
+        response = {"data": {"repository": {"c0": None}}}
+        fallback = [CheckRunResult(name="CI", status="completed", conclusion="success")]
+
+        with (
+            patch.object(github_client, "_run_gh_command", return_value=json.dumps(response)),
+            patch.object(github_client, "get_check_runs", return_value=fallback) as mock_single,
+        ):
+            results = github_client.get_check_runs_bulk("github.com/owner/repo", ["abc1234"])
+
+        mock_single.assert_called_once_with("github.com/owner/repo", "abc1234")
+        assert results == {"abc1234": fallback}
@@ -0,0 +1,297 @@
+"""Tests for the pooled HTTP transport used for `gh api` calls."""
+
+import json
+import subprocess
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+
+from src.ticket_clients import get_github_client
+from src.ticket_clients.base import NetworkError
+from src.ticket_clients.github import GitHubTicketClient
+from src.ticket_clients.github_enterprise_3_14 import GitHubEnterprise314Client
+from src.ticket_clients.http_transport import ApiRequest, HTTPTransport, parse_gh_api_args
+
+
+def _response(status_code=200, body=None, links=None, reason="OK"):
+    """Build a mock requests.Response."""
+    response = MagicMock()
+    response.status_code = status_code
+    response.reason = reason
+    response.text = json.dumps(body) if body is not None else ""
+    response.json.return_value = body
+    response.links = links or {}
+    return response
+
+
+@pytest.mark.unit
+class TestParseGhApiArgs:
+    """Tests for translating gh api arguments into requests."""
+
+    def test_graphql_with_stdin_input(self):
+        """Test GraphQL queries sent via --input - become POST requests."""
+        request = parse_gh_api_args(["api", "graphql", "--input", "-"])
+
+        assert request == ApiRequest(method="POST", endpoint="graphql")
+
+    def test_rest_get_with_headers_and_paginate(self):
+        """Test REST GET with custom headers and pagination."""
+        request = parse_gh_api_args(
+            [
+                "api",
+                "repos/owner/repo/issues/1/comments",
+                "-H",
+                "Accept: application/vnd.github+json",
+                "--paginate",
+            ]
+        )
+
+        assert request is not None
+        assert request.method == "GET"
+        assert request.endpoint == "repos/owner/repo/issues/1/comments"
+        assert request.headers == {"Accept": "application/vnd.github+json"}
+        assert request.paginate is True
+
+    def test_explicit_method_and_fields(self):
+        """Test -X and -f flags are parsed."""
+        request = parse_gh_api_args(
+            ["api", "-X", "patch", "repos/owner/repo/issues/1", "-f", "state=closed"]
+        )
+
+        assert request is not None
+        assert request.method == "PATCH"
+        assert request.fields == {"state": "closed"}
+
+    def test_fields_default_to_post(self):
+        """Test -f without -X defaults to POST like gh."""
+        request = parse_gh_api_args(["api", "repos/owner/repo/labels", "-f", "name=bug"])
+
+        assert request is not None
+        assert request.method == "POST"
+
+    def test_porcelain_command_not_translated(self):
+        """Test non-api commands are left to the gh CLI."""
+        assert parse_gh_api_args(["issue", "edit", "1", "--add-label", "bug"]) is None
+
+    def test_unsupported_flag_not_translated(self):
+        """Test unsupported gh api flags fall back to the gh CLI."""
+        assert parse_gh_api_args(["api", "user", "--jq", ".login"]) is None
+
+    def test_input_file_not_translated(self):
+        """Test --input with a file path falls back to the gh CLI."""
+        assert parse_gh_api_args(["api", "graphql", "--input", "query.json"]) is None
+
+
+@pytest.mark.unit
+class TestApiUrl:
+    """Tests for HTTPTransport.api_url."""
+
+    def test_github_com_graphql(self):
+        assert HTTPTransport.api_url("github.com", "graphql") == "https://api.github.com/graphql"
+
+    def test_github_com_rest(self):
+        assert (
+            HTTPTransport.api_url("github.com", "repos/o/r/pulls")
+            == "https://api.github.com/repos/o/r/pulls"
+        )
+
+    def test_ghes_graphql(self):
+        assert (
+            HTTPTransport.api_url("github.mycompany.com", "graphql")
+            == "https://github.mycompany.com/api/graphql"
+        )
+
+    def test_ghes_rest(self):
+        assert (
+            HTTPTransport.api_url("github.mycompany.com", "/repos/o/r")
+            == "https://github.mycompany.com/api/v3/repos/o/r"
+        )
+
+    def test_absolute_url_passthrough(self):
+        url = "https://api.github.com/repos/o/r/issues?page=2"
+        assert HTTPTransport.api_url("github.com", url) == url
+
+
+@pytest.mark.unit
+class TestHTTPTransportExecute:
+    """Tests for HTTPTransport.execute."""
+
+    def test_reuses_session_per_hostname(self):
+        """Test one pooled session is shared across calls to the same host."""
+        transport = HTTPTransport()
+
+        assert transport._get_session("github.com") is transport._get_session("github.com")
+        assert transport._get_session("github.com") is not transport._get_session("ghe.local")
+
+    def test_sends_bearer_token_and_body(self):
+        """Test the token and GraphQL body are sent on the request."""
+        transport = HTTPTransport()
+        session = MagicMock()
+        session.request.return_value = _response(body={"data": {"viewer": {"login": "me"}}})
+        transport._sessions["github.com"] = session
+
+        output = transport.execute(
+            "github.com",
+            "ghp_abc",
+            ApiRequest(method="POST", endpoint="graphql"),
+            input_data='{"query": "{ viewer { login } }"}',
+        )
+
+        assert json.loads(output)["data"]["viewer"]["login"] == "me"
+        method, url = session.request.call_args[0]
+        kwargs = session.request.call_args[1]
+        assert method == "POST"
+        assert url == "https://api.github.com/graphql"
+        assert kwargs["headers"]["Authorization"] == "bearer ghp_abc"
+        assert kwargs["data"] == b'{"query": "{ viewer { login } }"}'
+
+    def test_paginate_merges_array_pages(self):
+        """Test --paginate follows next links and merges JSON arrays."""
+        transport = HTTPTransport()
+        session = MagicMock()
+        session.request.side_effect = [
+            _response(body=[{"id": 1}], links={"next": {"url": "https://api.github.com/p2"}}),
+            _response(body=[{"id": 2}]),
+        ]
+        transport._sessions["github.com"] = session
+
+        output = transport.execute(
+            "github.com", "t", ApiRequest(method="GET", endpoint="x", paginate=True)
+        )
+
+        assert json.loads(output) == [{"id": 1}, {"id": 2}]
+        assert session.request.call_args_list[1][0][1] == "https://api.github.com/p2"
+
+    def test_http_error_raises_called_process_error(self):
+        """Test HTTP errors are reported like gh failures."""
+        transport = HTTPTransport()
+        session = MagicMock()
+        session.request.return_value = _response(
+            status_code=404, body={"message": "Not Found"}, reason="Not Found"
+        )
+        transport._sessions["github.com"] = session
+
+        with pytest.raises(subprocess.CalledProcessError) as exc_info:
+            transport.execute("github.com", "t", ApiRequest(method="GET", endpoint="x"))
+
+        assert exc_info.value.stderr == "gh: Not Found (HTTP 404)"
+
+    def test_graphql_errors_raise_called_process_error(self):
+        """Test GraphQL error payloads are reported like gh failures."""
+        transport = HTTPTransport()
+        session = MagicMock()
+        session.request.return_value = _response(
+            body={"errors": [{"message": "Could not resolve to an Issue"}]}
+        )
+        transport._sessions["github.com"] = session
+
+        with pytest.raises(subprocess.CalledProcessError) as exc_info:
+            transport.execute("github.com", "t", ApiRequest(method="POST", endpoint="graphql"))
+
+        assert "Could not resolve to an Issue" in exc_info.value.stderr
+
+    def test_connection_error_raises_network_error(self):
+        """Test connectivity failures raise NetworkError."""
+        transport = HTTPTransport()
+        session = MagicMock()
+        session.request.side_effect = requests.ConnectionError("connection refused")
+        transport._sessions["github.com"] = session
+
+        with pytest.raises(NetworkError):
+            transport.execute("github.com", "t", ApiRequest(method="GET", endpoint="x"))
+
+    def test_close_clears_sessions(self):
+        """Test close() closes and forgets all sessions."""
+        transport = HTTPTransport()
+        session = MagicMock()
+        transport._sessions["github.com"] = session
+
+        transport.close()
+
+        session.close.assert_called_once()
+        assert transport._sessions == {}
+
+
+@pytest.mark.unit
+class TestClientWithHTTPTransport:
+    """Tests for routing client calls through the HTTP transport."""
+
+    def test_api_call_uses_transport(self):
+        """Test gh api calls bypass the subprocess when a transport is set."""
+        transport = MagicMock(spec=HTTPTransport)
+        transport.execute.return_value = '{"data": {}}'
+        client = GitHubTicketClient(tokens={"github.com": "ghp_abc"}, http_transport=transport)
+
+        with patch("subprocess.run") as mock_run:
+            output = client._run_gh_command(["api", "graphql", "--input", "-"], "{}")
+
+        assert output == '{"data": {}}'
+        mock_run.assert_not_called()
+        hostname, token, request = transport.execute.call_args[0]
+        assert (hostname, token, request.endpoint) == ("github.com", "ghp_abc", "graphql")
+
+    def test_porcelain_command_uses_gh(self):
+        """Test non-api commands still run through the gh CLI."""
+        transport = MagicMock(spec=HTTPTransport)
+        client = GitHubTicketClient(tokens={"github.com": "ghp_abc"}, http_transport=transport)
+
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(stdout="ok")
+            client._run_gh_command(["issue", "close", "1"])
+
+        transport.execute.assert_not_called()
+        mock_run.assert_called_once()
+
+    def test_no_token_falls_back_to_gh(self):
+        """Test hosts without a token fall back to gh's own auth."""
+        transport = MagicMock(spec=HTTPTransport)
+        client = GitHubTicketClient(tokens={}, http_transport=transport)
+
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(stdout="{}")
+            client._run_gh_command(["api", "graphql", "--input", "-"], "{}")
+
+        transport.execute.assert_not_called()
+        mock_run.assert_called_once()
+
+    def test_http_401_classified_as_auth_error(self):
+        """Test HTTP 401 responses keep the existing auth error classification."""
+        transport = MagicMock(spec=HTTPTransport)
+        transport.execute.side_effect = subprocess.CalledProcessError(
+            1, ["gh", "api", "graphql"], stderr="gh: Bad credentials (HTTP 401)"
+        )
+        client = GitHubTicketClient(tokens={"github.com": "bad"}, http_transport=transport)
+
+        with pytest.raises(RuntimeError, match="authentication failed"):
+            client._run_gh_command(["api", "graphql", "--input", "-"], "{}")
+
+    def test_enterprise_client_uses_transport(self):
+        """Test GHES clients built on the base class route through the transport."""
+        transport = MagicMock(spec=HTTPTransport)
+        transport.execute.return_value = "{}"
+        client = GitHubEnterprise314Client(
+            tokens={"github.mycompany.com": "ghe_abc"}, http_transport=transport
+        )
+
+        with patch("subprocess.run") as mock_run:
+            client._run_gh_command(
+                ["api", "graphql", "--input", "-"], "{}", hostname="github.mycompany.com"
+            )
+
+        mock_run.assert_not_called()
+        assert transport.execute.call_args[0][:2] == ("github.mycompany.com", "ghe_abc")
+
+    def test_factory_passes_transport(self):
+        """Test get_github_client wires the transport into every client type."""
+        transport = HTTPTransport()
+
+        assert get_github_client(http_transport=transport).http_transport is transport
+        assert (
+            get_github_client(enterprise_version="3.19", http_transport=transport).http_transport
+            is transport
+        )
+        assert (
+            get_github_client(enterprise_version="3.14", http_transport=transport).http_transport
+            is transport
+        )
@@ -0,0 +1,218 @@
+"""Tests for batched per-issue GraphQL lookups."""
+
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from src.ticket_clients.github_enterprise_3_14 import GitHubEnterprise314Client
+from src.ticket_clients.issue_batch import (
+    MAX_ISSUES_PER_QUERY,
+    MAX_NODES_PER_QUERY,
+    IssueBatcher,
+)
+
+REPO = "github.com/owner/repo"
+
+
+def _issue(number, labels=(), body="", label_events=(), status_events=(), linked_prs=()):
+    """Build an issue node as returned by the aliased batch query."""
+    return {
+        "body": body or f"Body of #{number}",
+        "labels": {"nodes": [{"name": name} for name in labels]},
+        "label_events": {
+            "nodes": [
+                {"actor": {"login": actor}, "label": {"name": name}} for name, actor in label_events
+            ]
+        },
+        "status_events": {
+            "nodes": [
+                {"__typename": "ProjectV2ItemStatusChangedEvent", "actor": {"login": actor}}
+                for actor in status_events
+            ]
+        },
+        "linked_prs": {"nodes": list(linked_prs)},
+    }
+
+
+def _batch_response(variables, issues):
+    """Build an aliased batch response for the requested issue numbers."""
+    data = {}
+    i = 0
+    while f"n{i}" in variables:
+        number = variables[f"n{i}"]
+        data[f"i{i}"] = {"issue": issues.get(number)}
+        i += 1
+    return {"data": data}
+
+
+@pytest.mark.unit
+class TestIssueLookupBatch:
+    """Tests for serving per-issue lookups from aliased queries."""
+
+    def test_lookups_share_one_aliased_query(self, github_client):
+        """Test several lookups across issues are answered by a single query."""
+        issues = {
+            1: _issue(1, labels=["yolo"], label_events=[("yolo", "alice")]),
+            2: _issue(2, labels=["bug"], body="Blocked body", status_events=["bob"]),
+        }
+
+        with patch.object(github_client, "_execute_graphql_query") as mock_query:
+            mock_query.side_effect = lambda q, v, **kw: _batch_response(v, issues)
+
+            with github_client.issue_lookup_batch([(REPO, 1), (REPO, 2)]):
+                assert github_client.get_ticket_labels(REPO, 1) == {"yolo"}
+                assert github_client.get_label_actor(REPO, 1, "yolo") == "alice"
+                assert github_client.get_ticket_body(REPO, 2) == "Blocked body"
+                assert github_client.get_last_status_actor(REPO, 2) == "bob"
+                assert github_client.get_linked_prs(REPO, 2) == []
+
+        assert mock_query.call_count == 1
+        query, variables = mock_query.call_args[0]
+        assert "i0: repository(owner: $o0, name: $r0)" in query
+        assert "i1: repository(owner: $o1, name: $r1)" in query
+        assert "label_events: timelineItems(itemTypes: [LABELED_EVENT]" in query
+        assert variables == {
+            "o0": "owner",
+            "r0": "repo",
+            "n0": 1,
+            "o1": "owner",
+            "r1": "repo",
+            "n1": 2,
+        }
+        assert mock_query.call_args[1] == {"hostname": "github.com"}
+
+    def test_linked_prs_from_batch(self, github_client):
+        """Test linked PRs are parsed from the batched closedByPullRequestsReferences."""
+        pr = {
+            "number": 7,
+            "url": "https://github.com/owner/repo/pull/7",
+            "body": "Closes #3",
+            "state": "MERGED",
+            "merged": True,
+            "headRefName": "feature",
+            "title": "Fix",
+        }
+        issues = {3: _issue(3, linked_prs=[pr])}
+
+        with patch.object(github_client, "_execute_graphql_query") as mock_query:
+            mock_query.side_effect = lambda q, v, **kw: _batch_response(v, issues)
+
+            with github_client.issue_lookup_batch([(REPO, 3)]):
+                linked = github_client.get_linked_prs(REPO, 3)
+
+        assert [(p.number, p.merged, p.branch_name) for p in linked] == [(7, True, "feature")]
+
+    def test_missing_issue_returns_defaults(self, github_client):
+        """Test issues absent from the response behave like a not-found single query."""
+        with patch.object(github_client, "_execute_graphql_query") as mock_query:
+            mock_query.side_effect = lambda q, v, **kw: _batch_response(v, {})
+
+            with github_client.issue_lookup_batch([(REPO, 9)]):
+                assert github_client.get_ticket_body(REPO, 9) is None
+                assert github_client.get_ticket_labels(REPO, 9) == set()
+                assert github_client.get_label_actor(REPO, 9, "yolo") is None
+
+        assert mock_query.call_count == 1
+
+    def test_queries_are_chunked(self, github_client):
+        """Test large batches are split to stay under the node budget."""
+        numbers = list(range(1, 2 * MAX_ISSUES_PER_QUERY + 2))
+        issues = {n: _issue(n) for n in numbers}
+
+        with patch.object(github_client, "_execute_graphql_query") as mock_query:
+            mock_query.side_effect = lambda q, v, **kw: _batch_response(v, issues)
+
+            with github_client.issue_lookup_batch([(REPO, n) for n in numbers]):
+                for n in numbers:
+                    github_client.get_ticket_body(REPO, n)
+
+        per_query = github_client._issue_batcher.issues_per_query
+        expected = -(-len(numbers) // per_query)
+        assert mock_query.call_count == expected
+        assert all(len(c[0][1]) <= 3 * per_query for c in mock_query.call_args_list)
+
+    def test_unqueued_issue_uses_single_query(self, github_client):
+        """Test lookups for issues outside the batch use the regular query."""
+        with patch.object(github_client, "_execute_graphql_query") as mock_query:
+            mock_query.return_value = {"data": {"repository": {"issue": {"body": "single"}}}}
+
+            with github_client.issue_lookup_batch([]):
+                assert github_client.get_ticket_body(REPO, 5) == "single"
+
+        assert mock_query.call_args[0][1] == {"owner": "owner", "repo": "repo", "issueNumber": 5}
+
+    def test_batch_failure_falls_back_to_single_queries(self, github_client):
+        """Test a failed batch query falls back to per-issue queries."""
+        single = {"data": {"repository": {"issue": {"body": "fallback"}}}}
+
+        with patch.object(github_client, "_execute_graphql_query") as mock_query:
+            mock_query.side_effect = [ValueError("GraphQL errors: boom"), single]
+
+            with github_client.issue_lookup_batch([(REPO, 1)]):
+                assert github_client.get_ticket_body(REPO, 1) == "fallback"
+
+        assert mock_query.call_count == 2
+
+    def test_label_change_invalidates_batched_data(self, github_client):
+        """Test labels are re-fetched after the client modifies them."""
+        issues = {1: _issue(1, labels=["yolo"])}
+        single = {"data": {"repository": {"issue": {"labels": {"nodes": []}}}}}
+
+        with (
+            patch.object(github_client, "_execute_graphql_query") as mock_query,
+            patch.object(github_client, "_run_gh_command"),
+        ):
+            mock_query.side_effect = [_batch_response({"n0": 1}, issues), single]
+
+            with github_client.issue_lookup_batch([(REPO, 1)]):
+                assert github_client.get_ticket_labels(REPO, 1) == {"yolo"}
+                github_client.remove_label(REPO, 1, "yolo")
+                assert github_client.get_ticket_labels(REPO, 1) == set()
+
+        assert mock_query.call_count == 2
+
+    def test_batch_is_thread_local(self, github_client):
+        """Test other threads do not see the poll thread's batch."""
+        single = {"data": {"repository": {"issue": {"body": "worker"}}}}
+        results = []
+
+        with patch.object(github_client, "_execute_graphql_query") as mock_query:
+            mock_query.return_value = single
+
+            with github_client.issue_lookup_batch([(REPO, 1)]):
+                worker = threading.Thread(
+                    target=lambda: results.append(github_client.get_ticket_body(REPO, 1))
+                )
+                worker.start()
+                worker.join()
+
+        assert results == ["worker"]
+        assert "issueNumber" in mock_query.call_args[0][1]
+
+    def test_no_batch_outside_context(self, github_client):
+        """Test queue_issue_lookups is a no-op without an open batch."""
+        github_client.queue_issue_lookups([(REPO, 1)])
+
+        found, data = github_client._issue_batcher.lookup(REPO, 1, "body")
+
+        assert (found, data) == (False, None)
+
+
+@pytest.mark.unit
+class TestIssueBatchFields:
+    """Tests for per-client batch field selection."""
+
+    def test_ghes_314_excludes_unsupported_fields(self):
+        """Test GHES 3.14 does not batch project status events or linked PRs."""
+        client = GitHubEnterprise314Client(tokens={"github.mycompany.com": "t"})
+
+        assert client._issue_batcher.fields == ("body", "labels", "label_events")
+
+    def test_issues_per_query_respects_node_budget(self):
+        """Test chunk size shrinks as the per-issue node count grows."""
+        small = IssueBatcher(None, ["body"])  # type: ignore[arg-type]
+        large = IssueBatcher(None, ["labels", "label_events", "status_events", "linked_prs"])  # type: ignore[arg-type]
+
+        assert small.issues_per_query == MAX_ISSUES_PER_QUERY
+        assert large.issues_per_query == min(MAX_ISSUES_PER_QUERY, MAX_NODES_PER_QUERY // 170)
@@ -0,0 +1,117 @@
+"""Tests for targeted board item refreshes."""
+
+from unittest.mock import patch
+
+import pytest
+
+from src.ticket_clients.github_enterprise_3_14 import GitHubEnterprise314Client
+from src.ticket_clients.issue_items import MAX_ISSUES_PER_QUERY, build_issue_items_query
+
+BOARD = "https://github.com/orgs/owner/projects/1"
+OTHER_BOARD = "https://github.com/orgs/owner/projects/2"
+
+
+def _node(number, project_url=BOARD, status="Research"):
+    """Build a ProjectV2Item node as returned by the issue items query."""
+    return {
+        "id": f"PVTI_{number}_{project_url[-1]}",
+        "project": {"url": project_url},
+        "content": {
+            "number": number,
+            "title": f"Issue {number}",
+            "repository": {"nameWithOwner": "owner/repo"},
+            "labels": {"nodes": [{"name": "yolo"}]},
+            "state": "OPEN",
+            "comments": {"totalCount": 3},
+        },
+        "fieldValues": {"nodes": [{"name": status, "field": {"name": "Status"}}]},
+    }
+
+
+def _response(variables, nodes_by_number):
+    """Build an aliased response for the requested issue numbers."""
+    data = {}
+    i = 0
+    while f"n{i}" in variables:
+        nodes = nodes_by_number.get(variables[f"n{i}"])
+        data[f"i{i}"] = {"issue": {"projectItems": {"nodes": nodes}} if nodes else None}
+        i += 1
+    return {"data": data}
+
+
+@pytest.mark.unit
+class TestBuildIssueItemsQuery:
+    """Tests for build_issue_items_query()."""
+
+    def test_aliases_and_variables(self):
+        query, variables = build_issue_items_query(
+            [("owner", "repo", 1), ("owner", "other", 2)], "id"
+        )
+
+        assert "i0: repository(owner: $o0, name: $r0)" in query
+        assert "i1: repository(owner: $o1, name: $r1)" in query
+        assert "project { url }" in query
+        assert variables == {
+            "o0": "owner",
+            "r0": "repo",
+            "n0": 1,
+            "o1": "owner",
+            "r1": "other",
+            "n1": 2,
+        }
+
+
+@pytest.mark.unit
+class TestGetBoardItemsForIssues:
+    """Tests for get_board_items_for_issues()."""
+
+    def test_returns_items_on_configured_boards(self, github_client):
+        nodes = {
+            1: [_node(1), _node(1, project_url=OTHER_BOARD)],
+            2: [_node(2, status="Plan")],
+        }
+
+        with patch.object(github_client, "_execute_graphql_query") as mock_query:
+            mock_query.side_effect = lambda q, v, **kw: _response(v, nodes)
+            items = github_client.get_board_items_for_issues(
+                [BOARD], [("github.com/owner/repo", 1), ("github.com/owner/repo", 2)]
+            )
+
+        assert mock_query.call_count == 1
+        assert [(i.ticket_id, i.status, i.board_url) for i in items] == [
+            (1, "Research", BOARD),
+            (2, "Plan", BOARD),
+        ]
+        assert items[0].labels == {"yolo"}
+        assert items[0].comment_count == 3
+        assert "closedByPullRequestsReferences" in mock_query.call_args[0][0]
+
+    def test_missing_issue_is_skipped(self, github_client):
+        with patch.object(github_client, "_execute_graphql_query") as mock_query:
+            mock_query.side_effect = lambda q, v, **kw: _response(v, {})
+            items = github_client.get_board_items_for_issues(
+                [BOARD], [("github.com/owner/repo", 404)]
+            )
+
+        assert items == []
+
+    def test_issues_are_chunked(self, github_client):
+        issues = [("github.com/owner/repo", n) for n in range(MAX_ISSUES_PER_QUERY + 1)]
+
+        with patch.object(github_client, "_execute_graphql_query") as mock_query:
+            mock_query.side_effect = lambda q, v, **kw: _response(v, {})
+            github_client.get_board_items_for_issues([BOARD], issues)
+
+        assert mock_query.call_count == 2
+
+    def test_enterprise_uses_its_item_fields(self):
+        client = GitHubEnterprise314Client(tokens={"ghes.example.com": "test-token"})
+        board = "https://ghes.example.com/orgs/owner/projects/1"
+        nodes = {7: [_node(7, project_url=board)]}
+
+        with patch.object(client, "_execute_graphql_query") as mock_query:
+            mock_query.side_effect = lambda q, v, **kw: _response(v, nodes)
+            items = client.get_board_items_for_issues([board], [("ghes.example.com/owner/repo", 7)])
+
+        assert [i.repo for i in items] == ["ghes.example.com/owner/repo"]
+        assert "closedByPullRequestsReferences" not in mock_query.call_args[0][0]
@@ -248,3 +248,108 @@ class TestCommentOnPr:
         assert result is True
         call_args = mock_run.call_args[0][0]
         assert "@dependabot rebase" in call_args
+
+
+def _pr_node(number, labels, contexts=None, has_next_page=False):
+    """Build a pullRequests node of the labeled-PR snapshot query."""
+    commit = {"statusCheckRollup": None}
+    if contexts is not None:
+        commit = {
+            "statusCheckRollup": {
+                "contexts": {"pageInfo": {"hasNextPage": has_next_page}, "nodes": contexts}
+            }
+        }
+    return {
+        "number": number,
+        "createdAt": f"2024-01-15T{number % 24:02d}:00:00Z",
+        "baseRefName": "main",
+        "mergeStateStatus": "BEHIND",
+        "mergeable": "MERGEABLE",
+        "reviewDecision": None,
+        "headRefOid": f"sha{number}",
+        "baseRef": {"target": {"oid": "base"}},
+        "labels": {"nodes": [{"name": label} for label in labels]},
+        "commits": {"nodes": [{"commit": commit}]},
+    }
+
+
+def _page(nodes, end_cursor=None):
+    """Wrap nodes in a snapshot query response page."""
+    return json.dumps(
+        {
+            "data": {
+                "repository": {
+                    "pullRequests": {
+                        "pageInfo": {
+                            "hasNextPage": end_cursor is not None,
+                            "endCursor": end_cursor,
+                        },
+                        "nodes": nodes,
+                    }
+                }
+            }
+        }
+    )
+
+
+@pytest.mark.unit
+class TestListLabeledPrSnapshots:
+    """Tests for GitHubTicketClient.list_labeled_pr_snapshots() method."""
+
+    def test_parses_merge_state_labels_and_checks(self, github_client):
+        """Test each PR's merge state, labels and HEAD checks come from one query."""
+        check_run = {
+            "__typename": "CheckRun",
+            "name": "CI",
+            "status": "COMPLETED",
+            "conclusion": "SUCCESS",
+        }
+        response = _page([_pr_node(101, ["dependencies", "auto-merge-queue"], [check_run])])
+
+        with patch.object(github_client, "_run_gh_command", return_value=response) as mock_run:
+            prs = github_client.list_labeled_pr_snapshots(
+                "github.com/owner/repo", ["dependencies", "auto-merge-queue"]
+            )
+
+        assert mock_run.call_count == 1
+        payload = json.loads(mock_run.call_args.kwargs["input_data"])
+        assert payload["variables"]["labels"] == ["dependencies", "auto-merge-queue"]
+        assert len(prs) == 1
+        assert prs[0].number == 101
+        assert prs[0].labels == {"dependencies", "auto-merge-queue"}
+        assert prs[0].merge_state_status == "BEHIND"
+        assert prs[0].review_decision == ""
+        assert prs[0].head_sha == "sha101"
+        assert prs[0].base_ref == "main"
+        assert prs[0].base_head_sha == "base"
+        assert [(c.name, c.is_successful) for c in prs[0].checks] == [("CI", True)]
+
+    def test_follows_pagination(self, github_client):
+        """Test every page of matching PRs is fetched."""
+        pages = [
+            _page([_pr_node(101, ["dependencies"])], end_cursor="c1"),
+            _page([_pr_node(102, ["dependencies"])]),
+        ]
+
+        with patch.object(github_client, "_run_gh_command", side_effect=pages) as mock_run:
+            prs = github_client.list_labeled_pr_snapshots("github.com/owner/repo", ["dependencies"])
+
+        assert [pr.number for pr in prs] == [101, 102]
+        second = json.loads(mock_run.call_args_list[1].kwargs["input_data"])
+        assert second["variables"]["after"] == "c1"
+
+    def test_truncated_rollup_leaves_checks_unset(self, github_client):
+        """Test checks are None when the rollup has more contexts than one page."""
+        response = _page([_pr_node(101, ["dependencies"], [], has_next_page=True)])
+
+        with patch.object(github_client, "_run_gh_command", return_value=response):
+            prs = github_client.list_labeled_pr_snapshots("github.com/owner/repo", ["dependencies"])
+
+        assert prs[0].checks is None
+
+    def test_returns_none_on_error(self, github_client):
+        """Test a failed query returns None so callers can fall back."""
+        error = subprocess.CalledProcessError(1, "gh", stderr="boom")
+
+        with patch.object(github_client, "_run_gh_command", side_effect=error):
+            assert github_client.list_labeled_pr_snapshots("github.com/owner/repo", ["x"]) is None
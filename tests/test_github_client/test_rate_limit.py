@@ -0,0 +1,234 @@
+"""Tests for GitHub rate-limit tracking and poll budgeting."""
+
+import json
+import subprocess
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.ticket_clients.base import NetworkError, RateLimitError
+from src.ticket_clients.github import GitHubTicketClient
+from src.ticket_clients.github_enterprise_3_14 import GitHubEnterprise314Client
+from src.ticket_clients.http_transport import HTTPTransport
+from src.ticket_clients.rate_limit import RateLimitBudget, RateLimitTracker
+
+
+def _budget(tracker, fraction=0.8, max_interval=600):
+    return RateLimitBudget(tracker, budget_fraction=fraction, max_interval=max_interval)
+
+
+@pytest.mark.unit
+class TestRateLimitTracker:
+    """Tests for RateLimitTracker bookkeeping."""
+
+    def test_spend_is_drop_in_remaining(self):
+        """Test spend accumulates the drop in remaining within a window."""
+        tracker = RateLimitTracker()
+        tracker.update("github.com", "core", 5000, 4990, 1000.0)
+        tracker.update("github.com", "core", 5000, 4980, 1000.0)
+        tracker.update("github.com", "core", 5000, 4985, 1000.0)  # out of order
+
+        assert tracker.spent() == {("github.com", "core"): 10}
+        assert tracker.snapshots("github.com")["core"].remaining == 4980
+
+    def test_new_window_counts_usage_since_reset(self):
+        """Test a later reset time starts a new window."""
+        tracker = RateLimitTracker()
+        tracker.update("github.com", "core", 5000, 100, 1000.0)
+        tracker.update("github.com", "core", 5000, 4990, 4600.0)
+
+        assert tracker.spent() == {("github.com", "core"): 10}
+
+    def test_record_headers(self):
+        """Test X-RateLimit headers are recorded under their resource."""
+        tracker = RateLimitTracker()
+        tracker.record_headers(
+            "github.com",
+            {
+                "X-RateLimit-Limit": "5000",
+                "X-RateLimit-Remaining": "4000",
+                "X-RateLimit-Reset": "1700000000",
+                "X-RateLimit-Resource": "graphql",
+            },
+        )
+        tracker.record_headers("github.com", {"Content-Type": "application/json"})
+
+        snapshot = tracker.snapshots("github.com")["graphql"]
+        assert (snapshot.limit, snapshot.remaining, snapshot.reset_at) == (5000, 4000, 1.7e9)
+
+    def test_record_graphql(self):
+        """Test the GraphQL rateLimit field is recorded as the graphql resource."""
+        tracker = RateLimitTracker()
+        tracker.record_graphql(
+            "ghes.example.com",
+            {"cost": 1, "remaining": 4999, "limit": 5000, "resetAt": "2024-01-15T10:00:00Z"},
+        )
+        tracker.record_graphql("ghes.example.com", None)
+
+        snapshot = tracker.snapshots("ghes.example.com")["graphql"]
+        assert snapshot.remaining == 4999
+        assert snapshot.reset_at == 1705312800.0
+
+    def test_record_throttle(self):
+        """Test a throttle marks the host until Retry-After has elapsed."""
+        tracker = RateLimitTracker()
+        tracker.record_throttle("github.com", retry_after=30)
+
+        assert 25 < tracker.throttled_until("github.com") - time.time() <= 30
+        assert tracker.throttled_until("other.example.com") == 0.0
+
+
+@pytest.mark.unit
+class TestRateLimitBudget:
+    """Tests for RateLimitBudget poll interval and priority decisions."""
+
+    def test_no_data_keeps_base_interval(self):
+        """Test the configured interval is used before any rate-limit data exists."""
+        assert _budget(RateLimitTracker()).next_interval(60) == 60
+
+    def test_comfortable_budget_keeps_base_interval(self):
+        """Test a cheap cycle with plenty of budget does not stretch the interval."""
+        tracker = RateLimitTracker()
+        budget = _budget(tracker)
+        reset_at = time.time() + 3600
+        tracker.update("github.com", "graphql", 5000, 5000, reset_at)
+        tracker.update("github.com", "graphql", 5000, 4990, reset_at)
+        budget.end_cycle()
+
+        assert budget.predicted_cycle_cost("github.com", "graphql") == 10
+        assert budget.next_interval(60) == 60
+
+    def test_expensive_cycles_stretch_interval(self):
+        """Test the interval grows so the predicted spend fits until the reset."""
+        tracker = RateLimitTracker()
+        budget = _budget(tracker, max_interval=3600)
+        reset_at = time.time() + 3600
+        tracker.update("github.com", "graphql", 5000, 3000, reset_at)
+        tracker.update("github.com", "graphql", 5000, 2500, reset_at)
+        budget.end_cycle()
+
+        # usable = 2500 - 1000 = 1500 points: 3 cycles of 500 to spread over ~3600s
+        assert 1190 < budget.next_interval(60) <= 1200
+        budget.max_interval = 600
+        assert budget.next_interval(60) == 600
+
+    def test_exhausted_budget_waits_for_reset_up_to_cap(self):
+        """Test an exhausted budget waits until the reset, capped at max_interval."""
+        tracker = RateLimitTracker()
+        tracker.update("github.com", "core", 5000, 900, time.time() + 300)
+
+        assert 290 < _budget(tracker).next_interval(60) <= 300
+
+    def test_throttle_stretches_interval(self):
+        """Test the poll waits out a throttle."""
+        tracker = RateLimitTracker()
+        tracker.record_throttle("github.com", retry_after=120)
+
+        assert 110 < _budget(tracker).next_interval(60) <= 120
+
+    def test_is_low(self):
+        """Test low-priority work is deferred below a quarter of the budgeted share."""
+        tracker = RateLimitTracker()
+        budget = _budget(tracker)
+        reset_at = time.time() + 3600
+        tracker.update("github.com", "core", 5000, 3000, reset_at)
+        assert not budget.is_low("github.com")
+
+        # budgeted = 4000, usable = 1900 - 1000 = 900 < 1000
+        tracker.update("github.com", "core", 5000, 1900, reset_at)
+        assert budget.is_low("github.com")
+        assert not budget.is_low("ghes.example.com")
+
+    def test_expired_window_is_not_low(self):
+        """Test a bucket whose window has already reset is ignored."""
+        tracker = RateLimitTracker()
+        tracker.update("github.com", "core", 5000, 0, time.time() - 1)
+
+        assert not _budget(tracker).is_low("github.com")
+
+
+@pytest.mark.unit
+class TestRateLimitClientIntegration:
+    """Tests for rate-limit recording in the ticket client."""
+
+    def test_rate_limit_failure_raises_rate_limit_error(self):
+        """Test a rate-limited gh call is classified and recorded as a throttle."""
+        tracker = RateLimitTracker()
+        client = GitHubTicketClient(tokens={"github.com": "t"}, rate_limits=tracker)
+        error = subprocess.CalledProcessError(
+            1, "gh", stderr="API rate limit exceeded for user ID 1."
+        )
+
+        with (
+            patch("subprocess.run", side_effect=error),
+            pytest.raises(RateLimitError),
+        ):
+            client._run_gh_command(["api", "user"])
+
+        assert tracker.throttled_until("github.com") > time.time()
+
+    def test_graphql_rate_limit_field_is_recorded(self):
+        """Test GraphQL responses update the tracker from their rateLimit field."""
+        tracker = RateLimitTracker()
+        client = GitHubTicketClient(tokens={"github.com": "t"}, rate_limits=tracker)
+        response = {
+            "data": {
+                "rateLimit": {
+                    "cost": 1,
+                    "remaining": 4000,
+                    "limit": 5000,
+                    "resetAt": "2030-01-01T00:00:00Z",
+                }
+            }
+        }
+
+        with patch.object(client, "_run_gh_command", return_value=json.dumps(response)):
+            client._execute_graphql_query("query { viewer { login } }", {})
+
+        assert tracker.snapshots("github.com")["graphql"].remaining == 4000
+
+    def test_refresh_rate_limits(self):
+        """Test the rate_limit endpoint populates core and graphql buckets."""
+        tracker = RateLimitTracker()
+        client = GitHubTicketClient(tokens={"github.com": "t"}, rate_limits=tracker)
+        body = {
+            "resources": {
+                "core": {"limit": 5000, "remaining": 4500, "reset": 1700000000},
+                "graphql": {"limit": 5000, "remaining": 4800, "reset": 1700000000},
+            }
+        }
+
+        with patch.object(client, "_run_gh_command", return_value=json.dumps(body)):
+            client.refresh_rate_limits("github.com")
+
+        assert set(tracker.snapshots("github.com")) == {"core", "graphql"}
+
+    @pytest.mark.parametrize("client_class", [GitHubTicketClient, GitHubEnterprise314Client])
+    def test_refresh_rate_limits_ignores_network_errors(self, client_class):
+        """Test a dropped connection leaves hibernation to the connectivity check."""
+        tracker = RateLimitTracker()
+        client = client_class(tokens={"github.com": "t"}, rate_limits=tracker)
+
+        with patch.object(client, "_run_gh_command", side_effect=NetworkError("timeout")):
+            client.refresh_rate_limits("github.com")
+
+        assert tracker.snapshots("github.com") == {}
+
+    def test_transport_records_headers_and_throttles(self):
+        """Test the HTTP transport records headers and 429 Retry-After throttles."""
+        tracker = RateLimitTracker()
+        transport = HTTPTransport()
+        response = MagicMock()
+        response.status_code = 429
+        response.headers = {
+            "X-RateLimit-Limit": "5000",
+            "X-RateLimit-Remaining": "10",
+            "X-RateLimit-Reset": str(int(time.time()) + 600),
+            "Retry-After": "90",
+        }
+
+        transport._record_rate_limit("github.com", response, tracker)
+
+        assert tracker.snapshots("github.com")["core"].remaining == 10
+        assert 80 < tracker.throttled_until("github.com") - time.time() <= 90
@@ -0,0 +1,248 @@
+"""Tests for the conditional-request response cache."""
+
+import json
+import os
+import stat
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.ticket_clients.github import GitHubTicketClient
+from src.ticket_clients.http_transport import ApiRequest, HTTPTransport
+from src.ticket_clients.response_cache import CachedResponse, ResponseCache
+
+
+def _response(status_code=200, body=None, links=None, headers=None):
+    """Build a mock requests.Response."""
+    response = MagicMock()
+    response.status_code = status_code
+    response.reason = "OK"
+    response.text = json.dumps(body) if body is not None else ""
+    response.json.return_value = body
+    response.links = links or {}
+    response.headers = headers or {}
+    return response
+
+
+def _transport(*responses, cache=None):
+    """Build a transport with a mocked github.com session."""
+    transport = HTTPTransport(cache=cache if cache is not None else ResponseCache())
+    session = MagicMock()
+    session.request.side_effect = list(responses)
+    transport._sessions["github.com"] = session
+    return transport, session
+
+
+@pytest.mark.unit
+class TestResponseCache:
+    """Tests for ResponseCache storage and eviction."""
+
+    def test_evicts_least_recently_used_over_budget(self):
+        """Test entries are evicted oldest-first once the size budget is exceeded."""
+        cache = ResponseCache(max_bytes=25)
+        cache.put("a", CachedResponse("x" * 10))
+        cache.put("b", CachedResponse("x" * 10))
+        cache.get("a")  # a is now most recently used
+
+        cache.put("c", CachedResponse("x" * 10))
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("c") is not None
+        assert cache.size_bytes == 20
+
+    def test_oversized_entry_not_cached(self):
+        """Test a response larger than the whole budget is skipped."""
+        cache = ResponseCache(max_bytes=5)
+
+        cache.put("a", CachedResponse("x" * 10))
+
+        assert len(cache) == 0
+
+    def test_replacing_entry_updates_size(self):
+        """Test re-storing a key replaces its size accounting."""
+        cache = ResponseCache()
+        cache.put("a", CachedResponse("x" * 10))
+        cache.put("a", CachedResponse("x" * 3))
+
+        assert cache.size_bytes == 3
+
+    def test_persists_across_instances(self, tmp_path):
+        """Test saved entries are loaded by a new cache with owner-only permissions."""
+        path = tmp_path / "cache.json"
+        cache = ResponseCache(path=str(path))
+        cache.put("https://api.github.com/x", CachedResponse("[]", etag='"abc"'))
+
+        cache.save()
+        reloaded = ResponseCache(path=str(path))
+
+        assert reloaded.get("https://api.github.com/x") == CachedResponse("[]", etag='"abc"')
+        assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+
+    def test_unreadable_file_starts_empty(self, tmp_path):
+        """Test a corrupt cache file is ignored."""
+        path = tmp_path / "cache.json"
+        path.write_text("not json")
+
+        cache = ResponseCache(path=str(path))
+
+        assert len(cache) == 0
+
+
+@pytest.mark.unit
+class TestConditionalRequests:
+    """Tests for conditional GETs through HTTPTransport."""
+
+    def test_revalidates_with_etag_and_serves_304_from_cache(self):
+        """Test the second GET sends If-None-Match and a 304 returns the cached body."""
+        transport, session = _transport(
+            _response(body=[{"id": 1}], headers={"ETag": '"v1"'}),
+            _response(status_code=304),
+        )
+        request = ApiRequest(method="GET", endpoint="repos/o/r/commits/abc/status")
+
+        first = transport.execute("github.com", "t", request)
+        second = transport.execute("github.com", "t", request)
+
+        assert first == second == json.dumps([{"id": 1}])
+        assert "If-None-Match" not in session.request.call_args_list[0][1]["headers"]
+        assert session.request.call_args_list[1][1]["headers"]["If-None-Match"] == '"v1"'
+        assert (transport.cache.hits, transport.cache.misses) == (1, 1)
+
+    def test_last_modified_sent_as_if_modified_since(self):
+        """Test Last-Modified validators are sent back as If-Modified-Since."""
+        lm = "Wed, 21 Oct 2015 07:28:00 GMT"
+        transport, session = _transport(
+            _response(body={}, headers={"Last-Modified": lm}),
+            _response(status_code=304),
+        )
+        request = ApiRequest(method="GET", endpoint="x")
+
+        transport.execute("github.com", "t", request)
+        transport.execute("github.com", "t", request)
+
+        assert session.request.call_args_list[1][1]["headers"]["If-Modified-Since"] == lm
+
+    def test_changed_resource_replaces_cached_body(self):
+        """Test a 200 after a change updates the cached body and validator."""
+        transport, session = _transport(
+            _response(body=[1], headers={"ETag": '"v1"'}),
+            _response(body=[1, 2], headers={"ETag": '"v2"'}),
+            _response(status_code=304),
+        )
+        request = ApiRequest(method="GET", endpoint="x")
+
+        transport.execute("github.com", "t", request)
+        transport.execute("github.com", "t", request)
+        third = transport.execute("github.com", "t", request)
+
+        assert json.loads(third) == [1, 2]
+        assert session.request.call_args_list[2][1]["headers"]["If-None-Match"] == '"v2"'
+
+    def test_paginated_304_follows_cached_next_link(self):
+        """Test a 304 on page one still revalidates page two from the cached link."""
+        page2 = "https://api.github.com/x?page=2"
+        transport, session = _transport(
+            _response(body=[1], links={"next": {"url": page2}}, headers={"ETag": '"p1"'}),
+            _response(body=[2], headers={"ETag": '"p2"'}),
+            _response(status_code=304),
+            _response(body=[2, 3], headers={"ETag": '"p2b"'}),
+        )
+        request = ApiRequest(method="GET", endpoint="x", paginate=True)
+
+        transport.execute("github.com", "t", request)
+        output = transport.execute("github.com", "t", request)
+
+        assert json.loads(output) == [1, 2, 3]
+        assert session.request.call_args_list[3][0][1] == page2
+        assert session.request.call_args_list[3][1]["headers"]["If-None-Match"] == '"p2"'
+
+    def test_query_params_are_part_of_the_key(self):
+        """Test GETs with different query strings are cached separately."""
+        transport, session = _transport(
+            _response(body=[1], headers={"ETag": '"a"'}),
+            _response(body=[2], headers={"ETag": '"b"'}),
+        )
+
+        transport.execute("github.com", "t", ApiRequest("GET", "x", fields={"page": "1"}))
+        transport.execute("github.com", "t", ApiRequest("GET", "x", fields={"page": "2"}))
+
+        assert "If-None-Match" not in session.request.call_args_list[1][1]["headers"]
+
+    def test_non_get_requests_are_not_cached(self):
+        """Test POST requests never carry validators or populate the cache."""
+        transport, session = _transport(
+            _response(body={"data": {}}, headers={"ETag": '"g"'}),
+            _response(body={"data": {}}, headers={"ETag": '"g"'}),
+        )
+        request = ApiRequest(method="POST", endpoint="graphql")
+
+        transport.execute("github.com", "t", request, input_data="{}")
+        transport.execute("github.com", "t", request, input_data="{}")
+
+        assert "If-None-Match" not in session.request.call_args_list[1][1]["headers"]
+        assert len(transport.cache) == 0
+
+    def test_close_saves_cache(self, tmp_path):
+        """Test closing the transport persists the cache."""
+        path = tmp_path / "cache.json"
+        transport, _ = _transport(
+            _response(body=[], headers={"ETag": '"v1"'}),
+            cache=ResponseCache(path=str(path)),
+        )
+        transport.execute("github.com", "t", ApiRequest(method="GET", endpoint="x"))
+
+        transport.close()
+
+        assert len(ResponseCache(path=str(path))) == 1
+
+
+@pytest.mark.unit
+class TestListPrsByLabelConditional:
+    """Tests for listing labeled PRs over cacheable REST calls."""
+
+    def test_uses_rest_pulls_when_cache_enabled(self):
+        """Test open PRs are listed from the REST pulls endpoint and filtered by label."""
+        transport = HTTPTransport(cache=ResponseCache())
+        client = GitHubTicketClient(tokens={"github.com": "t"}, http_transport=transport)
+        pulls = [
+            {
+                "number": 1,
+                "title": "Bump a",
+                "created_at": "2024-01-15T10:00:00Z",
+                "head": {"sha": "abc"},
+                "labels": [{"name": "dependencies"}],
+            },
+            {
+                "number": 2,
+                "title": "Feature",
+                "created_at": "2024-01-16T10:00:00Z",
+                "head": {"sha": "def"},
+                "labels": [{"name": "enhancement"}],
+            },
+        ]
+
+        with patch.object(client, "_run_gh_command", return_value=json.dumps(pulls)) as mock_run:
+            prs = client.list_prs_by_label("github.com/owner/repo", "dependencies")
+
+        assert prs == [
+            {
+                "number": 1,
+                "title": "Bump a",
+                "createdAt": "2024-01-15T10:00:00Z",
+                "headRefOid": "abc",
+            }
+        ]
+        args = mock_run.call_args[0][0]
+        assert args[:2] == ["api", "repos/owner/repo/pulls?state=open&per_page=100"]
+
+    def test_uses_gh_pr_list_without_cache(self):
+        """Test the gh CLI is used when REST calls are not conditional."""
+        client = GitHubTicketClient(
+            tokens={"github.com": "t"}, http_transport=HTTPTransport(cache=None)
+        )
+
+        with patch.object(client, "_run_gh_command", return_value="[]") as mock_run:
+            client.list_prs_by_label("github.com/owner/repo", "dependencies")
+
+        assert mock_run.call_args[0][0][:2] == ["pr", "list"]
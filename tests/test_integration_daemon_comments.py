@@ -42,6 +42,9 @@ class TestDaemonResponseComments:
 
         config.username_self = "real-user"
         config.github_enterprise_version = None
+        config.github_http_transport = False
+        config.wake_port = 0
+        config.max_suspended_workflows = 8
 
         with patch("src.ticket_clients.github.GitHubTicketClient"):
             daemon = Daemon(config)
@@ -391,6 +394,9 @@ class TestDaemonInitializeCommentTimestamp:
         config.project_urls = []
 
         config.github_enterprise_version = None
+        config.github_http_transport = False
+        config.wake_port = 0
+        config.max_suspended_workflows = 8
 
         with patch("src.ticket_clients.github.GitHubTicketClient"):
             daemon = Daemon(config)
@@ -559,6 +565,9 @@ class TestDaemonProcessCommentsForItem:
 
         config.username_self = "real-user"
         config.github_enterprise_version = None
+        config.github_http_transport = False
+        config.wake_port = 0
+        config.max_suspended_workflows = 8
 
         with patch("src.ticket_clients.github.GitHubTicketClient"):
             daemon = Daemon(config)
@@ -1258,6 +1267,9 @@ class TestYoloLabelRemovalDuringWorkflow:
         config.project_urls = ["https://github.com/orgs/test/projects/1"]
 
         config.github_enterprise_version = None
+        config.github_http_transport = False
+        config.wake_port = 0
+        config.max_suspended_workflows = 8
         config.ghes_logs_mask = False
         config.github_enterprise_host = None
         config.log_file = f"{temp_workspace_dir}/.kiln/logs/kiln.log"
@@ -1488,6 +1500,9 @@ class TestImplementationCompleteComment:
         config.project_urls = ["https://github.com/orgs/test/projects/1"]
 
         config.github_enterprise_version = None
+        config.github_http_transport = False
+        config.wake_port = 0
+        config.max_suspended_workflows = 8
         config.ghes_logs_mask = False
         config.github_enterprise_host = None
         config.log_file = f"{temp_workspace_dir}/.kiln/logs/kiln.log"
@@ -27,6 +27,9 @@ class TestDaemonBackoff:
         config.project_urls = ["https://github.com/orgs/test/projects/1"]
 
         config.github_enterprise_version = None
+        config.github_http_transport = False
+        config.wake_port = 0
+        config.max_suspended_workflows = 8
 
         with patch("src.ticket_clients.github.GitHubTicketClient"):
             daemon = Daemon(config)
@@ -167,6 +170,9 @@ class TestDaemonMultiActorRaceDetection:
         config.project_urls = ["https://github.com/orgs/test/projects/1"]
 
         config.github_enterprise_version = None
+        config.github_http_transport = False
+        config.wake_port = 0
+        config.max_suspended_workflows = 8
         config.username_self = "kiln-bot"  # Our bot username
 
         with patch("src.ticket_clients.github.GitHubTicketClient"):
@@ -437,6 +443,9 @@ class TestDaemonStaleCommentCleanup:
         config.workspace_dir = temp_workspace_dir
         config.project_urls = ["https://github.com/orgs/test/projects/1"]
         config.github_enterprise_version = None
+        config.github_http_transport = False
+        config.wake_port = 0
+        config.max_suspended_workflows = 8
 
         with patch("src.ticket_clients.github.GitHubTicketClient"):
             daemon = Daemon(config)
@@ -617,6 +626,9 @@ class TestMaybeCleanupClosedWorkflowGuard:
         config.workspace_dir = temp_workspace_dir
         config.project_urls = ["https://github.com/orgs/test/projects/1"]
         config.github_enterprise_version = None
+        config.github_http_transport = False
+        config.wake_port = 0
+        config.max_suspended_workflows = 8
 
         with patch("src.ticket_clients.github.GitHubTicketClient"):
             daemon = Daemon(config)
@@ -682,14 +694,19 @@ class TestMaybeCleanupClosedWorkflowGuard:
         worktree_path = daemon._get_worktree_path(item.repo, item.ticket_id)
         Path(worktree_path).mkdir(parents=True, exist_ok=True)
 
-        # Mock cleanup_workspace to track calls
-        daemon.workspace_manager.cleanup_workspace = MagicMock()
+        # Mock the batched removal to track calls; hold the batch until collected below
+        daemon.workspace_manager.cleanup_workspaces = MagicMock()
+        daemon.worktree_gc.batch_delay = 60
 
         daemon._maybe_cleanup_closed(item)
 
-        # Cleanup should have been called
-        daemon.workspace_manager.cleanup_workspace.assert_called_once_with(
-            item.repo, item.ticket_id
+        # Removal is queued, and the issue is only labeled once it has run
+        assert daemon.worktree_gc.pending_count() == 1
+        daemon.ticket_client.add_label.assert_not_called()
+        daemon.worktree_gc.collect_once()
+
+        daemon.workspace_manager.cleanup_workspaces.assert_called_once_with(
+            item.repo, [item.ticket_id]
         )
         # add_label should have been called to mark as cleaned up
         from src.labels import Labels
@@ -799,6 +816,9 @@ class TestMaybeCleanupWorkflowGuard:
         config.workspace_dir = temp_workspace_dir
         config.project_urls = ["https://github.com/orgs/test/projects/1"]
         config.github_enterprise_version = None
+        config.github_http_transport = False
+        config.wake_port = 0
+        config.max_suspended_workflows = 8
 
         with patch("src.ticket_clients.github.GitHubTicketClient"):
             daemon = Daemon(config)
@@ -864,14 +884,19 @@ class TestMaybeCleanupWorkflowGuard:
         worktree_path = daemon._get_worktree_path(item.repo, item.ticket_id)
         Path(worktree_path).mkdir(parents=True, exist_ok=True)
 
-        # Mock cleanup_workspace to track calls
-        daemon.workspace_manager.cleanup_workspace = MagicMock()
+        # Mock the batched removal to track calls; hold the batch until collected below
+        daemon.workspace_manager.cleanup_workspaces = MagicMock()
+        daemon.worktree_gc.batch_delay = 60
 
         daemon._maybe_cleanup(item)
 
-        # Cleanup should have been called
-        daemon.workspace_manager.cleanup_workspace.assert_called_once_with(
-            item.repo, item.ticket_id
+        # Removal is queued, and the issue is only labeled once it has run
+        assert daemon.worktree_gc.pending_count() == 1
+        daemon.ticket_client.add_label.assert_not_called()
+        daemon.worktree_gc.collect_once()
+
+        daemon.workspace_manager.cleanup_workspaces.assert_called_once_with(
+            item.repo, [item.ticket_id]
         )
         # add_label should have been called to mark as cleaned up
         from src.labels import Labels
@@ -33,6 +33,9 @@ class TestDaemonClearKilnContent:
         config.project_urls = []
 
         config.github_enterprise_version = None
+        config.github_http_transport = False
+        config.wake_port = 0
+        config.max_suspended_workflows = 8
 
         with patch("src.ticket_clients.github.GitHubTicketClient"):
             daemon = Daemon(config)
@@ -575,6 +578,9 @@ class TestDaemonClosePrsAndDeleteBranches:
         config.project_urls = []
 
         config.github_enterprise_version = None
+        config.github_http_transport = False
+        config.wake_port = 0
+        config.max_suspended_workflows = 8
 
         with patch("src.ticket_clients.github.GitHubTicketClient"):
             daemon = Daemon(config)
@@ -1029,6 +1035,9 @@ class TestResetWithRunningWorkflow:
         config.project_urls = ["https://github.com/orgs/test/projects/1"]
 
         config.github_enterprise_version = None
+        config.github_http_transport = False
+        config.wake_port = 0
+        config.max_suspended_workflows = 8
         config.team_usernames = []
         config.username_self = "kiln-bot"
 
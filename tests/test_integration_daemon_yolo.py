@@ -28,6 +28,9 @@ class TestDaemonYoloLabelRemoval:
         config.project_urls = ["https://github.com/orgs/test/projects/1"]
 
         config.github_enterprise_version = None
+        config.github_http_transport = False
+        config.wake_port = 0
+        config.max_suspended_workflows = 8
         config.username_self = "test-user"
 
         with patch("src.ticket_clients.github.GitHubTicketClient"):
@@ -160,6 +163,9 @@ class TestDaemonAutoLabelSynonym:
         config.project_urls = ["https://github.com/orgs/test/projects/1"]
 
         config.github_enterprise_version = None
+        config.github_http_transport = False
+        config.wake_port = 0
+        config.max_suspended_workflows = 8
         config.username_self = "test-user"
 
         with patch("src.ticket_clients.github.GitHubTicketClient"):
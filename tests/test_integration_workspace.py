@@ -1,11 +1,48 @@
 """Integration tests for WorkspaceManager."""
 
+import shutil
+import subprocess
+import time
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from src.workspace import WorkspaceError, WorkspaceManager
+from src.workspace import (
+    CloneStrategy,
+    WorkspaceError,
+    WorkspaceManager,
+    gh_credential_config,
+    issue_branch_name,
+)
+
+
+def _git(*args: str, cwd: Path) -> str:
+    """Run a git command in cwd and return its stdout."""
+    return subprocess.run(
+        ["git", "-c", "user.name=Test", "-c", "user.email=test@example.com", *args],
+        cwd=cwd,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.strip()
+
+
+@pytest.fixture
+def origin_repo(tmp_path):
+    """Fixture providing a local origin repository with main and feature branches."""
+    origin = tmp_path / "origin"
+    origin.mkdir()
+    _git("init", "-b", "main", cwd=origin)
+    (origin / "README.md").write_text("main\n")
+    _git("add", "README.md", cwd=origin)
+    _git("commit", "-m", "Initial commit", cwd=origin)
+    _git("checkout", "-b", "feature", cwd=origin)
+    (origin / "feature.txt").write_text("feature\n")
+    _git("add", "feature.txt", cwd=origin)
+    _git("commit", "-m", "Feature commit", cwd=origin)
+    _git("checkout", "main", cwd=origin)
+    return origin
 
 
 @pytest.mark.integration
@@ -743,3 +780,387 @@ class TestCleanupWorkspaceBranchDeletion:
         # Verify no "branch" command was called
         branch_commands = [cmd for cmd in command_args if cmd[0] == "branch"]
         assert len(branch_commands) == 0
+
+
+@pytest.mark.unit
+class TestIssueBranchName:
+    """Tests for issue_branch_name()."""
+
+    def test_slugifies_title(self):
+        """Test the title is lowercased and non-alphanumerics collapse to dashes."""
+        assert issue_branch_name(42, "Add dark-mode toggle (UI)!") == "42-add-dark-mode-toggle-ui"
+
+    def test_truncates_long_titles_at_word_boundary(self):
+        """Test long titles are cut at a dash within the slug limit."""
+        name = issue_branch_name(7, "word " * 30)
+
+        assert len(name) <= len("7-") + 50
+        assert not name.endswith("-")
+        assert name.startswith("7-word-word")
+
+    def test_title_without_usable_characters(self):
+        """Test a title with no ASCII letters or digits yields just the number."""
+        assert issue_branch_name(9, "???") == "9"
+
+
+@pytest.mark.integration
+class TestWorktreePool:
+    """Tests for the pre-created worktree pool, against a local origin repository."""
+
+    REPO = "github.com/test-org/test-repo"
+
+    def _wait_for_pool(self, manager, count):
+        """Wait for a background refill to reach count worktrees."""
+        deadline = time.monotonic() + 30
+        while manager.pool_count(self.REPO) < count or manager._refilling:
+            assert time.monotonic() < deadline, "pool refill timed out"
+            time.sleep(0.05)
+
+    def test_refill_pool_creates_detached_worktrees(self, temp_workspace_dir, origin_repo):
+        """Test refill_pool clones the repo and creates pool_size detached worktrees."""
+        manager = WorkspaceManager(temp_workspace_dir, pool_size=2)
+
+        created = manager.refill_pool(str(origin_repo), self.REPO)
+
+        assert created == 2
+        assert manager.pool_count(self.REPO) == 2
+        assert manager.refill_pool(str(origin_repo), self.REPO) == 0
+
+    def test_claim_uses_pooled_worktree(self, temp_workspace_dir, origin_repo):
+        """Test claiming moves a pooled worktree into place on a new branch."""
+        manager = WorkspaceManager(temp_workspace_dir, pool_size=1)
+        manager.refill_pool(str(origin_repo), self.REPO)
+
+        path = manager.claim_worktree(str(origin_repo), self.REPO, 42, "42-add-thing")
+
+        assert path == manager.get_workspace_path(self.REPO, 42)
+        assert manager.is_valid_worktree(path, repo=self.REPO)
+        assert _git("branch", "--show-current", cwd=Path(path)) == "42-add-thing"
+        assert (Path(path) / "README.md").exists()
+        self._wait_for_pool(manager, 1)
+
+    def test_claim_with_empty_pool_creates_worktree(self, temp_workspace_dir, origin_repo):
+        """Test claiming without pooled worktrees creates the worktree directly."""
+        manager = WorkspaceManager(temp_workspace_dir, pool_size=0)
+
+        path = manager.claim_worktree(str(origin_repo), self.REPO, 43, "43-direct")
+
+        assert _git("branch", "--show-current", cwd=Path(path)) == "43-direct"
+        assert manager.pool_count(self.REPO) == 0
+
+    def test_claim_starts_from_base_branch(self, temp_workspace_dir, origin_repo):
+        """Test a base branch is fetched and used as the start point."""
+        manager = WorkspaceManager(temp_workspace_dir, pool_size=1)
+        manager.refill_pool(str(origin_repo), self.REPO)
+
+        path = manager.claim_worktree(
+            str(origin_repo), self.REPO, 44, "44-child", base_branch="feature"
+        )
+
+        assert (Path(path) / "feature.txt").exists()
+        self._wait_for_pool(manager, 1)
+
+    def test_claim_picks_up_new_commits_on_main(self, temp_workspace_dir, origin_repo):
+        """Test a worktree pooled before new commits landed is moved to the latest main."""
+        manager = WorkspaceManager(temp_workspace_dir, pool_size=1, fetch_ttl=0)
+        manager.refill_pool(str(origin_repo), self.REPO)
+        (origin_repo / "new.txt").write_text("new\n")
+        _git("add", "new.txt", cwd=origin_repo)
+        _git("commit", "-m", "New commit", cwd=origin_repo)
+
+        path = manager.claim_worktree(str(origin_repo), self.REPO, 45, "45-fresh")
+
+        assert (Path(path) / "new.txt").exists()
+        self._wait_for_pool(manager, 1)
+
+    @pytest.mark.parametrize("pool_size", [0, 1])
+    def test_claim_reuses_existing_branch(self, temp_workspace_dir, origin_repo, pool_size):
+        """Test an issue branch left in the clone is checked out, not reset to the base."""
+        manager = WorkspaceManager(temp_workspace_dir, pool_size=pool_size)
+        manager.refill_pool(str(origin_repo), self.REPO)
+        clone = Path(temp_workspace_dir) / "test-org_test-repo"
+        if pool_size == 0:
+            manager._ensure_repo_cloned(str(origin_repo), self.REPO)
+        _git("branch", "48-resumed", "origin/feature", cwd=clone)
+
+        path = manager.claim_worktree(str(origin_repo), self.REPO, 48, "48-resumed")
+
+        assert _git("branch", "--show-current", cwd=Path(path)) == "48-resumed"
+        assert (Path(path) / "feature.txt").exists()
+        self._wait_for_pool(manager, pool_size)
+
+    def test_clone_authenticates_through_gh(self, temp_workspace_dir):
+        """Test HTTPS clones are configured to get credentials from gh."""
+        manager = WorkspaceManager(temp_workspace_dir, pool_size=0)
+        url = "https://github.example.com/test-org/test-repo.git"
+
+        with patch.object(manager, "_run_git_command") as mock_git:
+            manager._ensure_repo_cloned(url, "github.example.com/test-org/test-repo")
+
+        clone_args = mock_git.call_args_list[0].args[0]
+        assert clone_args[:5] == ["clone", *gh_credential_config(url)]
+        assert gh_credential_config(url)[3] == (
+            "credential.https://github.example.com.helper=!gh auth git-credential"
+        )
+        assert gh_credential_config("/tmp/origin") == []
+
+    def test_claim_rejects_existing_path(self, temp_workspace_dir, origin_repo):
+        """Test claiming fails if something already occupies the workspace path."""
+        manager = WorkspaceManager(temp_workspace_dir, pool_size=0)
+        Path(manager.get_workspace_path(self.REPO, 46)).mkdir()
+
+        with pytest.raises(WorkspaceError, match="already exists"):
+            manager.claim_worktree(str(origin_repo), self.REPO, 46, "46-taken")
+
+    def test_failed_checkout_removes_claimed_worktree(self, temp_workspace_dir, origin_repo):
+        """Test a claimed worktree is removed again if the branch can't be created."""
+        manager = WorkspaceManager(temp_workspace_dir, pool_size=1)
+        manager.refill_pool(str(origin_repo), self.REPO)
+        # With fetch skipped and origin/main deleted, the branch has no start point
+        manager._run_git_command(
+            ["update-ref", "-d", "refs/remotes/origin/main"],
+            cwd=Path(temp_workspace_dir) / "test-org_test-repo",
+        )
+
+        real_git = manager._run_git_command
+
+        def git_without_fetch(args, cwd=None, check=True):
+            if args[0] == "fetch":
+                return MagicMock(returncode=0, stdout="", stderr="")
+            return real_git(args, cwd=cwd, check=check)
+
+        with (
+            patch.object(manager, "_run_git_command", git_without_fetch),
+            patch.object(manager, "refill_pool_async"),
+        ):
+            with pytest.raises(WorkspaceError):
+                manager.claim_worktree(str(origin_repo), self.REPO, 47, "47-broken")
+
+        assert not Path(manager.get_workspace_path(self.REPO, 47)).exists()
+
+
+@pytest.mark.integration
+class TestSyncFetchCoalescing:
+    """Tests for sharing origin/main fetches between worktrees of one clone."""
+
+    REPO = "github.com/test-org/test-repo"
+
+    def test_sync_fetches_once_per_clone_within_ttl(self, temp_workspace_dir, origin_repo):
+        """Test syncing several worktrees of a repo runs a single fetch in the main clone."""
+        manager = WorkspaceManager(temp_workspace_dir, pool_size=0, fetch_ttl=60)
+        paths = [
+            manager.claim_worktree(str(origin_repo), self.REPO, n, f"{n}-issue") for n in (1, 2, 3)
+        ]
+        (origin_repo / "new.txt").write_text("new\n")
+        _git("add", "new.txt", cwd=origin_repo)
+        _git("commit", "-m", "New commit", cwd=origin_repo)
+        manager._fetch_scheduler._fetched_at.clear()
+
+        real_git = manager._run_git_command
+        fetches = []
+
+        def recording_git(args, cwd=None, check=True):
+            if args[0] == "fetch":
+                fetches.append(cwd)
+            return real_git(args, cwd=cwd, check=check)
+
+        with patch.object(manager, "_run_git_command", recording_git):
+            assert all(manager.sync_worktree_with_main(path) for path in paths)
+
+        assert fetches == [Path(temp_workspace_dir).resolve() / "test-org_test-repo"]
+        assert all((Path(path) / "new.txt").exists() for path in paths)
+
+    def test_main_repo_path_for_standalone_directory(self, temp_workspace_dir):
+        """Test a directory that isn't a linked worktree fetches into itself."""
+        manager = WorkspaceManager(temp_workspace_dir)
+        path = Path(temp_workspace_dir) / "standalone"
+        path.mkdir()
+
+        assert manager._get_main_repo_path(path) == path
+
+
+@pytest.mark.integration
+class TestBatchedCleanup:
+    """Tests for removing several worktrees of one repository at once."""
+
+    REPO = "github.com/test-org/test-repo"
+
+    def test_cleanup_workspaces_removes_worktrees_and_branches(
+        self, temp_workspace_dir, origin_repo
+    ):
+        """Test worktrees are removed and their branches deleted in one branch -D."""
+        manager = WorkspaceManager(temp_workspace_dir, pool_size=0)
+        paths = [
+            manager.claim_worktree(str(origin_repo), self.REPO, n, f"{n}-issue") for n in (1, 2, 3)
+        ]
+        repo_path = Path(temp_workspace_dir) / "test-org_test-repo"
+
+        real_git = manager._run_git_command
+        commands = []
+
+        def recording_git(args, cwd=None, check=True):
+            commands.append(args[:2])
+            return real_git(args, cwd=cwd, check=check)
+
+        with patch.object(manager, "_run_git_command", recording_git):
+            removed = manager.cleanup_workspaces(self.REPO, [1, 2, 3, 4])
+
+        assert removed == [1, 2, 3]
+        assert not any(Path(path).exists() for path in paths)
+        assert commands.count(["worktree", "list"]) == 1
+        assert commands.count(["branch", "-D"]) == 1
+        assert "1-issue" not in _git("branch", "--list", cwd=repo_path)
+
+    def test_cleanup_workspaces_without_existing_worktrees(self, temp_workspace_dir):
+        """Test nothing is run when none of the worktrees exist."""
+        manager = WorkspaceManager(temp_workspace_dir)
+
+        assert manager.cleanup_workspaces(self.REPO, [1, 2]) == []
+
+    def test_maintain_repo_prunes_deleted_worktrees(self, temp_workspace_dir, origin_repo):
+        """Test maintain_repo drops metadata of worktrees deleted from disk."""
+        manager = WorkspaceManager(temp_workspace_dir, pool_size=0)
+        path = manager.claim_worktree(str(origin_repo), self.REPO, 1, "1-issue")
+        repo_path = Path(temp_workspace_dir) / "test-org_test-repo"
+        shutil.rmtree(path)
+
+        manager.maintain_repo(self.REPO)
+
+        assert path not in _git("worktree", "list", cwd=repo_path)
+
+
+@pytest.mark.integration
+class TestCloneStrategy:
+    """Tests for partial, sparse and shallow clones."""
+
+    REPO = "github.com/test-org/test-repo"
+
+    @pytest.fixture
+    def monorepo(self, tmp_path):
+        """Fixture providing an origin with several top-level directories, served with filters."""
+        origin = tmp_path / "monorepo"
+        for directory in ("services", "libs", "docs"):
+            (origin / directory).mkdir(parents=True)
+            (origin / directory / "file.txt").write_text(f"{directory}\n")
+        (origin / "README.md").write_text("root\n")
+        _git("init", "-b", "main", cwd=origin)
+        _git("config", "uploadpack.allowFilter", "true", cwd=origin)
+        _git("add", ".", cwd=origin)
+        _git("commit", "-m", "Initial commit", cwd=origin)
+        return f"file://{origin}"
+
+    def test_clone_args(self):
+        """Test each option maps to its git clone flag."""
+        strategy = CloneStrategy(partial=True, sparse_paths=["libs"], shallow_since="2024-01-01")
+
+        assert strategy.clone_args() == [
+            "--filter=blob:none",
+            "--shallow-since=2024-01-01",
+            "--sparse",
+        ]
+        assert CloneStrategy().clone_args() == []
+
+    def test_partial_sparse_clone_and_worktrees(self, temp_workspace_dir, monorepo):
+        """Test the clone, pooled and direct worktrees only check out the sparse paths."""
+        manager = WorkspaceManager(
+            temp_workspace_dir,
+            pool_size=1,
+            clone_strategies={self.REPO: CloneStrategy(partial=True, sparse_paths=["libs"])},
+        )
+        manager.refill_pool(monorepo, self.REPO)
+        repo_path = Path(temp_workspace_dir) / "test-org_test-repo"
+
+        with patch.object(manager, "refill_pool_async"):
+            pooled = Path(manager.claim_worktree(monorepo, self.REPO, 1, "1-pooled"))
+            direct = Path(manager.claim_worktree(monorepo, self.REPO, 2, "2-direct"))
+
+        assert _git("config", "remote.origin.promisor", cwd=repo_path) == "true"
+        for path in (repo_path, pooled, direct):
+            assert sorted(p.name for p in path.iterdir() if p.name != ".git") == [
+                "README.md",
+                "libs",
+            ]
+        assert _git("status", "--porcelain", cwd=pooled) == ""
+        assert _git("branch", "--show-current", cwd=direct) == "2-direct"
+
+    def test_repos_without_strategy_get_full_clone(self, temp_workspace_dir, monorepo):
+        """Test repositories not listed in clone_strategies are cloned in full."""
+        manager = WorkspaceManager(
+            temp_workspace_dir,
+            pool_size=0,
+            clone_strategies={"github.com/other/repo": CloneStrategy(sparse_paths=["libs"])},
+        )
+
+        path = Path(manager.claim_worktree(monorepo, self.REPO, 1, "1-full"))
+
+        assert (path / "docs").exists()
+        assert (path / "services").exists()
+
+
+@pytest.mark.integration
+class TestMergeTrainBuild:
+    """Tests for building and publishing speculative merge trains."""
+
+    REPO = "github.com/test-org/test-repo"
+
+    @pytest.fixture
+    def pr_origin(self, origin_repo):
+        """Origin with pull request heads 1 and 2 adding files and 3 conflicting with 1."""
+        for number, filename, content in (
+            (1, "shared.txt", "one\n"),
+            (2, "two.txt", "two\n"),
+            (3, "shared.txt", "three\n"),
+        ):
+            _git("checkout", "-b", f"pr{number}", "main", cwd=origin_repo)
+            (origin_repo / filename).write_text(content)
+            _git("add", filename, cwd=origin_repo)
+            _git("commit", "-m", f"PR {number}", cwd=origin_repo)
+            _git("update-ref", f"refs/pull/{number}/head", "HEAD", cwd=origin_repo)
+        _git("checkout", "main", cwd=origin_repo)
+        return origin_repo
+
+    def test_builds_stacked_merges_without_checkout(self, temp_workspace_dir, pr_origin):
+        """Test each commit merges one more PR on top of the previous one."""
+        manager = WorkspaceManager(temp_workspace_dir, pool_size=0)
+
+        build = manager.build_merge_train(str(pr_origin), self.REPO, "main", [1, 2])
+
+        repo_path = Path(temp_workspace_dir) / "test-org_test-repo"
+        assert build.base_sha == _git("rev-parse", "main", cwd=pr_origin)
+        assert build.pr_numbers == [1, 2]
+        assert build.head_shas == [_git("rev-parse", f"pr{n}", cwd=pr_origin) for n in (1, 2)]
+        assert build.conflict is None
+        assert _git("ls-tree", "--name-only", build.commits[0], cwd=repo_path).split() == [
+            "README.md",
+            "shared.txt",
+        ]
+        assert "two.txt" in _git("ls-tree", "--name-only", build.commits[1], cwd=repo_path)
+        assert _git("rev-parse", f"{build.commits[1]}^1", cwd=repo_path) == build.commits[0]
+        assert _git("status", "--porcelain", cwd=repo_path) == ""
+
+    def test_stops_at_first_conflict(self, temp_workspace_dir, pr_origin):
+        """Test a PR that conflicts with the train ends it."""
+        manager = WorkspaceManager(temp_workspace_dir, pool_size=0)
+
+        build = manager.build_merge_train(str(pr_origin), self.REPO, "main", [1, 3, 2])
+
+        assert build.pr_numbers == [1]
+        assert build.conflict == 3
+
+    def test_push_and_delete_branches(self, temp_workspace_dir, pr_origin):
+        """Test train commits are published to origin branches and removed again."""
+        manager = WorkspaceManager(temp_workspace_dir, pool_size=0)
+        build = manager.build_merge_train(str(pr_origin), self.REPO, "main", [1, 2])
+
+        manager.push_branches(str(pr_origin), self.REPO, {"kiln/merge-train/2": build.commits[1]})
+
+        assert _git("rev-parse", "kiln/merge-train/2", cwd=pr_origin) == build.commits[1]
+        manager.delete_remote_branches(str(pr_origin), self.REPO, ["kiln/merge-train/2", "gone"])
+        assert _git("branch", "--list", "kiln/*", cwd=pr_origin) == ""
+
+    def test_rejects_invalid_base_branch(self, temp_workspace_dir, pr_origin):
+        """Test a base branch name git would not accept is refused."""
+        manager = WorkspaceManager(temp_workspace_dir, pool_size=0)
+
+        with pytest.raises(WorkspaceError):
+            manager.build_merge_train(str(pr_origin), self.REPO, "main..x", [1])
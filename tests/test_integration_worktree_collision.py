@@ -140,6 +140,9 @@ class TestResetFlowWithNewPaths:
         config.workspace_dir = temp_workspace_dir
         config.project_urls = ["https://github.com/orgs/test/projects/1"]
         config.github_enterprise_version = None
+        config.github_http_transport = False
+        config.wake_port = 0
+        config.max_suspended_workflows = 8
         config.team_usernames = []
         config.username_self = "kiln-bot"
 
@@ -301,6 +304,9 @@ class TestAutoPrepareWithValidation:
         config.workspace_dir = temp_workspace_dir
         config.project_urls = ["https://github.com/orgs/test/projects/1"]
         config.github_enterprise_version = None
+        config.github_http_transport = False
+        config.wake_port = 0
+        config.max_suspended_workflows = 8
         config.team_usernames = []
         config.username_self = "kiln-bot"
 
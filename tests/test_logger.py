@@ -1,14 +1,19 @@
 """Unit tests for the logger module."""
 
+import json
 import logging
+import queue
 import re
 import sys
+import threading
 from datetime import datetime
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
 from src.logger import (
+    AsyncLogHandler,
     ColoredFormatter,
     Colors,
     ContextAwareFormatter,
@@ -16,12 +21,16 @@ from src.logger import (
     MaskingFilter,
     PlainContextAwareFormatter,
     RunLogger,
+    RunLogRouter,
     _extract_org_from_url,
+    _RunLogRoute,
     clear_issue_context,
     get_issue_context,
+    get_log_queue_stats,
     get_logger,
     set_issue_context,
     setup_logging,
+    stop_async_logging,
 )
 
 
@@ -404,6 +413,108 @@ class TestSetupLogging:
             assert len(masking_filters) == 0, f"Handler {handler} should not have MaskingFilter"
 
 
+@pytest.mark.unit
+class TestAsyncLogging:
+    """Tests for the queue-based logging pipeline and JSON-lines output."""
+
+    def teardown_method(self):
+        """Stop the listener and clean up root logger after each test."""
+        stop_async_logging()
+        root = logging.getLogger()
+        root.handlers.clear()
+        root.setLevel(logging.WARNING)
+        clear_issue_context()
+
+    def test_root_only_has_queue_handler(self, tmp_path, monkeypatch):
+        """Test that async mode moves all handlers behind the queue."""
+        monkeypatch.setenv("LOG_LEVEL", "INFO")
+        setup_logging(log_file=str(tmp_path / "kiln.log"), async_logging=True)
+
+        handlers = logging.getLogger().handlers
+        assert len(handlers) == 1
+        assert isinstance(handlers[0], AsyncLogHandler)
+
+    def test_records_written_by_listener_with_captured_context(self, tmp_path, monkeypatch):
+        """Test that records reach the file with the issue context of the logging thread."""
+        monkeypatch.setenv("LOG_LEVEL", "INFO")
+        log_file = tmp_path / "kiln.log"
+        setup_logging(log_file=str(log_file), daemon_mode=True, async_logging=True)
+
+        set_issue_context("github.com/owner/repo", 42)
+        get_logger("test.async").info("queued message")
+        clear_issue_context()
+        stop_async_logging()
+
+        content = log_file.read_text()
+        assert "queued message" in content
+        assert "github.com/owner/repo#42" in content
+
+    def test_console_output_keeps_colors(self, monkeypatch, capsys):
+        """Test that console output in async mode is colored as before."""
+        monkeypatch.setenv("LOG_LEVEL", "INFO")
+        setup_logging(log_file=None, async_logging=True)
+
+        get_logger("test.async").info("Task completed")
+        stop_async_logging()
+
+        out = capsys.readouterr().out
+        assert f"{Colors.GREEN}✓ " in out
+        assert "Task completed" in out
+
+    def test_json_lines_output(self, tmp_path, monkeypatch):
+        """Test that the JSON sink writes one parseable object per record."""
+        monkeypatch.setenv("LOG_LEVEL", "INFO")
+        json_file = tmp_path / "kiln.jsonl"
+        setup_logging(log_file=None, daemon_mode=True, json_log_file=str(json_file))
+
+        set_issue_context("github.com/owner/repo", 7)
+        get_logger("test.json").warning("value is %s", "odd")
+
+        entry = json.loads(json_file.read_text().splitlines()[0])
+        assert entry["level"] == "WARNING"
+        assert entry["logger"] == "test.json"
+        assert entry["message"] == "value is odd"
+        assert entry["issue_context"] == "github.com/owner/repo#7"
+
+    def test_json_lines_keeps_exception_field_in_async_mode(self, tmp_path, monkeypatch):
+        """Test that queued records carry the traceback separately from the message."""
+        monkeypatch.setenv("LOG_LEVEL", "INFO")
+        json_file = tmp_path / "kiln.jsonl"
+        setup_logging(
+            log_file=None, daemon_mode=True, json_log_file=str(json_file), async_logging=True
+        )
+
+        try:
+            raise ValueError("bad value")
+        except ValueError:
+            get_logger("test.json").error("step %s failed", "merge", exc_info=True)
+        stop_async_logging()
+
+        entry = json.loads(json_file.read_text().splitlines()[0])
+        assert entry["message"] == "step merge failed"
+        assert "ValueError: bad value" in entry["exc_info"]
+
+    def test_full_queue_drops_and_counts_low_priority_records(self):
+        """Test that DEBUG/INFO records are dropped and counted when the queue is full."""
+        handler = AsyncLogHandler(queue.Queue(maxsize=1))
+        for n in range(3):
+            handler.handle(logging.makeLogRecord({"msg": f"line {n}", "levelno": logging.INFO}))
+
+        assert handler.dropped_records == 2
+        assert handler.max_depth == 1
+
+    def test_queue_stats(self, monkeypatch):
+        """Test that backpressure counters are exposed only in async mode."""
+        monkeypatch.setenv("LOG_LEVEL", "INFO")
+        setup_logging(log_file=None, daemon_mode=True)
+        assert get_log_queue_stats() is None
+
+        setup_logging(log_file=None, daemon_mode=True, async_logging=True, log_queue_size=50)
+        stats = get_log_queue_stats()
+        assert stats.capacity == 50
+        assert stats.dropped_records == 0
+
+
 @pytest.mark.unit
 class TestGetLogger:
     """Tests for get_logger function."""
@@ -576,6 +687,51 @@ class TestMaskingFilter:
 
         assert record.msg == "github.corp.com/org/repo"
 
+    def test_mask_value_single_pass_matches_sequential_replacement(self):
+        """Test host, repo path and project URL are all masked in one string."""
+        f = MaskingFilter("github.corp.com", "myorg")
+        value = "github.corp.com/myorg/repo#1 on https://github.corp.com/orgs/myorg/projects/2"
+        assert f._mask_value(value) == "<GHES>/<ORG>/repo#1 on https://<GHES>/orgs/<ORG>/projects/2"
+
+    def test_filter_skips_record_masked_by_equivalent_filter(self):
+        """Test a record is masked only once when several handlers carry the filter."""
+        first = MaskingFilter("github.corp.com", "myorg")
+        second = MaskingFilter("github.corp.com", "myorg")
+        record = logging.makeLogRecord({"msg": "github.corp.com/myorg/repo"})
+
+        first.filter(record)
+        with patch.object(second, "_mask_value") as mask_value:
+            second.filter(record)
+
+        mask_value.assert_not_called()
+        assert record.msg == "<GHES>/<ORG>/repo"
+
+    def test_filter_masks_again_for_different_settings(self):
+        """Test a filter with other settings still masks an already-masked record."""
+        record = logging.makeLogRecord({"msg": "github.corp.com/myorg/repo on other.corp.com"})
+
+        MaskingFilter("github.corp.com", "myorg").filter(record)
+        MaskingFilter("other.corp.com", None).filter(record)
+
+        assert record.msg == "<GHES>/<ORG>/repo on <GHES>"
+
+    def test_mask_value_caches_short_strings(self):
+        """Test repeated short strings are only scanned once."""
+        f = MaskingFilter("github.corp.com", "myorg")
+        with patch.object(f, "_substitute", wraps=f._substitute) as substitute:
+            f._mask_value("github.corp.com/myorg/repo#42")
+            f._mask_value("github.corp.com/myorg/repo#42")
+
+        assert substitute.call_count == 1
+
+    def test_mask_value_does_not_cache_long_strings(self):
+        """Test long strings (e.g. streamed output) bypass the cache."""
+        f = MaskingFilter("github.corp.com", "myorg")
+        value = "x" * 1000 + " github.corp.com"
+
+        assert f._mask_value(value).endswith(" <GHES>")
+        assert value not in f._cache
+
 
 @pytest.mark.unit
 class TestExtractOrgFromUrl:
@@ -963,3 +1119,106 @@ class TestRunLogger:
         assert len(parts) == 2
         assert len(parts[0]) == 8  # YYYYMMDD
         assert len(parts[1]) == 4  # HHMM
+
+    def test_sets_and_restores_issue_context(self, tmp_path):
+        """Test that the run's issue context is active only inside the block."""
+        set_issue_context("github.com/owner/other", 7)
+
+        with RunLogger(
+            repo="github.com/owner/repo",
+            issue_number=42,
+            workflow="Research",
+            base_log_dir=str(tmp_path),
+        ):
+            assert get_issue_context() == "github.com/owner/repo#42"
+
+        assert get_issue_context() == "github.com/owner/other#7"
+
+    def test_concurrent_runs_only_capture_their_own_records(self, tmp_path, monkeypatch):
+        """Test that each run file only receives records from its own issue context."""
+        monkeypatch.setenv("LOG_LEVEL", "INFO")
+        setup_logging(log_file=None)
+        logger = get_logger("test.routing")
+        paths = {}
+        barrier = threading.Barrier(2)
+
+        def run(issue_number):
+            with RunLogger(
+                repo="github.com/owner/repo",
+                issue_number=issue_number,
+                workflow="Implement",
+                base_log_dir=str(tmp_path / str(issue_number)),
+            ) as run_logger:
+                barrier.wait()
+                logger.info(f"message for issue {issue_number}")
+                barrier.wait()
+                paths[issue_number] = run_logger.log_path
+
+        threads = [threading.Thread(target=run, args=(n,)) for n in (1, 2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        logger.info("system message outside any run")
+
+        first = Path(paths[1]).read_text()
+        second = Path(paths[2]).read_text()
+        assert "message for issue 1" in first
+        assert "message for issue 2" not in first
+        assert "message for issue 2" in second
+        assert "message for issue 1" not in second
+        assert "system message" not in first + second
+
+
+@pytest.mark.unit
+class TestRunLogRouter:
+    """Tests for the shared per-run log router."""
+
+    def teardown_method(self):
+        """Reset the root logger and issue context."""
+        logging.getLogger().handlers.clear()
+        clear_issue_context()
+
+    def _route(self, path):
+        """Build a route writing bare messages to path."""
+        return _RunLogRoute(
+            log_path=str(path),
+            level=logging.DEBUG,
+            formatter=logging.Formatter("%(message)s"),
+        )
+
+    def test_unrouted_context_is_ignored(self, tmp_path):
+        """Test that records from contexts without a run are not written."""
+        router = RunLogRouter()
+        router.add_route("github.com/owner/repo#1", self._route(tmp_path / "a.log"))
+
+        set_issue_context("github.com/owner/repo", 2)
+        router.handle(logging.makeLogRecord({"msg": "elsewhere", "levelno": logging.INFO}))
+
+        assert router.open_file_count() == 0
+
+    def test_open_files_are_bounded(self, tmp_path):
+        """Test that the least recently written file is closed past the limit."""
+        router = RunLogRouter(max_open_files=2)
+        for n in range(3):
+            router.add_route(f"github.com/owner/repo#{n}", self._route(tmp_path / f"{n}.log"))
+
+        for n in (0, 1, 2, 0):
+            set_issue_context("github.com/owner/repo", n)
+            router.handle(logging.makeLogRecord({"msg": f"line {n}", "levelno": logging.INFO}))
+
+        assert router.open_file_count() == 2
+        # File 0 was evicted and reopened in append mode
+        assert (tmp_path / "0.log").read_text() == "line 0\nline 0\n"
+        router.close()
+
+    def test_router_uninstalled_when_idle(self, tmp_path):
+        """Test that the router removes itself from the root logger after the last run."""
+        router = RunLogRouter()
+        route = self._route(tmp_path / "a.log")
+        router.add_route("github.com/owner/repo#1", route)
+        assert router in logging.getLogger().handlers
+
+        router.remove_route("github.com/owner/repo#1", route)
+
+        assert router not in logging.getLogger().handlers
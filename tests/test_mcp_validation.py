@@ -31,6 +31,9 @@ def base_config(tmp_path):
     config.project_urls = ["https://github.com/orgs/test/projects/1"]
 
     config.github_enterprise_version = None
+    config.github_http_transport = False
+    config.wake_port = 0
+    config.max_suspended_workflows = 8
     config.github_enterprise_host = None
     config.github_token = None
     config.github_enterprise_token = None
@@ -101,7 +104,7 @@ class TestMCPFailOnErrorStartup:
 
         with (
             patch("src.ticket_clients.github.GitHubTicketClient"),
-            patch("src.daemon.check_all_mcp_servers", return_value=mock_results),
+            patch("src.integrations.mcp_client.check_all_mcp_servers", return_value=mock_results),
             pytest.raises(RuntimeError) as exc_info,
         ):
             Daemon(base_config)
@@ -127,7 +130,7 @@ class TestMCPFailOnErrorStartup:
 
         with (
             patch("src.ticket_clients.github.GitHubTicketClient"),
-            patch("src.daemon.check_all_mcp_servers", return_value=mock_results),
+            patch("src.integrations.mcp_client.check_all_mcp_servers", return_value=mock_results),
             pytest.raises(RuntimeError) as exc_info,
         ):
             Daemon(base_config)
@@ -156,7 +159,7 @@ class TestMCPFailOnErrorStartup:
 
         with (
             patch("src.ticket_clients.github.GitHubTicketClient"),
-            patch("src.daemon.check_all_mcp_servers", return_value=mock_results),
+            patch("src.integrations.mcp_client.check_all_mcp_servers", return_value=mock_results),
         ):
             daemon = Daemon(base_config)
             assert daemon is not None
@@ -183,7 +186,7 @@ class TestMCPFailOnErrorStartup:
 
         with (
             patch("src.ticket_clients.github.GitHubTicketClient"),
-            patch("src.daemon.check_all_mcp_servers", return_value=mock_results),
+            patch("src.integrations.mcp_client.check_all_mcp_servers", return_value=mock_results),
             patch("src.daemon.logger") as mock_logger,
         ):
             # Daemon should initialize successfully despite MCP failures
@@ -214,7 +217,7 @@ class TestMCPFailOnErrorStartup:
 
         with (
             patch("src.ticket_clients.github.GitHubTicketClient"),
-            patch("src.daemon.check_all_mcp_servers", return_value=mock_results),
+            patch("src.integrations.mcp_client.check_all_mcp_servers", return_value=mock_results),
             patch("src.daemon.logger") as mock_logger,
         ):
             daemon = Daemon(base_config)
@@ -258,12 +261,14 @@ class TestPreWorkflowMCPHealthCheck:
 
         with (
             patch("src.ticket_clients.github.GitHubTicketClient"),
-            patch("src.daemon.check_all_mcp_servers", return_value=mock_results),
+            patch("src.integrations.mcp_client.check_all_mcp_servers", return_value=mock_results),
         ):
             daemon = Daemon(base_config)
 
             # Now mock check_all_mcp_servers for the health check call
-            with patch("src.daemon.check_all_mcp_servers", return_value=mock_results):
+            with patch(
+                "src.integrations.mcp_client.check_all_mcp_servers", return_value=mock_results
+            ):
                 result = daemon._check_mcp_health_before_workflow(issue_number=42)
 
             assert result is True
@@ -287,11 +292,16 @@ class TestPreWorkflowMCPHealthCheck:
 
         with (
             patch("src.ticket_clients.github.GitHubTicketClient"),
-            patch("src.daemon.check_all_mcp_servers", return_value=startup_results),
+            patch(
+                "src.integrations.mcp_client.check_all_mcp_servers", return_value=startup_results
+            ),
         ):
             daemon = Daemon(base_config)
 
-            with patch("src.daemon.check_all_mcp_servers", return_value=health_check_results):
+            with patch(
+                "src.integrations.mcp_client.check_all_mcp_servers",
+                return_value=health_check_results,
+            ):
                 result = daemon._check_mcp_health_before_workflow(issue_number=42)
 
             assert result is False
@@ -313,12 +323,17 @@ class TestPreWorkflowMCPHealthCheck:
 
         with (
             patch("src.ticket_clients.github.GitHubTicketClient"),
-            patch("src.daemon.check_all_mcp_servers", return_value=startup_results),
+            patch(
+                "src.integrations.mcp_client.check_all_mcp_servers", return_value=startup_results
+            ),
         ):
             daemon = Daemon(base_config)
 
             with (
-                patch("src.daemon.check_all_mcp_servers", return_value=health_check_results),
+                patch(
+                    "src.integrations.mcp_client.check_all_mcp_servers",
+                    return_value=health_check_results,
+                ),
                 patch("src.daemon.send_mcp_failure_notification") as mock_slack,
             ):
                 daemon._check_mcp_health_before_workflow(issue_number=42)
@@ -355,12 +370,17 @@ class TestPreWorkflowMCPHealthCheck:
 
         with (
             patch("src.ticket_clients.github.GitHubTicketClient"),
-            patch("src.daemon.check_all_mcp_servers", return_value=startup_results),
+            patch(
+                "src.integrations.mcp_client.check_all_mcp_servers", return_value=startup_results
+            ),
         ):
             daemon = Daemon(base_config)
 
             with (
-                patch("src.daemon.check_all_mcp_servers", return_value=health_check_results),
+                patch(
+                    "src.integrations.mcp_client.check_all_mcp_servers",
+                    return_value=health_check_results,
+                ),
                 patch("src.daemon.send_mcp_failure_notification") as mock_slack,
             ):
                 daemon._check_mcp_health_before_workflow(issue_number=123)
@@ -391,12 +411,17 @@ class TestPreWorkflowMCPHealthCheck:
 
         with (
             patch("src.ticket_clients.github.GitHubTicketClient"),
-            patch("src.daemon.check_all_mcp_servers", return_value=startup_results),
+            patch(
+                "src.integrations.mcp_client.check_all_mcp_servers", return_value=startup_results
+            ),
         ):
             daemon = Daemon(base_config)
 
             with (
-                patch("src.daemon.check_all_mcp_servers", return_value=health_check_results),
+                patch(
+                    "src.integrations.mcp_client.check_all_mcp_servers",
+                    return_value=health_check_results,
+                ),
                 patch("src.daemon.send_mcp_failure_notification"),
                 patch("src.daemon.logger") as mock_logger,
             ):
@@ -474,13 +499,18 @@ class TestGracefulDegradation:
 
         with (
             patch("src.ticket_clients.github.GitHubTicketClient"),
-            patch("src.daemon.check_all_mcp_servers", return_value=startup_results),
+            patch(
+                "src.integrations.mcp_client.check_all_mcp_servers", return_value=startup_results
+            ),
         ):
             daemon = Daemon(base_config)
 
             # Health check should return False
             with (
-                patch("src.daemon.check_all_mcp_servers", return_value=health_check_results),
+                patch(
+                    "src.integrations.mcp_client.check_all_mcp_servers",
+                    return_value=health_check_results,
+                ),
                 patch("src.daemon.send_mcp_failure_notification"),
             ):
                 mcp_healthy = daemon._check_mcp_health_before_workflow(issue_number=42)
@@ -505,12 +535,17 @@ class TestGracefulDegradation:
 
         with (
             patch("src.ticket_clients.github.GitHubTicketClient"),
-            patch("src.daemon.check_all_mcp_servers", return_value=startup_results),
+            patch(
+                "src.integrations.mcp_client.check_all_mcp_servers", return_value=startup_results
+            ),
         ):
             daemon = Daemon(base_config)
 
             with (
-                patch("src.daemon.check_all_mcp_servers", return_value=health_check_results),
+                patch(
+                    "src.integrations.mcp_client.check_all_mcp_servers",
+                    return_value=health_check_results,
+                ),
                 patch("src.daemon.send_mcp_failure_notification") as mock_slack,
             ):
                 result = daemon._check_mcp_health_before_workflow(issue_number=42)
@@ -533,12 +568,17 @@ class TestGracefulDegradation:
 
         with (
             patch("src.ticket_clients.github.GitHubTicketClient"),
-            patch("src.daemon.check_all_mcp_servers", return_value=startup_results),
+            patch(
+                "src.integrations.mcp_client.check_all_mcp_servers", return_value=startup_results
+            ),
         ):
             daemon = Daemon(base_config)
 
             with (
-                patch("src.daemon.check_all_mcp_servers", return_value=health_check_results),
+                patch(
+                    "src.integrations.mcp_client.check_all_mcp_servers",
+                    return_value=health_check_results,
+                ),
                 patch("src.daemon.send_mcp_failure_notification") as mock_slack,
             ):
                 daemon._check_mcp_health_before_workflow(issue_number=None)
@@ -604,7 +644,9 @@ class TestTokenSubstitutionDuringValidation:
 
         with (
             patch("src.ticket_clients.github.GitHubTicketClient"),
-            patch("src.daemon.check_all_mcp_servers", return_value=mock_results) as mock_check,
+            patch(
+                "src.integrations.mcp_client.check_all_mcp_servers", return_value=mock_results
+            ) as mock_check,
             patch("src.daemon.AzureOAuthClient", return_value=mock_azure_client),
         ):
             # Set Azure credentials so the client is created
@@ -650,7 +692,9 @@ class TestTokenSubstitutionDuringValidation:
 
         with (
             patch("src.ticket_clients.github.GitHubTicketClient"),
-            patch("src.daemon.check_all_mcp_servers", return_value=startup_results),
+            patch(
+                "src.integrations.mcp_client.check_all_mcp_servers", return_value=startup_results
+            ),
             patch("src.daemon.AzureOAuthClient", return_value=mock_azure_client),
         ):
             # Set Azure credentials so the client is created
@@ -664,7 +708,8 @@ class TestTokenSubstitutionDuringValidation:
 
             # Now call health check and verify substitution
             with patch(
-                "src.daemon.check_all_mcp_servers", return_value=health_check_results
+                "src.integrations.mcp_client.check_all_mcp_servers",
+                return_value=health_check_results,
             ) as mock_check:
                 result = daemon._check_mcp_health_before_workflow(issue_number=42)
 
@@ -695,7 +740,9 @@ class TestTokenSubstitutionDuringValidation:
 
         with (
             patch("src.ticket_clients.github.GitHubTicketClient"),
-            patch("src.daemon.check_all_mcp_servers", return_value=mock_results) as mock_check,
+            patch(
+                "src.integrations.mcp_client.check_all_mcp_servers", return_value=mock_results
+            ) as mock_check,
         ):
             daemon = Daemon(base_config)
 
@@ -708,7 +755,7 @@ class TestTokenSubstitutionDuringValidation:
         """Test that validation with empty config doesn't call check_all_mcp_servers."""
         with (
             patch("src.ticket_clients.github.GitHubTicketClient"),
-            patch("src.daemon.check_all_mcp_servers") as mock_check,
+            patch("src.integrations.mcp_client.check_all_mcp_servers") as mock_check,
             patch("src.daemon.MCPConfigManager") as mock_mcp_class,
         ):
             mock_mcp_instance = MagicMock()
@@ -30,6 +30,9 @@ def daemon(temp_workspace_dir):
     config.workspace_dir = temp_workspace_dir
     config.project_urls = ["https://github.com/orgs/test/projects/1"]
     config.github_enterprise_version = None
+    config.github_http_transport = False
+    config.wake_port = 0
+    config.max_suspended_workflows = 8
     config.username_self = "kiln-bot"
     config.team_usernames = []
 
@@ -37,6 +40,8 @@ def daemon(temp_workspace_dir):
         daemon = Daemon(config)
         daemon.ticket_client = MagicMock()
         daemon.ticket_client.supports_status_actor_check = True
+        # Snapshot unavailable: exercise the per-PR lookups (see TestMergeQueueSnapshot)
+        daemon.ticket_client.list_labeled_pr_snapshots.return_value = None
         daemon.auto_merging_manager = MagicMock()
         # Mock database methods for merge queue
         daemon.database.add_to_merge_queue = MagicMock()
@@ -8,6 +8,7 @@ mocked GitHub responses, covering:
 - Manual merge detection
 - Daemon restart with persisted queue
 - Config-disabled repo is skipped
+- Speculative merge trains
 """
 
 from unittest.mock import MagicMock, patch
@@ -17,8 +18,10 @@ import pytest
 from src.daemon import Daemon
 from src.database import Database
 from src.integrations.auto_merging import AutoMergingEntry
-from src.interfaces import CheckRunResult
+from src.interfaces import CheckRunResult, PullRequestSnapshot
 from src.labels import Labels
+from src.merge_train import CHECKS_REGISTRATION_GRACE
+from src.workspace import MergeTrainBuild
 
 # =============================================================================
 # Test Fixtures
@@ -133,6 +136,9 @@ def integration_daemon(temp_workspace_dir, auto_merge_config_fixture):
     config.workspace_dir = temp_workspace_dir
     config.project_urls = ["https://github.com/orgs/test/projects/1"]
     config.github_enterprise_version = None
+    config.github_http_transport = False
+    config.wake_port = 0
+    config.max_suspended_workflows = 8
     config.username_self = "kiln-bot"
     config.team_usernames = []
 
@@ -140,6 +146,8 @@ def integration_daemon(temp_workspace_dir, auto_merge_config_fixture):
         daemon = Daemon(config)
         daemon.ticket_client = MagicMock()
         daemon.ticket_client.supports_status_actor_check = True
+        # Snapshot unavailable: exercise the per-PR lookups (see TestMergeQueueSnapshot)
+        daemon.ticket_client.list_labeled_pr_snapshots.return_value = None
 
         # Default merge state response (can be overridden in tests)
         daemon.ticket_client.get_pr_merge_state.return_value = {
@@ -673,6 +681,9 @@ class TestDaemonRestartWithPersistedQueue:
         config_mock.workspace_dir = temp_workspace_dir
         config_mock.project_urls = ["https://github.com/orgs/test/projects/1"]
         config_mock.github_enterprise_version = None
+        config_mock.github_http_transport = False
+        config_mock.wake_port = 0
+        config_mock.max_suspended_workflows = 8
         config_mock.username_self = "kiln-bot"
         config_mock.team_usernames = []
 
@@ -737,6 +748,9 @@ class TestDaemonRestartWithPersistedQueue:
         config_mock.workspace_dir = temp_workspace_dir
         config_mock.project_urls = ["https://github.com/orgs/test/projects/1"]
         config_mock.github_enterprise_version = None
+        config_mock.github_http_transport = False
+        config_mock.wake_port = 0
+        config_mock.max_suspended_workflows = 8
         config_mock.username_self = "kiln-bot"
         config_mock.team_usernames = []
 
@@ -950,3 +964,353 @@ class TestFullMergeQueueLifecycle:
 
         # First repo failed early, second repo got 3 calls
         assert integration_daemon.ticket_client.list_prs_by_label.call_count >= 2
+
+
+# =============================================================================
+# Snapshot-based Queue Refresh Tests
+# =============================================================================
+
+
+def _snapshot(number, labels, checks=None, **state):
+    """Build a PullRequestSnapshot for a Dependabot PR."""
+    return PullRequestSnapshot(
+        number=number,
+        created_at=f"2024-01-15T{number % 24:02d}:00:00Z",
+        labels=set(labels),
+        merge_state_status=state.get("merge_state_status", "CLEAN"),
+        mergeable=state.get("mergeable", "MERGEABLE"),
+        review_decision=state.get("review_decision", "APPROVED"),
+        head_sha=state.get("head_sha", f"sha{number}"),
+        base_ref="main",
+        base_head_sha=state.get("base_head_sha"),
+        checks=checks,
+    )
+
+
+@pytest.mark.integration
+class TestMergeQueueSnapshot:
+    """Tests for refreshing the queue from one labeled-PR snapshot per repo."""
+
+    def test_poll_uses_only_the_snapshot_query(
+        self, integration_daemon, auto_merge_config_fixture, mock_check_runs_fixture
+    ):
+        """Test queue discovery and the head PR's merge flow need no per-PR lookups."""
+        config = auto_merge_config_fixture()
+        repo = config.repo
+        client = integration_daemon.ticket_client
+        integration_daemon.auto_merging_manager.get_enabled_repos.return_value = [config]
+        client.list_labeled_pr_snapshots.return_value = [
+            _snapshot(n, ["dependencies"], mock_check_runs_fixture(all_passing=True))
+            for n in (100, 101, 102)
+        ]
+        client.merge_pr.return_value = True
+        client.comment_on_pr.return_value = True
+
+        integration_daemon._poll_merge_queue()
+
+        client.list_labeled_pr_snapshots.assert_called_once_with(
+            repo, ["dependencies", Labels.AUTO_MERGING, Labels.AUTO_MERGE_QUEUE]
+        )
+        for lookup in (
+            client.list_prs_by_label,
+            client.get_pr_state,
+            client.get_pr_merge_state,
+            client.get_pr_head_sha,
+            client.get_check_runs,
+        ):
+            lookup.assert_not_called()
+        client.merge_pr.assert_called_once_with(repo, 100, "squash")
+        assert [e.pr_number for e in integration_daemon.database.get_merge_queue(repo)] == [
+            101,
+            102,
+        ]
+
+    def test_recovers_queue_from_snapshot_labels(
+        self, integration_daemon, auto_merge_config_fixture
+    ):
+        """Test PRs carrying queue labels are restored to the database."""
+        config = auto_merge_config_fixture()
+        repo = config.repo
+        integration_daemon.auto_merging_manager.get_enabled_repos.return_value = [config]
+        # Conflicting, so the recovered head PR is left as is
+        integration_daemon.ticket_client.list_labeled_pr_snapshots.return_value = [
+            _snapshot(100, [Labels.AUTO_MERGE_QUEUE], mergeable="CONFLICTING"),
+            _snapshot(101, [Labels.AUTO_MERGING], mergeable="CONFLICTING"),
+        ]
+
+        integration_daemon._poll_merge_queue()
+
+        queue = integration_daemon.database.get_merge_queue(repo)
+        assert [e.pr_number for e in queue] == [101, 100]
+        assert queue[0].status == "merging"
+
+    def test_only_prs_missing_from_snapshot_are_looked_up(
+        self, integration_daemon, auto_merge_config_fixture
+    ):
+        """Test a queued PR absent from the snapshot gets one state lookup."""
+        config = auto_merge_config_fixture()
+        repo = config.repo
+        integration_daemon.database.add_to_merge_queue(repo, 100, 0)
+        integration_daemon.database.add_to_merge_queue(repo, 101, 1)
+        integration_daemon.auto_merging_manager.get_enabled_repos.return_value = [config]
+        client = integration_daemon.ticket_client
+        client.list_labeled_pr_snapshots.return_value = [
+            _snapshot(101, ["dependencies", Labels.AUTO_MERGE_QUEUE], merge_state_status="BEHIND")
+        ]
+        client.get_pr_state.return_value = "MERGED"
+        client.comment_on_pr.return_value = True
+
+        integration_daemon._poll_merge_queue()
+
+        client.get_pr_state.assert_called_once_with(repo, 100)
+        client.remove_label.assert_any_call(repo, 100, Labels.AUTO_MERGE_QUEUE)
+        assert [e.pr_number for e in integration_daemon.database.get_merge_queue(repo)] == [101]
+        client.comment_on_pr.assert_called_once_with(repo, 101, "@dependabot rebase")
+
+    def test_truncated_checks_fall_back_to_rest(
+        self, integration_daemon, auto_merge_config_fixture, mock_check_runs_fixture
+    ):
+        """Test the head PR's checks are queried when the rollup did not fit."""
+        config = auto_merge_config_fixture()
+        repo = config.repo
+        integration_daemon.auto_merging_manager.get_enabled_repos.return_value = [config]
+        client = integration_daemon.ticket_client
+        client.list_labeled_pr_snapshots.return_value = [
+            _snapshot(100, ["dependencies"], checks=None)
+        ]
+        client.get_check_runs.return_value = mock_check_runs_fixture(all_failing=True)
+
+        integration_daemon._poll_merge_queue()
+
+        client.get_check_runs.assert_called_once_with(repo, "sha100")
+        client.get_pr_head_sha.assert_not_called()
+        client.merge_pr.assert_not_called()
+
+    def test_failed_snapshot_falls_back_to_per_pr_lookups(
+        self, integration_daemon, auto_merge_config_fixture, mock_pr_list_fixture
+    ):
+        """Test a failed snapshot query refreshes the queue with separate lookups."""
+        config = auto_merge_config_fixture()
+        repo = config.repo
+        integration_daemon.auto_merging_manager.get_enabled_repos.return_value = [config]
+        client = integration_daemon.ticket_client
+        client.list_labeled_pr_snapshots.return_value = None
+        client.list_prs_by_label.side_effect = lambda r, label: (
+            mock_pr_list_fixture(count=2) if label == "dependencies" else []
+        )
+        client.get_pr_state.return_value = "OPEN"
+        client.get_pr_head_sha.return_value = "sha100"
+        client.get_check_runs.return_value = []
+        client.merge_pr.return_value = False
+
+        integration_daemon._poll_merge_queue()
+
+        client.list_prs_by_label.assert_any_call(repo, "dependencies")
+        assert client.get_pr_state.call_count == 2
+        client.get_pr_merge_state.assert_called_once_with(repo, 100)
+
+
+# =============================================================================
+# Speculative Merge Train Tests
+# =============================================================================
+
+
+def _build(base_sha, pr_numbers, conflict=None):
+    """MergeTrainBuild with one merge commit per PR, named after the PR."""
+    return MergeTrainBuild(
+        base_sha=base_sha,
+        pr_numbers=list(pr_numbers),
+        head_shas=[f"sha{n}" for n in pr_numbers],
+        commits=[f"train{n}" for n in pr_numbers],
+        conflict=conflict,
+    )
+
+
+@pytest.mark.integration
+class TestSpeculativeMergeQueue:
+    """Tests for testing several queued PRs together and merging the passing prefix."""
+
+    @pytest.fixture
+    def speculative(self, integration_daemon):
+        """Daemon with a speculative config, four queued PRs and a mocked workspace."""
+        config = AutoMergingEntry(
+            repo="github.com/test-org/test-repo",
+            enabled=True,
+            strategy="speculative",
+            batch_size=3,
+        )
+        integration_daemon.auto_merging_manager.get_enabled_repos.return_value = [config]
+        integration_daemon.workspace_manager = MagicMock()
+        integration_daemon.workspace_manager.build_merge_train.side_effect = (
+            lambda url, repo, base, prs: _build("base", prs)
+        )
+        client = integration_daemon.ticket_client
+        client.list_labeled_pr_snapshots.return_value = [
+            _snapshot(n, ["dependencies"], merge_state_status="BEHIND") for n in range(100, 104)
+        ]
+        client.merge_pr.return_value = True
+        return integration_daemon, config
+
+    def test_first_poll_pushes_one_branch_per_prefix(self, speculative):
+        """Test the first batch_size PRs are merged locally and pushed for CI."""
+        daemon, config = speculative
+        repo = config.repo
+
+        daemon._poll_merge_queue()
+
+        daemon.workspace_manager.build_merge_train.assert_called_once_with(
+            "https://github.com/test-org/test-repo.git", repo, "main", [100, 101, 102]
+        )
+        daemon.workspace_manager.push_branches.assert_called_once_with(
+            "https://github.com/test-org/test-repo.git",
+            repo,
+            {
+                "kiln/merge-train/100": "train100",
+                "kiln/merge-train/101": "train101",
+                "kiln/merge-train/102": "train102",
+            },
+        )
+        statuses = {e.pr_number: e.status for e in daemon.database.get_merge_queue(repo)}
+        assert statuses == {100: "testing", 101: "testing", 102: "testing", 103: "queued"}
+        daemon.ticket_client.comment_on_pr.assert_not_called()
+        daemon.ticket_client.merge_pr.assert_not_called()
+
+    def test_merges_passing_prefix_and_sets_culprit_aside(
+        self, speculative, mock_check_runs_fixture
+    ):
+        """Test PRs before a failed prefix are merged and the next train skips the culprit."""
+        daemon, config = speculative
+        repo = config.repo
+        daemon._poll_merge_queue()
+        passing = mock_check_runs_fixture(all_passing=True)
+        daemon.ticket_client.get_check_runs_bulk.return_value = {
+            "train100": passing,
+            "train101": mock_check_runs_fixture(all_failing=True),
+            "train102": passing,
+        }
+
+        daemon._poll_merge_queue()
+
+        daemon.ticket_client.merge_pr.assert_called_once_with(repo, 100, "squash")
+        daemon.workspace_manager.delete_remote_branches.assert_called_once()
+        assert daemon.workspace_manager.build_merge_train.call_args.args[3] == [102, 103]
+        assert [e.pr_number for e in daemon.database.get_merge_queue(repo)] == [101, 102, 103]
+
+    def test_waits_while_ci_runs(self, speculative, mock_check_runs_fixture):
+        """Test nothing is merged or rebuilt while the first prefix is running."""
+        daemon, _ = speculative
+        daemon._poll_merge_queue()
+        daemon.ticket_client.get_check_runs_bulk.return_value = {
+            "train100": mock_check_runs_fixture(in_progress=True),
+        }
+
+        daemon._poll_merge_queue()
+
+        daemon.ticket_client.merge_pr.assert_not_called()
+        assert daemon.workspace_manager.build_merge_train.call_count == 1
+
+    def test_bisect_retries_failed_batch_at_half_size(self, speculative, mock_check_runs_fixture):
+        """Test bisect batching pushes only the whole batch and halves it on failure."""
+        daemon, config = speculative
+        config.batching = "bisect"
+        config.batch_size = 4
+        daemon._poll_merge_queue()
+        daemon.workspace_manager.push_branches.assert_called_once_with(
+            "https://github.com/test-org/test-repo.git",
+            config.repo,
+            {"kiln/merge-train/103": "train103"},
+        )
+        daemon.ticket_client.get_check_runs_bulk.return_value = {
+            "train103": mock_check_runs_fixture(all_failing=True),
+        }
+
+        daemon._poll_merge_queue()
+
+        daemon.ticket_client.merge_pr.assert_not_called()
+        assert daemon.workspace_manager.build_merge_train.call_args.args[3] == [100, 101]
+
+    def test_updated_pr_restarts_train(self, speculative):
+        """Test a push to a PR under test drops the train and builds a new one."""
+        daemon, _ = speculative
+        daemon._poll_merge_queue()
+        daemon.ticket_client.list_labeled_pr_snapshots.return_value = [
+            _snapshot(n, ["dependencies"], head_sha=f"new{n}" if n == 101 else f"sha{n}")
+            for n in range(100, 104)
+        ]
+
+        daemon._poll_merge_queue()
+
+        daemon.ticket_client.get_check_runs_bulk.assert_not_called()
+        daemon.workspace_manager.delete_remote_branches.assert_called_once()
+        assert daemon.workspace_manager.build_merge_train.call_count == 2
+
+    def test_moved_base_restarts_train(self, speculative):
+        """Test a push to the base branch drops the train and builds a new one."""
+        daemon, _ = speculative
+        daemon.ticket_client.list_labeled_pr_snapshots.return_value = [
+            _snapshot(n, ["dependencies"], base_head_sha="base") for n in range(100, 104)
+        ]
+        daemon._poll_merge_queue()
+        daemon.ticket_client.list_labeled_pr_snapshots.return_value = [
+            _snapshot(n, ["dependencies"], base_head_sha="other") for n in range(100, 104)
+        ]
+
+        daemon._poll_merge_queue()
+
+        daemon.ticket_client.get_check_runs_bulk.assert_not_called()
+        daemon.workspace_manager.delete_remote_branches.assert_called_once()
+        assert daemon.workspace_manager.build_merge_train.call_count == 2
+
+    def test_own_merges_do_not_restart_train(self, speculative, mock_check_runs_fixture):
+        """Test the base moved by the train's merges is adopted, later moves restart it."""
+        daemon, config = speculative
+        daemon.ticket_client.list_labeled_pr_snapshots.return_value = [
+            _snapshot(n, ["dependencies"], base_head_sha="base") for n in range(100, 104)
+        ]
+        daemon._poll_merge_queue()
+        daemon.ticket_client.get_check_runs_bulk.return_value = {
+            "train100": mock_check_runs_fixture(all_passing=True),
+            "train101": mock_check_runs_fixture(in_progress=True),
+        }
+        daemon._poll_merge_queue()
+        daemon.ticket_client.merge_pr.assert_called_once_with(config.repo, 100, "squash")
+
+        daemon.ticket_client.list_labeled_pr_snapshots.return_value = [
+            _snapshot(n, ["dependencies"], base_head_sha="merged100") for n in range(101, 104)
+        ]
+        daemon._poll_merge_queue()
+        assert daemon.workspace_manager.build_merge_train.call_count == 1
+
+        daemon.ticket_client.list_labeled_pr_snapshots.return_value = [
+            _snapshot(n, ["dependencies"], base_head_sha="other") for n in range(101, 104)
+        ]
+        daemon._poll_merge_queue()
+        assert daemon.workspace_manager.build_merge_train.call_count == 2
+
+    def test_probe_without_checks_waits_unless_no_ci(self, speculative):
+        """Test a train without CI checks is never merged unless the repo has no CI."""
+        daemon, config = speculative
+        daemon._poll_merge_queue()
+        daemon._merge_trains[config.repo].pushed_at -= CHECKS_REGISTRATION_GRACE + 1
+        daemon.ticket_client.get_check_runs_bulk.return_value = {}
+
+        daemon._poll_merge_queue()
+        daemon.ticket_client.merge_pr.assert_not_called()
+
+        config.no_ci = True
+        daemon._poll_merge_queue()
+        assert daemon.ticket_client.merge_pr.call_count == 3
+
+    def test_conflicting_pr_is_set_aside(self, speculative):
+        """Test a PR that does not merge onto the train is skipped by later trains."""
+        daemon, _ = speculative
+        daemon.workspace_manager.build_merge_train.side_effect = [
+            _build("base", [100], conflict=101),
+            _build("base", [100, 102, 103]),
+        ]
+        daemon._poll_merge_queue()
+        daemon._end_merge_train("github.com/test-org/test-repo")
+
+        daemon._poll_merge_queue()
+
+        assert daemon.workspace_manager.build_merge_train.call_args.args[3] == [100, 102, 103]
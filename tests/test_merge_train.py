@@ -0,0 +1,128 @@
+"""Unit tests for speculative merge train evaluation."""
+
+import pytest
+
+from src.interfaces import CheckRunResult
+from src.merge_train import (
+    CHECKS_REGISTRATION_GRACE,
+    MergeTrain,
+    evaluate_merge_train,
+    plan_probes,
+)
+
+
+def done(name, conclusion="success"):
+    return CheckRunResult(name=name, status="completed", conclusion=conclusion)
+
+
+def running(name):
+    return CheckRunResult(name=name, status="in_progress")
+
+
+def make_train(count, batching="prefixes"):
+    """Train of PRs 101.. with one merge commit each, pushed at time 0."""
+    return MergeTrain(
+        repo="github.com/owner/repo",
+        base_branch="main",
+        base_sha="base",
+        pr_numbers=[101 + i for i in range(count)],
+        head_shas=[f"head{i}" for i in range(count)],
+        commits=[f"c{i}" for i in range(count)],
+        probes=plan_probes(count, batching),
+        pushed_at=0.0,
+    )
+
+
+@pytest.mark.unit
+class TestPlanProbes:
+    """Tests for plan_probes()."""
+
+    def test_prefixes_probe_every_commit(self):
+        assert plan_probes(3, "prefixes") == [0, 1, 2]
+
+    def test_bisect_probes_whole_batch(self):
+        assert plan_probes(3, "bisect") == [2]
+
+    def test_empty_train(self):
+        assert plan_probes(0, "bisect") == []
+
+
+@pytest.mark.unit
+class TestMergeTrain:
+    """Tests for MergeTrain branch naming."""
+
+    def test_probe_refs(self):
+        train = make_train(2)
+
+        assert train.probe_refs() == {
+            "kiln/merge-train/101": "c0",
+            "kiln/merge-train/102": "c1",
+        }
+
+
+@pytest.mark.unit
+class TestEvaluateMergeTrain:
+    """Tests for evaluate_merge_train()."""
+
+    def test_all_probes_pass(self):
+        train = make_train(3)
+        checks = {f"c{i}": [done("CI")] for i in range(3)}
+
+        verdict = evaluate_merge_train(train, checks, now=1.0)
+
+        assert verdict.passed == 3
+        assert not verdict.failed
+
+    def test_passing_prefix_before_running_probe(self):
+        """Test PRs before a probe that is still running can be merged."""
+        train = make_train(3)
+        checks = {"c0": [done("CI")], "c1": [running("CI")], "c2": [done("CI", "failure")]}
+
+        verdict = evaluate_merge_train(train, checks, now=1.0)
+
+        assert verdict.passed == 1
+        assert not verdict.failed
+
+    def test_failed_prefix_names_culprit(self):
+        train = make_train(3)
+        checks = {"c0": [done("CI")], "c1": [done("CI", "failure")], "c2": [done("CI")]}
+
+        verdict = evaluate_merge_train(train, checks, now=1.0)
+
+        assert verdict.passed == 1
+        assert verdict.culprit == 102
+        assert verdict.retest_size is None
+
+    def test_failed_batch_is_halved(self):
+        train = make_train(4, batching="bisect")
+
+        verdict = evaluate_merge_train(train, {"c3": [done("CI", "failure")]}, now=1.0)
+
+        assert verdict.passed == 0
+        assert verdict.culprit is None
+        assert verdict.retest_size == 2
+
+    def test_failed_batch_of_one_names_culprit(self):
+        train = make_train(1, batching="bisect")
+
+        verdict = evaluate_merge_train(train, {"c0": [done("CI", "cancelled")]}, now=1.0)
+
+        assert verdict.culprit == 101
+
+    def test_missing_checks_stay_pending(self):
+        """Test a probe without checks never passes in a repository with CI."""
+        train = make_train(1)
+
+        early = evaluate_merge_train(train, {}, now=1.0)
+        late = evaluate_merge_train(train, {}, now=CHECKS_REGISTRATION_GRACE + 1)
+
+        assert (early.passed, early.missing_checks, early.failed) == (0, False, False)
+        assert (late.passed, late.missing_checks, late.failed) == (0, True, False)
+
+    def test_missing_checks_pass_without_ci(self):
+        """Test a probe without checks passes after the grace period when no_ci is set."""
+        train = make_train(1)
+
+        assert evaluate_merge_train(train, {}, now=1.0, no_ci=True).passed == 0
+        late = evaluate_merge_train(train, {}, now=CHECKS_REGISTRATION_GRACE + 1, no_ci=True)
+        assert late.passed == 1
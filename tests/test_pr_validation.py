@@ -2,6 +2,7 @@
 
 import json
 import subprocess
+from dataclasses import replace
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -987,6 +988,89 @@ class TestImplementWorkflowWaitForCI:
         assert result == []
 
 
+@pytest.mark.unit
+class TestImplementWorkflowWaitForCIWatched:
+    """Tests for ImplementWorkflow._wait_for_ci() with a shared CI watcher."""
+
+    def test_uses_watcher_instead_of_polling(self):
+        """Test the wait is served by the watcher and returns failed checks."""
+        checks = [
+            CheckRunResult(name="CI / test", status="completed", conclusion="success"),
+            CheckRunResult(name="CI / lint", status="completed", conclusion="failure"),
+        ]
+        ci_watcher = MagicMock()
+        ci_watcher.watch.return_value.result.return_value = checks
+        workflow = ImplementWorkflow()
+
+        with patch("src.workflows.implement.GitHubTicketClient") as MockClient:
+            result = workflow._wait_for_ci(
+                "github.com/owner/repo", 42, "abc123", timeout=60, ci_watcher=ci_watcher
+            )
+
+        ci_watcher.watch.assert_called_once_with("github.com/owner/repo", "abc123")
+        ci_watcher.suspended.assert_called_once()
+        MockClient.assert_not_called()
+        assert [r.name for r in result] == ["CI / lint"]
+
+    def test_timeout_cancels_and_uses_latest_checks(self):
+        """Test a timeout comments on the PR and returns failures seen so far."""
+        from concurrent.futures import TimeoutError as FuturesTimeoutError
+
+        ci_watcher = MagicMock()
+        ci_watcher.watch.return_value.result.side_effect = FuturesTimeoutError()
+        ci_watcher.cancel.return_value = [
+            CheckRunResult(name="CI / lint", status="completed", conclusion="failure"),
+            CheckRunResult(name="CI / test", status="in_progress"),
+        ]
+        ci_watcher.ticket_client.get_check_runs.side_effect = NetworkError("unreachable")
+        workflow = ImplementWorkflow()
+
+        with patch.object(workflow, "_add_pr_comment") as mock_comment:
+            result = workflow._wait_for_ci(
+                "github.com/owner/repo", 42, "abc123", timeout=60, ci_watcher=ci_watcher
+            )
+
+        ci_watcher.cancel.assert_called_once()
+        assert "timeout" in mock_comment.call_args[0][2]
+        assert [r.name for r in result] == ["CI / lint"]
+
+    def test_timeout_looks_checks_up_once_more(self):
+        """Test a timeout returns the failures of a final check lookup."""
+        from concurrent.futures import TimeoutError as FuturesTimeoutError
+
+        ci_watcher = MagicMock()
+        ci_watcher.watch.return_value.result.side_effect = FuturesTimeoutError()
+        ci_watcher.cancel.return_value = []
+        ci_watcher.ticket_client.get_check_runs.return_value = [
+            CheckRunResult(name="CI / test", status="completed", conclusion="failure"),
+        ]
+        workflow = ImplementWorkflow()
+
+        with patch.object(workflow, "_add_pr_comment"):
+            result = workflow._wait_for_ci(
+                "github.com/owner/repo", 42, "abc123", timeout=60, ci_watcher=ci_watcher
+            )
+
+        ci_watcher.ticket_client.get_check_runs.assert_called_once_with(
+            "github.com/owner/repo", "abc123"
+        )
+        assert [r.name for r in result] == ["CI / test"]
+
+    def test_persistent_network_error_proceeds_without_waiting(self):
+        """Test a network error reported by the watcher ends the wait with no failures."""
+        ci_watcher = MagicMock()
+        ci_watcher.watch.return_value.result.side_effect = NetworkError("unreachable")
+        workflow = ImplementWorkflow()
+
+        with patch.object(workflow, "_add_pr_comment") as mock_comment:
+            result = workflow._wait_for_ci(
+                "github.com/owner/repo", 42, "abc123", timeout=600, ci_watcher=ci_watcher
+            )
+
+        assert result == []
+        mock_comment.assert_not_called()
+
+
 # =============================================================================
 # Tests for ImplementWorkflow._run_validation_phase()
 # =============================================================================
@@ -1086,6 +1170,32 @@ class TestImplementWorkflowRunValidationPhase:
         comment_calls = [str(call) for call in mock_comment.call_args_list]
         assert any("CI validation passed" in call for call in comment_calls)
 
+    def test_validation_phase_waits_through_context_ci_watcher(self, workflow_context, mock_config):
+        """Test the CI wait uses the watcher passed in the WorkflowContext."""
+        workflow = ImplementWorkflow()
+        ci_watcher = MagicMock()
+        ctx = replace(workflow_context, ci_watcher=ci_watcher)
+
+        mock_manager = MagicMock()
+        mock_manager.get_validation_config.return_value = PRValidationEntry(
+            repo="github.com/owner/repo",
+            validate_before_ready=True,
+            max_fix_attempts=3,
+            timeout=600,
+        )
+
+        with (
+            patch("src.workflows.implement.GitHubTicketClient") as MockClient,
+            patch.object(workflow, "_wait_for_ci", return_value=[]) as mock_wait,
+            patch.object(workflow, "_mark_pr_ready"),
+            patch.object(workflow, "_add_pr_comment"),
+        ):
+            MockClient.return_value.get_pr_head_sha.return_value = "abc123"
+
+            workflow._run_validation_phase(ctx, mock_config, 42, mock_manager)
+
+        assert mock_wait.call_args.kwargs["ci_watcher"] is ci_watcher
+
     def test_validation_phase_runs_fix_loop(self, workflow_context, mock_config):
         """Test validation phase runs fix loop when CI fails."""
         workflow = ImplementWorkflow()
@@ -354,6 +354,167 @@ class TestRunRecordDatabase:
         assert result is not None
 
 
+@pytest.mark.unit
+class TestRunHistoryRetention:
+    """Tests for run-history retention and daily rollups."""
+
+    REPO = "github.com/owner/repo"
+
+    def _insert_run(
+        self, db, started_at, duration_seconds=60, outcome="success", workflow="research"
+    ):
+        """Insert a run that completed duration_seconds after started_at."""
+        completed_at = (
+            started_at + timedelta(seconds=duration_seconds) if duration_seconds else None
+        )
+        return db.insert_run_record(
+            RunRecord(
+                repo=self.REPO,
+                issue_number=42,
+                workflow=workflow,
+                started_at=started_at,
+                completed_at=completed_at,
+                outcome=outcome if completed_at else None,
+            )
+        )
+
+    def test_retention_indexes_created(self, temp_db):
+        """Test that the time-range indexes exist."""
+        names = {
+            row["name"]
+            for row in temp_db.conn.execute("SELECT name FROM sqlite_master WHERE type='index'")
+        }
+
+        assert {
+            "idx_run_history_started_at",
+            "idx_run_history_completed_at",
+            "idx_run_history_outcome",
+            "idx_run_history_workflow",
+            "idx_processing_comments_started_at",
+        } <= names
+
+    def test_rolls_up_finished_days(self, temp_db):
+        """Test that runs of past days are aggregated per day, workflow and outcome."""
+        day = (datetime.now() - timedelta(days=3)).replace(hour=10, minute=0)
+        self._insert_run(temp_db, day, duration_seconds=60)
+        self._insert_run(temp_db, day, duration_seconds=180)
+        self._insert_run(temp_db, day, duration_seconds=30, outcome="failed")
+
+        result = temp_db.apply_retention(max_age_days=0, max_rows=0)
+
+        assert result.rolled_up_days == 1
+        rollups = temp_db.get_run_rollups()
+        assert [(r.outcome, r.runs) for r in rollups] == [("failed", 1), ("success", 2)]
+        success = rollups[1]
+        assert success.day == day.strftime("%Y-%m-%d")
+        assert success.total_duration_seconds == pytest.approx(240, abs=1)
+        assert success.max_duration_seconds == pytest.approx(180, abs=1)
+
+    def test_today_not_rolled_up(self, temp_db):
+        """Test that runs completed today wait until the day has ended."""
+        self._insert_run(temp_db, datetime.now() - timedelta(seconds=120))
+
+        result = temp_db.apply_retention(max_age_days=0, max_rows=0)
+
+        assert result.rolled_up_days == 0
+        assert temp_db.get_run_rollups() == []
+
+    def test_days_rolled_up_once(self, temp_db):
+        """Test that a second pass does not count runs again."""
+        self._insert_run(temp_db, datetime.now() - timedelta(days=2))
+        temp_db.apply_retention(max_age_days=0, max_rows=0)
+
+        result = temp_db.apply_retention(max_age_days=0, max_rows=0)
+
+        assert result.rolled_up_days == 0
+        assert [r.runs for r in temp_db.get_run_rollups()] == [1]
+
+    def test_deletes_old_runs_and_keeps_rollups(self, temp_db):
+        """Test that runs older than max_age_days are deleted after being rolled up."""
+        old_id = self._insert_run(temp_db, datetime.now() - timedelta(days=40))
+        stalled_id = self._insert_run(
+            temp_db, datetime.now() - timedelta(days=40), duration_seconds=0
+        )
+        recent_id = self._insert_run(temp_db, datetime.now() - timedelta(days=5))
+
+        result = temp_db.apply_retention(max_age_days=30, max_rows=0)
+
+        assert result.deleted_runs == 2
+        assert temp_db.get_run_record(old_id) is None
+        assert temp_db.get_run_record(stalled_id) is None
+        assert temp_db.get_run_record(recent_id) is not None
+        assert sum(r.runs for r in temp_db.get_run_rollups()) == 2
+
+    def test_row_cap_keeps_newest_runs(self, temp_db):
+        """Test that max_rows deletes the oldest finished runs."""
+        ids = [
+            self._insert_run(temp_db, datetime.now() - timedelta(days=days))
+            for days in (5, 4, 3, 2)
+        ]
+
+        result = temp_db.apply_retention(max_age_days=0, max_rows=2)
+
+        assert result.deleted_runs == 2
+        remaining = [run_id for run_id in ids if temp_db.get_run_record(run_id) is not None]
+        assert remaining == ids[2:]
+
+    def test_row_cap_spares_runs_not_rolled_up(self, temp_db):
+        """Test that runs completed today survive the row cap until rolled up."""
+        ids = [
+            self._insert_run(temp_db, datetime.now() - timedelta(seconds=seconds))
+            for seconds in (300, 200, 100)
+        ]
+
+        result = temp_db.apply_retention(max_age_days=0, max_rows=1)
+
+        assert result.deleted_runs == 0
+        assert all(temp_db.get_run_record(run_id) is not None for run_id in ids)
+
+    def test_deletes_orphaned_processing_comments(self, temp_db):
+        """Test that processing_comments rows older than max_age_days are deleted."""
+        temp_db.add_processing_comment(self.REPO, 42, "IC_old")
+        temp_db.add_processing_comment(self.REPO, 42, "IC_new")
+        old = (datetime.now() - timedelta(days=40)).isoformat()
+        temp_db.conn.execute(
+            "UPDATE processing_comments SET started_at = ? WHERE comment_id = 'IC_old'", (old,)
+        )
+        temp_db.conn.commit()
+
+        result = temp_db.apply_retention(max_age_days=30, max_rows=0)
+
+        assert result.deleted_processing_comments == 1
+        rows = temp_db.conn.execute("SELECT comment_id FROM processing_comments").fetchall()
+        assert [row["comment_id"] for row in rows] == ["IC_new"]
+
+    def test_switches_to_incremental_vacuum(self, temp_db):
+        """Test that retention leaves the database in incremental auto_vacuum mode."""
+        temp_db.apply_retention(max_age_days=30, max_rows=100)
+
+        assert temp_db.conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2
+
+    def test_retention_never_runs_full_vacuum(self, temp_db):
+        """Test that an older database is only converted by enable_incremental_vacuum."""
+
+        def disable_auto_vacuum(conn):
+            conn.execute("PRAGMA auto_vacuum = NONE")
+            conn.execute("VACUUM")
+
+        def auto_vacuum_mode():
+            return temp_db._writer.run(
+                [lambda conn: conn.execute("PRAGMA auto_vacuum").fetchone()[0]]
+            )[0]
+
+        temp_db._writer.run([disable_auto_vacuum], exclusive=True)
+        assert auto_vacuum_mode() == 0
+
+        temp_db.apply_retention(max_age_days=30, max_rows=100)
+        assert auto_vacuum_mode() == 0
+
+        assert temp_db.enable_incremental_vacuum() is True
+        assert auto_vacuum_mode() == 2
+        assert temp_db.enable_incremental_vacuum() is False
+
+
 @pytest.mark.unit
 class TestDetermineState:
     """Tests for _determine_state helper function."""
@@ -485,6 +646,44 @@ class TestCmdLogsSummary:
         assert "#100: Add feature" in captured.out
         assert "researching" in captured.out
 
+    def test_cmd_logs_summary_shows_run_rollups(self, tmp_path, capsys):
+        """Test summary view totals workflow runs from the daily rollups."""
+        from src.cli import cmd_logs_summary
+
+        db = Database(str(tmp_path / "test.db"))
+        db.update_issue_state("github.com/owner/repo", 42, "Research")
+        day = (datetime.now() - timedelta(days=2)).strftime("%Y-%m-%d")
+        db.conn.executemany(
+            "INSERT INTO run_history_daily VALUES (?, ?, ?, ?, ?, ?, ?)",
+            [
+                (day, "github.com/owner/repo", "research", "success", 2, 300.0, 200.0),
+                (day, "github.com/owner/other", "research", "success", 1, 60.0, 60.0),
+            ],
+        )
+        db.conn.commit()
+        mock_client = MagicMock()
+        mock_client.get_ticket_labels.return_value = set()
+        mock_client.get_linked_prs.return_value = []
+
+        with (
+            patch("src.config.load_config") as mock_config,
+            patch("src.ticket_clients.get_github_client", return_value=mock_client),
+            patch.object(db, "get_run_history") as mock_history,
+        ):
+            mock_config.return_value = MagicMock(
+                github_token="fake-token",
+                github_enterprise_host=None,
+                github_enterprise_token=None,
+                github_enterprise_version=None,
+            )
+            cmd_logs_summary(db)
+
+        db.close()
+        mock_history.assert_not_called()
+        lines = capsys.readouterr().out.splitlines()
+        row = next(line for line in lines if line.startswith("research"))
+        assert row.split() == ["research", "success", "3", "2m", "0s", "3m", "20s"]
+
     def test_cmd_logs_summary_yolo_indicator(self, tmp_path, capsys):
         """Test that yolo label is displayed with state."""
         from src.cli import cmd_logs_summary
@@ -1115,6 +1314,9 @@ class TestRunLoggingIntegration:
         config.project_urls = ["https://github.com/orgs/test/projects/1"]
 
         config.github_enterprise_version = None
+        config.github_http_transport = False
+        config.wake_port = 0
+        config.max_suspended_workflows = 8
         config.ghes_logs_mask = False
         config.github_enterprise_host = None
         config.log_file = str(tmp_path / ".kiln/logs/kiln.log")
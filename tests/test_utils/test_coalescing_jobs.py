@@ -0,0 +1,125 @@
+"""Tests for the per-key coalescing job registry."""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.utils.coalescing_jobs import CoalescingJobs
+
+
+class Recorder:
+    """Job body that records its arguments and can be held until released."""
+
+    def __init__(self):
+        self.calls = []
+        self.started = threading.Event()
+        self.release = threading.Event()
+        self.release.set()
+
+    def __call__(self, arg):
+        self.calls.append(arg)
+        self.started.set()
+        self.release.wait(timeout=5)
+
+
+@pytest.fixture
+def pool():
+    """Thread pool the registry submits jobs to."""
+    executor = ThreadPoolExecutor(max_workers=4)
+    yield executor
+    executor.shutdown(wait=True)
+
+
+def make_jobs(pool, fn, still_needed=None):
+    """Registry keyed by the part of "key:value" arguments before the colon."""
+    futures = []
+
+    def submit(job, arg):
+        futures.append(pool.submit(job, arg))
+
+    jobs = CoalescingJobs(fn, submit, key=lambda arg: arg.split(":")[0], still_needed=still_needed)
+    return jobs, futures
+
+
+def wait_all(futures):
+    for future in list(futures):
+        future.result(timeout=5)
+
+
+@pytest.mark.unit
+class TestCoalescingJobs:
+    """Tests for CoalescingJobs."""
+
+    def test_queued_submissions_coalesce(self):
+        """Test submissions before the job starts keep only the newest argument."""
+        recorder = Recorder()
+        pending = []
+        jobs = CoalescingJobs(recorder, lambda job, arg: pending.append((job, arg)), key=len)
+
+        assert jobs.submit("a") is True
+        assert jobs.submit("b") is False
+        assert jobs.stats().queued == 1
+
+        job, arg = pending.pop()
+        job(arg)
+
+        assert recorder.calls == ["b"]
+        assert pending == []
+        assert jobs.stats().depth == 0
+
+    def test_submission_while_running_reruns_once(self, pool):
+        recorder = Recorder()
+        recorder.release.clear()
+        jobs, futures = make_jobs(pool, recorder)
+
+        jobs.submit("issue:1")
+        assert recorder.started.wait(timeout=5)
+        jobs.submit("issue:2")
+        jobs.submit("issue:3")
+        stats = jobs.stats()
+        recorder.release.set()
+        wait_all(futures)
+
+        assert stats.running == 1
+        assert stats.rerun_pending == 1
+        assert stats.coalesced == 2
+        assert recorder.calls == ["issue:1", "issue:3"]
+        assert len(futures) == 1
+        assert jobs.stats().depth == 0
+
+    def test_rerun_skipped_when_no_longer_needed(self, pool):
+        recorder = Recorder()
+        recorder.release.clear()
+        jobs, futures = make_jobs(pool, recorder, still_needed=lambda arg: False)
+
+        jobs.submit("issue:1")
+        assert recorder.started.wait(timeout=5)
+        jobs.submit("issue:2")
+        recorder.release.set()
+        wait_all(futures)
+
+        assert recorder.calls == ["issue:1"]
+        assert jobs.submit("issue:3") is True
+
+    def test_keys_run_independently(self, pool):
+        recorder = Recorder()
+        jobs, futures = make_jobs(pool, recorder)
+
+        assert jobs.submit("a:1") is True
+        assert jobs.submit("b:1") is True
+        wait_all(futures)
+
+        assert sorted(recorder.calls) == ["a:1", "b:1"]
+
+    def test_failed_job_releases_key(self, pool):
+        def fail(arg):
+            raise ValueError(arg)
+
+        jobs, futures = make_jobs(pool, fail)
+
+        jobs.submit("issue:1")
+        with pytest.raises(ValueError):
+            wait_all(futures)
+
+        assert jobs.submit("issue:2") is True
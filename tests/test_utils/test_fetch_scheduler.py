@@ -0,0 +1,83 @@
+"""Tests for coalescing git fetches per clone and ref."""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.utils.fetch_scheduler import FetchScheduler
+
+
+@pytest.mark.unit
+class TestFetchScheduler:
+    """Tests for FetchScheduler."""
+
+    def test_concurrent_fetches_share_one_run(self):
+        """Test callers arriving during a fetch wait for it instead of fetching again."""
+        scheduler = FetchScheduler(ttl=0)
+        started = threading.Event()
+        release = threading.Event()
+        runs = []
+
+        def run():
+            runs.append(1)
+            started.set()
+            release.wait(timeout=5)
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            owner = pool.submit(scheduler.fetch, "repo:main", run)
+            assert started.wait(timeout=5)
+            joiners = [pool.submit(scheduler.fetch, "repo:main", run) for _ in range(3)]
+            release.set()
+
+            assert owner.result(timeout=5) is True
+            assert [f.result(timeout=5) for f in joiners] == [False, False, False]
+        assert len(runs) == 1
+
+    def test_recent_fetch_is_reused_within_ttl(self):
+        """Test a fetch completed within the TTL is treated as fresh."""
+        now = [100.0]
+        scheduler = FetchScheduler(ttl=30, clock=lambda: now[0])
+        runs = []
+
+        assert scheduler.fetch("repo:main", lambda: runs.append(1)) is True
+        now[0] += 29
+        assert scheduler.fetch("repo:main", lambda: runs.append(1)) is False
+        now[0] += 1
+        assert scheduler.fetch("repo:main", lambda: runs.append(1)) is True
+
+        assert len(runs) == 2
+
+    def test_keys_are_independent(self):
+        """Test fetches of different clones or refs don't share results."""
+        scheduler = FetchScheduler(ttl=30)
+        runs = []
+
+        scheduler.fetch("repo:main", lambda: runs.append("main"))
+        scheduler.fetch("repo:feature", lambda: runs.append("feature"))
+
+        assert runs == ["main", "feature"]
+
+    def test_failed_fetch_propagates_to_waiters_and_is_not_cached(self):
+        """Test a failure reaches every waiter and the next call fetches again."""
+        scheduler = FetchScheduler(ttl=30)
+        started = threading.Event()
+        release = threading.Event()
+
+        def failing():
+            started.set()
+            release.wait(timeout=5)
+            raise RuntimeError("network down")
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            owner = pool.submit(scheduler.fetch, "repo:main", failing)
+            assert started.wait(timeout=5)
+            joiner = pool.submit(scheduler.fetch, "repo:main", failing)
+            release.set()
+
+            with pytest.raises(RuntimeError, match="network down"):
+                owner.result(timeout=5)
+            with pytest.raises(RuntimeError, match="network down"):
+                joiner.result(timeout=5)
+
+        assert scheduler.fetch("repo:main", lambda: None) is True
@@ -0,0 +1,97 @@
+"""Tests for the per-key ordered thread pool."""
+
+import threading
+import time
+
+import pytest
+
+from src.utils.keyed_executor import KeyedExecutor
+
+
+@pytest.fixture
+def executor():
+    """Create a keyed executor and shut it down after the test."""
+    pool = KeyedExecutor(max_workers=4, thread_name_prefix="test-io-")
+    yield pool
+    pool.shutdown(wait=True)
+
+
+@pytest.mark.unit
+class TestKeyedExecutor:
+    """Tests for KeyedExecutor."""
+
+    def test_same_key_runs_in_submission_order(self, executor):
+        """Test tasks for one key run sequentially in order."""
+        results = []
+
+        def record(value):
+            time.sleep(0.001)
+            results.append(value)
+
+        futures = [executor.submit("repo#1", record, i) for i in range(20)]
+        for future in futures:
+            future.result(timeout=5)
+
+        assert results == list(range(20))
+
+    def test_different_keys_run_concurrently(self, executor):
+        """Test tasks for different keys can overlap."""
+        barrier = threading.Barrier(2, timeout=5)
+
+        futures = [executor.submit(key, barrier.wait) for key in ("repo#1", "repo#2")]
+
+        # Both tasks must be running at once for the barrier to release
+        for future in futures:
+            future.result(timeout=5)
+
+    def test_same_key_never_overlaps(self, executor):
+        """Test a second task for a key waits for the first to finish."""
+        running = threading.Event()
+        overlaps = []
+
+        def task():
+            if running.is_set():
+                overlaps.append(True)
+            running.set()
+            time.sleep(0.01)
+            running.clear()
+
+        futures = [executor.submit("repo#1", task) for _ in range(5)]
+        for future in futures:
+            future.result(timeout=5)
+
+        assert overlaps == []
+
+    def test_exception_is_set_on_future(self, executor):
+        """Test a failing task reports its exception and later tasks still run."""
+
+        def fail():
+            raise ValueError("boom")
+
+        failed = executor.submit("repo#1", fail)
+        after = executor.submit("repo#1", lambda: "ok")
+
+        with pytest.raises(ValueError, match="boom"):
+            failed.result(timeout=5)
+        assert after.result(timeout=5) == "ok"
+
+    def test_keys_are_released_after_draining(self, executor):
+        """Test no keys remain tracked once all tasks finished."""
+        executor.submit("repo#1", lambda: None).result(timeout=5)
+        executor.submit("repo#2", lambda: None).result(timeout=5)
+
+        # The drain loop removes the key right after the last task completes
+        deadline = time.monotonic() + 5
+        while executor.pending_keys() and time.monotonic() < deadline:
+            time.sleep(0.001)
+
+        assert executor.pending_keys() == 0
+
+    def test_submit_after_shutdown_raises(self):
+        """Test submitting to a shut-down executor raises and leaves no queue behind."""
+        pool = KeyedExecutor(max_workers=1)
+        pool.shutdown(wait=True)
+
+        with pytest.raises(RuntimeError):
+            pool.submit("repo#1", lambda: None)
+        assert pool.pending_keys() == 0
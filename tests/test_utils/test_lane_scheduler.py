@@ -0,0 +1,204 @@
+"""Tests for the prioritized, per-lane capped workflow scheduler."""
+
+import threading
+
+import pytest
+
+from src.utils.lane_scheduler import LaneScheduler
+
+
+@pytest.fixture
+def make_scheduler():
+    """Build schedulers and shut them down after the test."""
+    schedulers = []
+
+    def make(lanes, max_workers=8, **kwargs):
+        scheduler = LaneScheduler(lanes, max_workers=max_workers, **kwargs)
+        schedulers.append(scheduler)
+        return scheduler
+
+    yield make
+    for scheduler in schedulers:
+        scheduler.shutdown()
+
+
+class Gate:
+    """Task body that records its argument and blocks until opened."""
+
+    def __init__(self):
+        self.order = []
+        self.started = threading.Event()
+        self.open = threading.Event()
+
+    def __call__(self, arg):
+        self.order.append(arg)
+        self.started.set()
+        assert self.open.wait(timeout=5)
+        return arg
+
+
+@pytest.mark.unit
+class TestLaneScheduler:
+    """Tests for LaneScheduler."""
+
+    def test_lanes_have_separate_caps(self, make_scheduler):
+        """Test a full lane does not hold up work in another lane."""
+        scheduler = make_scheduler({"implement": 1, "comments": 1})
+        gate = Gate()
+
+        blocked = scheduler.submit("implement", gate, "long")
+        assert gate.started.wait(timeout=5)
+        queued = scheduler.submit("implement", lambda arg: arg, "next")
+
+        assert scheduler.submit("comments", lambda arg: arg, "edit").result(timeout=5) == "edit"
+        assert not queued.done()
+        assert scheduler.stats()["implement"].queued == 1
+
+        gate.open.set()
+        assert blocked.result(timeout=5) == "long"
+        assert queued.result(timeout=5) == "next"
+
+    def test_priority_orders_queued_work(self, make_scheduler):
+        scheduler = make_scheduler({"lane": 1})
+        gate = Gate()
+
+        scheduler.submit("lane", gate, "first")
+        assert gate.started.wait(timeout=5)
+        futures = [
+            scheduler.submit("lane", gate, name, priority=priority)
+            for name, priority in [("old", (1, 10)), ("yolo", (0, 50)), ("older", (1, 5))]
+        ]
+        gate.open.set()
+        for future in futures:
+            future.result(timeout=5)
+
+        assert gate.order == ["first", "yolo", "older", "old"]
+
+    def test_repos_take_turns(self, make_scheduler):
+        """Test a repo with a backlog doesn't keep another repo waiting."""
+        scheduler = make_scheduler({"lane": 2})
+        running, queued = Gate(), Gate()
+        two_started = threading.Event()
+
+        def hold(arg):
+            queued.order.append(arg)
+            if len(queued.order) == 2:
+                two_started.set()
+            assert queued.open.wait(timeout=5)
+
+        blockers = [scheduler.submit("lane", running, n, repo="x") for n in range(2)]
+        futures = [
+            scheduler.submit("lane", hold, f"a{n}", repo="a", priority=(0,)) for n in range(3)
+        ]
+        futures.append(scheduler.submit("lane", hold, "b0", repo="b", priority=(1,)))
+        running.open.set()
+        assert two_started.wait(timeout=5)
+
+        # The second slot goes to repo b even though repo a's work has better priority
+        assert sorted(queued.order) == ["a0", "b0"]
+        queued.open.set()
+        for future in blockers + futures:
+            future.result(timeout=5)
+
+    def test_released_frees_slot_for_others(self, make_scheduler):
+        """Test a suspended task lets another task run, then reacquires its slot."""
+        scheduler = make_scheduler({"lane": 1})
+        other_ran = threading.Event()
+        suspended = []
+
+        def waiting(_):
+            with scheduler.released():
+                suspended.append(scheduler.stats()["lane"].suspended)
+                scheduler.submit("lane", lambda _: other_ran.set(), None)
+                assert other_ran.wait(timeout=5)
+            return scheduler.stats()["lane"].running
+
+        assert scheduler.submit("lane", waiting, None).result(timeout=5) == 1
+        assert suspended == [1]
+
+    def test_suspensions_limited_to_spare_threads(self, make_scheduler):
+        """Test more CI waiters than spare threads all finish once CI completes."""
+        scheduler = make_scheduler({"implement": 1}, max_workers=2)
+        ci_done = threading.Event()
+        waiting = threading.Semaphore(0)
+        suspended = []
+
+        def wait_on_ci(_):
+            with scheduler.released():
+                suspended.append(scheduler.stats()["implement"].suspended)
+                waiting.release()
+                assert ci_done.wait(timeout=5)
+
+        futures = [scheduler.submit("implement", wait_on_ci, n) for n in range(3)]
+        # Two tasks reach their CI wait; the third queues behind the one keeping its slot
+        for _ in range(2):
+            assert waiting.acquire(timeout=5)
+        ci_done.set()
+
+        for future in futures:
+            future.result(timeout=5)
+        assert max(suspended) == 1
+        stats = scheduler.stats()["implement"]
+        assert (stats.running, stats.suspended) == (0, 0)
+
+    def test_no_spare_threads_keeps_slot(self, make_scheduler):
+        scheduler = make_scheduler({"lane": 1}, max_workers=1)
+
+        def waiting(_):
+            with scheduler.released():
+                return scheduler.stats()["lane"].running
+
+        assert scheduler.submit("lane", waiting, None).result(timeout=5) == 1
+
+    def test_released_outside_pool_is_noop(self, make_scheduler):
+        scheduler = make_scheduler({"lane": 1})
+
+        with scheduler.released():
+            assert scheduler.stats()["lane"].suspended == 0
+
+    def test_switched_runs_block_in_other_lane(self, make_scheduler):
+        scheduler = make_scheduler({"implement": 1, "prepare": 1})
+
+        def run(_):
+            with scheduler.switched("prepare"):
+                stats = scheduler.stats()
+                return stats["implement"].running, stats["prepare"].running
+
+        assert scheduler.submit("implement", run, None).result(timeout=5) == (0, 1)
+        stats = scheduler.stats()
+        assert (stats["implement"].running, stats["prepare"].running) == (0, 0)
+
+    def test_stats_report_wait_and_utilization(self, make_scheduler):
+        waits = []
+        scheduler = make_scheduler({"lane": 1}, on_wait=lambda lane, s: waits.append(lane))
+        gate = Gate()
+
+        scheduler.submit("lane", gate, "a")
+        assert gate.started.wait(timeout=5)
+        second = scheduler.submit("lane", gate, "b")
+        gate.open.set()
+        second.result(timeout=5)
+
+        stats = scheduler.stats(reset=True)["lane"]
+        assert stats.started == 2
+        assert stats.max_wait > 0
+        assert 0 < stats.utilization <= 1
+        assert waits == ["lane", "lane"]
+        assert scheduler.stats()["lane"].started == 0
+
+    def test_exceptions_are_set_on_future(self, make_scheduler):
+        scheduler = make_scheduler({"lane": 1})
+
+        def fail(_):
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError):
+            scheduler.submit("lane", fail, None).result(timeout=5)
+        assert scheduler.submit("lane", lambda arg: arg, "ok").result(timeout=5) == "ok"
+
+    def test_submit_after_shutdown_raises(self):
+        scheduler = LaneScheduler({"lane": 1}, max_workers=1)
+        scheduler.shutdown()
+
+        with pytest.raises(RuntimeError):
+            scheduler.submit("lane", lambda arg: arg, None)
@@ -0,0 +1,84 @@
+"""Tests for the local wake channel."""
+
+import json
+import urllib.error
+import urllib.request
+
+import pytest
+
+from src.wake_channel import WakeChannel, parse_item_key, send_wake
+
+
+@pytest.fixture
+def channel():
+    """Fixture providing a wake channel listening on a free local port."""
+    channel = WakeChannel(0)
+    channel.start()
+    yield channel
+    channel.stop()
+
+
+def _post(url, body):
+    """POST raw JSON and return (status, response body)."""
+    request = urllib.request.Request(url, data=body.encode("utf-8"), method="POST")
+    try:
+        with urllib.request.urlopen(request, timeout=5) as response:
+            return response.status, json.loads(response.read())
+    except urllib.error.HTTPError as e:
+        return e.code, json.loads(e.read())
+
+
+@pytest.mark.unit
+class TestParseItemKey:
+    """Tests for parse_item_key()."""
+
+    def test_valid_key(self):
+        assert parse_item_key("github.com/org/repo#42") == ("github.com/org/repo", 42)
+
+    @pytest.mark.parametrize("key", ["org/repo#42", "github.com/org/repo", "a/b/c#x", 42])
+    def test_invalid_key(self, key):
+        with pytest.raises(ValueError):
+            parse_item_key(key)
+
+
+@pytest.mark.integration
+class TestWakeChannel:
+    """Tests for WakeChannel with send_wake() standing in for a relay."""
+
+    def test_item_hints_wake_the_loop(self, channel):
+        response = send_wake(channel.url, items=["github.com/org/repo#1", "github.com/org/repo#2"])
+
+        assert response == {"accepted": 2, "full": False}
+        assert channel.wait(5) is True
+        hints = channel.drain()
+        assert hints.items == {("github.com/org/repo", 1), ("github.com/org/repo", 2)}
+        assert hints.full is False
+        assert channel.wait(0) is False
+
+    def test_hints_coalesce_until_drained(self, channel):
+        send_wake(channel.url, items=["github.com/org/repo#1"])
+        send_wake(channel.url, items=["github.com/org/repo#1"], full=True)
+
+        hints = channel.drain()
+        assert hints.items == {("github.com/org/repo", 1)}
+        assert hints.full is True
+
+    def test_bad_item_is_rejected(self, channel):
+        status, body = _post(channel.url, json.dumps({"items": ["repo#1"]}))
+
+        assert status == 400
+        assert "invalid item" in body["error"]
+        assert channel.wait(0) is False
+
+    def test_unknown_path(self, channel):
+        status, _ = _post(channel.url.replace("/wake", "/other"), "{}")
+
+        assert status == 404
+
+    def test_busy_port_disables_channel(self, channel):
+        """Test a port that cannot be bound is logged instead of raised."""
+        second = WakeChannel(channel.port)
+        second.start()
+
+        assert second.wait(0) is False
+        second.stop()
@@ -0,0 +1,103 @@
+"""Unit tests for the background worktree collector."""
+
+import threading
+from unittest.mock import MagicMock, call
+
+import pytest
+
+from src.workspace import WorkspaceError
+from src.worktree_gc import WorktreeCollector
+
+REPO = "github.com/owner/repo"
+
+
+@pytest.fixture
+def manager():
+    """WorkspaceManager mock with cleanup_workspaces and maintain_repo."""
+    return MagicMock()
+
+
+@pytest.fixture
+def collector(manager):
+    """WorktreeCollector whose background thread is never started by these tests."""
+    on_collected = MagicMock()
+    worktree_gc = WorktreeCollector(manager, on_collected=on_collected, maintenance_interval=3600)
+    worktree_gc._thread = MagicMock()  # collect_once() is driven by the tests
+    yield worktree_gc
+    worktree_gc._thread = None
+    worktree_gc.stop()
+
+
+@pytest.mark.unit
+class TestWorktreeCollector:
+    """Tests for WorktreeCollector."""
+
+    def test_one_batch_per_repo(self, collector, manager):
+        """Test queued removals are grouped per repository, deduplicated and in order."""
+        collector.enqueue(REPO, 3)
+        collector.enqueue(REPO, 1)
+        collector.enqueue(REPO, 3)
+        collector.enqueue("github.com/owner/other", 7)
+
+        assert collector.pending_count() == 3
+        collector.collect_once()
+
+        manager.cleanup_workspaces.assert_has_calls(
+            [call(REPO, [3, 1]), call("github.com/owner/other", [7])]
+        )
+        assert collector.pending_count() == 0
+
+    def test_on_collected_called_per_issue(self, collector):
+        """Test every issue of a batch is reported after its removal."""
+        collector.enqueue(REPO, 1)
+        collector.enqueue(REPO, 2)
+
+        collector.collect_once()
+
+        assert collector.on_collected.call_args_list == [call(REPO, 1), call(REPO, 2)]
+
+    def test_failed_batch_still_reports_issues(self, collector, manager):
+        """Test issues are reported even if their repository's cleanup fails."""
+        manager.cleanup_workspaces.side_effect = WorkspaceError("repository not found")
+        collector.enqueue(REPO, 1)
+
+        collector.collect_once()
+
+        collector.on_collected.assert_called_once_with(REPO, 1)
+
+    def test_issues_in_use_are_skipped(self, collector, manager):
+        """Test worktrees of running workflows are neither removed nor reported."""
+        collector.in_use = lambda repo, issue_number: issue_number == 2
+        collector.enqueue(REPO, 1)
+        collector.enqueue(REPO, 2)
+
+        collector.collect_once()
+
+        manager.cleanup_workspaces.assert_called_once_with(REPO, [1])
+        collector.on_collected.assert_called_once_with(REPO, 1)
+
+    def test_maintenance_runs_once_per_interval(self, collector, manager):
+        """Test prune/gc runs for cleaned-up repositories only when due."""
+        collector.enqueue(REPO, 1)
+        collector.collect_once()
+
+        collector.maintain_once()
+        manager.maintain_repo.assert_not_called()
+
+        collector._maintained_at[REPO] -= 3600
+        collector.maintain_once()
+        manager.maintain_repo.assert_called_once_with(REPO)
+
+    def test_background_thread_collects_queued_worktrees(self, manager):
+        """Test the collector thread drains the queue without being driven."""
+        collected = threading.Event()
+        worktree_gc = WorktreeCollector(
+            manager, on_collected=lambda repo, n: collected.set(), batch_delay=0.01
+        )
+        try:
+            worktree_gc.enqueue(REPO, 5)
+            assert collected.wait(timeout=5)
+        finally:
+            worktree_gc.stop()
+
+        manager.cleanup_workspaces.assert_called_once_with(REPO, [5])